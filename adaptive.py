@@ -0,0 +1,166 @@
+"""Adaptive Drills selection on top of the mastery model.
+
+Each question in a pool gets a weight from the current mastery estimates
+(see mastery.py):
+
+    fit(p)    = exp(-((p - TARGET) / WIDTH)^2 / 2)   p = predicted P(correct)
+    weakness  = 1 - sigmoid(weakest tag ability)
+    weight    = FLOOR + fit(p) * (1 + WEAK_BOOST * weakness)
+
+so draws concentrate on questions the learner should get right about
+three times out of four, over-sampling weak tags, while every question
+keeps a small chance.
+
+Questions are drawn from a two-level Walker alias structure: one alias
+table per block of ``BLOCK`` questions plus one over the block totals.
+A draw is O(1); changing a weight rebuilds only its block and the top
+table, and ``AdaptivePool.refresh`` only rebuilds the blocks whose weights
+actually moved since the last quiz. Drawn questions are zeroed for the
+rest of the quiz, so a quiz never repeats a question.
+"""
+import hashlib
+import json
+import math
+import random
+
+import mastery
+import quiz_engine
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+TARGET = 0.75
+WIDTH = 0.1
+WEAK_BOOST = 2.0
+FLOOR = 1e-3
+BLOCK = 256
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) build, O(1) draw proportional to ``weights``."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        self.n = n
+        self.total = total
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        if n == 0 or total <= 0:
+            return
+        scaled = [w * n / total for w in weights]
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = int(rng.random() * self.n)
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class BlockedAlias:
+    """Alias tables per block plus one over the block totals; O(1) draws, O(BLOCK + n/BLOCK) updates."""
+
+    def __init__(self, weights, block=BLOCK):
+        self.block = block
+        self.weights = [float(w) for w in weights]
+        self.blocks = [AliasTable(self.weights[s:s + block]) for s in range(0, len(self.weights), block)]
+        self.top = AliasTable([b.total for b in self.blocks])
+
+    @property
+    def total(self):
+        return self.top.total
+
+    def set_weights(self, weights):
+        """Replace all weights, rebuilding only the blocks that changed; returns how many did."""
+        rebuilt = 0
+        weights = [float(w) for w in weights]
+        for k in range(len(self.blocks)):
+            s = k * self.block
+            if weights[s:s + self.block] != self.weights[s:s + self.block]:
+                self.blocks[k] = AliasTable(weights[s:s + self.block])
+                rebuilt += 1
+        self.weights = weights
+        if rebuilt:
+            self.top = AliasTable([b.total for b in self.blocks])
+        return rebuilt
+
+    def update(self, i, w):
+        k, s = i // self.block, i // self.block * self.block
+        self.weights[i] = float(w)
+        self.blocks[k] = AliasTable(self.weights[s:s + self.block])
+        self.top = AliasTable([b.total for b in self.blocks])
+
+    def sample(self, rng=random):
+        k = self.top.sample(rng)
+        return k * self.block + self.blocks[k].sample(rng)
+
+
+def fingerprint(questions):
+    """SHA-256 of the questions' content: a regenerated bank of the same size still differs."""
+    blob = json.dumps(questions, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class AdaptivePool:
+    """A Drills question pool with mastery-based weights, reused across quiz starts."""
+
+    def __init__(self, questions, subject):
+        self.questions = questions
+        self.subject = subject
+        self.fingerprint = fingerprint(questions)
+        self.qids = [mastery.question_id(q) for q in questions]
+        tag_lists = [mastery.question_tags(q, subject) for q in questions]
+        self.tags = sorted({t for tags in tag_lists for t in tags})
+        local = {t: i for i, t in enumerate(self.tags)}
+        width = max((len(tags) for tags in tag_lists), default=1)
+        # Local tag index per question, padded with -1
+        self.tag_matrix = np.full((len(questions), width), -1, dtype=np.int32)
+        for i, tags in enumerate(tag_lists):
+            self.tag_matrix[i, :len(tags)] = [local[t] for t in tags]
+        self.p = np.zeros(len(questions))
+        self.sampler = None
+
+    def refresh(self, model):
+        """Recompute predicted accuracy and weights from ``model``; returns the blocks rebuilt."""
+        codes = np.array([model.question_codes.get(qid, -1) for qid in self.qids], dtype=np.int64)
+        difficulty = np.zeros(len(self.qids))
+        seen = codes >= 0
+        difficulty[seen] = model.difficulty[codes[seen]]
+        tag_ability = np.array([float(model.ability[model.tag_codes[t]]) if t in model.tag_codes else 0.0 for t in self.tags])
+        mask = self.tag_matrix >= 0
+        per_tag = np.where(mask, tag_ability[np.maximum(self.tag_matrix, 0)], 0.0)
+        ability = per_tag.sum(axis=1) / np.maximum(mask.sum(axis=1), 1)
+        weakest = np.where(mask, per_tag, np.inf).min(axis=1)
+        self.p = 1.0 / (1.0 + np.exp(-(ability - difficulty)))
+        fit = np.exp(-0.5 * ((self.p - TARGET) / WIDTH) ** 2)
+        weakness = 1.0 - 1.0 / (1.0 + np.exp(-weakest))
+        weights = (FLOOR + fit * (1.0 + WEAK_BOOST * weakness)).tolist()
+        if self.sampler is None:
+            self.sampler = BlockedAlias(weights)
+            return len(self.sampler.blocks)
+        return self.sampler.set_weights(weights)
+
+    def select(self, n, rng=random, shuffle=True):
+        """(questions, expected accuracy) for a quiz of up to ``n`` distinct questions."""
+        picked = []
+        for _ in range(min(n, len(self.questions))):
+            if self.sampler.total <= 0:
+                break
+            i = self.sampler.sample(rng)
+            picked.append((i, self.sampler.weights[i]))
+            self.sampler.update(i, 0.0)
+        # Put the drawn questions back for the next quiz
+        for i, w in picked:
+            self.sampler.update(i, w)
+        qs = [quiz_engine.shuffle_options(self.questions[i], rng) if shuffle else dict(self.questions[i]) for i, _ in picked]
+        expected = float(np.mean([self.p[i] for i, _ in picked])) if picked else math.nan
+        return qs, expected
@@ -0,0 +1,145 @@
+"""Process-wide registry of read-only reference assets.
+
+vocab.json, formulas.json, exam_metadata.json and the exam vocabulary index
+are parsed once per process and shared by every session instead of being
+re-read on each Streamlit rerun. ``get`` stats the file; the asset is only
+reparsed when its mtime/size changed *and* its SHA-256 differs from the
+loaded copy (so a ``touch`` doesn't trigger a reload).
+
+Values are shared between sessions: treat them as read-only and write
+changes back through the file (which invalidates the entry).
+
+An optional ``migrate`` hook runs right after a (re)load and may fix up the
+parsed value; if it returns True the value is written back with ``save``.
+This replaces the seed-on-every-rerun pattern with a one-time migration per
+file version. ``check`` runs the same load and migration without caching or
+writing anything.
+
+A file that fails to parse is recorded in ``errors`` (for the pages to
+show) and served as a fresh copy of its ``default``; it is never migrated
+or saved over.
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+
+import tracing
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def load_npz(path):
+    import numpy as np
+
+    with np.load(path, allow_pickle=False) as z:
+        return {k: z[k] for k in z.files}
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class AssetRegistry:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._assets = {}
+        self.loads = {}
+        self.errors = {}
+
+    def register(self, name, path, loader=load_json, default=None, migrate=None, save=save_json):
+        """Declare an asset. Re-registering keeps the loaded value if the path is unchanged."""
+        with self._lock:
+            entry = self._assets.get(name)
+            if entry is not None and entry["path"] == path:
+                entry.update(loader=loader, default=default, migrate=migrate, save=save)
+                return
+            self._assets[name] = {
+                "path": path, "loader": loader, "default": default, "migrate": migrate, "save": save,
+                "value": None, "stat": None, "sha256": None, "loaded": False,
+            }
+
+    def _stat(self, path):
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def get(self, name):
+        entry = self._assets[name]
+        stat = self._stat(entry["path"])
+        if entry["loaded"] and stat == entry["stat"]:
+            return entry["value"]
+        with self._lock, tracing.section("assets"):
+            stat = self._stat(entry["path"])
+            if entry["loaded"] and stat == entry["stat"]:
+                return entry["value"]
+            if stat is None:
+                self.errors.pop(name, None)
+                entry.update(value=copy.deepcopy(entry["default"]), stat=None, sha256=None, loaded=True)
+                return entry["value"]
+            sha = _sha256(entry["path"])
+            if entry["loaded"] and sha == entry["sha256"]:
+                entry["stat"] = stat
+                return entry["value"]
+            try:
+                value = entry["loader"](entry["path"])
+                self.errors.pop(name, None)
+            except Exception as e:
+                print(f"Error loading asset {name}: {e}")
+                self.errors[name] = str(e)
+                value = copy.deepcopy(entry["default"])
+            else:
+                if entry["migrate"] is not None and entry["migrate"](value):
+                    entry["save"](entry["path"], value)
+                    stat, sha = self._stat(entry["path"]), _sha256(entry["path"])
+            entry.update(value=value, stat=stat, sha256=sha, loaded=True)
+            self.loads[name] = self.loads.get(name, 0) + 1
+            return value
+
+    def check(self, name):
+        """What ``get`` would report or rewrite for ``name``, without caching or saving; None if nothing."""
+        entry = self._assets[name]
+        if self._stat(entry["path"]) is None:
+            return None
+        try:
+            value = entry["loader"](entry["path"])
+        except Exception as e:
+            return str(e)
+        if entry["migrate"] is not None and entry["migrate"](value):
+            return "migration pending"
+        return None
+
+    def invalidate(self, name=None):
+        with self._lock:
+            for key in ([name] if name else list(self._assets)):
+                self._assets[key]["loaded"] = False
+
+    def names(self):
+        return list(self._assets)
+
+
+registry = AssetRegistry()
+registry.register("vocab", os.path.join(BASE_DIR, "assets", "vocab.json"), default={})
+registry.register("formulas", os.path.join(BASE_DIR, "assets", "formulas.json"), default=[])
+registry.register("exam_metadata", os.path.join(BASE_DIR, "exam_metadata.json"), default={})
+registry.register("exam_vocab", os.path.join(BASE_DIR, "exam_vocab.json"), default={})
+registry.register("exam_vocab_index", os.path.join(BASE_DIR, "exam_vocab_index.npz"), loader=load_npz)
@@ -0,0 +1,299 @@
+"""Helpers shared by the app entrypoint and the page modules in views/."""
+import base64
+import json
+import os
+from datetime import date
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+import lecture_index
+import mastery
+import pdf_pages
+import pdf_store
+import srs
+import study_rollups
+import tracing
+from asset_registry import registry as assets
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Overridable so benchmarks and load tests keep off the real progress file
+DATA_FILE = os.environ.get("CPA_DATA_FILE", "cpa_data.json")
+MASTERY_FILE = os.path.splitext(DATA_FILE)[0] + "_mastery.npz"
+
+# ---- Generated Questions Utilities (lazy load) ----
+@st.cache_data(show_spinner=False)
+def load_generated_subject(subject: str):
+    try:
+        with open('questions.json', 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data.get(subject, [])
+    except FileNotFoundError:
+        return []
+    except Exception:
+        return []
+
+@st.cache_data(show_spinner=False)
+def available_tags(subject: str):
+    tags = set()
+    try:
+        for q in load_generated_subject(subject):
+            qtags = q.get('tags', [])
+            if isinstance(qtags, list):
+                for t in qtags:
+                    if isinstance(t, str):
+                        tags.add(t)
+            elif isinstance(qtags, str):
+                tags.add(qtags)
+    except Exception:
+        pass
+    return sorted(tags)
+
+@st.cache_data(show_spinner=False)
+def load_pdf_manifest(files: tuple, manifest_mtime: float):
+    # Per-file (size, mtime) changes when a PDF is added, removed, renamed or
+    # replaced in place; the manifest mtime changes when
+    # `python pdf_store.py --compress` wrote new blobs
+    return pdf_store.refresh()
+
+def pdf_manifest():
+    path = pdf_store.manifest_path()
+    return load_pdf_manifest(pdf_store.signature(), os.path.getmtime(path) if os.path.exists(path) else 0.0)
+
+@st.cache_data(show_spinner=False)
+def load_lecture_index(pdf_path: str, excel_path: str, mtimes: tuple, _items: list):
+    # Lecture -> page ranges; lecture_index also caches on disk by file hash
+    return lecture_index.load_or_build(pdf_path, excel_path, _items)
+
+def load_data():
+    defaults = {
+        "scores": [],
+        "logs": [],
+        "xp": 0,
+        "level": 1,
+        "badges": [],
+        "wrong_answers": [],
+        "retry": [],
+        "english_prep": {
+            "ielts": {
+                "target_band": 7.0,
+                "exam_date": "",
+                "logs": [],
+                "checklist": [
+                    {"item": "アカデミック語彙 3000 語", "done": False},
+                    {"item": "Cambridge IELTS Reading 10回", "done": False},
+                    {"item": "リーディング T/F/NG 対策 50問", "done": False},
+                    {"item": "Listening 10 模試（地図/表/多肢）", "done": False},
+                    {"item": "スペリング・数字読み上げ対策", "done": False},
+                    {"item": "Writing Task1 グラフ別テンプレ構築", "done": False},
+                    {"item": "Writing Task2 論点・例示バンク50", "done": False},
+                    {"item": "Speaking Part2 キューカード50本", "done": False},
+                    {"item": "Speaking Part3 ディスカッション練習", "done": False},
+                    {"item": "Band Descriptors 熟読（W/S）", "done": False},
+                    {"item": "時間配分リハーサル（R60/L30/W60/S14）", "done": False}
+                ],
+                "resources": [
+                    "https://www.ielts.org/about-ielts/what-is-ielts/ielts-scoring-in-detail",
+                    "https://www.ielts.org/for-test-takers/how-ielts-is-scored",
+                    "https://ieltsliz.com/",
+                    "https://ieltssimon.com/"
+                ]
+            },
+            "toefl": {
+                "target_score": 100,
+                "exam_date": "",
+                "logs": [],
+                "checklist": [
+                    {"item": "Academic Vocabulary 2000", "done": False},
+                    {"item": "Reading 10 模試", "done": False},
+                    {"item": "Listening 10 模試", "done": False},
+                    {"item": "Speaking 20 セッション", "done": False},
+                    {"item": "Writing 20 本", "done": False}
+                ],
+                "resources": []
+            }
+        },
+        "official_checklist": [
+            {"item": "受験資格・身分証の要件確認", "done": False, "notes": ""},
+            {"item": "受験申込期間・受験料の確認", "done": False, "notes": ""},
+            {"item": "持込可否（電卓等）・注意事項の確認", "done": False, "notes": ""},
+            {"item": "短答合格の有効期間の把握", "done": False, "notes": ""},
+            {"item": "出題範囲（シラバス）ダウンロード", "done": False, "notes": ""},
+            {"item": "過去問PDF入手（直近3年）", "done": False, "notes": ""},
+            {"item": "試験当日の持ち物・会場アクセス確認", "done": False, "notes": ""}
+        ],
+        "revisions": []
+    }
+    if os.path.exists(DATA_FILE):
+        with open(DATA_FILE, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+                # Merge defaults for backward compatibility
+                for k, v in defaults.items():
+                    if k not in data:
+                        data[k] = v
+                # Folds logs added before rollups existed (or outside the app)
+                study_rollups.rollups(data)
+                return data
+            except:
+                return defaults
+    return defaults
+
+def mastery_model():
+    # Loaded on first use, so the quiz pages only import numpy once an answer is graded
+    if "mastery" not in st.session_state:
+        st.session_state.mastery = mastery.MasteryModel.load(MASTERY_FILE)
+    return st.session_state.mastery
+
+def save_mastery():
+    with tracing.section("persist"):
+        mastery_model().save(MASTERY_FILE)
+
+def srs_deck():
+    # Heap built once per session; wrong answers logged since are enrolled on the way
+    state = st.session_state.data.setdefault("srs", {})
+    deck = st.session_state.get("_srs_deck")
+    if deck is None or deck.state is not state:
+        deck = st.session_state._srs_deck = srs.Deck(state)
+    srs.sync_wrong_answers(deck, st.session_state.data)
+    return deck
+
+def show_asset_errors(*names):
+    # A broken asset is served as its empty default; say so instead of showing nothing
+    for name in names:
+        if name in assets.errors:
+            st.error(f"Error loading {name}: {assets.errors[name]}")
+
+def save_data(data):
+    with tracing.section("persist"), open(DATA_FILE, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def render_pdf(path: str, height: int = 800):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except Exception as e:
+        st.error(f"PDF表示に失敗: {e}")
+        return
+    render_pdf_bytes(data, os.path.basename(path), height)
+
+def render_pdf_bytes(data: bytes, name: str, height: int = 800):
+    try:
+        b64 = base64.b64encode(data).decode("utf-8")
+        bid = name.replace(".", "_").replace(" ", "_")
+        html = f"""
+        <div>
+          <iframe src="data:application/pdf;base64,{b64}" width="100%" height="{height}" type="application/pdf"></iframe>
+          <div style="margin-top:8px">
+            <button id="open_{bid}" style="padding:8px 12px;border-radius:6px;border:1px solid #ddd;background:#f6f6f6;cursor:pointer;">Open in new tab (if blocked)</button>
+          </div>
+        </div>
+        <script>
+        (function() {{
+          var b64 = "{b64}";
+          var s = atob(b64);
+          var arr = new Uint8Array(s.length);
+          for (var i = 0; i < s.length; i++) arr[i] = s.charCodeAt(i);
+          var blob = new Blob([arr], {{type: "application/pdf"}});
+          var url = URL.createObjectURL(blob);
+          var btn = document.getElementById("open_{bid}");
+          if (btn) {{
+            btn.addEventListener("click", function() {{
+              window.open(url, "_blank");
+            }});
+          }}
+        }})();
+        </script>
+        """
+        components.html(html, height=height, scrolling=True)
+    except Exception as e:
+        st.error(f"PDF表示に失敗: {e}")
+
+@st.cache_data(show_spinner=False)
+def pdf_page_count(path: str, mtime: float) -> int:
+    return pdf_pages.page_count(path)
+
+def render_pdf_pages(path: str, key: str, default: str = "1-3", height: int = 800):
+    # Ship only the requested pages (sliced + disk-cached by pdf_pages)
+    try:
+        n_pages = pdf_page_count(path, os.path.getmtime(path))
+        spec = st.text_input(f"Pages (1–{n_pages}, e.g. 1-3,5)", value=default, key=key)
+        ranges = pdf_pages.parse_ranges(spec, n_pages)
+        if not ranges:
+            # Empty or out-of-range input: fall back to the default pages, never the whole file
+            st.warning(f"No pages in 1–{n_pages} selected; showing {default}.")
+            ranges = pdf_pages.parse_ranges(default, n_pages) or [(0, 0)]
+        data = pdf_pages.page_range_bytes(path, ranges)
+    except Exception as e:
+        st.error(f"PDF表示に失敗: {e}")
+        return
+    st.caption(f"{sum(e - s + 1 for s, e in ranges)} / {n_pages} pages · {len(data) / 1024:.0f} KB")
+    render_pdf_bytes(data, os.path.basename(path), height)
+
+def ielts_reading_band(module: str, raw_correct: int) -> float:
+    m = (module or "Academic").lower()
+    r = max(0, min(40, int(raw_correct)))
+    if m.startswith("acad"):
+        if r >= 39: return 9.0
+        if r >= 37: return 8.5
+        if r >= 35: return 8.0
+        if r >= 32: return 7.5
+        if r >= 30: return 7.0
+        if r >= 27: return 6.5
+        if r >= 23: return 6.0
+        if r >= 19: return 5.5
+        if r >= 15: return 5.0
+        if r >= 13: return 4.5
+        if r >= 10: return 4.0
+        if r >= 8: return 3.5
+        if r >= 6: return 3.0
+        if r >= 4: return 2.5
+        if r >= 3: return 2.0
+        if r >= 2: return 1.5
+        if r >= 1: return 1.0
+        return 0.0
+    else:
+        if r >= 40: return 9.0
+        if r >= 39: return 8.5
+        if r >= 37: return 8.0
+        if r >= 36: return 7.5
+        if r >= 34: return 7.0
+        if r >= 32: return 6.5
+        if r >= 30: return 6.0
+        if r >= 27: return 5.5
+        if r >= 23: return 5.0
+        if r >= 19: return 4.5
+        if r >= 15: return 4.0
+        if r >= 12: return 3.5
+        if r >= 9: return 3.0
+        if r >= 6: return 2.5
+        if r >= 4: return 2.0
+        if r >= 2: return 1.5
+        if r >= 1: return 1.0
+        return 0.0
+
+default_official_schedule = [
+    # Short I (Dec) 2026
+    {'date': '2026-12-13', 'category': 'Exam', 'event': '短答式 第I回（12月） 試験', 'notes': '企業法/管理/監査/財務（500点満点）'},
+    {'date': '2027-01-20', 'category': 'Result', 'event': '短答式 第I回 合格発表（目安）', 'notes': '公式発表時刻に従う・目安日付'},
+    # Short II (May) 2027
+    {'date': '2027-05-23', 'category': 'Exam', 'event': '短答式 第II回（5月） 試験', 'notes': '目標：同年の論文へ'},
+    {'date': '2027-06-20', 'category': 'Result', 'event': '短答式 第II回 合格発表（目安）', 'notes': '公式発表時刻に従う・目安日付'},
+    # Essay 2027
+    {'date': '2027-08-20', 'category': 'Exam', 'event': '論文式 試験', 'notes': '2日間科目・配点に注意'},
+    {'date': '2027-11-15', 'category': 'Result', 'event': '論文式 合格発表（目安）', 'notes': '例年11月頃発表・目安日付'}
+]
+
+def official_schedule():
+    return st.session_state.data.get('official_schedule', default_official_schedule)
+
+
+def parse_date(value) -> date:
+    """``YYYY-MM-DD`` strings (as saved in cpa_data.json) without importing pandas; anything else via pandas."""
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return pd.to_datetime(value).date()
@@ -0,0 +1,89 @@
+"""Process-wide cache of serialized Plotly figures.
+
+    st.plotly_chart(figure_cache.figure("roadmap_gantt", None, _gantt_figure), use_container_width=True)
+
+``figure(chart_id, inputs, build)`` keys the figure on ``chart_id`` plus a
+SHA-256 of ``inputs`` (anything ``json.dumps`` can encode, ``str`` as the
+fallback) and only calls ``build()`` on a miss. The figure JSON is kept and
+every hit returns a fresh dict parsed from it, which ``st.plotly_chart``
+takes like a Figure. Static charts (border chart, Gantt, radars, timeline)
+pass ``None`` as inputs and are built once per process; charts over the
+user's scores or logs pass that data, so saving a score is a miss and every
+other rerun a hit. Entries are shared between sessions; the least recently
+used ones are dropped beyond ``MAX_ENTRIES``.
+
+Hits and misses are counted per chart for the process and per rerun in the
+trace (see tracing.py).
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import tracing
+
+MAX_ENTRIES = 128
+
+
+def input_hash(inputs):
+    blob = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class FigureCache:
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (chart_id, input hash) -> figure JSON
+        self.max_entries = max_entries
+        self.hits = {}
+        self.misses = {}
+
+    def figure(self, chart_id, inputs, build):
+        """Figure dict for ``chart_id``; ``build()`` returns a plotly Figure on a miss."""
+        key = (chart_id, input_hash(inputs))
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits[chart_id] = self.hits.get(chart_id, 0) + 1
+        if spec is not None:
+            tracing.count("figure_cache.hit")
+            return json.loads(spec)
+
+        # Built outside the lock; two sessions missing at once both build
+        with tracing.section("charts"):
+            spec = build().to_json(validate=False)
+        with self._lock:
+            self._entries[key] = spec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.misses[chart_id] = self.misses.get(chart_id, 0) + 1
+        tracing.count("figure_cache.miss")
+        return json.loads(spec)
+
+    def stats(self):
+        """Per chart id: hits, misses and cached bytes."""
+        with self._lock:
+            sizes = {}
+            for (chart_id, _), spec in self._entries.items():
+                sizes[chart_id] = sizes.get(chart_id, 0) + len(spec)
+            ids = sorted(set(self.hits) | set(self.misses))
+            return {i: {"hits": self.hits.get(i, 0), "misses": self.misses.get(i, 0), "bytes": sizes.get(i, 0)} for i in ids}
+
+    def nbytes(self):
+        with self._lock:
+            return sum(len(spec) for spec in self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+
+cache = FigureCache()
+
+
+def figure(chart_id, inputs, build):
+    return cache.figure(chart_id, inputs, build)
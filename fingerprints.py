@@ -0,0 +1,51 @@
+"""Cheap staleness checks for state folded incrementally from a record list.
+
+study_rollups (``data["logs"]``) and pass_sim (``data["scores"]``) keep
+sufficient statistics next to the records they summarize, with ``count``
+(records folded in so far) and ``last`` (``fingerprint`` of the last one).
+Appends are caught up by folding ``records[count:]``; ``stale`` says when
+that is not enough and the state must be rebuilt:
+
+    if stale(state, records):            # records removed, or the one at
+        state = rebuild(...)             # count - 1 edited / replaced
+    for r in records[state["count"]:]:
+        fold(state, r)
+    state["last"] = fingerprint(records[-1])
+
+Only the last folded record is checked, so this costs one hash per call;
+an edit further back with nothing appended after it goes unnoticed.
+
+``digest`` applies the same scheme to a running hash of the whole list, for
+caches keyed on its content (the Scores trend chart in figure_cache).
+"""
+import hashlib
+import json
+
+
+def fingerprint(record):
+    """Short hash of one record (any JSON-encodable dict)."""
+    blob = json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def stale(state, records):
+    """True when ``state`` can't be caught up by folding ``records[state["count"]:]``."""
+    count = state.get("count", 0)
+    if count > len(records):
+        return True
+    return count > 0 and state.get("last") != fingerprint(records[count - 1])
+
+
+def digest(data, key):
+    """Running SHA-1 over ``data[key]``, kept in ``data[key + "_digest"]`` and caught up in O(appended)."""
+    records = data.setdefault(key, [])
+    state = data.get(key + "_digest")
+    if not isinstance(state, dict) or stale(state, records):
+        state = {"count": 0, "last": None, "sha": ""}
+    if state["count"] < len(records):
+        sha = state["sha"]
+        for record in records[state["count"]:]:
+            sha = hashlib.sha1((sha + fingerprint(record)).encode("ascii")).hexdigest()
+        state.update(count=len(records), last=fingerprint(records[-1]), sha=sha)
+    data[key + "_digest"] = state
+    return state["sha"]
@@ -1,23 +1,52 @@
 import os
+import re
 import json
+import unicodedata
+import numpy as np
 import pypdf
 from janome.tokenizer import Tokenizer
 from collections import Counter
+import pdf_store
 
 exam_dir = "EXAM"
 vocab_file = "exam_vocab.json"
+index_file = "exam_vocab_index.npz"
 metadata_file = "exam_metadata.json"
 
+TOP_K = 50
+
 # Known unimportant words or stopwords
 STOPWORDS = set([
-    "の", "に", "は", "を", "た", "が", "で", "て", "と", "し", "れ", "さ", "ある", "いる", "する", "ない", 
-    "よう", "もの", "こと", "ため", "なり", "これ", "それ", "あり", "よっ", "等", "及び", "又は", 
-    "並び", "その", "この", "から", "また", "へ", "ば", "より", "など", "ます", "まで", "お", 
+    "の", "に", "は", "を", "た", "が", "で", "て", "と", "し", "れ", "さ", "ある", "いる", "する", "ない",
+    "よう", "もの", "こと", "ため", "なり", "これ", "それ", "あり", "よっ", "等", "及び", "又は",
+    "並び", "その", "この", "から", "また", "へ", "ば", "より", "など", "ます", "まで", "お",
     "問題", "正解", "番号", "試験", "解答", "用紙", "注意事項", "受験", "令和", "年度", "ページ",
-    "次", "記述", "うち", "最も", "適切", "選べ", "マーク", "場合", "第", "問", "年"
+    "次", "記述", "うち", "最も", "適切", "選べ", "マーク", "場合", "第", "問", "年", "論文"
 ])
 
-def extract_vocab_from_pdf(pdf_path, subject_name):
+# Noun sub-types that may be chained into a compound noun (e.g. 会社 + 法 -> 会社法)
+COMPOUND_HEAD = ("一般", "固有名詞", "サ変接続", "形容動詞語幹")
+COMPOUND_TAIL = COMPOUND_HEAD + ("接尾",)
+
+
+# Page headers/footers and printer marks ("令和7年論文式会計学", "DKIO-R", "xxx.indd")
+HEADER_NOISE = re.compile(r'^年|短答|論文式|答式|午前|午後')
+JAPANESE = re.compile(r'[\u3040-\u30ff\u4e00-\u9fff]')
+
+
+def _keep(word):
+    # Filter: length > 1, not in stopwords, no digits (simple numbers/dates),
+    # at least one kana/kanji and no header/printer noise
+    return (len(word) > 1 and word not in STOPWORDS
+            and not any(char.isdigit() or char.isspace() for char in word)
+            and JAPANESE.search(word) is not None and HEADER_NOISE.search(word) is None)
+
+
+def extract_vocab_from_pdf(pdf_path, subject_name, tokenizer=None, compounds=None):
+    """Return the noun unigrams and merged compound nouns of one PDF.
+
+    Compound nouns are also added to ``compounds`` (a set) when it is given.
+    """
     text = ""
     try:
         reader = pypdf.PdfReader(pdf_path)
@@ -27,25 +56,87 @@ def extract_vocab_from_pdf(pdf_path, subject_name):
         print(f"Error reading {pdf_path}: {e}")
         return []
 
-    t = Tokenizer()
+    t = tokenizer or Tokenizer()
     words = []
-    
-    # Extract nouns (名詞)
+    run = []
+
+    def flush():
+        if len(run) > 1:
+            compound = "".join(run)
+            if _keep(compound):
+                words.append(compound)
+                if compounds is not None:
+                    compounds.add(compound)
+        run.clear()
+
+    # Extract nouns (名詞) and chain consecutive ones into compounds
     for token in t.tokenize(text):
-        pos = token.part_of_speech.split(',')[0]
+        pos = token.part_of_speech.split(',')
         word = token.surface
-        
-        # Filter: Nouns only, length > 1, not in stopwords, not a number
-        if pos == '名詞' and len(word) > 1 and word not in STOPWORDS and not word.isdigit():
-            # Filter out simple numbers/dates
-            if not any(char.isdigit() for char in word):
-                 words.append(word)
-    
+
+        if pos[0] != '名詞':
+            flush()
+            continue
+        if _keep(word):
+            words.append(word)
+        if pos[1] in (COMPOUND_TAIL if run else COMPOUND_HEAD):
+            run.append(word)
+        else:
+            flush()
+    flush()
+
     return words
 
+
+def normalize_year(year):
+    # "令和８年" / "令和7年" -> "R8" / "R7"
+    m = re.search(r'令和\s*(\d+)', unicodedata.normalize("NFKC", year or ""))
+    return f"R{int(m.group(1))}" if m else "Unknown"
+
+
+def build_csr(doc_counters, term_index):
+    """Pack a list of Counters into CSR arrays (data, indices, indptr)."""
+    indptr = np.zeros(len(doc_counters) + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for i, counter in enumerate(doc_counters):
+        cols = np.fromiter((term_index[w] for w in counter), dtype=np.int32, count=len(counter))
+        vals = np.fromiter(counter.values(), dtype=np.int32, count=len(counter))
+        order = np.argsort(cols)
+        indices.append(cols[order])
+        data.append(vals[order])
+        indptr[i + 1] = indptr[i] + len(counter)
+    indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+    data = np.concatenate(data) if data else np.zeros(0, dtype=np.int32)
+    return data, indices, indptr
+
+
+def group_rows(data, indices, indptr, row_group, n_groups, n_terms):
+    """Sum CSR rows by group label into a dense (n_groups x n_terms) matrix."""
+    rows = np.repeat(row_group, np.diff(indptr))
+    out = np.zeros((n_groups, n_terms), dtype=np.int64)
+    np.add.at(out, (rows, indices), data)
+    return out
+
+
+def tfidf(data, indices, indptr, subject_of_file, n_subjects, n_terms):
+    """Subject x term TF-IDF, with document frequency taken over exam files.
+
+    Generic nouns that appear in every paper get idf ~ 1 while subject-specific
+    terms are boosted, which is what the Old Exams chart wants to rank by.
+    """
+    n_docs = len(indptr) - 1
+    df = np.bincount(indices, minlength=n_terms)
+    idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+    counts = group_rows(data, indices, indptr, subject_of_file, n_subjects, n_terms)
+    tf = np.log1p(counts)
+    return counts, tf * idf[None, :]
+
+
 def main():
-    # Load metadata to map file -> subject
+    # Load metadata to map file -> subject / year
     file_to_subject = {}
+    file_to_year = {}
     if os.path.exists(metadata_file):
         with open(metadata_file, "r", encoding="utf-8") as f:
             meta = json.load(f)
@@ -55,31 +146,78 @@ def main():
                     # "企業法 (Corporate Law)" -> "企業法"
                     simple_subject = v['subject'].split(' ')[0]
                     file_to_subject[k] = simple_subject
+                file_to_year[k] = normalize_year(v.get('year', ''))
+
+    # Process files (one Counter per file = one row of the doc x term matrix).
+    # Byte-identical copies ("01.pdf" / "01 (2).pdf") are read once so they
+    # don't inflate counts or document frequencies.
+    docs = pdf_store.documents(pdf_store.scan(dirs=(exam_dir,)), exam_dir + "/")
+    pdf_files = [d["name"] for d in docs]
+    tokenizer = Tokenizer()
+    doc_counters = []
+    compounds = set()
 
-    # Process files
-    subject_vocab = {} # {subject: Counter}
-    
-    pdf_files = [f for f in os.listdir(exam_dir) if f.endswith(".pdf")]
-    
     for pdf_file in pdf_files:
         print(f"Processing {pdf_file}...")
         subject = file_to_subject.get(pdf_file, "Uncategorized")
-        
-        if subject not in subject_vocab:
-            subject_vocab[subject] = Counter()
-            
-        words = extract_vocab_from_pdf(os.path.join(exam_dir, pdf_file), subject)
-        subject_vocab[subject].update(words)
-
-    # Convert to JSON structure (Top 50 words per subject)
+        words = extract_vocab_from_pdf(os.path.join(exam_dir, pdf_file), subject, tokenizer, compounds)
+        doc_counters.append(Counter(words))
+
+    vocab = Counter()
+    for c in doc_counters:
+        vocab.update(c)
+    terms = sorted(vocab)
+    term_index = {w: i for i, w in enumerate(terms)}
+    data, indices, indptr = build_csr(doc_counters, term_index)
+
+    subjects = sorted({file_to_subject.get(f, "Uncategorized") for f in pdf_files})
+    years = sorted({file_to_year.get(f, "Unknown") for f in pdf_files})
+    file_subject = np.array([subjects.index(file_to_subject.get(f, "Uncategorized")) for f in pdf_files], dtype=np.int32)
+    file_year = np.array([years.index(file_to_year.get(f, "Unknown")) for f in pdf_files], dtype=np.int32)
+
+    counts, scores = tfidf(data, indices, indptr, file_subject, len(subjects), len(terms))
+
+    # Per (subject, year) counts for the trend series
+    n_years = len(years)
+    subject_year = group_rows(data, indices, indptr, file_subject * n_years + file_year, len(subjects) * n_years, len(terms))
+
+    # Top-K table per subject, stored column-wise
+    top_subject, top_term, top_score, top_count, top_trend = [], [], [], [], []
     final_output = {}
-    for subject, counter in subject_vocab.items():
-        top_words = counter.most_common(50)
-        final_output[subject] = [{"word": w, "count": c} for w, c in top_words]
+    for s, subject in enumerate(subjects):
+        order = np.argsort(-scores[s], kind="stable")
+        order = order[counts[s, order] > 0][:TOP_K]
+        top_subject.append(np.full(len(order), s, dtype=np.int32))
+        top_term.append(order.astype(np.int32))
+        top_score.append(scores[s, order].astype(np.float32))
+        top_count.append(counts[s, order].astype(np.int32))
+        top_trend.append(subject_year[s * n_years:(s + 1) * n_years, order].T.astype(np.int32))
+        final_output[subject] = [{"word": terms[t], "count": int(counts[s, t])} for t in order]
+
+    np.savez_compressed(
+        index_file,
+        terms=np.array(terms),
+        term_compound=np.array([w in compounds for w in terms]),
+        files=np.array(pdf_files),
+        subjects=np.array(subjects),
+        years=np.array(years),
+        file_subject=file_subject,
+        file_year=file_year,
+        dt_data=data,
+        dt_indices=indices,
+        dt_indptr=indptr,
+        top_subject=np.concatenate(top_subject),
+        top_term=np.concatenate(top_term),
+        top_tfidf=np.concatenate(top_score),
+        top_count=np.concatenate(top_count),
+        top_trend=np.concatenate(top_trend, axis=0).reshape(-1, n_years),
+    )
+    print(f"Vocabulary index saved to {index_file} ({len(pdf_files)} files x {len(terms)} terms, nnz={len(data)})")
 
+    # Legacy JSON (Top 50 words per subject, now ranked by TF-IDF)
     with open(vocab_file, "w", encoding="utf-8") as f:
         json.dump(final_output, f, indent=4, ensure_ascii=False)
-    
+
     print(f"Vocabulary saved to {vocab_file}")
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ import random
 import hashlib
 import os
 
+from quiz_engine import shuffle_options, write_questions_js
+
 def _sig(q):
     return hashlib.md5((q.get('q','') + '|' + '|'.join(q.get('options', [])) + '|' + str(q.get('correct'))).encode('utf-8')).hexdigest()
 
@@ -76,9 +78,7 @@ def generate_intro_questions(count_per_subject=50):
         
         # Shuffle
         if "options" in q:
-            correct_opt = q['options'][q['correct']]
-            random.shuffle(q['options'])
-            q['correct'] = q['options'].index(correct_opt)
+            q = shuffle_options(q)
         data["Financial"].append(q)
 
     # --- Management Accounting Basics ---
@@ -110,9 +110,7 @@ def generate_intro_questions(count_per_subject=50):
         
         # Shuffle
         if "options" in q:
-            correct_opt = q['options'][q['correct']]
-            random.shuffle(q['options'])
-            q['correct'] = q['options'].index(correct_opt)
+            q = shuffle_options(q)
         data["Management"].append(q)
 
     # --- Audit Basics ---
@@ -141,11 +139,7 @@ def generate_intro_questions(count_per_subject=50):
     ]
     for _ in range(count_per_subject):
         base = random.choice(audit_templates)
-        q = base.copy()
-        q['options'] = base['options'].copy()
-        correct_opt = q['options'][q['correct']]
-        random.shuffle(q['options'])
-        q['correct'] = q['options'].index(correct_opt)
+        q = shuffle_options(base)
         data["Audit"].append(q)
 
     # --- Company Law Basics ---
@@ -174,11 +168,7 @@ def generate_intro_questions(count_per_subject=50):
     ]
     for _ in range(count_per_subject):
         base = random.choice(company_templates)
-        q = base.copy()
-        q['options'] = base['options'].copy()
-        correct_opt = q['options'][q['correct']]
-        random.shuffle(q['options'])
-        q['correct'] = q['options'].index(correct_opt)
+        q = shuffle_options(base)
         data["Company"].append(q)
         
     return data
@@ -456,11 +446,7 @@ def generate_audit_questions(count):
     seen = set()
     while len(questions) < count:
         base = random.choice(templates)
-        q = base.copy()
-        q['options'] = base['options'].copy()
-        correct_option = q['options'][q['correct']]
-        random.shuffle(q['options'])
-        q['correct'] = q['options'].index(correct_option)
+        q = shuffle_options(base)
         q['tags'] = _tag_for_text(q['q'], "監査")
         s = _sig(q)
         if s not in seen:
@@ -562,11 +548,7 @@ def generate_company_law_questions(count):
     seen = set()
     while len(questions) < count:
         base = random.choice(templates)
-        q = base.copy()
-        q['options'] = base['options'].copy()
-        correct_option = q['options'][q['correct']]
-        random.shuffle(q['options'])
-        q['correct'] = q['options'].index(correct_option)
+        q = shuffle_options(base)
         q['tags'] = _tag_for_text(q['q'], "会社法")
         s = _sig(q)
         if s not in seen:
@@ -626,10 +608,7 @@ def main(seed=None):
         json.dump(all_data, f, ensure_ascii=False, indent=2)
         
     # Save as JS for HTML
-    js_path = os.path.join(output_dir, "questions.js")
-    js_content = f"const generatedQuestions = {json.dumps(all_data, ensure_ascii=False, indent=2)};"
-    with open(js_path, "w", encoding="utf-8") as f:
-        f.write(js_content)
+    write_questions_js(all_data, os.path.join(output_dir, "questions.js"))
 
     # Additionally write sharded files by Subject x Level
     shards_dir = os.path.join(output_dir, "questions")
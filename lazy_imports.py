@@ -0,0 +1,58 @@
+"""Deferred imports for heavy libraries (pandas, numpy, plotly, ...).
+
+    pd = lazy_import("pandas")
+    px = lazy_import("plotly.express")
+
+returns a module stand-in that imports the real module on first attribute
+access, so a page only pays for pandas or plotly when a code path actually
+uses them (a cold start on Drills, for instance, never imports pandas).
+After the first access the module's namespace is copied onto the stand-in,
+so later lookups cost the same as on the real module. The deferred import
+is charged to the "import" section of a rerun trace (see tracing.py).
+
+Measure the effect with scripts/bench_importtime.py.
+"""
+import importlib
+import sys
+import types
+
+import tracing
+
+
+class LazyModule(types.ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            # import_module (not a sys.modules lookup) so a session thread
+            # waits for another thread's half-finished import of the module
+            with tracing.section("import"):
+                module = importlib.import_module(self.__dict__["_lazy_target"])
+            self.__dict__.update(module.__dict__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        # Only called for names not (yet) copied onto the stand-in
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__dict__['_lazy_target']!r} ({state})>"
+
+
+def _initialized(module):
+    return module is not None and not getattr(getattr(module, "__spec__", None), "_initializing", False)
+
+
+def lazy_import(name):
+    """The module itself if already imported, else a stand-in that imports it on first use."""
+    module = sys.modules.get(name)
+    return module if _initialized(module) else LazyModule(name)
@@ -0,0 +1,185 @@
+"""Lecture -> PDF page alignment for the studying/ course books.
+
+Each syllabus row (講座名 / カテゴリ / サブカテゴリ) from ``studying/*.xlsx`` is
+matched against the per-page text of the paired course PDF. Rows are aligned
+in order: a lecture starts on the first page at/after the previous lecture
+whose text contains its title, and runs until the page before the next
+lecture starts. Titles that never appear verbatim fall back to the page with
+the best character-bigram overlap.
+
+The result is cached as JSON under ``.pdf_store/lectures/`` keyed by the
+SHA-256 of the PDF and the Excel file, so it is only rebuilt when either
+changes.
+
+    python lecture_index.py     # (re)build the index for every course
+"""
+import json
+import os
+import re
+import unicodedata
+
+import pdf_pages
+import pdf_store
+
+CACHE_DIR = os.path.join(pdf_store.STORE_DIR, "lectures")
+INDEX_VERSION = 1
+MIN_FUZZY_SCORE = 0.6
+
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(text):
+    # NFKC folds full-width digits/latin; whitespace differs between Excel and PDF
+    return _SPACE.sub("", unicodedata.normalize("NFKC", str(text or "")))
+
+
+def _bigrams(s):
+    return {s[i:i + 2] for i in range(len(s) - 1)} or {s}
+
+
+def page_texts(pdf_path):
+    return [normalize(t) for t in pdf_pages.page_texts(pdf_path)]
+
+
+def _best_fuzzy_page(title, texts, page_grams):
+    grams = _bigrams(title)
+    best, best_score = None, 0.0
+    for p, pg in enumerate(page_grams):
+        score = len(grams & pg) / len(grams)
+        if score > best_score:
+            best, best_score = p, score
+    return best if best_score >= MIN_FUZZY_SCORE else None
+
+
+def align(titles, texts):
+    """Return a ``[start, end]`` 0-based page range (or None) per title."""
+    n_pages = len(texts)
+    page_grams = None
+    starts = []
+    prev = 0
+    for title in titles:
+        t = normalize(title)
+        hits = [p for p, text in enumerate(texts) if t and t in text]
+        if hits:
+            after = [p for p in hits if p >= prev]
+            start = after[0] if after else hits[0]
+        else:
+            if page_grams is None:
+                page_grams = [_bigrams(text) for text in texts]
+            start = _best_fuzzy_page(t, texts, page_grams) if t else None
+        starts.append(start)
+        if start is not None:
+            prev = start
+
+    ranges = []
+    for i, start in enumerate(starts):
+        if start is None:
+            ranges.append(None)
+            continue
+        nxt = next((s for s in starts[i + 1:] if s is not None and s >= start), None)
+        end = n_pages - 1 if nxt is None else max(start, nxt - 1)
+        ranges.append([start, end])
+    return ranges
+
+
+def _cache_path(pdf_sha, xlsx_sha, root):
+    return os.path.join(root, CACHE_DIR, f"{pdf_sha[:16]}_{xlsx_sha[:16]}.json")
+
+
+def build_index(pdf_path, excel_path, items):
+    """Align syllabus ``items`` (dicts with title/category/subcategory) to pages."""
+    texts = page_texts(pdf_path)
+    ranges = align([it.get("title", "") for it in items], texts)
+    return {
+        "version": INDEX_VERSION,
+        "pdf": os.path.basename(pdf_path),
+        "n_pages": len(texts),
+        "items": [
+            {
+                "title": str(it.get("title", "")),
+                "category": _clean(it.get("category")),
+                "subcategory": _clean(it.get("subcategory")),
+                "pages": r,
+            }
+            for it, r in zip(items, ranges)
+        ],
+    }
+
+
+def _clean(v):
+    # Excel cells come through pandas as NaN when empty
+    if v is None or (isinstance(v, float) and v != v):
+        return ""
+    return str(v)
+
+
+def cached_index(pdf_path, excel_path, root=pdf_store.BASE_DIR):
+    """The stored index for this PDF/Excel pair, or None if missing or outdated."""
+    path = _cache_path(pdf_pages.file_sha(pdf_path), pdf_pages.file_sha(excel_path), root)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            return index
+    except (FileNotFoundError, ValueError):
+        pass
+    return None
+
+
+def load_or_build(pdf_path, excel_path, items, root=pdf_store.BASE_DIR):
+    index = cached_index(pdf_path, excel_path, root)
+    if index is not None:
+        return index
+    pdf_sha = pdf_pages.file_sha(pdf_path)
+    path = _cache_path(pdf_sha, pdf_pages.file_sha(excel_path), root)
+    index = build_index(pdf_path, excel_path, items)
+    index["pdf_sha256"] = pdf_sha
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+    return index
+
+
+def read_syllabus_items(excel_path):
+    # Same parsing as views.syllabus.load_study_materials()
+    import pandas as pd
+
+    df = pd.read_excel(excel_path, header=1)
+    for col in ("カテゴリ", "サブカテゴリ"):
+        if col in df.columns:
+            df[col] = df[col].ffill()
+    items = []
+    for _, row in df.iterrows():
+        if pd.notna(row.get("講座名")):
+            items.append({
+                "category": row.get("カテゴリ", ""),
+                "subcategory": row.get("サブカテゴリ", ""),
+                "title": row["講座名"],
+            })
+    return items
+
+
+def syllabus_pairs(materials_dir=os.path.join(pdf_store.BASE_DIR, "studying")):
+    """(excel_path, pdf_path) for every course spreadsheet with a matching PDF."""
+    pairs = []
+    for filename in sorted(os.listdir(materials_dir)):
+        if not filename.endswith(".xlsx") or filename.startswith("~$"):
+            continue
+        excel_path = os.path.join(materials_dir, filename)
+        pdf_path = excel_path.replace(".xlsx", ".pdf")
+        if os.path.exists(pdf_path):
+            pairs.append((excel_path, pdf_path))
+    return pairs
+
+
+def main():
+    for excel_path, pdf_path in syllabus_pairs():
+        index = load_or_build(pdf_path, excel_path, read_syllabus_items(excel_path))
+        found = sum(1 for it in index["items"] if it["pages"] is not None)
+        print(f"{os.path.basename(excel_path)}: {found}/{len(index['items'])} lectures aligned over {index['n_pages']} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Online per-tag mastery estimates from graded Drills answers.
+
+A one-parameter IRT (Rasch) model fitted online with Elo-style updates:
+
+    P(correct) = sigmoid(ability - difficulty)
+
+where ``ability`` is the mean ability of the question's tags (its subject
+plus its questions.json ``tags``) and ``difficulty`` belongs to the
+question. Each answer moves the tag abilities up and the difficulty down
+by ``K * (correct - P)``, with a step size that shrinks as a tag or
+question collects answers, so a grade costs O(1) whatever the history.
+The Fisher information p(1 - p) gathered per tag gives a standard error,
+reported as a 95% band on the expected accuracy for a question of average
+difficulty.
+
+State lives in numpy arrays indexed by integer codes for question ids
+(``question_id``) and tags, and is saved as one small .npz:
+
+    python mastery.py [--file cpa_data_mastery.npz]   # ability per tag
+"""
+import argparse
+import hashlib
+import math
+import os
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+# Elo step sizes: K = K0 / (1 + n / HALF_LIFE) after n answers
+K_ABILITY = 0.4
+K_DIFFICULTY = 0.3
+HALF_LIFE = 20
+PRIOR_PRECISION = 1.0  # N(0, 1) prior on abilities
+MIN_ANSWERS = 3
+Z95 = 1.96
+MIXED = "Mixed"
+
+
+def sigmoid(x):
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+def question_id(q):
+    """Stable id for a question: its text survives option shuffling and copying."""
+    return hashlib.sha1(str(q.get("q", "")).encode("utf-8")).hexdigest()[:16]
+
+
+def question_tags(q, subject=None):
+    # "Mixed" is a paper, not a skill: fall back to the question's own subject
+    subject = next((s for s in (subject, q.get("subject")) if s and s != MIXED), None)
+    qtags = q.get("tags") or []
+    if isinstance(qtags, str):
+        qtags = [qtags]
+    qtags = [t for t in qtags if isinstance(t, str) and t != MIXED]
+    tags = [subject or ("General" if not qtags else qtags[0])]
+    tags.extend(t for t in qtags if t not in tags)
+    # Vocabulary meaning questions are their own skill
+    if q.get("type") == "vocab":
+        tags.append("vocab")
+    return tags
+
+
+def _grow(arr, size):
+    if size <= len(arr):
+        return arr
+    out = np.zeros(max(size, 2 * len(arr), 16), dtype=arr.dtype)
+    out[:len(arr)] = arr
+    return out
+
+
+class MasteryModel:
+    def __init__(self):
+        self.question_codes = {}
+        self.tag_codes = {}
+        self.difficulty = np.zeros(0, dtype=np.float32)
+        self.q_answers = np.zeros(0, dtype=np.int32)
+        self.ability = np.zeros(0, dtype=np.float32)
+        self.info = np.zeros(0, dtype=np.float32)
+        self.t_answers = np.zeros(0, dtype=np.int32)
+        self.t_correct = np.zeros(0, dtype=np.int32)
+
+    def question_code(self, qid):
+        code = self.question_codes.get(qid)
+        if code is None:
+            code = self.question_codes[qid] = len(self.question_codes)
+            self.difficulty = _grow(self.difficulty, code + 1)
+            self.q_answers = _grow(self.q_answers, code + 1)
+        return code
+
+    def tag_code(self, tag):
+        code = self.tag_codes.get(tag)
+        if code is None:
+            code = self.tag_codes[tag] = len(self.tag_codes)
+            self.ability = _grow(self.ability, code + 1)
+            self.info = _grow(self.info, code + 1)
+            self.t_answers = _grow(self.t_answers, code + 1)
+            self.t_correct = _grow(self.t_correct, code + 1)
+        return code
+
+    def tag_ability(self, tags):
+        codes = [self.tag_codes[t] for t in tags if t in self.tag_codes]
+        return sum(float(self.ability[c]) for c in codes) / len(codes) if codes else 0.0
+
+    def question_difficulty(self, qid):
+        code = self.question_codes.get(qid)
+        return float(self.difficulty[code]) if code is not None else 0.0
+
+    def predict(self, qid, tags):
+        """P(correct) for question ``qid`` carrying ``tags``."""
+        return sigmoid(self.tag_ability(tags) - self.question_difficulty(qid))
+
+    def update(self, qid, tags, correct):
+        """Fold in one graded answer; returns the prediction made before it."""
+        q = self.question_code(qid)
+        codes = [self.tag_code(t) for t in tags]
+        p = self.predict(qid, tags)
+        err = (1.0 if correct else 0.0) - p
+        for c in codes:
+            k = K_ABILITY / (1 + self.t_answers[c] / HALF_LIFE)
+            self.ability[c] += k * err / len(codes)
+            self.info[c] += p * (1 - p)
+            self.t_answers[c] += 1
+            self.t_correct[c] += 1 if correct else 0
+        self.difficulty[q] -= K_DIFFICULTY / (1 + self.q_answers[q] / HALF_LIFE) * err
+        self.q_answers[q] += 1
+        return p
+
+    def record(self, q, subject, correct):
+        return self.update(question_id(q), question_tags(q, subject), correct)
+
+    def tag_stats(self, min_answers=1):
+        """Per tag, weakest first: ability, standard error, expected accuracy and its 95% band."""
+        out = []
+        for tag, c in self.tag_codes.items():
+            n = int(self.t_answers[c])
+            if n < min_answers or tag == MIXED:
+                continue
+            theta = float(self.ability[c])
+            se = 1.0 / math.sqrt(PRIOR_PRECISION + float(self.info[c]))
+            out.append({
+                "tag": tag, "answers": n, "correct": int(self.t_correct[c]),
+                "ability": theta, "se": se,
+                "accuracy": sigmoid(theta), "low": sigmoid(theta - Z95 * se), "high": sigmoid(theta + Z95 * se),
+            })
+        out.sort(key=lambda s: s["ability"])
+        return out
+
+    def weakest(self, k=3, min_answers=MIN_ANSWERS):
+        return self.tag_stats(min_answers)[:k]
+
+    # ---- persistence ----
+
+    def save(self, path):
+        nq, nt = len(self.question_codes), len(self.tag_codes)
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(
+            tmp,
+            question_ids=np.array(list(self.question_codes), dtype=str),
+            tags=np.array(list(self.tag_codes), dtype=str),
+            difficulty=self.difficulty[:nq], q_answers=self.q_answers[:nq],
+            ability=self.ability[:nt], info=self.info[:nt],
+            t_answers=self.t_answers[:nt], t_correct=self.t_correct[:nt],
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        model = cls()
+        try:
+            with np.load(path, allow_pickle=False) as z:
+                model.question_codes = {str(qid): i for i, qid in enumerate(z["question_ids"])}
+                model.tag_codes = {str(t): i for i, t in enumerate(z["tags"])}
+                model.difficulty = z["difficulty"].astype(np.float32)
+                model.q_answers = z["q_answers"].astype(np.int32)
+                model.ability = z["ability"].astype(np.float32)
+                model.info = z["info"].astype(np.float32)
+                model.t_answers = z["t_answers"].astype(np.int32)
+                model.t_correct = z["t_correct"].astype(np.int32)
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return cls()
+        return model
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Estimated ability per tag, weakest first")
+    ap.add_argument("--file", default="cpa_data_mastery.npz")
+    ap.add_argument("--min-answers", type=int, default=1)
+    args = ap.parse_args()
+
+    model = MasteryModel.load(args.file)
+    print(f"{len(model.question_codes)} questions, {len(model.tag_codes)} tags from {args.file}")
+    for s in model.tag_stats(args.min_answers):
+        print(f"  {s['tag']:<24} n={s['answers']:<5} ability {s['ability']:+.2f} ± {Z95 * s['se']:.2f}  "
+              f"accuracy {s['accuracy']:.0%} ({s['low']:.0%}–{s['high']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Opt-in per-session memory accounting.
+
+    CPA_MEMORY=1 streamlit run app.py
+    CPA_MEMORY=1 CPA_TRACEMALLOC=1 CPA_SESSION_BUDGET_MB=32 streamlit run app.py
+
+With ``CPA_MEMORY`` set, every rerun sizes the session state key by key
+(``deep_sizeof``: containers are walked, numpy arrays count ``nbytes``
+(a view counts its base once),
+DataFrames ``memory_usage(deep=True)``, uploads their buffer), diffs the
+result against the session's previous rerun and shows it in a collapsible
+sidebar panel, which can also size the process-wide caches (asset registry
+values, ``st.cache_data`` and ``st.cache_resource``). A session above
+``CPA_SESSION_BUDGET_MB`` (default 64) gets a sidebar warning and a line on
+stderr.
+
+Objects reachable from the asset registry or the built-in question bank are
+shared by every session, so they are not charged to the session holding a
+reference (Survival's ``all_questions`` copies are charged for the copied
+dicts only, not for the question text).
+
+``CPA_TRACEMALLOC=1`` additionally keeps a tracemalloc snapshot per session
+and lists the source lines whose allocations grew most since that session's
+previous rerun. tracemalloc is process-wide, so with several sessions
+active the lines include other sessions' allocations.
+
+    python scripts/soak_memory.py --sessions 20 --rounds 3   # all pages, many sessions
+"""
+import io
+import os
+import sys
+import threading
+import types
+import uuid
+
+ENABLED = os.environ.get("CPA_MEMORY", "") not in ("", "0")
+TRACEMALLOC = ENABLED and os.environ.get("CPA_TRACEMALLOC", "") not in ("", "0")
+BUDGET_BYTES = int(float(os.environ.get("CPA_SESSION_BUDGET_MB", "64")) * 1024 * 1024)
+PREV_KEY = "_mem_prev"
+MAX_OBJECTS = 2_000_000
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+_lock = threading.Lock()
+_shared = {"stamp": None, "ids": frozenset()}
+_snapshots = {}
+
+if TRACEMALLOC:
+    import tracemalloc
+    tracemalloc.start()
+
+
+def _own_size(obj):
+    """Bytes held by ``obj`` itself, not counting objects it refers to."""
+    mod = type(obj).__module__
+    if mod.startswith("numpy") and hasattr(obj, "nbytes"):
+        # Views share their base's buffer, which is charged as a child (once)
+        return sys.getsizeof(obj) if getattr(obj, "base", None) is not None else int(obj.nbytes)
+    if mod.startswith("pandas") and hasattr(obj, "memory_usage"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(obj, io.BytesIO):
+        with obj.getbuffer() as buf:
+            return sys.getsizeof(obj) + buf.nbytes
+    try:
+        return sys.getsizeof(obj)
+    except TypeError:
+        return 0
+
+
+def _children(obj):
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None), io.BytesIO)):
+        return ()
+    mod = type(obj).__module__
+    if mod.startswith(("numpy", "pandas")):
+        # Sized as a whole above; object arrays are rare in session state.
+        # A view's buffer lives in its base (arrays loaded from .npz are views)
+        base = getattr(obj, "base", None) if mod.startswith("numpy") else None
+        return (base,) if base is not None else ()
+    if isinstance(obj, dict):
+        return [x for kv in obj.items() for x in kv]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+    out = []
+    d = getattr(obj, "__dict__", None)
+    if isinstance(d, dict):
+        out.append(d)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if isinstance(slot, str) and slot != "__dict__" and hasattr(obj, slot):
+            out.append(getattr(obj, slot))
+    return out
+
+
+def deep_sizeof(obj, seen=None, shared=frozenset()):
+    """Approximate bytes reachable from ``obj``.
+
+    Objects whose id is in ``seen`` (updated in place) or ``shared`` are
+    skipped, so sizing several roots with one ``seen`` set counts objects
+    they share only once.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack and len(seen) < MAX_OBJECTS:
+        o = stack.pop()
+        oid = id(o)
+        if oid in seen or oid in shared or isinstance(o, _SKIP_TYPES):
+            continue
+        seen.add(oid)
+        total += _own_size(o)
+        stack.extend(_children(o))
+    return total
+
+
+def _reachable_ids(roots):
+    seen = set()
+    stack = list(roots)
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, _SKIP_TYPES):
+            continue
+        seen.add(id(o))
+        stack.extend(_children(o))
+    return seen
+
+
+def shared_ids():
+    """Ids of objects every session shares (asset registry values, built-in questions).
+
+    Recomputed only when an asset was (re)loaded since the last call.
+    """
+    from asset_registry import registry
+    import question_bank
+
+    values = [registry.get(name) for name in registry.names()]
+    stamp = tuple(sorted(registry.loads.items()))
+    with _lock:
+        if _shared["stamp"] != stamp:
+            _shared["ids"] = frozenset(_reachable_ids(values + [question_bank.STATIC_QUESTIONS]))
+            _shared["stamp"] = stamp
+        return _shared["ids"]
+
+
+def session_report(state, shared=None):
+    """Bytes per session-state key (largest first), shared objects excluded."""
+    shared = shared_ids() if shared is None else shared
+    seen = set()
+    sizes = {}
+    for key in list(state.keys()):
+        if str(key).startswith("_mem"):
+            continue
+        try:
+            value = state[key]
+        except KeyError:
+            continue
+        sizes[str(key)] = deep_sizeof(value, seen, shared)
+    return dict(sorted(sizes.items(), key=lambda kv: -kv[1]))
+
+
+def cache_report():
+    """Bytes per process-wide cache: asset registry entries, figure cache and Streamlit caches."""
+    import figure_cache
+    from asset_registry import registry
+
+    out = {}
+    for name in registry.names():
+        out[f"asset:{name}"] = deep_sizeof(registry.get(name))
+    out["figure_cache"] = figure_cache.cache.nbytes()
+    try:
+        from streamlit.runtime.caching.cache_data_api import get_data_cache_stats_provider
+        from streamlit.runtime.caching.cache_resource_api import get_resource_cache_stats_provider
+    except ImportError:
+        return out
+    for kind, provider in (("cache_data", get_data_cache_stats_provider()), ("cache_resource", get_resource_cache_stats_provider())):
+        try:
+            stats = provider.get_stats()
+        except Exception:
+            continue
+        if isinstance(stats, dict):
+            stats = [s for group in stats.values() for s in group]
+        for s in stats:
+            key = f"{kind}:{s.cache_name.rsplit('.', 1)[-1]}"
+            out[key] = out.get(key, 0) + s.byte_length
+    return dict(sorted(out.items(), key=lambda kv: -kv[1]))
+
+
+def diff(prev, cur):
+    """Per-key change in bytes between two ``session_report`` results (non-zero only)."""
+    keys = set(prev) | set(cur)
+    changes = {k: cur.get(k, 0) - prev.get(k, 0) for k in keys}
+    return dict(sorted(((k, v) for k, v in changes.items() if v), key=lambda kv: -abs(kv[1])))
+
+
+def _tracemalloc_top(session, limit=10):
+    import tracemalloc
+
+    snap = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    with _lock:
+        prev = _snapshots.get(session)
+        _snapshots[session] = snap
+    if prev is None:
+        return []
+    stats = snap.compare_to(prev, "lineno")
+    return [{"line": str(s.traceback[0]), "size_diff": s.size_diff, "count_diff": s.count_diff}
+            for s in stats[:limit] if s.size_diff > 0]
+
+
+def measure(state, session=None):
+    """Size this session, diff it against its previous rerun and remember it."""
+    session = session or state.setdefault("_mem_session", uuid.uuid4().hex[:8])
+    keys = session_report(state)
+    total = sum(keys.values())
+    prev = state.get(PREV_KEY) or {}
+    report = {
+        "session": session,
+        "total_bytes": total,
+        "keys": keys,
+        "diff": diff(prev.get("keys", {}), keys),
+        "total_diff": total - prev.get("total_bytes", total),
+        "over_budget": total > BUDGET_BYTES,
+        "reruns": prev.get("reruns", 0) + 1,
+    }
+    if TRACEMALLOC:
+        report["tracemalloc"] = _tracemalloc_top(session)
+    state[PREV_KEY] = {"total_bytes": total, "keys": keys, "reruns": report["reruns"]}
+    if report["over_budget"]:
+        print(f"[memory] session {session} holds {fmt_bytes(total)} (budget {fmt_bytes(BUDGET_BYTES)})", file=sys.stderr)
+    return report
+
+
+def fmt_bytes(n):
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{sign}{n:.0f} {unit}" if unit == "B" else f"{sign}{n:.1f} {unit}"
+        n /= 1024
+    return f"{sign}{n:.2f} GB"
+
+
+def render_panel(st, report):
+    """Collapsible sidebar breakdown of the session's memory, with a budget warning."""
+    if report["over_budget"]:
+        st.sidebar.warning(f"This session holds {fmt_bytes(report['total_bytes'])}, over the {fmt_bytes(BUDGET_BYTES)} budget.")
+    with st.sidebar.expander(f"🧠 Session memory ({fmt_bytes(report['total_bytes'])}, {report['total_diff']:+,} B)"):
+        st.table([{"key": k, "size": fmt_bytes(v), "Δ": fmt_bytes(report["diff"].get(k, 0))} for k, v in list(report["keys"].items())[:15]])
+        if st.checkbox("Process-wide caches", key="_mem_caches"):
+            st.table([{"cache": k, "size": fmt_bytes(v)} for k, v in cache_report().items()])
+        if report.get("tracemalloc"):
+            st.caption("Allocation growth since last rerun (tracemalloc, whole process)")
+            st.table([{"line": t["line"], "size": fmt_bytes(t["size_diff"]), "blocks": t["count_diff"]} for t in report["tracemalloc"]])
@@ -0,0 +1,217 @@
+"""短答式 pass probability from the user's own Drills / Exam Mode scores.
+
+Scores (``data["scores"]``: subject, date, val in %) are modelled on the
+logit scale per subject. Sufficient statistics are folded in as scores
+arrive and kept in ``data["pass_stats"]`` (like study_rollups, ``stats``
+catches up on scores appended since the last call and rebuilds only if
+scores were removed or the last one folded in changed, see fingerprints.py):
+
+    subjects  {subject: [n, mean, M2]}           Welford, logit of val
+    days      {date: {subject: [sum, n]}}        same-day means per subject
+    pairs     {"a|b": [n, sa, sb, saa, sbb, sab]} over days with both subjects
+
+``fit`` turns them into a posterior for each subject's mean (shrunk towards
+the pooled mean, "Mixed" / "Total" scores included), a per-exam spread and
+a correlation matrix (same-day co-movement, shrunk towards ``PRIOR_RHO``).
+``simulate`` then draws ``n_params`` parameter sets and ``n_exams``
+correlated exams for each in one vectorized batch (samplers.py), applies
+the 500-point weighting, the 40% per-subject cutoff and a border drawn from
+the R4-R8 table, and reports P(pass) with a 95% interval over the
+parameter draws. It assumes practice scores are representative of exam day.
+"""
+import math
+
+import fingerprints
+import samplers
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+VERSION = 2
+# Subject: (name on the exam, points out of 500)
+SUBJECTS = {
+    "Company": ("企業法", 100),
+    "Management": ("管理会計論", 100),
+    "Audit": ("監査論", 100),
+    "Financial": ("財務会計論", 200),
+}
+POOLED = ("Mixed", "Total")
+TOTAL_POINTS = 500
+CUTOFF = 0.40
+# 短答式 borders (% of 500), R4-R8 reference values
+BORDERS = (
+    ("R4 (2022)", "I (Dec)", 68.0),
+    ("R4 (2022)", "II (May)", 73.0),
+    ("R5 (2023)", "I (Dec)", 71.0),
+    ("R5 (2023)", "II (May)", 70.2),
+    ("R6 (2024)", "I (Dec)", 68.0),
+    ("R6 (2024)", "II (May)", 78.0),
+    ("R7 (2025)", "I (Dec)", 70.4),
+    ("R7 (2025)", "II (May)", 74.0),
+    ("R8 (2026)", "I (Dec)", 72.0),
+)
+
+CLIP = 0.01
+PRIOR_MEAN = 0.0  # logit 50% when there are no scores at all
+PRIOR_STRENGTH = 1.0  # pseudo-scores behind the pooled mean
+PRIOR_SD = 0.6
+PRIOR_SD_WEIGHT = 3.0
+PRIOR_RHO = 0.5
+RHO_WEIGHT = 5.0
+N_PARAMS = 400
+N_EXAMS = 1000
+
+
+def logit(val):
+    p = min(max(float(val) / 100.0, CLIP), 1.0 - CLIP)
+    return math.log(p / (1.0 - p))
+
+
+def empty():
+    return {"version": VERSION, "count": 0, "last": None, "subjects": {}, "days": {}, "pairs": {}}
+
+
+def _pair_key(a, b):
+    return f"{a}|{b}" if a < b else f"{b}|{a}"
+
+
+def _pair_add(pairs, a, xa, b, xb, sign):
+    if a > b:
+        a, xa, b, xb = b, xb, a, xa
+    s = pairs.setdefault(_pair_key(a, b), [0, 0.0, 0.0, 0.0, 0.0, 0.0])
+    s[0] += sign
+    s[1] += sign * xa
+    s[2] += sign * xb
+    s[3] += sign * xa * xa
+    s[4] += sign * xb * xb
+    s[5] += sign * xa * xb
+
+
+def _fold(st, score):
+    subject = score.get("subject")
+    st["count"] += 1
+    try:
+        x = logit(score.get("val"))
+    except (TypeError, ValueError):
+        return
+    if subject not in SUBJECTS and subject not in POOLED:
+        return
+    n, mean, m2 = st["subjects"].get(subject, [0, 0.0, 0.0])
+    n += 1
+    delta = x - mean
+    mean += delta / n
+    m2 += delta * (x - mean)
+    st["subjects"][subject] = [n, mean, m2]
+    day = str(score.get("date", ""))[:10]
+    if subject not in SUBJECTS or not day:
+        return
+    bucket = st["days"].setdefault(day, {})
+    old = bucket.get(subject)
+    total, k = old if old else (0.0, 0)
+    bucket[subject] = [total + x, k + 1]
+    # Swap this subject's day mean in every pair it forms that day
+    for other, (o_total, o_k) in bucket.items():
+        if other == subject:
+            continue
+        if old:
+            _pair_add(st["pairs"], subject, old[0] / old[1], other, o_total / o_k, -1)
+        _pair_add(st["pairs"], subject, (total + x) / (k + 1), other, o_total / o_k, +1)
+
+
+def rebuild(data):
+    st = empty()
+    scores = data.get("scores", [])
+    for score in scores:
+        _fold(st, score)
+    st["last"] = fingerprints.fingerprint(scores[-1]) if scores else None
+    data["pass_stats"] = st
+    return st
+
+
+def stats(data):
+    """``data["pass_stats"]``, brought up to date with ``data["scores"]``."""
+    st = data.get("pass_stats")
+    scores = data.setdefault("scores", [])
+    if not isinstance(st, dict) or st.get("version") != VERSION or fingerprints.stale(st, scores):
+        return rebuild(data)
+    if st["count"] < len(scores):
+        for score in scores[st["count"]:]:
+            _fold(st, score)
+        st["last"] = fingerprints.fingerprint(scores[-1])
+    return st
+
+
+def fit(st):
+    """Per subject (SUBJECTS order): posterior mean / sd of the logit mean, exam spread, n; and the correlation matrix."""
+    names = list(SUBJECTS)
+    subj = st["subjects"]
+    counted = [v for v in subj.values() if v[0] > 0]
+    total_n = sum(v[0] for v in counted)
+    pooled = sum(v[0] * v[1] for v in counted) / total_n if total_n else PRIOR_MEAN
+    rows = []
+    for name in names:
+        n, mean, m2 = subj.get(name, [0, 0.0, 0.0])
+        spread = math.sqrt((m2 + PRIOR_SD_WEIGHT * PRIOR_SD ** 2) / (max(n - 1, 0) + PRIOR_SD_WEIGHT))
+        post_n = n + PRIOR_STRENGTH
+        rows.append({
+            "subject": name, "n": n,
+            "mean": (n * mean + PRIOR_STRENGTH * pooled) / post_n,
+            "mean_sd": spread / math.sqrt(post_n),
+            "spread": spread,
+        })
+    corr = np.eye(len(names))
+    for i, a in enumerate(names):
+        for j in range(i + 1, len(names)):
+            s = st["pairs"].get(_pair_key(a, names[j]))
+            r, k = 0.0, 0
+            if s and s[0] >= 3:
+                k = s[0]
+                va = s[3] - s[1] ** 2 / k
+                vb = s[4] - s[2] ** 2 / k
+                if va > 1e-12 and vb > 1e-12:
+                    r = (s[5] - s[1] * s[2] / k) / math.sqrt(va * vb)
+                else:
+                    k = 0
+            corr[i, j] = corr[j, i] = (k * r + RHO_WEIGHT * PRIOR_RHO) / (k + RHO_WEIGHT)
+    # Nearest valid correlation matrix (clip eigenvalues, renormalize)
+    w, v = np.linalg.eigh(corr)
+    corr = (v * np.maximum(w, 1e-6)) @ v.T
+    d = np.sqrt(np.diag(corr))
+    return rows, corr / np.outer(d, d)
+
+
+def simulate(rows, corr, n_params=N_PARAMS, n_exams=N_EXAMS, seed=None, sampler="plain", borders=BORDERS):
+    """P(pass) over parameter uncertainty and exam-day noise; returns a summary dict."""
+    rng = np.random.default_rng(seed)
+    draw = samplers.get(sampler).draw
+    k = len(rows)
+    mean = np.array([r["mean"] for r in rows])[:, None, None]
+    mean_sd = np.array([r["mean_sd"] for r in rows])[:, None, None]
+    spread = np.array([r["spread"] for r in rows])[:, None, None]
+    weights = np.array([SUBJECTS[r["subject"]][1] for r in rows], dtype=float)[:, None, None]
+    chol = np.linalg.cholesky(corr)
+    # Parameter draws: correlated too, since subject means move together
+    z_param, _ = draw(rng, n_params, k)
+    mu = mean + mean_sd * (chol @ z_param)[:, :, None]
+    z_exam, u = draw(rng, n_params * n_exams, k, 1)
+    eps = (chol @ z_exam).reshape(k, n_params, n_exams)
+    pct = 1.0 / (1.0 + np.exp(-(mu + spread * eps)))
+    total = (weights * pct).sum(axis=0) / TOTAL_POINTS
+    border_values = np.array([b[2] for b in borders]) / 100.0
+    border = border_values[np.minimum((u[0] * len(border_values)).astype(int), len(border_values) - 1)]
+    border = border.reshape(n_params, n_exams)
+    cut = (pct < CUTOFF).any(axis=0)
+    passed = (total >= border) & ~cut
+    per_param = passed.mean(axis=1)
+    p = float(per_param.mean())
+    lo, hi = np.percentile(per_param, [2.5, 97.5])
+    return {
+        "p_pass": p,
+        "low": float(lo), "high": float(hi),
+        "mc_se": float(per_param.std(ddof=1) / math.sqrt(n_params)),
+        "p_cutoff": float(cut.mean()),
+        "p_below_border": float(((total < border) & ~cut).mean()),
+        "total_median": float(np.median(total)),
+        "subject_median": {r["subject"]: float(np.median(pct[i])) for i, r in enumerate(rows)},
+        "draws": n_params * n_exams,
+    }
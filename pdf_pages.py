@@ -0,0 +1,179 @@
+"""Page-range extraction and per-page text for PDF previews.
+
+Previews no longer ship whole course books: ``page_range_bytes`` cuts the
+requested pages into a small standalone PDF with pypdf. Slices are kept in
+an LRU disk cache under ``.pdf_store/pages/`` keyed by (file hash, page
+range, hashed); the least recently used slices are evicted once the cache grows
+past ``MAX_CACHE_BYTES``.
+
+``page_texts`` is the matching text store (one JSON per file hash under
+``.pdf_store/text/``) used by lecture alignment and PDF search.
+"""
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+
+import pdf_store
+
+PAGES_DIR = os.path.join(pdf_store.STORE_DIR, "pages")
+TEXT_DIR = os.path.join(pdf_store.STORE_DIR, "text")
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Whitespace and control characters (pypdf emits \x07 etc. between glyph runs)
+_SKIP = re.compile(r"[\s\x00-\x1f]+")
+
+_lock = threading.Lock()
+# (path, size, mtime) -> sha256, so repeated previews don't rehash the file
+_sha_memo = {}
+
+
+def file_sha(path):
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime)
+    sha = _sha_memo.get(key)
+    if sha is None:
+        sha = _sha_memo[key] = pdf_store.sha256_file(path)
+    return sha
+
+
+def parse_ranges(spec, n_pages):
+    """Parse "1-3, 5" (1-based, inclusive) into clamped 0-based (start, end) tuples."""
+    ranges = []
+    for part in re.split(r"[,\s]+", str(spec or "").strip()):
+        if not part:
+            continue
+        m = re.fullmatch(r"(\d+)(?:-(\d*))?", part)
+        if not m:
+            raise ValueError(f"Invalid page range: {part}")
+        a = int(m.group(1))
+        b = a if m.group(2) is None else int(m.group(2) or n_pages)
+        a, b = max(1, min(a, b)), min(n_pages, max(a, b))
+        if a <= b:
+            ranges.append((a - 1, b - 1))
+    return ranges
+
+
+def page_count(path):
+    import pypdf
+
+    return len(pypdf.PdfReader(path).pages)
+
+
+def _slice(path, ranges):
+    import pypdf
+
+    reader = pypdf.PdfReader(path)
+    writer = pypdf.PdfWriter()
+    last = len(reader.pages) - 1
+    for start, end in ranges:
+        for p in range(max(0, start), min(end, last) + 1):
+            writer.add_page(reader.pages[p])
+    try:
+        writer.compress_identical_objects(remove_duplicates=True, remove_unreferenced=True)
+    except TypeError:
+        writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def _evict(cache_dir, budget):
+    entries = []
+    for name in os.listdir(cache_dir):
+        full = os.path.join(cache_dir, name)
+        try:
+            st = os.stat(full)
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, full))
+    total = sum(e[1] for e in entries)
+    for _, size, full in sorted(entries):
+        if total <= budget:
+            break
+        try:
+            os.remove(full)
+            total -= size
+        except FileNotFoundError:
+            pass
+
+
+def page_range_bytes(path, ranges, root=pdf_store.BASE_DIR, budget=MAX_CACHE_BYTES):
+    """Standalone PDF bytes for ``ranges`` ([(start, end), ...], 0-based inclusive).
+
+    A single ``(start, end)`` tuple is accepted too.
+    """
+    if ranges and isinstance(ranges[0], int):
+        ranges = [tuple(ranges)]
+    # Hashed so a long list of ranges can't exceed the filename limit
+    key = hashlib.sha1(",".join(f"{s}-{e}" for s, e in ranges).encode("ascii")).hexdigest()[:16]
+    cache_dir = os.path.join(root, PAGES_DIR)
+    cached = os.path.join(cache_dir, f"{file_sha(path)[:24]}_{key}.pdf")
+    try:
+        with open(cached, "rb") as f:
+            data = f.read()
+        os.utime(cached)  # mark as recently used
+        return data
+    except FileNotFoundError:
+        pass
+    data = _slice(path, ranges)
+    with _lock:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{cached}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, cached)
+        _evict(cache_dir, budget)
+    return data
+
+
+def text_cache_path(sha, root=pdf_store.BASE_DIR):
+    return os.path.join(root, TEXT_DIR, f"{sha[:24]}.json")
+
+
+def page_texts(path, root=pdf_store.BASE_DIR):
+    """Extracted text of every page, cached on disk by file hash."""
+    cached = text_cache_path(file_sha(path), root)
+    try:
+        with open(cached, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+    import pypdf
+
+    texts = []
+    for page in pypdf.PdfReader(path).pages:
+        try:
+            texts.append(page.extract_text() or "")
+        except Exception:
+            texts.append("")
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    tmp = f"{cached}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(texts, f, ensure_ascii=False)
+    os.replace(tmp, cached)
+    return texts
+
+
+def search(paths, query, limit=50, context=40):
+    """Find ``query`` in the page text of ``paths``.
+
+    Returns ``[{"path", "page", "snippet"}, ...]`` with 0-based page numbers.
+    """
+    q = _SKIP.sub("", query or "")
+    if not q:
+        return []
+    hits = []
+    for path in paths:
+        for p, text in enumerate(page_texts(path)):
+            flat = _SKIP.sub("", text)
+            i = flat.find(q)
+            if i < 0:
+                continue
+            snippet = flat[max(0, i - context):i + len(q) + context]
+            hits.append({"path": path, "page": p, "snippet": snippet})
+            if len(hits) >= limit:
+                return hits
+    return hits
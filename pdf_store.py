@@ -0,0 +1,236 @@
+"""Content-addressed store for the EXAM/ and studying/ PDF archive.
+
+Every PDF is hashed (SHA-256); byte-identical files collapse into one blob
+with several aliases (e.g. ``EXAM/01.pdf`` and ``EXAM/01 (2).pdf``).
+Hashes are cached in ``.pdf_store/manifest.json`` and only recomputed when
+a file's size or mtime changes, so listing the archive on a rerun is a
+handful of ``stat`` calls.
+
+Optionally each blob is rewritten with pypdf (content-stream compression and
+identical-object dedup) into ``.pdf_store/blobs/<sha256>.pdf``; the smaller of
+the original and the rewrite is what gets previewed/downloaded.
+
+    python pdf_store.py               # hash + manifest only
+    python pdf_store.py --compress    # also write compressed blobs
+    python pdf_store.py --link-duplicates   # hard-link duplicate files on disk
+"""
+import argparse
+import hashlib
+import json
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_DIR = ".pdf_store"
+MANIFEST_FILE = "manifest.json"
+ARCHIVE_DIRS = ("EXAM", "studying")
+
+
+def sha256_file(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _iter_pdfs(root, dirs):
+    for d in dirs:
+        top = os.path.join(root, d)
+        if not os.path.isdir(top):
+            continue
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.lower().endswith(".pdf") and not name.startswith("~$"):
+                    full = os.path.join(dirpath, name)
+                    yield os.path.relpath(full, root).replace(os.sep, "/"), full
+
+
+def manifest_path(root=BASE_DIR):
+    return os.path.join(root, STORE_DIR, MANIFEST_FILE)
+
+
+def load_manifest(root=BASE_DIR):
+    try:
+        with open(manifest_path(root), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"files": {}, "blobs": {}}
+
+
+def save_manifest(manifest, root=BASE_DIR):
+    os.makedirs(os.path.join(root, STORE_DIR), exist_ok=True)
+    tmp = manifest_path(root) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, manifest_path(root))
+
+
+def signature(root=BASE_DIR, dirs=ARCHIVE_DIRS):
+    """(path, size, mtime_ns) of every PDF: changes when one is added, removed or replaced in place."""
+    out = []
+    for rel, full in _iter_pdfs(root, dirs):
+        st = os.stat(full)
+        out.append((rel, st.st_size, st.st_mtime_ns))
+    return tuple(out)
+
+
+def scan(root=BASE_DIR, dirs=ARCHIVE_DIRS, previous=None):
+    """Hash every PDF under ``dirs`` and group them by content.
+
+    Entries of ``previous`` whose (size, mtime) still match are reused
+    without re-reading the file.
+    """
+    previous = previous or {"files": {}, "blobs": {}}
+    old_files = previous.get("files", {})
+    old_blobs = previous.get("blobs", {})
+    files = {}
+    blobs = {}
+    for rel, full in _iter_pdfs(root, dirs):
+        st = os.stat(full)
+        old = old_files.get(rel)
+        if old and old.get("size") == st.st_size and old.get("mtime") == st.st_mtime:
+            digest = old["sha256"]
+        else:
+            digest = sha256_file(full)
+        files[rel] = {"sha256": digest, "size": st.st_size, "mtime": st.st_mtime}
+        blob = blobs.get(digest)
+        if blob is None:
+            blob = dict(old_blobs.get(digest, {}))
+            blob.update({"size": st.st_size, "aliases": []})
+            blob.setdefault("compressed", None)
+            blob.setdefault("compressed_size", None)
+            blobs[digest] = blob
+        blob["aliases"].append(rel)
+    for blob in blobs.values():
+        # Shortest name is the canonical one: "01.pdf" over "01 (2).pdf"
+        blob["aliases"].sort(key=lambda a: (len(a), a))
+        blob["canonical"] = blob["aliases"][0]
+    return {"files": files, "blobs": blobs}
+
+
+def refresh(root=BASE_DIR, dirs=ARCHIVE_DIRS):
+    """Load the manifest, rescan changed files and persist it if anything moved."""
+    manifest = load_manifest(root)
+    fresh = scan(root, dirs, manifest)
+    if fresh != manifest:
+        save_manifest(fresh, root)
+    return fresh
+
+
+def compress_pdf(src, dst):
+    """Rewrite ``src`` with compressed content streams and deduplicated objects."""
+    import pypdf
+
+    writer = pypdf.PdfWriter(clone_from=src)
+    for page in writer.pages:
+        page.compress_content_streams()
+    try:
+        writer.compress_identical_objects(remove_duplicates=True, remove_unreferenced=True)
+    except TypeError:
+        # pypdf < 6 spells the flags differently
+        writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+    tmp = dst + ".tmp"
+    with open(tmp, "wb") as f:
+        writer.write(f)
+    os.replace(tmp, dst)
+    return os.path.getsize(dst)
+
+
+def compress_blobs(manifest, root=BASE_DIR):
+    blob_dir = os.path.join(root, STORE_DIR, "blobs")
+    os.makedirs(blob_dir, exist_ok=True)
+    for digest, blob in manifest["blobs"].items():
+        rel = f"{STORE_DIR}/blobs/{digest}.pdf"
+        dst = os.path.join(root, rel)
+        if blob.get("compressed") == rel and os.path.exists(dst):
+            continue
+        try:
+            size = compress_pdf(os.path.join(root, blob["canonical"]), dst)
+        except Exception as e:
+            print(f"Error compressing {blob['canonical']}: {e}")
+            continue
+        if size < blob["size"]:
+            blob["compressed"], blob["compressed_size"] = rel, size
+        else:
+            os.remove(dst)
+            blob["compressed"], blob["compressed_size"] = None, None
+    return manifest
+
+
+def link_duplicates(manifest, root=BASE_DIR):
+    """Replace duplicate alias files with hard links to the canonical file."""
+    saved = 0
+    for blob in manifest["blobs"].values():
+        src = os.path.join(root, blob["canonical"])
+        for alias in blob["aliases"][1:]:
+            dst = os.path.join(root, alias)
+            if os.path.samefile(src, dst):
+                continue
+            tmp = dst + ".lnk"
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+            saved += blob["size"]
+    return saved
+
+
+def blob_path(manifest, rel, root=BASE_DIR):
+    """Path of the smallest stored copy of ``rel`` (compressed blob if any).
+
+    ``rel`` may also be an absolute path inside ``root``.
+    """
+    if os.path.isabs(rel):
+        rel = os.path.relpath(rel, root).replace(os.sep, "/")
+    entry = manifest["files"].get(rel)
+    if entry is None:
+        return os.path.join(root, rel)
+    blob = manifest["blobs"][entry["sha256"]]
+    if blob.get("compressed") and os.path.exists(os.path.join(root, blob["compressed"])):
+        return os.path.join(root, blob["compressed"])
+    return os.path.join(root, blob["canonical"])
+
+
+def documents(manifest, prefix=""):
+    """Logical documents (one per blob) with at least one alias under ``prefix``."""
+    docs = []
+    for digest, blob in manifest["blobs"].items():
+        aliases = [a for a in blob["aliases"] if a.startswith(prefix)]
+        if not aliases:
+            continue
+        docs.append({
+            "sha256": digest,
+            "name": aliases[0][len(prefix):],
+            "aliases": [a[len(prefix):] for a in aliases],
+            "path": aliases[0],
+            "size": blob["size"],
+            "stored_size": blob.get("compressed_size") or blob["size"],
+        })
+    return sorted(docs, key=lambda d: d["name"])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Hash, dedupe and optionally compress the PDF archive")
+    ap.add_argument("--compress", action="store_true", help="write pypdf-compressed blobs to .pdf_store/blobs")
+    ap.add_argument("--link-duplicates", action="store_true", help="hard-link byte-identical files on disk")
+    args = ap.parse_args()
+
+    manifest = scan(BASE_DIR, ARCHIVE_DIRS, load_manifest(BASE_DIR))
+    if args.compress:
+        compress_blobs(manifest, BASE_DIR)
+    save_manifest(manifest, BASE_DIR)
+
+    total = sum(f["size"] for f in manifest["files"].values())
+    unique = sum(b["size"] for b in manifest["blobs"].values())
+    stored = sum(b.get("compressed_size") or b["size"] for b in manifest["blobs"].values())
+    print(f"{len(manifest['files'])} files -> {len(manifest['blobs'])} blobs")
+    print(f"raw {total / 1e6:.1f} MB, unique {unique / 1e6:.1f} MB, stored {stored / 1e6:.1f} MB")
+    for blob in manifest["blobs"].values():
+        if len(blob["aliases"]) > 1:
+            print(f"  {blob['canonical']} == {', '.join(blob['aliases'][1:])}")
+    if args.link_duplicates:
+        saved = link_duplicates(manifest, BASE_DIR)
+        print(f"hard-linked duplicates, {saved / 1e6:.1f} MB freed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Drill question bank: built-in questions plus the generated questions.json.
+
+questions.json is parsed once per process through the asset registry rather
+than on every rerun. ``drill_questions`` returns fresh per-subject lists, but
+the question dicts themselves are shared: copy a question before changing it.
+"""
+import os
+
+from asset_registry import BASE_DIR, registry
+
+registry.register("questions", os.path.join(BASE_DIR, "questions.json"), default={})
+
+STATIC_QUESTIONS = {
+    'Financial': [
+        {
+            'level': 1,
+            'q': "現金預金: 貸借対照表の「現金」に含まれないものはどれですか？",
+            'options': ["紙幣 (Bank notes)", "硬貨 (Coins)", "郵便切手 (Postage stamps)", "当座預金 (Demand deposits)"],
+            'correct': 2,
+            'explanation': "郵便切手は「貯蔵品」または「通信費」として処理され、現金には含まれません。現金には通貨、小切手、当座預金などが含まれます。"
+        },
+        {
+            'level': 1,
+            'q': "減価償却: 資産の利用量に基づいて減価償却費を計算する方法はどれですか？",
+            'options': ["定額法 (Straight-line)", "定率法 (Declining-balance)", "生産高比例法 (Production-output)", "級数法 (Sum-of-the-years'-digits)"],
+            'correct': 2,
+            'explanation': "生産高比例法は、総見積生産量に対する当期の実際生産量の割合に基づいて費用を配分する方法です。"
+        },
+        {
+            'level': 1,
+            'q': "棚卸資産: 物価上昇局面において、当期純利益が最も大きくなる評価方法はどれですか？",
+            'options': ["先入先出法 (FIFO)", "後入先出法 (LIFO)", "移動平均法 (Weighted Average)", "個別法 (Specific Identification)"],
+            'correct': 0,
+            'explanation': "先入先出法(FIFO)では、過去の（安い）在庫が先に売上原価となり、期末在庫に直近の（高い）単価が残るため、売上原価が小さくなり利益が大きくなります。"
+        },
+        {
+            'level': 1,
+            'q': "資産除去債務: 資産除去債務は当初何をもって測定されますか？",
+            'options': ["除去費用の将来価値", "除去費用の割引現在価値", "資産の取得原価", "資産の公正価値"],
+            'correct': 1,
+            'explanation': "資産除去債務は、将来発生すると見込まれる除去費用の「割引現在価値」で算定されます。"
+        },
+        {
+            'level': 1,
+            'q': "一般原則: 企業会計原則の「真実性の原則」における「真実」の意味として正しいものはどれですか？",
+            'options': ["絶対的真実", "相対的真実", "形式的真実", "法的真実"],
+            'correct': 1,
+            'explanation': "企業会計は複数の会計処理の原則・手続の選択適用を認めているため、求められるのは「相対的真実」であると解されます。"
+        },
+        {
+            'level': 1,
+            'q': "減損会計: 固定資産の「回収可能価額」とは、どのように算定されますか？",
+            'options': ["正味売却価額と使用価値のいずれか高い金額", "正味売却価額と使用価値のいずれか低い金額", "正味売却価額のみ", "使用価値のみ"],
+            'correct': 0,
+            'explanation': "回収可能価額は、資産の「正味売却価額」と「使用価値」のいずれか高い方の金額とされます。"
+        },
+        {
+            'level': 1,
+            'q': "リース会計: ファイナンス・リース取引において、借手が計上する資産の額は原則としていくらですか？",
+            'options': ["リース料総額", "リース料総額の割引現在価値と貸手の購入価額等のいずれか低い額", "貸手の購入価額", "リース料総額の割引現在価値"],
+            'correct': 1,
+            'explanation': "通常のファイナンス・リースでは、リース料総額の現在価値と、貸手の購入価額（現金購入価額）のいずれか低い額で資産計上します。"
+        },
+        {
+            'level': 2,
+            'q': "キャッシュ・フロー計算書: 間接法において、税引前当期純利益からスタートする際、減価償却費はどう調整しますか？",
+            'options': ["加算する", "減算する", "調整しない", "営業外収益として扱う"],
+            'correct': 0,
+            'explanation': "減価償却費は現金支出を伴わない費用（非資金損益）であるため、利益からスタートしてキャッシュフローを求める際は「加算」して戻します。"
+        },
+        {
+            'level': 3,
+            'q': "税効果会計: 繰延税金資産の回収可能性を判断する際、会社分類が「分類2」の企業において、スケジューリング可能な一時差異はいつまで計上可能ですか？",
+            'options': ["1年以内", "5年以内", "スケジューリング可能な全期間", "計上できない"],
+            'correct': 2,
+            'explanation': "「分類2（業績が安定している企業）」の場合、スケジューリング可能な将来減算一時差異については、期間制限なく（全期間）回収可能性があると判断されます。"
+        }
+    ],
+    'Management': [
+        {
+            'level': 1,
+            'q': "CVP分析: 損益分岐点売上高を求める計算式はどれですか？",
+            'options': ["固定費 ÷ 貢献利益率", "固定費 ÷ 変動費率", "変動費 ÷ 売上高", "利益 ÷ 売上高"],
+            'correct': 0,
+            'explanation': "損益分岐点売上高 ＝ 固定費 ÷ (1 － 変動費率) ＝ 固定費 ÷ 貢献利益率 です。"
+        },
+        {
+            'level': 1,
+            'q': "原価の分類: 「素価 (Prime Cost)」を構成するものはどれですか？",
+            'options': ["直接材料費 ＋ 直接労務費", "直接労務費 ＋ 製造間接費", "直接材料費 ＋ 製造間接費", "販売費及び一般管理費"],
+            'correct': 0,
+            'explanation': "素価（Prime Cost）は、直接材料費と直接労務費の合計です。（加工費 ＝ 直接労務費 ＋ 製造間接費）"
+        },
+        {
+            'level': 1,
+            'q': "標準原価計算: 実際消費量が標準消費量を上回った場合に発生する差異はどれですか？",
+            'options': ["有利数量差異", "不利数量差異", "有利価格差異", "不利価格差異"],
+            'correct': 1,
+            'explanation': "標準よりも多くの数量を消費してしまった場合は、コスト増となるため「不利差異（Unfavorable）」となります。"
+        },
+        {
+            'level': 1,
+            'q': "直接原価計算: 固定製造間接費はどのように処理されますか？",
+            'options': ["製品原価として処理", "期間原価として処理", "資産として計上", "負債として計上"],
+            'correct': 1,
+            'explanation': "直接原価計算では、固定製造間接費は発生時に「期間原価」として全額費用処理されます（CVP分析に有用）。"
+        },
+        {
+            'level': 1,
+            'q': "原価計算基準: 原価計算基準において、原価計算の目的として挙げられていないものはどれですか？",
+            'options': ["財務諸表の作成", "原価管理", "予算統制", "従業員給与の計算"],
+            'correct': 3,
+            'explanation': "原価計算基準には、財務諸表作成、価格計算、原価管理、予算管理、基本計画策定の5つの目的が挙げられていますが、給与計算は含まれません。"
+        },
+        {
+            'level': 1,
+            'q': "ABC (活動基準原価計算): 製造間接費を製品に配賦するために使用される基準は何ですか？",
+            'options': ["操業度", "コスト・ドライバー (活動原価要因)", "直接作業時間", "機械稼働時間"],
+            'correct': 1,
+            'explanation': "ABCでは、製造間接費を活動ごとに把握し、それぞれの活動の発生要因である「コスト・ドライバー」に基づいて製品に配賦します。"
+        },
+        {
+            'level': 1,
+            'q': "投資の経済性計算: ROI (投下資本利益率) を求める計算式はどれですか？",
+            'options': ["利益 ÷ 売上高", "売上高 ÷ 投下資本", "利益 ÷ 投下資本", "投下資本 ÷ 利益"],
+            'correct': 2,
+            'explanation': "ROI (Return On Investment) は、利益を投下資本で割って算出します（ROI = 売上高利益率 × 資本回転率）。"
+        },
+        {
+            'level': 2,
+            'q': "CVP分析: 固定費1,000、変動費率0.6、目標利益200の場合、目標売上高はいくらですか？",
+            'options': ["2,000", "3,000", "2,500", "1,200"],
+            'correct': 1,
+            'explanation': "目標売上高 ＝ (固定費 ＋ 目標利益) ÷ (1 － 変動費率) ＝ (1000 + 200) ÷ 0.4 ＝ 3000 です。"
+        }
+    ],
+    'Audit': [
+        {
+            'level': 1,
+            'q': "監査リスク: 監査リスク・モデルの構成要素として正しいものはどれですか？",
+            'options': ["固有リスク × 統制リスク × 発見リスク", "ビジネスリスク × 監査リスク", "重要性 × リスク", "抽出リスク × 非抽出リスク"],
+            'correct': 0,
+            'explanation': "監査リスク ＝ 重要な虚偽表示リスク（固有リスク×統制リスク） × 発見リスク です。"
+        },
+        {
+            'level': 1,
+            'q': "独立性: 「外観的独立性」を損なう要因となるものはどれですか？",
+            'options': ["被監査会社の株式保有", "誠実であること", "専門能力を有すること", "倫理規定の遵守"],
+            'correct': 0,
+            'explanation': "被監査会社の株式や重要な経済的利害関係を有することは、外観的独立性（第三者から見て独立していると見えること）を損ないます。"
+        },
+        {
+            'level': 1,
+            'q': "監査意見: 財務諸表全体に重要な虚偽表示があり、かつその影響が広範である場合に表明される意見はどれですか？",
+            'options': ["無限定適正意見", "限定付適正意見", "不適正意見", "意見不表明"],
+            'correct': 2,
+            'explanation': "重要かつ広範（Pervasive）な虚偽表示がある場合は、「不適正意見（Adverse Opinion）」が表明されます。"
+        },
+        {
+            'level': 1,
+            'q': "内部統制: 内部統制の整備・運用責任は誰にありますか？",
+            'options': ["監査人", "経営者", "株主", "政府"],
+            'correct': 1,
+            'explanation': "内部統制を整備し運用する責任は「経営者」にあります。監査人はその有効性を評価・報告する立場です。"
+        },
+        {
+            'level': 1,
+            'q': "監査証拠: 一般的に最も証明力が高いとされる監査証拠はどれですか？",
+            'options': ["経営者への質問", "観察", "外部確認", "社内文書"],
+            'correct': 2,
+            'explanation': "外部の第三者から直接入手する「確認（External Confirmation）」は、一般に社内証拠よりも証明力が高いとされます。"
+        },
+        {
+            'level': 1,
+            'q': "不正対応: 「不正のトライアングル」の3要素に含まれないものはどれですか？",
+            'options': ["動機・プレッシャー", "機会", "姿勢・正当化", "罰則"],
+            'correct': 3,
+            'explanation': "不正のトライアングルは、「動機・プレッシャー」「機会」「姿勢・正当化」の3要素から構成されます。"
+        },
+        {
+            'level': 1,
+            'q': "監査報告書: 監査報告書日はいつであるべきですか？",
+            'options': ["決算日", "監査人が監査意見を形成するのに十分かつ適切な監査証拠を入手した日", "株主総会開催日", "有価証券報告書提出日"],
+            'correct': 1,
+            'explanation': "監査報告書日は、監査人が意見表明の基礎となる十分かつ適切な監査証拠を入手した日（監査終了日）とする必要があります。"
+        }
+    ],
+    'Company': [
+        {
+            'level': 1,
+            'q': "設立: 株式会社の設立における最低資本金の額はいくらですか？",
+            'options': ["1,000万円", "300万円", "1円", "0円"],
+            'correct': 2,
+            'explanation': "現在の会社法では、最低資本金制度は撤廃されており、資本金1円から設立が可能です。"
+        },
+        {
+            'level': 1,
+            'q': "自己株式: 株式会社は自己株式を取得することができますか？",
+            'options': ["完全に禁止されている", "財源規制等の下で認められる", "自由に認められる", "解散時のみ認められる"],
+            'correct': 1,
+            'explanation': "自己株式の取得は、分配可能額の範囲内であることや株主総会決議などの規制の下で認められています。"
+        },
+        {
+            'level': 1,
+            'q': "機関設計: 取締役会設置会社における取締役の最低人数は何人ですか？",
+            'options': ["1人", "2人", "3人", "5人"],
+            'correct': 2,
+            'explanation': "取締役会を設置する場合、取締役は3人以上必要です。"
+        },
+        {
+            'level': 1,
+            'q': "株主総会: 特別決議の定足数は原則としてどのくらいですか？",
+            'options': ["議決権の過半数", "議決権の3分の1", "議決権の3分の2", "全株主"],
+            'correct': 0,
+            'explanation': "特別決議の定足数は原則として「議決権の過半数」です（定款で3分の1まで緩和可）。決議要件は出席株主の議決権の3分の2以上です。"
+        },
+        {
+            'level': 1,
+            'q': "監査役: 監査役の任期は原則として何年ですか？",
+            'options': ["1年", "2年", "4年", "10年"],
+            'correct': 2,
+            'explanation': "監査役の任期は原則として4年です。定款によっても短縮することはできません。"
+        },
+        {
+            'level': 1,
+            'q': "株主の権利: 単独株主権（1株でも保有していれば行使できる権利）はどれですか？",
+            'options': ["株主総会招集請求権", "帳簿閲覧請求権", "剰余金配当請求権", "取締役解任請求権"],
+            'correct': 2,
+            'explanation': "剰余金配当請求権や議決権は、1株から認められる単独株主権です。帳簿閲覧権などは一定の株式数・期間が必要な少数株主権です。"
+        },
+        {
+            'level': 1,
+            'q': "事業譲渡: 株主総会の特別決議が必要となる事業譲渡はどれですか？",
+            'options': ["事業の全部または重要な一部の譲渡", "重要な資産の処分", "多額の借財", "支配人の選任"],
+            'correct': 0,
+            'explanation': "事業の全部の譲渡、または事業の重要な一部の譲渡（譲渡資産が総資産の1/5超など）には、株主総会の特別決議が必要です。"
+        }
+    ]
+}
+
+
+def generated_questions():
+    return registry.get("questions")
+
+
+def drill_questions():
+    merged = {subject: list(qs) for subject, qs in STATIC_QUESTIONS.items()}
+    for subject, qs in generated_questions().items():
+        merged.setdefault(subject, []).extend(qs)
+    return merged
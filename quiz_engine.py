@@ -0,0 +1,309 @@
+"""UI-free quiz logic: question selection, option shuffling, grading, XP.
+
+Used by the Streamlit pages (Drills, Exam Mode, Survival, Wrong Answers),
+by generate_questions.py (which builds questions.js for index.html) and by
+the terminal quiz below, so the same rules can be profiled and load-tested
+without a browser (see scripts/bench_quiz_engine.py).
+
+Questions are questions.json entries: ``q``, ``options``, ``correct``
+(index into ``options``), ``explanation`` and optional ``level``, ``tags``
+and ``subject``. ``data`` is the cpa_data.json dict (``xp``, ``level``,
+``scores``, ``wrong_answers``); functions here update it in place and leave
+persisting it to the caller.
+
+    python quiz_engine.py --subject Audit --level 2 -n 10 [--save]
+"""
+import argparse
+import json
+import random
+from datetime import date
+
+XP_PER_CORRECT = 10
+
+
+def today():
+    return date.today().strftime("%Y-%m-%d")
+
+
+def xp_to_next(level):
+    return level * 100
+
+
+# ---- Selection ----
+
+def shuffle_options(q, rng=random):
+    """Copy of ``q`` with its options shuffled and ``correct`` remapped."""
+    qq = dict(q)
+    try:
+        correct_opt = qq['options'][qq['correct']]
+        qq['options'] = list(qq['options'])
+        rng.shuffle(qq['options'])
+        qq['correct'] = qq['options'].index(correct_opt)
+    except (KeyError, IndexError, TypeError, ValueError):
+        pass
+    return qq
+
+
+def matches_keyword(q, keyword):
+    lkw = keyword.lower()
+    try:
+        if lkw in str(q.get('q', '')).lower():
+            return True
+        return any(lkw in str(opt).lower() for opt in (q.get('options') or []))
+    except Exception:
+        return False
+
+
+def filter_questions(questions, level=None, tags=None, keyword=None, default_level=None):
+    """Questions at ``level`` (``default_level`` for ones without a level)
+    carrying any of ``tags`` and containing ``keyword``."""
+    out = questions
+    if level is not None:
+        out = [q for q in out if q.get('level', default_level) == level]
+    if tags:
+        tags = set(tags)
+        out = [q for q in out if any(t in tags for t in (q.get('tags') or []))]
+    keyword = (keyword or '').strip()
+    if keyword:
+        out = [q for q in out if matches_keyword(q, keyword)]
+    return out
+
+
+def select_questions(pool, n, rng=random, shuffle=True):
+    """Sample up to ``n`` questions; each is a copy, safe to hand to a session."""
+    picked = rng.sample(pool, min(len(pool), n))
+    return [shuffle_options(q, rng) if shuffle else dict(q) for q in picked]
+
+
+def vocab_questions(vocab_list, rng=random):
+    """Meaning questions for vocab.json terms (correct answer plus three fillers)."""
+    out = []
+    for v in vocab_list:
+        q = {
+            'q': f"【重要語句】 「{v['term']}」 の意味として最も適切なものは？",
+            'options': [v['desc'], "（誤りの選択肢: 逆の意味）", "（誤りの選択肢: 無関係な定義）", "（誤りの選択肢: 類似用語の定義）"],
+            'correct': 0,
+            'explanation': f"**{v['term']} ({v['jp']})**\n\n**🇯🇵 日本語:** {v['desc']}\n\n**🇺🇸 English:** {v.get('desc_en', 'No English description available.')}",
+            'type': 'vocab'
+        }
+        out.append(shuffle_options(q, rng))
+    return out
+
+
+def build_exam(drill_questions, subject, n, rng=random):
+    """Exam Mode paper: ``n`` questions from one subject or "Mixed", tagged with their subject."""
+    pool = []
+    subjects = drill_questions.items() if subject == "Mixed" else [(subject, drill_questions.get(subject, []))]
+    for sub, qs in subjects:
+        for q in qs:
+            qx = dict(q)
+            qx['subject'] = sub
+            pool.append(qx)
+    rng.shuffle(pool)
+    return pool[:int(n)]
+
+
+# ---- Grading ----
+
+def is_correct(q, selected_idx):
+    return selected_idx is not None and selected_idx == q.get('correct')
+
+
+def score_exam(questions, answers):
+    """(correct, total, percent) for an Exam Mode answer sheet."""
+    corrects = sum(1 for q, a in zip(questions, answers) if is_correct(q, a))
+    total = max(1, len(questions))
+    return corrects, total, round(corrects / total * 100, 1)
+
+
+def survival_points(streak):
+    # Bonus XP for streak
+    return 10 + streak * 2
+
+
+# ---- State updates ----
+
+def award_xp(data, earned_xp):
+    """Add XP and apply level-ups; returns (level, leveled_up)."""
+    xp = data.get('xp', 0) + earned_xp
+    level = data.get('level', 1)
+    leveled_up = False
+    while xp >= xp_to_next(level):
+        xp -= xp_to_next(level)
+        level += 1
+        leveled_up = True
+    data['xp'] = xp
+    data['level'] = level
+    return level, leveled_up
+
+
+def record_wrong_answer(data, q, selected_idx, subject='General', level=None, confidence=None, day=None):
+    """Append to the wrong-answer notebook; returns the entry's index."""
+    entry = {
+        'date': day or today(),
+        'subject': subject,
+        'level': level,
+        'q': q.get('q', ''),
+        'options': q.get('options', []),
+        'correct_idx': q.get('correct', None),
+        'selected_idx': selected_idx,
+        'explanation': q.get('explanation', ''),
+    }
+    if q.get('tags'):
+        entry['tags'] = list(q['tags']) if not isinstance(q['tags'], str) else [q['tags']]
+    if confidence is not None:
+        entry['confidence'] = int(confidence)
+    wrong = data.setdefault('wrong_answers', [])
+    wrong.append(entry)
+    return len(wrong) - 1
+
+
+def record_score(data, name, subject, val, day=None):
+    data.setdefault('scores', []).append({'name': name, 'date': day or today(), 'subject': subject, 'val': val})
+
+
+def new_quiz(questions, subject, level):
+    """Fresh Drills ``quiz_state`` for ``questions``."""
+    return {
+        'active': bool(questions),
+        'subject': subject,
+        'level': level,
+        'q_index': 0,
+        'score': 0,
+        'show_feedback': False,
+        'selected_option': None,
+        'questions': questions,
+    }
+
+
+def submit_answer(quiz, data, selected_idx, confidence=None, day=None):
+    """Grade the current question of ``quiz``.
+
+    Returns the wrong-answer index when the answer was wrong, else None.
+    """
+    q = quiz['questions'][quiz['q_index']]
+    quiz['selected_option'] = selected_idx
+    quiz['show_feedback'] = True
+    if is_correct(q, selected_idx):
+        quiz['score'] += 1
+        return None
+    # Retry and Exam Mode questions carry their own subject
+    subject = q.get('subject') or quiz.get('subject', 'General')
+    return record_wrong_answer(data, q, selected_idx, subject, quiz.get('level', None), confidence, day)
+
+
+def next_question(quiz):
+    quiz['q_index'] += 1
+    quiz['show_feedback'] = False
+    quiz['selected_option'] = None
+
+
+def finish_quiz(quiz, data, day=None):
+    """Award XP for a finished Drills quiz and log its score; returns (earned_xp, level, leveled_up)."""
+    score, total = quiz['score'], len(quiz['questions'])
+    earned = score * XP_PER_CORRECT
+    level, leveled_up = award_xp(data, earned)
+    record_score(data, f"Drill: {quiz.get('subject', 'General')} Lv{quiz.get('level', '?')}", quiz.get('subject', 'General'),
+                 (score / total) * 100 if total > 0 else 0, day)
+    quiz['active'] = False
+    return earned, level, leveled_up
+
+
+def finish_exam(exam, data, day=None):
+    """Grade an Exam Mode sheet, award XP and log the score; returns (corrects, total, percent, earned_xp, level, leveled_up).
+
+    Only the first call for a sheet awards XP and logs the score; later calls
+    (the finished screen reruns) return the recorded result without leveling up again.
+    """
+    if exam.get('recorded'):
+        return tuple(exam['recorded'][:5]) + (False,)
+    corrects, total, percent = score_exam(exam['questions'], exam['answers'])
+    earned = corrects * XP_PER_CORRECT
+    level, leveled_up = award_xp(data, earned)
+    record_score(data, f"Exam Mode ({exam.get('subject', 'Mixed')})", exam.get('subject', 'Mixed'), percent, day)
+    exam['recorded'] = [corrects, total, percent, earned, level]
+    return corrects, total, percent, earned, level, leveled_up
+
+
+def survival_answer(game, data, selected_idx):
+    """Apply one Survival Mode answer; returns the points earned (0 when wrong)."""
+    q = game['q']
+    game['user_ans'] = selected_idx
+    game['feedback'] = True
+    if selected_idx == q['correct_idx']:
+        points = survival_points(game['streak'])
+        game['score'] += points
+        game['streak'] += 1
+        data['xp'] = data.get('xp', 0) + points
+        return points
+    game['lives'] -= 1
+    game['streak'] = 0
+    return 0
+
+
+# ---- index.html data ----
+
+def write_questions_js(all_data, path):
+    """questions.js for index.html (a ``generatedQuestions`` global)."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"const generatedQuestions = {json.dumps(all_data, ensure_ascii=False, indent=2)};")
+
+
+# ---- Terminal quiz ----
+
+def main():
+    ap = argparse.ArgumentParser(description="Terminal drill using the same rules as the app")
+    ap.add_argument("--subject", default="Financial", choices=["Financial", "Management", "Audit", "Company"])
+    ap.add_argument("--level", type=int, default=1, help="1 = static + generated level 0, 2/3 = generated")
+    ap.add_argument("-n", type=int, default=10, help="number of questions")
+    ap.add_argument("--tag", action="append", help="only questions with this tag (repeatable)")
+    ap.add_argument("--keyword", default="", help="only questions containing this text")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--save", action="store_true", help="record XP, score and wrong answers in cpa_data.json")
+    args = ap.parse_args()
+
+    import question_bank
+
+    rng = random.Random(args.seed)
+    questions = question_bank.drill_questions().get(args.subject, [])
+    if args.level == 1:
+        pool = filter_questions(questions, level=1, default_level=1, keyword=args.keyword)
+        pool += filter_questions(questions, level=0, tags=args.tag, keyword=args.keyword)
+    else:
+        pool = filter_questions(questions, level=args.level, tags=args.tag, keyword=args.keyword)
+    if not pool:
+        print("No questions match.")
+        return
+
+    if args.save:
+        from common import load_data, save_data
+        data = load_data()
+    else:
+        data = {}
+    quiz = new_quiz(select_questions(pool, args.n, rng), args.subject, args.level)
+    total = len(quiz['questions'])
+    while True:
+        q = quiz['questions'][quiz['q_index']]
+        print(f"\nQ{quiz['q_index'] + 1}/{total}  {q['q']}")
+        for i, opt in enumerate(q['options'], 1):
+            print(f"  {i}. {opt}")
+        ans = input("> ").strip()
+        selected = int(ans) - 1 if ans.isdigit() and 0 < int(ans) <= len(q['options']) else None
+        if submit_answer(quiz, data, selected) is None:
+            print("Correct!")
+        else:
+            print(f"Wrong. Answer: {q['options'][q['correct']]}")
+        if q.get('explanation'):
+            print(q['explanation'])
+        if quiz['q_index'] >= total - 1:
+            break
+        next_question(quiz)
+
+    earned, level, leveled_up = finish_quiz(quiz, data)
+    print(f"\nScore: {quiz['score']} / {total}  (+{earned} XP{', LEVEL UP to ' + str(level) if leveled_up else ''})")
+    if args.save:
+        save_data(data)
+
+
+if __name__ == "__main__":
+    main()
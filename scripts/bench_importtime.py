@@ -0,0 +1,145 @@
+"""Cold-start benchmark: time to first render per page, plus ``-X importtime``.
+
+Each page is rendered once in a fresh interpreter started with
+``python -X importtime`` (AppTest, no server), so nothing is cached between
+pages. Reports the time to first render, the total import time parsed
+from the importtime log, the slowest top-level imports and which heavy
+libraries the page pulled in.
+
+Fails (exit 1) when one of the quiz pages (``LIGHT_PAGES``) imports
+pandas, numpy or plotly.express on its first render, when a page exceeds
+``--budget-ms``, or, with ``--baseline``, when it is more than
+``--tolerance`` slower than the saved baseline:
+
+    python scripts/bench_importtime.py --save-baseline .traces/importtime.json
+    python scripts/bench_importtime.py --baseline .traces/importtime.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PAGES = ["Dashboard 📊", "Drills 🔧", "Vocabulary 📖", "Survival Mode ⚡", "Exam Mode ⏲️", "Scores 📈", "EDINET 🧾"]
+HEAVY = ("pandas", "numpy", "plotly.express", "plotly.graph_objects", "pypdf", "openpyxl", "torch", "requests")
+# Pages whose first render must not import these (streamlit itself pulls in a bit of plotly)
+LIGHT_PAGES = ["Drills 🔧", "Vocabulary 📖", "Survival Mode ⚡", "Exam Mode ⏲️"]
+LIGHT_FORBIDDEN = ("pandas", "numpy", "plotly.express", "torch")
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[3]))
+at.session_state["nav"] = sys.argv[2]
+at.run()
+ms = (time.perf_counter() - t0) * 1000
+print(json.dumps({"ms": ms, "exception": at.exception[0].value[:200] if at.exception else None}))
+"""
+
+
+def parse_importtime(log):
+    """{module: (self_us, cumulative_us, depth)} from ``-X importtime`` stderr."""
+    out = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        out[name.strip()] = (int(self_us), int(cum_us), depth)
+    return out
+
+
+def heavy_ms(imports, module):
+    """Cumulative ms spent importing ``module``.
+
+    The top-level line of a package imported on the script thread is
+    sometimes missing from the log; fall back to the outermost submodules
+    that were logged.
+    """
+    if module in imports:
+        return imports[module][1] / 1000
+    subs = [(depth, cum) for name, (_, cum, depth) in imports.items() if name.startswith(module + ".")]
+    top = min(depth for depth, _ in subs)
+    return sum(cum for depth, cum in subs if depth == top) / 1000
+
+
+def cold_render(app, page, timeout):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD, app, page, str(timeout)],
+                          cwd=ROOT, env=env, capture_output=True, text=True, timeout=timeout + 60)
+    lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"{page}: child failed ({proc.returncode})\n{proc.stderr[-2000:]}")
+    result = json.loads(lines[-1])
+    imports = parse_importtime(proc.stderr)
+    result["import_ms"] = sum(cum for _, cum, depth in imports.values() if depth == 0) / 1000
+    result["heavy"] = {m: round(heavy_ms(imports, m), 1) for m in HEAVY if any(n == m or n.startswith(m + ".") for n in imports)}
+    top = sorted(((cum, name) for name, (_, cum, depth) in imports.items() if depth == 0), reverse=True)[:5]
+    result["top"] = [(name, round(cum / 1000, 1)) for cum, name in top]
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="Streamlit entry script")
+    ap.add_argument("--pages", nargs="+", default=DEFAULT_PAGES, help="Navigation labels to benchmark")
+    ap.add_argument("--repeat", type=int, default=1, help="cold starts per page (the fastest counts)")
+    ap.add_argument("--budget-ms", type=float, default=None, help="fail when a page's first render is slower")
+    ap.add_argument("--baseline", help="JSON from --save-baseline to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs the baseline (0.25 = 25%%)")
+    ap.add_argument("--save-baseline", help="write the results to this JSON file")
+    ap.add_argument("--timeout", type=float, default=120, help="AppTest timeout per run (s)")
+    ap.add_argument("-v", "--verbose", action="store_true", help="also list the slowest top-level imports")
+    args = ap.parse_args()
+
+    # Keep the benchmark from touching the real user data file
+    data_file = os.path.join(ROOT, "cpa_data.json")
+    had_data = os.path.exists(data_file)
+    results = {}
+    try:
+        for page in args.pages:
+            runs = [cold_render(args.app, page, args.timeout) for _ in range(args.repeat)]
+            results[page] = min(runs, key=lambda r: r["ms"])
+    finally:
+        if not had_data and os.path.exists(data_file):
+            os.remove(data_file)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    failures = []
+    print(f"{'page':<24} {'first render':>12} {'imports':>9} {'baseline':>9}  heavy imports (cumulative ms)")
+    for page, r in results.items():
+        base = baseline.get(page, {}).get("ms")
+        heavy = ", ".join(f"{m} {ms:.0f}" for m, ms in r["heavy"].items()) or "-"
+        print(f"{page:<24} {r['ms']:10.0f} ms {r['import_ms']:6.0f} ms {'-' if base is None else f'{base:.0f} ms':>9}  {heavy}")
+        if args.verbose:
+            for name, ms in r["top"]:
+                print(f"    {name:<40} {ms:8.1f} ms")
+        if r["exception"]:
+            failures.append(f"{page}: {r['exception']}")
+        if page in LIGHT_PAGES and any(m in r["heavy"] for m in LIGHT_FORBIDDEN):
+            failures.append(f"{page}: first render imports {', '.join(m for m in LIGHT_FORBIDDEN if m in r['heavy'])}")
+        if args.budget_ms is not None and r["ms"] > args.budget_ms:
+            failures.append(f"{page}: {r['ms']:.0f} ms > budget {args.budget_ms:.0f} ms")
+        if base is not None and r["ms"] > base * (1 + args.tolerance):
+            failures.append(f"{page}: {r['ms']:.0f} ms is more than {args.tolerance:.0%} over the baseline {base:.0f} ms")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({p: {"ms": round(r["ms"], 1), "import_ms": round(r["import_ms"], 1)} for p, r in results.items()}, f, ensure_ascii=False, indent=2)
+    if failures:
+        print("\nFAIL:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Throughput benchmark for quiz_engine (no Streamlit involved).
+
+Simulates N answers (default 10k, 100k and 1M) through each stage and
+reports answers per second, pytest-benchmark style (min / median over
+``--rounds``):
+
+  select  draw 20-question quizzes from the bank, options shuffled
+  grade   is_correct on (question, answer) pairs
+  state   submit_answer / next_question / finish_quiz on a user data dict,
+          wrong answers recorded and XP levelled up as in the app
+
+then times adaptive selection (adaptive.py) over a ``--bank``-question
+bank: building the pool, refreshing its weights from the mastery model
+(full and after one answer), a single alias draw and a 20-question quiz.
+
+    python scripts/bench_quiz_engine.py --sizes 10000 100000 1000000
+    python scripts/bench_quiz_engine.py --only adaptive --bank 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import adaptive  # noqa: E402
+import mastery  # noqa: E402
+import question_bank  # noqa: E402
+import quiz_engine  # noqa: E402
+
+QUIZ_LEN = 20
+
+
+def load_pool():
+    pool = [q for qs in question_bank.drill_questions().values() for q in qs if q.get('options')]
+    if pool:
+        return pool
+    # No questions.json: synthetic four-option questions
+    return [{'q': f"Q{i}", 'options': ["a", "b", "c", "d"], 'correct': i % 4, 'explanation': ""} for i in range(2000)]
+
+
+def bench_select(pool, n, rng):
+    for _ in range(max(1, n // QUIZ_LEN)):
+        quiz_engine.select_questions(pool, QUIZ_LEN, rng)
+
+
+def bench_grade(pool, n, rng):
+    qs = [pool[rng.randrange(len(pool))] for _ in range(min(n, 100_000))]
+    answers = [rng.randrange(4) for _ in qs]
+    t0 = time.perf_counter()
+    for i in range(n):
+        j = i % len(qs)
+        quiz_engine.is_correct(qs[j], answers[j])
+    return time.perf_counter() - t0
+
+
+def bench_state(pool, n, rng):
+    data = {'xp': 0, 'level': 1, 'scores': [], 'wrong_answers': []}
+    quizzes = [quiz_engine.select_questions(pool, QUIZ_LEN, rng) for _ in range(50)]
+    answers = [rng.randrange(4) for _ in range(QUIZ_LEN)]
+    done = 0
+    t0 = time.perf_counter()
+    while done < n:
+        quiz = quiz_engine.new_quiz(list(quizzes[done // QUIZ_LEN % len(quizzes)]), "Bench", 2)
+        for i in range(QUIZ_LEN):
+            quiz_engine.submit_answer(quiz, data, answers[i], day="2026-01-01")
+            if i < QUIZ_LEN - 1:
+                quiz_engine.next_question(quiz)
+        quiz_engine.finish_quiz(quiz, data, day="2026-01-01")
+        done += QUIZ_LEN
+    return time.perf_counter() - t0
+
+
+def bench_adaptive(pool, bank_size, rounds, seed):
+    rng = random.Random(seed)
+    bank = [dict(pool[i % len(pool)], q=f"{pool[i % len(pool)]['q']} #{i}", tags=[f"tag{i % 50}"]) for i in range(bank_size)]
+    model = mastery.MasteryModel()
+    for _ in range(5000):
+        model.record(bank[rng.randrange(bank_size)], "Bench", rng.random() < 0.7)
+
+    def timed(fn):
+        samples = []
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - t0)
+        return min(samples)
+
+    t0 = time.perf_counter()
+    ap = adaptive.AdaptivePool(bank, "Bench")
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    blocks = ap.refresh(model)
+    first = time.perf_counter() - t0
+
+    def one_answer():
+        model.record(bank[rng.randrange(bank_size)], "Bench", True)
+        ap.refresh(model)
+
+    rows = [
+        ("pool build", build),
+        (f"refresh, all {blocks} blocks", first),
+        ("refresh after 1 answer", timed(one_answer)),
+        ("select 20", timed(lambda: ap.select(QUIZ_LEN, rng))),
+        ("1 draw", timed(lambda: [ap.sampler.sample(rng) for _ in range(10_000)]) / 10_000),
+    ]
+    print(f"\nadaptive selection, bank {bank_size:,}")
+    for name, sec in rows:
+        print(f"  {name:<26} {sec * 1000:10.3f} ms")
+
+
+def run(name, fn, pool, n, rounds, seed):
+    samples = []
+    for r in range(rounds):
+        rng = random.Random(seed + r)
+        t0 = time.perf_counter()
+        timed = fn(pool, n, rng)
+        samples.append(timed if timed is not None else time.perf_counter() - t0)
+    best, med = min(samples), statistics.median(samples)
+    print(f"{name:<7} {n:>9,} {best * 1000:10.1f} {med * 1000:10.1f} {n / best:14,.0f} {best / n * 1e9:10.0f}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="simulated answers per run")
+    ap.add_argument("--rounds", type=int, default=3)
+    ap.add_argument("--only", choices=["select", "grade", "state", "adaptive"], action="append", help="run only these stages")
+    ap.add_argument("--bank", type=int, default=100_000, help="question bank size for the adaptive stage")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    pool = load_pool()
+    print(f"question pool: {len(pool):,}")
+    stages = {"select": bench_select, "grade": bench_grade, "state": bench_state}
+    stages = {name: fn for name, fn in stages.items() if not args.only or name in args.only}
+    if stages:
+        print(f"{'stage':<7} {'answers':>9} {'min ms':>10} {'median ms':>10} {'answers/s':>14} {'ns/answer':>10}")
+    for name, fn in stages.items():
+        for n in args.sizes:
+            run(name, fn, pool, n, args.rounds, args.seed)
+    if not args.only or "adaptive" in args.only:
+        bench_adaptive(pool, args.bank, args.rounds, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Rerun latency benchmark for app.py using Streamlit's headless AppTest.
+
+Switches to each page once, then reruns it ``--runs`` times and reports
+median / p95 latency per page. Run it before and after a change:
+
+    python scripts/bench_rerun.py --pages "Official Checklist ✅" "Revisions 🧭"
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PAGES = ["Official Checklist ✅", "Revisions 🧭", "Study Timer ⏱️", "Mock Exams 📝", "Dashboard 📊", "Drills 🔧"]
+
+
+def percentile(values, q):
+    xs = sorted(values)
+    k = (len(xs) - 1) * q / 100.0
+    lo, hi = int(k), min(int(k) + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (k - lo)
+
+
+def bench(app_path, pages, runs, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=timeout)
+    t0 = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - t0
+    results = {}
+    for page in pages:
+        at.session_state["nav"] = page
+        at.run()
+        if at.exception:
+            print(f"[WARN] {page}: {at.exception[0].value[:200]}")
+        samples = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            at.run()
+            samples.append(time.perf_counter() - t0)
+        results[page] = samples
+    return cold, results
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="Streamlit entry script")
+    ap.add_argument("--pages", nargs="+", default=DEFAULT_PAGES, help="Navigation labels to benchmark")
+    ap.add_argument("--runs", type=int, default=10, help="Reruns per page")
+    ap.add_argument("--timeout", type=float, default=120, help="AppTest timeout per run (s)")
+    args = ap.parse_args()
+
+    # Keep the benchmark from touching the real user data file
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["CPA_DATA_FILE"] = os.path.join(tmp, "cpa_data.json")
+        os.chdir(ROOT)
+        sys.path.insert(0, ROOT)
+        cold, results = bench(args.app, args.pages, args.runs, args.timeout)
+
+    print(f"first run: {cold * 1000:.0f} ms")
+    print(f"{'page':<28} {'p50 ms':>8} {'p95 ms':>8} {'min ms':>8}")
+    for page, samples in results.items():
+        ms = [s * 1000 for s in samples]
+        print(f"{page:<28} {statistics.median(ms):8.1f} {percentile(ms, 95):8.1f} {min(ms):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Local load test: N virtual students driving app.py concurrently.
+
+Each virtual user is a headless AppTest session on its own thread (as
+Streamlit runs one script thread per browser session) that keeps picking a
+scenario and playing it through:
+
+  drills     start a 5-question Drills quiz, answer, submit, claim XP
+  exam       start Exam Mode, answer and move through questions, finish
+  survival   start Survival Mode and answer until out of lives (max 5)
+  syllabus   tick and untick a lecture on My Syllabus
+  old_exams  open Old Exams, search the papers, toggle a preview
+
+Every rerun (one widget interaction) is timed from the click until the
+page is back, followed by an exponentially distributed think time
+(``--think``, mean seconds). For each user count the report shows
+p50/p95/p99 rerun latency, throughput in reruns per second and RSS growth
+of the process holding all the sessions. No network and no server:
+everything runs in-process. Progress is written to a temporary
+CPA_DATA_FILE, never cpa_data.json.
+
+AppTest swaps a process-global runtime on every run, so reruns are
+serialized with a lock. That is close to one Streamlit server process,
+whose script threads share the GIL, except that I/O waits do not overlap:
+read the latencies as an upper bound for a single-process server.
+
+    python scripts/load_test.py --users 1 4 8 16 --duration 60
+    python scripts/load_test.py --users 8 --scenarios drills exam survival
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tracing import percentile  # noqa: E402
+
+SCENARIOS = ["drills", "exam", "survival", "syllabus", "old_exams"]
+# Quiz pages dominate real use; the heavy pages are visited less often
+DEFAULT_WEIGHTS = {"drills": 4, "exam": 2, "survival": 3, "syllabus": 1, "old_exams": 1}
+
+_run_lock = threading.Lock()
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class VirtualUser:
+    def __init__(self, app, rng, timeout, think):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(app, default_timeout=timeout)
+        self.rng = rng
+        self.think = think
+        self.samples = []  # (scenario, seconds)
+        self.errors = []
+        self.scenario = "start"
+
+    def run(self, action=None):
+        """Time one rerun; ``action`` returns the widget to run (else a plain rerun)."""
+        t0 = time.perf_counter()
+        with _run_lock:
+            (action() if action else self.at).run()
+        self.samples.append((self.scenario, time.perf_counter() - t0))
+        if self.at.exception:
+            self.errors.append(f"{self.scenario}: {self.at.exception[0].value[:200]}")
+        if self.think:
+            time.sleep(self.rng.expovariate(1 / self.think))
+
+    def button(self, label):
+        found = [b for b in self.at.button if b.label == label]
+        return found[0] if found else None
+
+    def click(self, label):
+        b = self.button(label)
+        if b is None:
+            return False
+        self.run(b.click)
+        return True
+
+    def goto(self, page):
+        self.at.session_state["nav"] = page
+        self.run()
+
+    # ---- scenarios ----
+
+    def drills(self):
+        self.goto("Drills 🔧")
+        self.run(lambda: self.at.number_input(key="qcount_drill").set_value(5))
+        if not self.click("Start / Restart Quiz"):
+            return
+        for i in range(5):
+            radio = self.at.radio(key=f"q_{i}")
+            radio.set_value(self.rng.choice(radio.options))
+            if not self.click("Submit Answer"):
+                break
+            if not self.click("Next Question"):
+                break
+        self.click("Finish & Claim XP")
+
+    def exam(self):
+        self.goto("Exam Mode ⏲️")
+        if not self.click("Start Exam"):
+            return
+        for _ in range(5):
+            idx = self.at.session_state["exam"]["q_index"]
+            radio = self.at.radio(key=f"exam_{idx}")
+            radio.set_value(self.rng.choice(radio.options))
+            self.click("Save Answer")
+            if not self.click("Next"):
+                break
+        self.click("Finish Now")
+
+    def survival(self):
+        self.goto("Survival Mode ⚡")
+        if not (self.click("🚀 Start Challenge") or self.click("Try Again")):
+            return
+        for _ in range(5):
+            radios = [r for r in self.at.radio if r.key and r.key.endswith("_ans")]
+            if radios:
+                radios[0].set_value(self.rng.choice(radios[0].options))
+            if not self.click("Submit Answer") or not self.click("Next Question ➡"):
+                break
+
+    def syllabus(self):
+        self.goto("My Syllabus 📚")
+        boxes = [c for c in self.at.checkbox if c.key and c.key.startswith("chk_")]
+        if boxes:
+            box = self.rng.choice(boxes)
+            self.run(box.check if not box.value else box.uncheck)
+            box = self.at.checkbox(key=box.key)
+            self.run(box.uncheck if box.value else box.check)
+
+    def old_exams(self):
+        self.goto("Old Exams 📄")
+        term = self.rng.choice(["監査", "会計", "企業", "租税", "資産"])
+        self.run(lambda: self.at.text_input(key="exam_search_q").input(term))
+        previews = [c for c in self.at.checkbox if c.key and c.key.startswith("pv_exam_")]
+        if previews:
+            box = self.rng.choice(previews)
+            self.run(box.check)
+            self.run(lambda: self.at.checkbox(key=box.key).uncheck())
+
+    def play(self, scenarios, weights, deadline, stop):
+        self.run()
+        while time.perf_counter() < deadline and not stop.is_set():
+            self.scenario = self.rng.choices(scenarios, weights)[0]
+            try:
+                getattr(self, self.scenario)()
+            except Exception as e:
+                self.errors.append(f"{self.scenario}: {type(e).__name__}: {e}"[:200])
+                self.run()  # like reloading the page
+
+
+def load_step(app, users, scenarios, weights, duration, seed, timeout, think):
+    rss0 = rss_mb()
+    vus = [VirtualUser(app, random.Random(seed * 1000 + i), timeout, think) for i in range(users)]
+    stop = threading.Event()
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+    threads = [threading.Thread(target=vu.play, args=(scenarios, weights, deadline, stop), daemon=True) for vu in vus]
+    for t in threads:
+        t.start()
+    try:
+        for t in threads:
+            t.join()
+    except KeyboardInterrupt:
+        stop.set()
+        raise
+    wall = time.perf_counter() - t0
+    samples = [s for vu in vus for s in vu.samples]
+    ms = [s * 1000 for _, s in samples]
+    per_scenario = {}
+    for name, s in samples:
+        per_scenario.setdefault(name, []).append(s * 1000)
+    return {
+        "users": users,
+        "reruns": len(ms),
+        "throughput": len(ms) / wall if wall else 0.0,
+        "p50": percentile(ms, 50), "p95": percentile(ms, 95), "p99": percentile(ms, 99), "max": max(ms, default=0.0),
+        "rss": rss_mb(), "rss_growth": rss_mb() - rss0,
+        "errors": [e for vu in vus for e in vu.errors],
+        "per_scenario": per_scenario,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="Streamlit entry script")
+    ap.add_argument("--users", type=int, nargs="+", default=[1, 2, 4, 8], help="virtual users per step")
+    ap.add_argument("--duration", type=float, default=30, help="seconds per step")
+    ap.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    ap.add_argument("--think", type=float, default=1.0, help="mean think time between interactions (s), 0 for none")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--timeout", type=float, default=120, help="AppTest timeout per rerun (s)")
+    ap.add_argument("-v", "--verbose", action="store_true", help="per-scenario latency for every step")
+    args = ap.parse_args()
+
+    from streamlit import logger as st_logger
+
+    # Widget warnings from hundreds of reruns would drown the report
+    st_logger.set_log_level("error")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["CPA_DATA_FILE"] = os.path.join(tmp, "cpa_data.json")
+        os.chdir(ROOT)
+        weights = [DEFAULT_WEIGHTS[s] for s in args.scenarios]
+        print(f"{'users':>5} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'RSS MB':>7} {'ΔRSS':>6} {'errors':>6}")
+        for users in args.users:
+            r = load_step(args.app, users, args.scenarios, weights, args.duration, args.seed, args.timeout, args.think)
+            print(f"{r['users']:>5} {r['reruns']:>7} {r['throughput']:8.1f} {r['p50']:8.0f} {r['p95']:8.0f} {r['p99']:8.0f} "
+                  f"{r['max']:8.0f} {r['rss']:7.0f} {r['rss_growth']:+6.0f} {len(r['errors']):>6}", flush=True)
+            if args.verbose:
+                for name, ms in sorted(r["per_scenario"].items()):
+                    print(f"      {name:<10} n={len(ms):<5} p50 {percentile(ms, 50):7.0f}  p95 {percentile(ms, 95):7.0f}")
+            for e in sorted(set(r["errors"]))[:5]:
+                print(f"      [WARN] {e}")
+
+
+if __name__ == "__main__":
+    main()
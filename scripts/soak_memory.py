@@ -0,0 +1,121 @@
+"""Memory soak test: many headless sessions driven through every page.
+
+Each session is an AppTest kept alive for the whole run (so their state
+coexists as on a busy server) and visits every page once per round with
+CPA_MEMORY=1. After each page the session's accounted size is read back
+from memory_report. Reports the largest session per page, each session's
+growth between the first and last round (a steady climb on revisiting the
+same pages points at a leak), process-wide cache sizes and peak RSS.
+
+Before the soak, checks that an array loaded from an .npz (a view onto
+the file's buffer, like the exam vocabulary index and the mastery arrays)
+is sized at about its ``nbytes``.
+
+Exits non-zero when that check fails, a session exceeds the budget or grows
+by more than ``--max-growth-kb`` after the first round.
+
+    python scripts/soak_memory.py --sessions 20 --rounds 3 --budget-mb 32
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def check_npz_accounting(memory_report):
+    """deep_sizeof of a loaded .npz against its arrays' nbytes; returns (counted, expected)."""
+    import numpy as np
+    from asset_registry import load_npz
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "check.npz")
+        np.savez_compressed(path, a=np.arange(100_000, dtype=np.float64), b=np.ones((200, 300), dtype=np.float32))
+        arrays = load_npz(path)
+    expected = sum(a.nbytes for a in arrays.values())
+    return memory_report.deep_sizeof(arrays), expected
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="Streamlit entry script")
+    ap.add_argument("--sessions", type=int, default=10)
+    ap.add_argument("--rounds", type=int, default=3, help="passes over all pages per session")
+    ap.add_argument("--pages", nargs="+", default=None, help="Navigation labels (default: all)")
+    ap.add_argument("--budget-mb", type=float, default=None, help="per-session budget (default CPA_SESSION_BUDGET_MB or 64)")
+    ap.add_argument("--max-growth-kb", type=float, default=256, help="allowed growth after the first round")
+    ap.add_argument("--timeout", type=float, default=120, help="AppTest timeout per run (s)")
+    args = ap.parse_args()
+
+    os.environ["CPA_MEMORY"] = "1"
+    # Keep the soak from touching the real user data file (set before the
+    # app modules are imported, since common reads it at import)
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["CPA_DATA_FILE"] = os.path.join(tmp.name, "cpa_data.json")
+    if args.budget_mb is not None:
+        os.environ["CPA_SESSION_BUDGET_MB"] = str(args.budget_mb)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    from streamlit.testing.v1 import AppTest
+    import memory_report
+    import views
+
+    counted, expected = check_npz_accounting(memory_report)
+    if not 0.9 * expected <= counted <= 1.1 * expected + 4096:
+        print(f"FAIL: a loaded .npz is sized at {counted} B, its arrays hold {expected} B")
+        sys.exit(1)
+
+    pages = args.pages or list(views.PAGES)
+    peak = {}      # page -> (bytes, session, top key)
+    per_round = {}  # (session, round) -> bytes after the last page
+    errors = []
+    t0 = time.perf_counter()
+    try:
+        apps = [AppTest.from_file(args.app, default_timeout=args.timeout) for _ in range(args.sessions)]
+        for rnd in range(args.rounds):
+            for sid, at in enumerate(apps):
+                for page in pages:
+                    at.session_state["nav"] = page
+                    at.run()
+                    if at.exception:
+                        errors.append(f"session {sid} {page}: {at.exception[0].value[:200]}")
+                    report = memory_report.session_report(at.session_state)
+                    total = sum(report.values())
+                    if total > peak.get(page, (0,))[0]:
+                        peak[page] = (total, sid, next(iter(report), ""))
+                per_round[(sid, rnd)] = total
+            print(f"round {rnd + 1}/{args.rounds} done ({time.perf_counter() - t0:.0f} s)", flush=True)
+        caches = memory_report.cache_report()
+    finally:
+        tmp.cleanup()
+
+    budget = memory_report.BUDGET_BYTES
+    fmt = memory_report.fmt_bytes
+    print(f"\n{'page':<28} {'max session':>12}  largest key")
+    for page in pages:
+        size, sid, key = peak.get(page, (0, None, ""))
+        print(f"{page:<28} {fmt(size):>12}  {key}{'  OVER BUDGET' if size > budget else ''}")
+
+    growth = [per_round[(sid, args.rounds - 1)] - per_round[(sid, 0)] for sid in range(args.sessions)]
+    print(f"\ngrowth round 1 -> {args.rounds}: max {fmt(max(growth))}, mean {fmt(sum(growth) / len(growth))}")
+    print("\nprocess-wide caches:")
+    for name, size in caches.items():
+        print(f"  {name:<32} {fmt(size):>10}")
+    # ru_maxrss is KiB on Linux
+    print(f"\npeak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB, {args.sessions} sessions x {len(pages)} pages x {args.rounds} rounds")
+    for e in errors[:10]:
+        print(f"[WARN] {e}")
+
+    over = [p for p, (size, _, _) in peak.items() if size > budget]
+    leaking = args.rounds > 1 and max(growth) > args.max_growth_kb * 1024
+    if over or leaking:
+        print(f"\nFAIL: {len(over)} page(s) over the {fmt(budget)} budget" + (f", growth above {args.max_growth_kb:g} KB" if leaking else ""))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
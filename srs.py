@@ -0,0 +1,158 @@
+"""One spaced-repetition deck for vocabulary, wrong answers and formulas.
+
+Cards are keyed ``<source>:<id>``:
+
+    vocab:<subject>:<term>     Vocabulary flashcards
+    wrong:<question id>        Wrong Answers notebook (mastery.question_id)
+    formula:<name>             Formulas review
+
+and scheduled with SM-2. Each card is stored in ``data["srs"]["cards"]``
+as a compact list ``[due, interval_days, ease, reps, lapses]`` (``due`` an
+ISO date, so the JSON stays readable and sorts correctly).
+
+``Deck`` keeps a min-heap of ``(due, seq, key)`` over those cards. A review
+pushes a new entry and leaves the old one behind as stale (its ``seq`` no
+longer matches), so the next due card is O(log n) amortized. "Due by a
+date" is a range scan of the heap: a subtree is skipped as soon as its
+root is due later, so listing or counting k due cards touches O(k)
+entries, not the whole deck. Functions here update ``data`` in place and
+leave persisting it to the caller.
+"""
+import heapq
+import itertools
+from datetime import date, timedelta
+
+import mastery
+
+SOURCES = ("vocab", "wrong", "formula")
+NEW_PER_SESSION = 20
+MIN_EASE = 1.3
+START_EASE = 2.5
+# Button grades on the SM-2 0-5 scale
+AGAIN, HARD, GOOD, EASY = 1, 3, 4, 5
+
+
+def vocab_key(subject, term):
+    return f"vocab:{subject}:{term}"
+
+
+def wrong_key(q):
+    return f"wrong:{mastery.question_id(q)}"
+
+
+def formula_key(name):
+    return f"formula:{name}"
+
+
+def source(key):
+    return key.split(":", 1)[0]
+
+
+def sm2(card, grade, today):
+    """Next ``[due, interval, ease, reps, lapses]`` after a review graded 0-5."""
+    _, interval, ease, reps, lapses = card
+    if grade < 3:
+        reps, interval, lapses = 0, 1, lapses + 1
+    else:
+        reps += 1
+        interval = 1 if reps == 1 else 6 if reps == 2 else max(1, round(interval * ease))
+    ease = max(MIN_EASE, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    return [(today + timedelta(days=interval)).isoformat(), interval, round(ease, 2), reps, lapses]
+
+
+class Deck:
+    def __init__(self, state):
+        self.state = state
+        self.cards = state.setdefault("cards", {})
+        self._seq = itertools.count()
+        self._live = {}
+        self._rebuild()
+
+    def _rebuild(self):
+        self._live = {key: next(self._seq) for key in self.cards}
+        self.heap = [(card[0], self._live[key], key) for key, card in self.cards.items()]
+        heapq.heapify(self.heap)
+
+    def _push(self, key):
+        seq = self._live[key] = next(self._seq)
+        heapq.heappush(self.heap, (self.cards[key][0], seq, key))
+        # Drop stale entries once they outnumber the live ones
+        if len(self.heap) > 2 * len(self.cards) + 64:
+            self._rebuild()
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __contains__(self, key):
+        return key in self.cards
+
+    def add(self, key, today):
+        """Enroll a new card due ``today``; no-op if it is already in the deck."""
+        if key not in self.cards:
+            self.cards[key] = [today.isoformat(), 0, START_EASE, 0, 0]
+            self._push(key)
+
+    def review(self, key, grade, today):
+        """Schedule ``key`` after a review (enrolling it first if needed); returns its new card."""
+        self.add(key, today)
+        self.cards[key] = sm2(self.cards[key], grade, today)
+        self._push(key)
+        return self.cards[key]
+
+    def remove_source(self, name):
+        for key in [k for k in self.cards if source(k) == name]:
+            del self.cards[key]
+        self._rebuild()
+
+    def next_due(self):
+        """(key, due) of the earliest card, or None."""
+        while self.heap:
+            due, seq, key = self.heap[0]
+            if self._live.get(key) == seq:
+                return key, due
+            heapq.heappop(self.heap)
+        return None
+
+    def _scan(self, today):
+        # Heap order: children are never due earlier than their parent
+        limit = today.isoformat()
+        heap, stack = self.heap, [0]
+        while stack:
+            i = stack.pop()
+            if i >= len(heap) or heap[i][0] > limit:
+                continue
+            due, seq, key = heap[i]
+            if self._live.get(key) == seq:
+                yield due, seq, key
+            stack.extend((2 * i + 1, 2 * i + 2))
+
+    def due(self, today, prefix=None):
+        """Keys due on or before ``today`` (optionally starting with ``prefix``), most overdue first."""
+        entries = sorted(e for e in self._scan(today) if prefix is None or e[2].startswith(prefix))
+        return [key for _, _, key in entries]
+
+    def due_counts(self, today):
+        counts = dict.fromkeys(SOURCES, 0)
+        for _, _, key in self._scan(today):
+            counts[source(key)] = counts.get(source(key), 0) + 1
+        return counts
+
+
+def session_queue(deck, keys, today, prefix, new_limit=NEW_PER_SESSION):
+    """Due cards under ``prefix`` first, then up to ``new_limit`` of ``keys`` not yet in the deck."""
+    queue = deck.due(today, prefix)
+    fresh = [k for k in keys if k not in deck][:new_limit]
+    return queue + fresh
+
+
+def sync_wrong_answers(deck, data, today=None):
+    """Enroll wrong-answer entries appended since the last sync (O(new entries))."""
+    wrong = data.get("wrong_answers", [])
+    synced = deck.state.get("wrong_synced", 0)
+    if synced > len(wrong):
+        # The notebook was cleared
+        synced = 0
+    today = today or date.today()
+    for entry in wrong[synced:]:
+        deck.add(wrong_key(entry), today)
+    deck.state["wrong_synced"] = len(wrong)
@@ -0,0 +1,127 @@
+"""Materialized study-time rollups kept next to the logs in cpa_data.json.
+
+``data["logs"]`` is the append-only list of study sessions (``date``,
+``subject``, ``duration`` in minutes). Instead of rescanning it on every
+rerun, Dashboard, Analytics and the Study Timer read ``data["rollups"]``:
+
+    count     number of logs folded in so far
+    last      fingerprint of the last log folded in
+    total     minutes over all logs
+    days      {"YYYY-MM-DD": minutes}
+    weeks     {"YYYY-Www": [Mon, ..., Sun minutes]} (ISO weeks)
+    subjects  {subject: minutes}
+    lengths   {session length in minutes: number of sessions}
+
+``add_log`` appends a log and folds it in O(1). ``rollups`` checks
+``count`` and ``last`` against the log list and folds whatever was
+appended behind its back (older files, edits outside the app); if logs
+were removed, or the log at ``count - 1`` is no longer the one folded in
+(an edit or delete followed by an append; see fingerprints.py), it
+rebuilds from scratch. Like quiz_engine, functions update ``data`` in place
+and leave persisting it to the caller.
+"""
+from datetime import date, timedelta
+
+from fingerprints import fingerprint, stale
+
+VERSION = 2
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def week_key(d):
+    year, week, _ = d.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _day(value):
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _minutes(log):
+    try:
+        return float(log.get("duration") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def empty():
+    return {"version": VERSION, "count": 0, "last": None, "total": 0, "days": {}, "weeks": {}, "subjects": {}, "lengths": {}}
+
+
+def _fold(r, log):
+    minutes = _minutes(log)
+    # Keep whole minutes as ints so the JSON stays readable
+    if minutes == int(minutes):
+        minutes = int(minutes)
+    r["count"] += 1
+    r["total"] += minutes
+    length = str(minutes)
+    r["lengths"][length] = r["lengths"].get(length, 0) + 1
+    subject = log.get("subject") or "Other"
+    r["subjects"][subject] = r["subjects"].get(subject, 0) + minutes
+    d = _day(log.get("date"))
+    if d is None:
+        return
+    iso = d.isoformat()
+    r["days"][iso] = r["days"].get(iso, 0) + minutes
+    week = r["weeks"].setdefault(week_key(d), [0] * 7)
+    week[d.weekday()] += minutes
+
+
+def rebuild(data):
+    r = empty()
+    logs = data.get("logs", [])
+    for log in logs:
+        _fold(r, log)
+    r["last"] = fingerprint(logs[-1]) if logs else None
+    data["rollups"] = r
+    return r
+
+
+def rollups(data):
+    """``data["rollups"]``, brought up to date with ``data["logs"]``."""
+    r = data.get("rollups")
+    logs = data.setdefault("logs", [])
+    if not isinstance(r, dict) or r.get("version") != VERSION or stale(r, logs):
+        return rebuild(data)
+    if r["count"] < len(logs):
+        for log in logs[r["count"]:]:
+            _fold(r, log)
+        r["last"] = fingerprint(logs[-1])
+    return r
+
+
+def add_log(data, log):
+    r = rollups(data)
+    data["logs"].append(log)
+    _fold(r, log)
+    r["last"] = fingerprint(log)
+    return r
+
+
+def day_minutes(data, day):
+    return rollups(data)["days"].get(day.isoformat(), 0)
+
+
+def last_days(data, today, n=7):
+    """[(date, minutes)] for the ``n`` days ending ``today``, oldest first."""
+    days = rollups(data)["days"]
+    out = []
+    for i in range(n - 1, -1, -1):
+        d = today - timedelta(days=i)
+        out.append((d, days.get(d.isoformat(), 0)))
+    return out
+
+
+def streak(data, today):
+    """Consecutive days with study time, counting back from ``today``."""
+    days = rollups(data)["days"]
+    n = 0
+    d = today
+    while days.get(d.isoformat(), 0) > 0:
+        n += 1
+        d -= timedelta(days=1)
+    return n
@@ -0,0 +1,209 @@
+"""Opt-in rerun tracing.
+
+    CPA_TRACE=1 streamlit run app.py
+
+With ``CPA_TRACE`` set, every rerun records how long its named sections
+took (session/data loading, sidebar, page import, page body, asset
+registry loads, persistence, chart rendering, ...) and event counts such
+as figure cache hits/misses, shows the breakdown in a collapsible sidebar
+panel and appends one JSON line per rerun to ``CPA_TRACE_FILE`` (default
+``.traces/reruns.jsonl``).
+
+Sections may nest; each name accumulates its own wall time, so "page"
+includes the "charts" and "persist" time spent inside it. Without the env
+var ``section`` returns a shared no-op context manager.
+
+    python tracing.py [--file PATH] [--last N]   # per-page percentiles
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ENABLED = os.environ.get("CPA_TRACE", "") not in ("", "0")
+TRACE_FILE = os.environ.get("CPA_TRACE_FILE", os.path.join(BASE_DIR, ".traces", "reruns.jsonl"))
+CHART_FUNCS = ("plotly_chart", "line_chart", "bar_chart", "area_chart", "scatter_chart", "altair_chart", "pyplot")
+
+# Streamlit runs each session's script on its own thread
+_local = threading.local()
+_write_lock = threading.Lock()
+_NULL = nullcontext()
+
+
+def start(session=None):
+    if ENABLED:
+        now = time.perf_counter()
+        _local.trace = {"ts": time.time(), "session": session, "page": None, "sections": {}, "counts": {}, "t0": now, "lap": now}
+
+
+def set_page(page):
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace["page"] = page
+
+
+@contextmanager
+def _timed(name):
+    trace = getattr(_local, "trace", None)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        if trace is not None:
+            sections = trace["sections"]
+            sections[name] = sections.get(name, 0.0) + (time.perf_counter() - t0) * 1000
+
+
+def section(name):
+    return _timed(name) if ENABLED else _NULL
+
+
+def count(name, n=1):
+    """Add ``n`` to the current rerun's counter ``name`` (no-op when not tracing)."""
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace["counts"][name] = trace["counts"].get(name, 0) + n
+
+
+def lap(name):
+    """Charge the time since the previous lap (or start) to ``name``.
+
+    For straight-line top-level code such as app.py, where a ``with`` block
+    would mean re-indenting the whole script.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        now = time.perf_counter()
+        trace["sections"][name] = trace["sections"].get(name, 0.0) + (now - trace["lap"]) * 1000
+        trace["lap"] = now
+
+
+def finish(path=None):
+    """Close the current rerun's trace, append it to the JSONL file and return it."""
+    trace = getattr(_local, "trace", None)
+    _local.trace = None
+    if trace is None:
+        return None
+    record = {
+        "ts": round(trace["ts"], 3),
+        "session": trace["session"],
+        "page": trace["page"],
+        "total_ms": round((time.perf_counter() - trace["t0"]) * 1000, 2),
+        "sections": {k: round(v, 2) for k, v in trace["sections"].items()},
+    }
+    if trace["counts"]:
+        record["counts"] = trace["counts"]
+    path = path or TRACE_FILE
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _write_lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+    return record
+
+
+def install_chart_hooks(st):
+    """Time Streamlit chart calls (figure serialization + send) as "charts"."""
+    for name in CHART_FUNCS:
+        fn = getattr(st, name, None)
+        if fn is None or getattr(fn, "_traced", False):
+            continue
+
+        def traced(*args, _fn=fn, **kwargs):
+            with section("charts"):
+                return _fn(*args, **kwargs)
+
+        traced._traced = True
+        setattr(st, name, traced)
+
+
+def load(path=None, last=None):
+    path = path or TRACE_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+    if last:
+        lines = lines[-last:]
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def percentile(values, q):
+    xs = sorted(values)
+    if not xs:
+        return 0.0
+    k = (len(xs) - 1) * q / 100.0
+    lo, hi = int(k), min(int(k) + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (k - lo)
+
+
+def summary(records):
+    """Per page: rerun count, sessions, p50/p95 of the total and of every section, summed counts."""
+    pages = {}
+    for r in records:
+        p = pages.setdefault(r.get("page") or "?", {"totals": [], "sections": {}, "sessions": set(), "counts": {}})
+        p["totals"].append(r["total_ms"])
+        p["sessions"].add(r.get("session"))
+        for name, ms in r.get("sections", {}).items():
+            p["sections"].setdefault(name, []).append(ms)
+        for name, n in r.get("counts", {}).items():
+            p["counts"][name] = p["counts"].get(name, 0) + n
+    out = []
+    for page, p in sorted(pages.items()):
+        row = {"page": page, "reruns": len(p["totals"]), "sessions": len(p["sessions"]),
+               "p50_ms": round(percentile(p["totals"], 50), 1), "p95_ms": round(percentile(p["totals"], 95), 1)}
+        for name, values in sorted(p["sections"].items()):
+            row[f"{name} p50"] = round(percentile(values, 50), 1)
+            row[f"{name} p95"] = round(percentile(values, 95), 1)
+        for name, n in sorted(p["counts"].items()):
+            row[f"{name} count"] = n
+        out.append(row)
+    return out
+
+
+def render_panel(st, record):
+    """Collapsible sidebar breakdown of this rerun plus percentiles across sessions."""
+    with st.sidebar.expander(f"⏱️ Rerun trace ({record['total_ms']:.0f} ms)"):
+        rows = sorted(record["sections"].items(), key=lambda kv: -kv[1])
+        st.table([{"section": k, "ms": round(v, 1)} for k, v in rows])
+        if record.get("counts"):
+            st.caption(" · ".join(f"{k}: {v}" for k, v in sorted(record["counts"].items())))
+        if st.checkbox("Figure cache (process)", key="_trace_figures"):
+            import figure_cache
+
+            st.dataframe([{"chart": k, **v} for k, v in figure_cache.cache.stats().items()], hide_index=True)
+        if st.checkbox("Percentiles per page (all sessions)", key="_trace_summary"):
+            st.dataframe(summary(load(last=5000)), hide_index=True)
+        st.caption(TRACE_FILE)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Summarize rerun traces written with CPA_TRACE=1")
+    ap.add_argument("--file", default=TRACE_FILE)
+    ap.add_argument("--last", type=int, default=None, help="only the last N reruns")
+    args = ap.parse_args()
+
+    records = load(args.file, args.last)
+    print(f"{len(records)} reruns from {args.file}")
+    for row in summary(records):
+        print(f"\n{row['page']}: {row['reruns']} reruns / {row['sessions']} sessions, total p50 {row['p50_ms']} ms, p95 {row['p95_ms']} ms")
+        for key, value in row.items():
+            if key.endswith(" p50"):
+                name = key[:-4]
+                print(f"  {name:<12} p50 {value:8.1f}  p95 {row[name + ' p95']:8.1f}")
+            elif key.endswith(" count"):
+                print(f"  {key[:-6]:<24} {value:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Trend lines over long histories with a bounded number of points.
+
+    fig = trend_charts.trend_figure(scores, x="date", y="val", group="subject", y_range=[0, 100])
+
+Records (cpa_data.json dicts with a ``YYYY-MM-DD`` date) are split into one
+series per ``group`` value in a single pass, sorted by date and reduced to
+at most ``budget`` points each with Largest-Triangle-Three-Buckets (LTTB),
+which keeps the peaks and dips a plain stride would drop. Above
+``WEBGL_THRESHOLD`` points in the figure the traces switch to
+``Scattergl``. The figure therefore stays the same size however many
+drills have been logged.
+"""
+from datetime import date
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+go = lazy_import("plotly.graph_objects")
+
+POINT_BUDGET = 400
+WEBGL_THRESHOLD = 1000
+
+
+def lttb(x, y, n):
+    """Indices of the ``n`` points LTTB keeps; the first and last point always stay."""
+    size = len(x)
+    if n >= size or n < 3:
+        return np.arange(size)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # n - 2 buckets between the fixed first and last point
+    edges = np.linspace(1, size - 1, n - 1).astype(int)
+    keep = np.empty(n, dtype=int)
+    keep[0], keep[-1] = 0, size - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (size - 1, size)
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def group_series(records, x="date", y="val", group=None):
+    """{group value: (dates, values)} sorted by date, in one pass over ``records``."""
+    series = {}
+    for r in records:
+        try:
+            d = date.fromisoformat(str(r[x])[:10])
+            v = float(r[y])
+        except (KeyError, TypeError, ValueError):
+            continue
+        series.setdefault(r.get(group) if group else None, []).append((d, v))
+    out = {}
+    for key, points in series.items():
+        points.sort(key=lambda p: p[0])
+        out[key] = ([p[0] for p in points], [p[1] for p in points])
+    return out
+
+
+def downsample(dates, values, budget=POINT_BUDGET):
+    if len(dates) <= budget:
+        return dates, values
+    keep = lttb([d.toordinal() for d in dates], values, budget)
+    return [dates[i] for i in keep], [values[i] for i in keep]
+
+
+def trend_figure(records, x="date", y="val", group=None, title=None, y_range=None, mode="lines+markers",
+                 budget=POINT_BUDGET, webgl_threshold=WEBGL_THRESHOLD):
+    """Figure with one (downsampled) line per ``group`` value; one line when ``group`` is None."""
+    series = {key: downsample(*xy, budget=budget) for key, xy in group_series(records, x, y, group).items()}
+    shipped = sum(len(xs) for xs, _ in series.values())
+    trace = go.Scattergl if shipped > webgl_threshold else go.Scatter
+    fig = go.Figure()
+    for key, (xs, ys) in series.items():
+        fig.add_trace(trace(x=[d.isoformat() for d in xs], y=ys, mode=mode, name=str(key) if group else y,
+                            showlegend=group is not None))
+    fig.update_layout(title=title, yaxis_range=y_range)
+    return fig
@@ -0,0 +1,42 @@
+"""One module per navigation page, each exposing ``render()``.
+
+Page modules are imported on first visit only, so a rerun executes the
+shared sidebar plus the selected page instead of every page's setup code.
+Data loading lives in the page modules, and heavy libraries (pandas,
+numpy, plotly) are bound through ``lazy_imports.lazy_import`` so they load
+only when a page's code path actually touches them.
+"""
+import importlib
+
+import tracing
+
+PAGES = {
+    "Dashboard 📊": "dashboard",
+    "My Syllabus 📚": "syllabus",
+    "Official Checklist ✅": "checklist",
+    "Revisions 🧭": "revisions",
+    "Vocabulary 📖": "vocabulary",
+    "Formulas 📐": "formulas",
+    "English Prep 🌐": "english_prep",
+    "Old Exams 📄": "old_exams",
+    "Study Timer ⏱️": "study_timer",
+    "Mock Exams 📝": "mock_exams",
+    "Scores 📈": "scores",
+    "Wrong Answers 📕": "wrong_answers",
+    "Drills 🔧": "drills",
+    "Exam Mode ⏲️": "exam_mode",
+    "Survival Mode ⚡": "survival",
+    "Analytics 📊": "analytics",
+    "Roadmap 🗺️": "roadmap",
+    "Big 4 Job Hunting 💼": "big4",
+    "Company Directory 🏢": "company_directory",
+    "EDINET 🧾": "edinet",
+    "Future 🚀": "future",
+}
+
+
+def render(page):
+    with tracing.section("import"):
+        module = importlib.import_module(f"{__name__}.{PAGES[page]}")
+    with tracing.section("page"):
+        module.render()
@@ -0,0 +1,56 @@
+"""Study analytics."""
+import streamlit as st
+
+import figure_cache
+import study_rollups
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    st.header("Analytics")
+    scores_df = pd.DataFrame(st.session_state.data.get("scores", []))
+    rollups = study_rollups.rollups(st.session_state.data)
+    c1, c2 = st.columns(2)
+    with c1:
+        st.subheader("Skill Radar")
+        subjects = ['Financial', 'Management', 'Audit', 'Company', 'Tax', 'Elective']
+        radar_scores = [30] * 6
+        if not scores_df.empty:
+            vals = []
+            for sub in subjects:
+                sub_df = scores_df[scores_df['subject'] == sub]
+                if not sub_df.empty:
+                    vals.append(sub_df['val'].mean())
+                else:
+                    vals.append(30)
+            radar_scores = vals
+        fig = figure_cache.figure("analytics_skill_radar", radar_scores, lambda: _skill_radar_figure(subjects, radar_scores))
+        st.plotly_chart(fig, use_container_width=True)
+    with c2:
+        st.subheader("Pacing Histogram")
+        if rollups["count"]:
+            lengths = rollups["lengths"]
+            fig = figure_cache.figure("analytics_pacing", lengths, lambda: px.histogram(
+                x=[float(m) for m in lengths], y=list(lengths.values()), histfunc="sum", nbins=20,
+                labels={"x": "minutes", "y": "sessions"}, title="Study Session Lengths"))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No study logs")
+    st.subheader("Weekly Heatmap")
+    if rollups["weeks"]:
+        # Weekday x ISO week, straight from the weekly rollup
+        weeks = rollups["weeks"]
+        pivot = pd.DataFrame({w: weeks[w] for w in sorted(weeks)}, index=study_rollups.WEEKDAYS)
+        st.dataframe(pivot)
+    else:
+        st.info("No data for heatmap")
+
+
+def _skill_radar_figure(subjects, radar_scores):
+    fig = go.Figure(data=go.Scatterpolar(r=radar_scores, theta=subjects, fill='toself', name='Avg'))
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 100])), showlegend=False, height=350)
+    return fig
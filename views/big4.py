@@ -0,0 +1,722 @@
+"""Big 4 job hunting tracker."""
+import streamlit as st
+
+import figure_cache
+from common import load_data, save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    st.header("🏢 Big 4 CPA Job Hunting Strategy")
+    st.markdown("Strategy guide and comparison for the major audit firms in Japan.")
+
+    tab1, tab2, tab_depts, tab3, tab4, tab5 = st.tabs(["Strategy & Timeline", "Big 4 Comparison", "Departments (FAS/Tax/...) 🏢", "Tech & Data Science Advantage 🤖", "Boston Career Forum 🇺🇸", "Interview & Case Prep 📝"])
+
+    with tab1:
+        st.subheader("📅 Job Hunting Timeline (Typical)")
+        st.info("The job hunting season for CPA candidates peaks immediately after the August Essay Exam.")
+        
+        timeline_data = [
+            {"Period": "August (Late)", "Activity": "Essay Exam Ends", "Details": "Rest for a few days, then prepare for briefings."},
+            {"Period": "September", "Activity": "Firm Briefings (Setsumeikai)", "Details": "Attend online/offline sessions. Key for networking."},
+            {"Period": "October", "Activity": "Entry Sheet (ES) Submission", "Details": "Prepare resumes. Focus on 'Why this firm?'"},
+            {"Period": "November (Mid)", "Activity": "Results Announcement", "Details": "Official passing results released."},
+            {"Period": "November (Late)", "Activity": "Interviews & Offers", "Details": "Intensive interview period (1-2 weeks). Offers issued quickly."}
+        ]
+        st.table(pd.DataFrame(timeline_data))
+
+        st.subheader("💡 Key Strategies")
+        st.markdown("""
+        *   **Start Early**: Don't wait for the results. Attend briefings in September.
+        *   **Differentiate**: All Big 4 do audit. Focus on culture, specific clients (e.g., Tech, Auto), or non-audit opportunities (IPO, Advisory).
+        *   **Networking**: Use alumni connections (OB/OG Visits) if possible.
+        """)
+
+    with tab2:
+        st.subheader("📊 Big 4 Audit Firms vs. Tech Giants Comparison")
+        
+        # Personalized Ranking Section
+        st.markdown("### 🏆 Personalized Ranking for You (ML/DS Master's Student)")
+        st.info("""
+        Based on your **CPA Goal** + **ML/Data Science Strength**, here is your recommended priority:
+        
+        1.  🥇 **PwC Aarata / EY ShinNihon**: Best balance of **Digital Audit** innovation and **CPA License** support. Both have dedicated "Digital" tracks for auditors.
+        2.  🥈 **Deloitte Tohmatsu**: Massive scale and data access. Great for "Audit Analytics" but slightly more traditional hierarchy.
+        3.  🥉 **Accenture / IBM**: **Top Tier for Tech**, but ⚠️ **WARNING**: You likely **cannot** complete the CPA practical experience (Jitsumu Hoshu) requirement here. Great for *after* getting your CPA, or if you pivot to Consulting.
+        """)
+
+        # Radar Chart
+        st.subheader("Visual Comparison (Illustrative)")
+        st.plotly_chart(figure_cache.figure("big4_radar", None, _firm_radar_figure), use_container_width=True)
+        
+        st.subheader("🏢 Firm Details")
+        firms_data = [
+            {
+                "Firm Name (JP)": "有限責任監査法人トーマツ (Tohmatsu)",
+                "Network": "Deloitte",
+                "Key Strengths": "Largest scale, aggressive growth, strong in IPOs and Venture support.",
+                "Culture": "Meritocratic, Sports-oriented, High energy.",
+                "Link": "https://www2.deloitte.com/jp/ja/pages/audit/topics/recruit-index.html"
+            },
+            {
+                "Firm Name (JP)": "有限責任 あずさ監査法人 (AZSA)",
+                "Network": "KPMG",
+                "Key Strengths": "Balanced portfolio, strong domestic manufacturing clients.",
+                "Culture": "Conservative, Collaborative, 'Gentlemanly'.",
+                "Link": "https://home.kpmg/jp/ja/home/careers.html"
+            },
+            {
+                "Firm Name (JP)": "EY新日本有限責任監査法人 (EY ShinNihon)",
+                "Network": "EY",
+                "Key Strengths": "Long history, large number of listed clients, strong Digital Audit focus.",
+                "Culture": "Traditional yet transforming, Diversity focus.",
+                "Link": "https://www.ey.com/ja_jp/careers/audit"
+            },
+            {
+                "Firm Name (JP)": "PwCあらた有限責任監査法人 (PwC Aarata)",
+                "Network": "PwC",
+                "Key Strengths": "Global integration, strong advisory connection, newer organizational style.",
+                "Culture": "Global, Flat hierarchy, Innovative.",
+                "Link": "https://www.pwc.com/jp/ja/careers/audit.html"
+            },
+            {
+                "Firm Name (JP)": "アクセンチュア (Accenture)",
+                "Network": "Accenture",
+                "Key Strengths": "Absolute leader in DX/IT Consulting. High salary.",
+                "Culture": "Up or Out (Evolving), High performance, Tech-first.",
+                "Link": "https://www.accenture.com/jp-ja/careers"
+            },
+            {
+                "Firm Name (JP)": "日本IBM (IBM Japan)",
+                "Network": "IBM",
+                "Key Strengths": "Deep research (Watson), Hybrid Cloud, Legacy stability.",
+                "Culture": "Engineering-driven, Mature, Good work-life balance.",
+                "Link": "https://www.ibm.com/jp-ja/employment"
+            }
+        ]
+        
+        # Display as a styled table or cards
+        for firm in firms_data:
+            with st.expander(f"{firm['Firm Name (JP)']} ({firm['Network']})", expanded=True):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.markdown(f"**Strengths:** {firm['Key Strengths']}")
+                    st.markdown(f"**Culture:** {firm['Culture']}")
+                with col2:
+                    st.link_button("Recruit Page", firm['Link'])
+
+    with tab_depts:
+        st.subheader("🏢 Service Lines & Business Units")
+        st.markdown("Beyond Audit: Understanding the different career paths within Big 4.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🔍 Audit & Assurance (監査・保証)")
+            st.info("""
+            **The Core Business.**
+            *   **Role:** Examining financial statements to ensure accuracy and compliance.
+            *   **Pros:** Stability, clear career path, high demand for CPAs.
+            *   **Cons:** Can be repetitive, busy season is intense.
+            *   **For You:** "Digital Audit" roles are growing fast here.
+            """)
+            
+            st.markdown("### 💰 Financial Advisory (FAS)")
+            st.warning("""
+            **The "Deal" Makers.**
+            *   **Role:** M&A support, Valuations, Due Diligence, Forensic investigations.
+            *   **Pros:** High compensation, dynamic work, exposure to high-level strategy.
+            *   **Cons:** Very high pressure, long hours, up-or-out culture.
+            *   **For You:** **Forensic Technology** (Fraud Detection) is a perfect fit for Data Science skills.
+            """)
+
+        with col2:
+            st.markdown("### ⚖️ Tax (税務)")
+            st.info("""
+            **The Specialists.**
+            *   **Role:** Corporate tax compliance, Transfer Pricing, International Tax.
+            *   **Pros:** Deep expertise, high autonomy, stable.
+            *   **Cons:** Highly specialized (niche), constant regulatory changes.
+            *   **For You:** "Tax Technology" is emerging, but less common for new grads than Audit.
+            """)
+            
+            st.markdown("### 🚀 Consulting (コンサルティング)")
+            st.success("""
+            **The Problem Solvers.**
+            *   **Role:** Strategy, IT Implementation, Operations improvement.
+            *   **Note:** Usually a separate entity (e.g., Deloitte Tohmatsu Consulting vs. Deloitte Tohmatsu Audit).
+            *   **Pros:** Variety of projects, high pay.
+            *   **Cons:** Travel, unstable workload, "Jack of all trades" risk.
+            """)
+
+    with tab3:
+        st.subheader("🤖 Leveraging Data Science & ML in CPA Job Hunting")
+        st.markdown("""
+        **Profile:** Double Degree Master's Student (Keio 🇯🇵 & Leibniz Hannover 🇩🇪) | **Major:** Mechanical Engineering
+        
+        **Your Technical Arsenal:**
+        *   **Advanced ML:** Graph Neural Networks (GNNs), PyTorch, Bayesian Inference (MCMC/TMCMC).
+        *   **Engineering:** Finite Element Analysis (FEA), Structural Health Monitoring.
+        *   **Languages:** Python, MATLAB, TypeScript.
+        
+        Your background is a **massive differentiator** in the modern audit industry. All Big 4 firms are heavily investing in "Audit Transformation" and "Digital Audit".
+        """)
+
+        st.markdown("---")
+        st.markdown("### 📚 Recommended Reading")
+        st.markdown("""
+        > **[The State of Generative AI in the Enterprise (Deloitte)](https://www.deloitte.com/global/en/issues/generative-ai/state-of-ai-in-enterprise.html)**  
+        > *This report highlights how enterprises are adopting GenAI. Essential reading for interviews to show commercial awareness.*
+        """)
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🎯 Target Roles")
+            st.success("**1. Digital Audit Specialist**")
+            st.markdown("Work at the intersection of Audit and Tech. Use Python/SQL to analyze full population data instead of sampling.")
+            
+            st.success("**2. AI Governance / Algorithm Assurance**")
+            st.markdown("Audit AI models! With your GNN/Bayesian background, you can audit complex *algorithms* themselves, not just the financial numbers.")
+            
+            st.success("**3. Financial Advisory (FAS) - Forensics**")
+            st.markdown("Your experience in 'Defect Localization' translates perfectly to **Fraud Detection** (finding anomalies in massive datasets).")
+
+        with col2:
+            st.markdown("### 💡 Strategic Actions")
+            st.info("**Resume / Entry Sheet (ES)**")
+            st.markdown("*   **Highlight Research**: Explicitly mention your GNN work for Aerospace/CFRP. It shows you can handle *complex, unstructured data*.")
+            st.markdown("*   **Keywords**: `PyTorch`, `Bayesian Inference`, `Uncertainty Quantification`, `End-to-End Pipelines`.")
+            
+            st.info("**Interview Questions to Ask**")
+            st.markdown("*   *\"How can I apply Bayesian methods to audit risk assessment?\"*\n*   *\"Does your firm analyze unstructured data (like contracts/images) using GNNs or NLP?\"*")
+            
+            st.info("**Firm-Specific Tech Vibes**")
+            st.markdown("""
+            *   **EY**: Very strong brand in "Digital Audit". Has "EY Digital" specific recruiting tracks.
+            *   **PwC**: Strong on "Tech-enablement". "Digital Upskilling" for all staff is a key slogan.
+            *   **Deloitte**: "Audit Analytics" is a core part of their massive scale.
+            *   **KPMG**: "Digital Innovation" focus, often collaborative with their consulting arm.
+            """)
+
+    with tab4:
+        st.subheader("🇺🇸 Boston Career Forum (BCF)")
+        st.markdown("The world's largest job fair for Japanese-English bilinguals. **Crucial for Master's students.**")
+        
+        st.info("💡 **Why BCF for You?**\n*   **Speed**: Offers (Naitei) often given in 3 days (Fri-Sun).\n*   **Positions**: Big 4 hires for **Advisory/Consulting** heavily here, not just Audit.\n*   **Timing**: Held in November, aligning perfectly with post-essay exam period.")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("### 📅 Timeline")
+            st.markdown("""
+            *   **Aug-Sep**: Registration & Resume Upload.
+            *   **Sep-Oct**: Online Applications & Skype Interviews (Pre-event).
+            *   **Nov (Event)**: Walk-ins (Risky) vs. Scheduled Interviews (Safe).
+            """)
+        with col2:
+            st.markdown("### 🎯 Strategy")
+            st.markdown("""
+            *   **Pre-Event is King**: Secure interviews *before* flying to Boston.
+            *   **Target**: Big 4 (US & Japan offices), Consulting (MBB/Accenture), Tech.
+            *   **Dinner Invitations**: If you do well, you get invited to dinner. This is effectively the final interview.
+            """)
+        st.link_button("BCF Official Site", "https://careerforum.net/en/event/bos/")
+
+    with tab5:
+        st.subheader("📝 Interview & Case Prep: The 'Master' Level")
+        
+        st.info("💡 **Goal**: Move beyond 'prepared answers'. Show **Intellectual Curiosity** and **Professional Maturity**.")
+
+        # --- Interactive Mock Interview ---
+        st.markdown("### 🤖 Mock Interview Simulator")
+        mock_mode = st.radio("Select Mode:", ["Behavioral (HR/Partner)", "Technical (Audit/Accounting)", "Case/Logic (Consulting)", "Buy-Side (Investment)"], horizontal=True)
+        
+        if st.button("🎲 Generate Question"):
+            import random
+            
+            if "Behavioral" in mock_mode:
+                q_bank = [
+                    {"q": "Why do you want to be a CPA instead of an Engineer?", "hint": "Connect 'Reliability' in Engineering to 'Assurance' in Audit."},
+                    {"q": "Why our firm specifically? (Why not others?)", "hint": "Mention specific culture, clients (Tech/Auto), or digital initiatives."},
+                    {"q": "Tell me about a time you failed.", "hint": "Focus on the **Lesson Learned** and **Improvement**, not the failure itself."},
+                    {"q": "How do you handle disagreement with a team member?", "hint": "Emphasize **Listening**, **Data-driven discussion**, and **Shared Goals**."},
+                    {"q": "What is your career plan for the next 5-10 years?", "hint": "Be ambitious but realistic. 'Digital Audit Specialist' -> 'Project Manager'."},
+                    {"q": "Describe your research in simple terms to a 10-year-old.", "hint": "Tests communication skills. Avoid jargon. Use analogies."}
+                ]
+            elif "Technical" in mock_mode:
+                q_bank = [
+                    {"q": "What is the difference between 'Audit' and 'Advisory'?", "hint": "Audit = Assurance (Past/Present). Advisory = Consulting (Future/Improvement)."},
+                    {"q": "Explain 'Materiality' in Audit.", "hint": "The threshold above which a misstatement would influence decision making."},
+                    {"q": "How would you audit a company with massive data volumes?", "hint": "ITAC (IT Application Controls) + Data Analytics (Full population testing)."},
+                    {"q": "What are the risks of using AI in financial reporting?", "hint": "Black box logic, Bias, Hallucinations, Lack of audit trail."},
+                    {"q": "Explain the concept of 'Going Concern'.", "hint": "The assumption that a company will continue operating in the foreseeable future."}
+                ]
+            elif "Case/Logic" in mock_mode: # Case
+                q_bank = [
+                    {"q": "Estimate the number of smartphones sold in Japan annually.", "hint": "Pop (125M) x Penetration (80%) / Replacement Cycle (3 years)."},
+                    {"q": "A client's profit is down 20%. How do you analyze it?", "hint": "Revenue vs Cost. Price x Vol. Fixed vs Variable. External vs Internal."},
+                    {"q": "Should a Japanese auto-maker enter the EV market in India?", "hint": "Market Size, Competition, Regulation, Infrastructure, Capabilities."},
+                    {"q": "How would you use AI to improve audit efficiency?", "hint": "Automated document review, Anomaly detection in journals, Chatbot for inquiries."}
+                ]
+            else: # Buy-Side
+                q_bank = [
+                    {"q": "Pitch a stock you would buy today (Japan-listed).", "hint": "Thesis, Catalysts, Valuation (PE/EV/EBITDA/DCF), Risks."},
+                    {"q": "Walk me through an LBO model at a high level.", "hint": "Sources & Uses, Leverage, Operating Case, Exit Multiple, IRR/MOIC."},
+                    {"q": "How would you diligence a mid-cap manufacturing target?", "hint": "Unit economics, customers, order backlog, capex, working capital seasonality."},
+                    {"q": "What is your investment edge as a CPA + Engineer?", "hint": "Accounting quality + Technical moat assessment + Data skills."}
+                ]
+            
+            selected = random.choice(q_bank)
+            st.session_state['mock_q'] = selected
+            st.session_state['show_hint'] = False
+        
+        if 'mock_q' in st.session_state:
+            st.markdown(f"#### ❓ Q: {st.session_state['mock_q']['q']}")
+            
+            if st.button("Show Hint / Direction"):
+                st.session_state['show_hint'] = not st.session_state.get('show_hint', False)
+                
+            if st.session_state.get('show_hint', False):
+                st.success(f"💡 **Direction**: {st.session_state['mock_q']['hint']}")
+        
+        st.divider()
+
+        # --- Case Interview Prep ---
+        st.markdown("### 🧮 Case Interview Prep")
+        with st.expander("Framework Cheatsheet（フレームワーク早見）", expanded=False):
+            st.markdown("""
+            - Profitability: Profit = Price×Volume − Fixed − Variable
+            - Market Sizing: Top-down (Population→Penetration→Frequency) / Bottom-up (Units×Price)
+            - Growth: New customers / ARPU / Retention / New products / Geographies
+            - Cost Cut: COGS（材料/歩留/物流）× 稼働率、SG&A（人件費/広告/IT）
+            - Pricing: Value-based / Cost-plus / Competitive parity / Segmentation
+            - Investment: Thesis / Catalysts / Moat / Valuation / Risks
+            """)
+        with st.expander("Quick Calculators（即席計算）", expanded=False):
+            col_q1, col_q2 = st.columns(2)
+            with col_q1:
+                st.caption("Break-even Units")
+                be_f = st.number_input("Fixed Costs", min_value=0.0, value=1000.0, step=10.0, key="case_be_f")
+                be_p = st.number_input("Price per Unit", min_value=0.0, value=20.0, step=1.0, key="case_be_p")
+                be_v = st.number_input("Variable per Unit", min_value=0.0, value=12.0, step=1.0, key="case_be_v")
+                be_units = (be_f / (be_p - be_v)) if (be_p - be_v) > 0 else None
+                st.metric("Q_BE", f"{be_units:.1f}" if be_units else "N/A")
+            with col_q2:
+                st.caption("Simple DCF (Perpetual)")
+                cf1 = st.number_input("FCF Year 1", min_value=0.0, value=100.0, step=5.0, key="case_dcf_cf1")
+                g = st.number_input("Growth g (%)", min_value=0.0, max_value=10.0, value=2.0, step=0.5, key="case_dcf_g")
+                k = st.number_input("Discount k (%)", min_value=1.0, max_value=20.0, value=8.0, step=0.5, key="case_dcf_k")
+                pv = (cf1 * (1 + g/100)) / ((k/100) - (g/100)) if k > g else None
+                st.metric("PV (Gordon)", f"{pv:.1f}" if pv else "N/A")
+        with st.expander("Issue Tree Builder（MECE）", expanded=False):
+            case_type = st.selectbox("Case Type", ["Profitability", "Market Entry", "Growth"], key="issue_type")
+            seed = {
+                "Profitability": ["Revenue", "Costs"],
+                "Market Entry": ["Market", "Competition", "Capabilities", "Regulation"],
+                "Growth": ["New Customers", "ARPU", "Retention", "Geographies", "Products"]
+            }[case_type]
+            st.write(", ".join(seed))
+            note = st.text_area("Add branches (one per line)", value="")
+            if st.button("Export Outline", key="issue_export"):
+                txt = f"{case_type} Case\n" + "\n".join([f"- {x}" for x in seed]) + ("\n" + "\n".join([f"- {x}" for x in note.splitlines() if x.strip()]) if note else "")
+                st.code(txt, language="markdown")
+        with st.expander("Market Sizing Generator", expanded=False):
+            if st.button("Generate Scenario", key="ms_gen"):
+                import random
+                pop = random.choice([50, 80, 100, 125])
+                pen = random.choice([40, 60, 75, 80])
+                freq = random.choice([1, 2, 4, 12])
+                price = random.choice([1000, 2000, 5000])
+                st.session_state['ms_scn'] = {"pop": pop, "pen": pen, "freq": freq, "price": price}
+            scn = st.session_state.get('ms_scn')
+            if scn:
+                st.markdown(f"Population={scn['pop']}M, Penetration={scn['pen']}%, Frequency={scn['freq']}/yr, Price=¥{scn['price']}")
+                ans_units = scn['pop']*1e6 * (scn['pen']/100) * scn['freq']
+                ans_revenue = ans_units * scn['price']
+                guess = st.number_input("Your revenue estimate (JPY)", min_value=0.0, value=0.0, step=1000.0)
+                if st.button("Check", key="ms_check"):
+                    tol = 0.1
+                    low = ans_revenue*(1-tol)
+                    high = ans_revenue*(1+tol)
+                    correct = (guess >= low and guess <= high)
+                    if correct:
+                        st.success("Close enough. Good job.")
+                    else:
+                        st.error("Outside tolerance.")
+                    st.caption(f"Answer≈ ¥{int(ans_revenue):,}")
+        with st.expander("Math Speed Drills", expanded=False):
+            if st.button("New Set", key="math_new"):
+                import random
+                qs = []
+                for _ in range(5):
+                    a = random.randint(50, 500)
+                    b = random.randint(5, 50)
+                    qs.append({"q": f"{a} × {b}", "a": a*b})
+                st.session_state['math_set'] = qs
+            ms = st.session_state.get('math_set', [])
+            if ms:
+                answers = []
+                for i, item in enumerate(ms):
+                    u = st.number_input(item["q"], min_value=0.0, step=1.0, key=f"math_{i}")
+                    answers.append(u)
+                if st.button("Grade", key="math_grade"):
+                    correct = 0
+                    for i, item in enumerate(ms):
+                        if int(answers[i]) == item["a"]:
+                            correct += 1
+                    st.metric("Score", f"{correct}/5")
+        with st.expander("Chart Reading Drill", expanded=False):
+            import pandas as _pd
+            import plotly.express as _px
+            dfc = _pd.DataFrame({"Cat": ["A","B","C","D"], "Y1": [100, 140, 90, 110], "Y2": [120, 130, 150, 100]})
+            figc = _px.bar(dfc, x="Cat", y=["Y1","Y2"], barmode="group", title="Category Values")
+            st.plotly_chart(figc, use_container_width=True)
+            st.caption("Q: Which category has the largest increase from Y1 to Y2?")
+            inp = st.selectbox("Your answer", ["A","B","C","D"], key="chart_ans")
+            inc = (dfc["Y2"]-dfc["Y1"]).tolist()
+            idx = inc.index(max(inc))
+            if st.button("Check", key="chart_check"):
+                if inp == dfc.iloc[idx]["Cat"]:
+                    st.success("Correct.")
+                else:
+                    st.error(f"Incorrect. Answer: {dfc.iloc[idx]['Cat']}")
+
+        st.divider()
+
+        # --- Detailed Guide ---
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🗣️ Core Competency Questions (STAR Method)")
+            with st.expander("1. Self-Introduction & Why CPA?", expanded=True):
+                st.markdown("""
+                **The 'Engineer to Auditor' Narrative**:
+                *   "I research **Defect Localization** in aerospace structures using **AI**. My job is to find 'hidden cracks' before they cause failure."
+                *   "I realized **Audit** is the same concept but for **Business Structures**. I want to use my tech skills to find 'financial cracks' and ensure stability."
+                *   **Why**: "Engineering is precise. Accounting is the language of business. I want to combine **Precision + Business Logic**."
+                """)
+            
+            with st.expander("2. Handling Conflict / Teamwork"):
+                st.markdown("""
+                *   **Situation**: "In a joint research project with 3 others..."
+                *   **Task**: "We disagreed on the simulation method (Speed vs Accuracy)."
+                *   **Action**: "I didn't argue opinion. I proposed a **small-scale benchmark test** to compare data."
+                *   **Result**: "Data showed my method was 2x faster with 99% accuracy. Team agreed based on evidence."
+                *   **Key**: You are **Data-Driven** and **Collaborative**.
+                """)
+
+        with col2:
+            st.markdown("### 🙋‍♂️ Reverse Questions (Gyakushitsumon)")
+            st.info("Asking good questions is more important than giving good answers.")
+            
+            with st.expander("Level 1: The 'Safe' Questions"):
+                st.markdown("""
+                *   "What does a typical day look like for a first-year associate?"
+                *   "How is the team structure for a typical audit engagement?"
+                *   "What kind of training support is available for CPA exam (Jitsumu Hoshu)?"
+                """)
+                
+            with st.expander("Level 2: The 'Interest' Questions"):
+                st.markdown("""
+                *   "I am interested in the Digital Audit sector. How early can I get involved in data analytics projects?"
+                *   "What differentiates a 'High Performer' from an average one in your firm?"
+                *   "Can you tell me about the most challenging project you've worked on recently?"
+                """)
+                
+            with st.expander("Level 3: The 'Killer' Questions (Partner Level)"):
+                st.markdown("""
+                *   "With the rise of AI, how do you see the **business model of Audit** changing in 5 years? Will it shift from 'Time-Charge' to 'Value-Based'?"
+                *   "How is the firm preparing for the auditing of **Non-Financial Information** (ESG/Sustainability)? I believe my engineering background could be useful there."
+                *   "I want to be a bridge between the Tech team and the Audit team. Is there a career path for a 'Hybrid' professional?"
+                """)
+        st.divider()
+        st.markdown("### 🧑‍💻 Programming Test")
+        prob = st.selectbox("Select Problem", ["FizzBuzz", "Two Sum", "Valid Parentheses", "Fibonacci", "Anagram Grouping"], key="code_prob")
+        starter = {
+            "FizzBuzz": "def fizzbuzz(n):\n    res = []\n    for i in range(1, n+1):\n        out = ''\n        if i % 3 == 0:\n            out += 'Fizz'\n        if i % 5 == 0:\n            out += 'Buzz'\n        res.append(out or str(i))\n    return res\n",
+            "Two Sum": "def two_sum(nums, target):\n    idx = {}\n    for i, x in enumerate(nums):\n        y = target - x\n        if y in idx:\n            return [idx[y], i]\n        idx[x] = i\n    return []\n",
+            "Valid Parentheses": "def valid_parentheses(s):\n    stack = []\n    m = {')':'(', ']':'[', '}':'{'}\n    for ch in s:\n        if ch in '([{':\n            stack.append(ch)\n        elif ch in ')]}':\n            if not stack or stack[-1] != m[ch]:\n                return False\n            stack.pop()\n    return not stack\n",
+            "Fibonacci": "def fib(n):\n    if n <= 1:\n        return n\n    a, b = 0, 1\n    for _ in range(n-1):\n        a, b = b, a+b\n    return b\n",
+            "Anagram Grouping": "def group_anagrams(words):\n    buckets = {}\n    for w in words:\n        k = ''.join(sorted(w))\n        buckets.setdefault(k, []).append(w)\n    return list(buckets.values())\n"
+        }[prob]
+        code = st.text_area("Write your function", value=starter, height=260, key="code_area")
+        if st.button("Run Tests", key="run_tests"):
+            safe_builtins = {'range': range, 'len': len, 'abs': abs, 'min': min, 'max': max, 'sum': sum, 'sorted': sorted, 'enumerate': enumerate, 'zip': zip, 'map': map, 'filter': filter, 'all': all, 'any': any, 'list': list, 'dict': dict, 'set': set, 'tuple': tuple}
+            g = {"__builtins__": safe_builtins}
+            l = {}
+            ok = False
+            try:
+                exec(code, g, l)
+                ok = True
+            except Exception as e:
+                st.error(f"Compile error: {e}")
+            if ok:
+                res_lines = []
+                def run_case(fn, args, exp):
+                    try:
+                        out = fn(*args)
+                        return out == exp, out, exp
+                    except Exception as err:
+                        return False, str(err), exp
+                tests = []
+                if prob == "FizzBuzz":
+                    tests = [([15], [str(i) if (i%3 and i%5) else ('Fizz'*(i%3==0)+'Buzz'*(i%5==0)) or str(i) for i in range(1,16)])]
+                    fn = l.get("fizzbuzz")
+                elif prob == "Two Sum":
+                    tests = [([[2,7,11,15], 9], [0,1]), ([[3,2,4], 6], [1,2])]
+                    fn = l.get("two_sum")
+                elif prob == "Valid Parentheses":
+                    tests = [(["()[]{}"], True), (["(]"], False), (["({[]})"], True)]
+                    fn = l.get("valid_parentheses")
+                elif prob == "Fibonacci":
+                    tests = [([0],0),([1],1),([10],55)]
+                    fn = l.get("fib")
+                else:
+                    tests = [([["eat","tea","tan","ate","nat","bat"]], [['eat','tea','ate'], ['tan','nat'], ['bat']])]
+                    fn = l.get("group_anagrams")
+                if not fn:
+                    st.error("Function not found with required name.")
+                else:
+                    passed = 0
+                    for args, exp in tests:
+                        ok, out, ex = run_case(fn, args, exp)
+                        if ok:
+                            passed += 1
+                        res_lines.append(f"Input={args} | Output={out} | Expected={ex} | {'OK' if ok else 'NG'}")
+                    st.code("\n".join(res_lines), language="text")
+                    st.metric("Passed", f"{passed}/{len(tests)}")
+        with st.expander("Solution Outline (Steps)", expanded=False):
+            if prob == "FizzBuzz":
+                st.write("Loop 1..n; if %3 append 'Fizz'; if %5 append 'Buzz'; else str(i).")
+            elif prob == "Two Sum":
+                st.write("Use hashmap: store value→index; for x find target−x.")
+            elif prob == "Valid Parentheses":
+                st.write("Use stack; push opens; on close check top and pop; stack empty at end.")
+            elif prob == "Fibonacci":
+                st.write("Iterate a,b; next=b,a+b; repeat n−1 times.")
+            else:
+                st.write("Key = sorted letters of word; group by key.")
+
+    # --- Buy-Side Path Tab ---
+    tab_bs = st.tabs(["Buy-Side Path 💹"])[0]
+    with tab_bs:
+        st.subheader("💹 Buy-Side（AM / PE / VC）への道：CPA×Engineer")
+        st.markdown("""
+        **Roles**
+        - AM（アセットマネジメント）: Equity/Fixed Income Analyst → PM  
+        - PE: Deal Sourcing, DD（商流/財務/業界）, モデル（LBO）, バリューアップ  
+        - VC: Sourcing, Tech DD, Term Sheet, ポートフォリオ支援
+        
+        **必須スキル**
+        - Accounting/Valuation: 財務3表、DCF/Multiples、Quality of Earnings
+        - Modeling: 3-statement, LBO, Sensitivity（Excel/Sheets; Python可）
+        - Domain/Tech: 事業理解（製造/Tech）、データ処理（Python, SQL）
+        - Edge（差別化）: CPAの会計品質×Engineerの技術理解/自動化
+        
+        **典型ルート**
+        1) 監査（上場/製造/Tech）→ FAS（DD/Valuation）→ PE  
+        2) 監査 → 事業会社（Corp Dev/IR/FP&A）→ PE/AM  
+        3) Data/ML（Fin）→ Quant/AM  
+        
+        **実装アクション（ToDo）**
+        - モデルポートフォリオ作成：3表・DCF・LBO（テンプレ整備）
+        - 投資メモ（1-2ページ）: Thesis/Catalysts/Valuation/Risks（月1本）
+        - 認定: CFA（推奨）＋CPA、Pythonプロジェクト（バックテスト/スクレイピング）
+        - ネットワーキング: ミートアップ、OB訪問、LinkedIn最適化
+        """)
+        with st.expander("📎 ダウンロード（テンプレ）", expanded=False):
+            st.markdown("- DCF テンプレ（準備中）\n- LBO テンプレ（準備中）\n- One-Pager 投資メモ（準備中）")
+
+        st.markdown("### What is Buy-Side?")
+        st.markdown("""
+        - Investors that allocate capital to generate returns.  
+        - 代表: アセットマネジメント（公募/機関）、プライベートエクイティ、ベンチャーキャピタル、ヘッジファンド。  
+        - 主な成果物: 投資リターン、投資メモ、DDレポート、ポートフォリオ管理。
+        """)
+        st.markdown("### Buy-Side vs Sell-Side")
+        st.markdown("""
+        | 観点 | Buy-Side | Sell-Side |
+        |---|---|---|
+        | 顧客 | 自社/投資家 | 外部クライアント |
+        | 成果 | リターン/損益 | フィー/アドバイス |
+        | 仕事 | 投資選定/DD/運用 | リサーチ/仲介/アドバイス |
+        | 時間軸 | 中長期（戦略/実行） | 短中期（案件/レポート） |
+        """)
+
+        if "buyside_plan" not in st.session_state:
+            try:
+                _data = load_data()
+                st.session_state["buyside_plan"] = _data.get("buyside_plan", {})
+            except Exception:
+                st.session_state["buyside_plan"] = {}
+
+        st.markdown("### Readiness Self-Assessment")
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            r_acc = st.slider("Accounting/Valuation", 0, 10, 6, key="ready_acc")
+            r_mod = st.slider("Modeling (3表/DCF/LBO)", 0, 10, 5, key="ready_mod")
+        with c2:
+            r_dom = st.slider("Domain (製造/Tech理解)", 0, 10, 6, key="ready_dom")
+            r_data = st.slider("Data (Python/SQL)", 0, 10, 6, key="ready_data")
+        with c3:
+            r_eng = st.slider("English/Global", 0, 10, 5, key="ready_eng")
+            r_net = st.slider("Networking", 0, 10, 4, key="ready_net")
+        score = int((r_acc*0.2 + r_mod*0.2 + r_dom*0.15 + r_data*0.15 + r_eng*0.15 + r_net*0.15) * 10)
+        st.metric("Readiness Score", f"{score}/100")
+        st.progress(score)
+        if score < 60:
+            st.info("Focus: Modeling と English を引き上げる。DCF/LBO と英語ピッチの反復。")
+        elif score < 80:
+            st.success("Good 基盤。案件型アウトプット（投資メモ/月）を習慣化。")
+        else:
+            st.success("Ready 水準。応募＋面接練習を本格化。")
+
+        st.markdown("### 12-Week Plan")
+        plan_items = [
+            "Week1: 3表リンク再復習（運転資本/設備/税効果）",
+            "Week2: DCF（WACC/Terminal）を自作テンプレで2社",
+            "Week3: 上場製造業でQofE視点の調整を考える",
+            "Week4: LBO簡易モデル（5年・簡易金利・Exit倍数）",
+            "Week5: Stock Pitch #1（1-2ページ）",
+            "Week6: セクター研究（自動車/サプライチェーン）",
+            "Week7: DDフレーム（商流/財務/法務/オペレーション）",
+            "Week8: Stock Pitch #2（異業種）",
+            "Week9: Pythonでスクレイピング/財務データ取り込み",
+            "Week10: バリュエーション比較（Multiples × DCF）",
+            "Week11: 英語ピッチ練習（5分）を録音/改善",
+            "Week12: 面接総仕上げ（Buy-Side想定質疑）"
+        ]
+        current_plan = st.session_state.get("buyside_plan", {})
+        new_plan = {}
+        for item in plan_items:
+            checked = st.checkbox(item, value=bool(current_plan.get(item)), key=f"pl_{item}")
+            new_plan[item] = checked
+        csa1, csa2 = st.columns([1,1])
+        with csa1:
+            if st.button("Save Progress", key="save_buyside_plan"):
+                st.session_state["buyside_plan"] = new_plan
+                try:
+                    blob = load_data()
+                    blob["buyside_plan"] = new_plan
+                    save_data(blob)
+                    st.success("Saved progress.")
+                except Exception as e:
+                    st.error(f"Save failed: {e}")
+        with csa2:
+            if st.button("Reset Plan", key="reset_buyside_plan"):
+                for item in plan_items:
+                    st.session_state[f"pl_{item}"] = False
+                st.session_state["buyside_plan"] = {}
+                try:
+                    blob = load_data()
+                    blob["buyside_plan"] = {}
+                    save_data(blob)
+                except Exception:
+                    pass
+                st.info("Plan reset.")
+
+        st.markdown("### Stock Pitch Builder")
+        p1, p2 = st.columns([2,1])
+        with p1:
+            sp_name = st.text_input("Company", value="Example Corp")
+            sp_thesis = st.text_area("Thesis (3 bullets, one per line)", value="1) Structural growth\n2) Operating leverage\n3) Cash returns policy")
+            sp_catalysts = st.text_area("Catalysts", value="New product launch; Cost restructuring; Regulatory approval")
+        with p2:
+            sp_val = st.selectbox("Valuation Method", ["PE", "EV/EBITDA", "DCF"], index=1)
+            sp_risks = st.text_area("Risks", value="FX; Raw materials; Execution")
+        if st.button("Build One-Pager", key="build_pitch"):
+            text = f"""Company: {sp_name}
+Thesis:
+{sp_thesis}
+Valuation: {sp_val}
+Catalysts: {sp_catalysts}
+Risks: {sp_risks}
+"""
+            st.code(text, language="markdown")
+
+        st.markdown("### Quick LBO Estimator")
+        l1, l2, l3 = st.columns(3)
+        with l1:
+            ebitda = st.number_input("EBITDA (Year 1)", min_value=0.0, value=1000.0, step=50.0, key="lbo_ebitda")
+            entry_mult = st.number_input("Entry EV/EBITDA", min_value=1.0, value=8.0, step=0.5, key="lbo_entry_mult")
+        with l2:
+            debt_mult = st.number_input("Debt / EBITDA", min_value=0.0, value=4.0, step=0.5, key="lbo_debt_mult")
+            exit_mult = st.number_input("Exit EV/EBITDA", min_value=1.0, value=8.0, step=0.5, key="lbo_exit_mult")
+        with l3:
+            years = st.number_input("Hold Years", min_value=1, value=5, step=1, key="lbo_years")
+            growth = st.number_input("EBITDA CAGR (%)", min_value=0.0, value=5.0, step=0.5, key="lbo_cagr")
+        entry_ev = ebitda * entry_mult
+        debt = ebitda * debt_mult
+        equity = max(entry_ev - debt, 0.0)
+        ebitda_exit = ebitda * ((1 + growth/100) ** years)
+        exit_ev = ebitda_exit * exit_mult
+        equity_exit = max(exit_ev - debt, 0.0)
+        moic = (equity_exit / equity) if equity > 0 else None
+        irr = ((moic ** (1/years)) - 1) * 100 if moic and moic > 0 else None
+        st.metric("MOIC (approx)", f"{moic:.2f}x" if moic else "N/A")
+        st.metric("IRR (approx)", f"{irr:.1f}%" if irr else "N/A")
+
+
+def _firm_radar_figure():
+    categories = ['Tech/AI Focus', 'Global Network', 'Domestic Scale', 'IPO/Venture', 'Work-Life Balance']
+
+    fig = go.Figure()
+
+    # Tohmatsu (Deloitte)
+    fig.add_trace(go.Scatterpolar(
+        r=[4, 5, 5, 5, 3],
+        theta=categories,
+        fill='toself',
+        name='Tohmatsu (Deloitte)'
+    ))
+    # AZSA (KPMG)
+    fig.add_trace(go.Scatterpolar(
+        r=[3, 4, 5, 3, 4],
+        theta=categories,
+        fill='toself',
+        name='AZSA (KPMG)'
+    ))
+    # EY ShinNihon
+    fig.add_trace(go.Scatterpolar(
+        r=[5, 4, 4, 3, 3],
+        theta=categories,
+        fill='toself',
+        name='EY ShinNihon'
+    ))
+    # PwC Aarata
+    fig.add_trace(go.Scatterpolar(
+        r=[5, 5, 3, 2, 4],
+        theta=categories,
+        fill='toself',
+        name='PwC Aarata'
+    ))
+    # Accenture (Comparison)
+    fig.add_trace(go.Scatterpolar(
+        r=[5, 5, 5, 2, 2],
+        theta=categories,
+        fill='toself',
+        name='Accenture (Ref)'
+    ))
+    # IBM (Comparison)
+    fig.add_trace(go.Scatterpolar(
+        r=[5, 5, 4, 1, 4],
+        theta=categories,
+        fill='toself',
+        name='IBM (Ref)'
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 5]
+            )),
+        showlegend=True,
+        height=500,
+        margin=dict(l=40, r=40, t=20, b=20)
+    )
+    return fig
@@ -0,0 +1,65 @@
+"""Official exam checklist."""
+import streamlit as st
+
+from common import save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def render():
+    st.header("Official Checklist ✅")
+    items = st.session_state.data.get("official_checklist", [])
+    if 'checklist_state' not in st.session_state:
+        st.session_state.checklist_state = [dict(x) for x in items]
+    with st.expander("Helpful Links"):
+        st.markdown("- [CPAAOB 試験情報](https://www.fsa.go.jp/cpaaob/kouninkaikeishi-shiken/index.html)")
+        st.markdown("- [短答・論文 合格基準](https://www.fsa.go.jp/cpaaob/kouninkaikeishi-shiken/kijuntou/05.html)")
+        st.markdown("- [企業会計基準委員会 (ASBJ)](https://www.asb.or.jp/)")
+        st.markdown("- [日本公認会計士協会 (JICPA) 実務指針](https://jicpa.or.jp/specialized_field/)")
+    with st.expander("Quick Add Templates"):
+        cqa1, cqa2, cqa3 = st.columns(3)
+        if cqa1.button("Add: 最新シラバスDL"):
+            st.session_state.checklist_state.append({"item": "最新シラバスを公式からDL", "done": False, "notes": ""})
+            st.rerun()
+        if cqa2.button("Add: 電卓・持込確認"):
+            st.session_state.checklist_state.append({"item": "電卓・持込可否と注意事項の確認", "done": False, "notes": ""})
+            st.rerun()
+        if cqa3.button("Add: 会場アクセス確認"):
+            st.session_state.checklist_state.append({"item": "試験会場と当日のアクセス確認", "done": False, "notes": ""})
+            st.rerun()
+    st.subheader("Progress")
+    total = len(st.session_state.checklist_state)
+    done = sum(1 for x in st.session_state.checklist_state if x.get("done"))
+    pct = (done / total) if total else 0
+    st.progress(pct)
+    st.caption(f"Completed: {done} / {total} ({pct:.0%})")
+    st.markdown("---")
+    rows = []
+    for i, x in enumerate(st.session_state.checklist_state):
+        c1, c2, c3 = st.columns([0.6, 3, 2])
+        with c1:
+            checked = st.checkbox("", value=bool(x.get("done", False)), key=f"chk_item_{i}")
+        with c2:
+            label = st.text_input("Item", value=x.get("item", ""), key=f"txt_item_{i}")
+        with c3:
+            note = st.text_input("Notes", value=x.get("notes", ""), key=f"note_item_{i}")
+        rows.append({"item": label, "done": checked, "notes": note})
+    c_add, c_save, c_dl = st.columns([1,1,1])
+    with c_add:
+        with st.form("add_check_item"):
+            new_item = st.text_input("Add a new checklist item")
+            add_now = st.form_submit_button("Add")
+            if add_now and new_item.strip():
+                st.session_state.checklist_state.append({"item": new_item.strip(), "done": False, "notes": ""})
+                st.rerun()
+    with c_save:
+        if st.button("Save Checklist", type="primary"):
+            st.session_state.data["official_checklist"] = rows
+            save_data(st.session_state.data)
+            st.toast("Checklist saved", icon="✅")
+            st.session_state.checklist_state = [dict(r) for r in rows]
+    with c_dl:
+        if rows:
+            df_dl = pd.DataFrame(rows)
+            st.download_button("Download CSV", data=df_dl.to_csv(index=False).encode("utf-8"), file_name="official_checklist.csv", mime="text/csv")
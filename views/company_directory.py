@@ -0,0 +1,576 @@
+"""Company directory."""
+import streamlit as st
+
+from common import load_data, save_data
+
+
+def render():
+    st.header("🏢 Company Directory for CPA Candidates")
+    st.markdown("A curated list of potential employers in Japan for CPA holders, ranging from Audit to Tech.")
+
+    st.subheader("Preferences")
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        target_city = st.selectbox("Target City", ["Tokyo", "Osaka", "Nagoya", "Any"], index=0)
+    with c2:
+        w_cpa = st.slider("Weight: CPA Track", 0, 50, 20)
+    with c3:
+        w_ds = st.slider("Weight: Data Science/Tech", 0, 50, 15)
+    with c4:
+        w_global = st.slider("Weight: Global Brand", 0, 30, 5)
+    min_score = st.slider("Show companies with score ≥", 0, 100, 0, 5)
+
+    def _score_company(attrs, locs):
+        score = 50
+        try:
+            if target_city != "Any":
+                if isinstance(locs, list) and target_city in locs:
+                    score += 30
+                else:
+                    score -= 10
+            cpa_v = attrs.get("CPA", False)
+            if isinstance(cpa_v, bool):
+                score += w_cpa if cpa_v else 0
+            elif isinstance(cpa_v, str):
+                m = {"High": 1.0, "Medium": 0.6, "Low": 0.2}.get(cpa_v, 0.0)
+                score += int(w_cpa * m)
+            ds_v = attrs.get("DS", False)
+            if isinstance(ds_v, bool):
+                score += w_ds if ds_v else 0
+            elif isinstance(ds_v, str):
+                m = {"High": 1.0, "Medium": 0.6, "Low": 0.2}.get(ds_v, 0.0)
+                score += int(w_ds * m)
+            global_v = attrs.get("Global", False)
+            if global_v:
+                score += w_global
+        except Exception:
+            pass
+        if score < 0:
+            score = 0
+        if score > 100:
+            score = 100
+        return int(score)
+
+    tab1, tab2, tab3 = st.tabs(["Audit (Big 4 & Mid)", "Consulting & FAS", "Tech & Enterprise"])
+
+    with tab1:
+        st.subheader("Big 4 Audit Firms (The Standard Path)")
+        big4 = [
+            {"name": "Deloitte Touche Tohmatsu", "desc": "Largest scale, aggressive growth. Strong in IPO support.", "link": "https://www2.deloitte.com/jp/ja/pages/audit/topics/recruit-index.html", "locs": ["Tokyo", "Osaka", "Nagoya"], "attrs": {"CPA": True, "DS": True, "Global": True}},
+            {"name": "KPMG AZSA", "desc": "Balanced portfolio, strong manufacturing clients. 'Gentleman' culture.", "link": "https://home.kpmg/jp/ja/home/careers.html", "locs": ["Tokyo", "Osaka", "Nagoya"], "attrs": {"CPA": True, "DS": True, "Global": True}},
+            {"name": "EY ShinNihon", "desc": "Longest history, most listed clients. Strong Digital Audit focus.", "link": "https://www.ey.com/ja_jp/careers/audit", "locs": ["Tokyo", "Osaka", "Nagoya"], "attrs": {"CPA": True, "DS": True, "Global": True}},
+            {"name": "PwC Aarata / Kyoto", "desc": "Global integration, innovative. PwC Kyoto is famous for high profitability.", "link": "https://www.pwc.com/jp/ja/careers/audit.html", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": True, "DS": True, "Global": True}}
+        ]
+        for c in big4:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            with st.expander(f"🦁 {c['name']}  |  Score: {sc}/100"):
+                st.write(c['desc'])
+                st.progress(sc)
+                st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+                st.link_button("Recruit Page", c['link'])
+
+        st.divider()
+        st.subheader("Mid-Tier Audit Firms (准大手)")
+        st.info("💡 **Why Mid-Tier?** Faster promotion, broader experience (you do everything), better work-life balance.")
+        mid_tier = [
+            {"name": "Grant Thornton Taiyo (太陽)", "desc": "Largest mid-tier. Very growing. Good alternative to Big 4.", "link": "https://www.grantthornton.jp/recruit/", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Crowe Toyo (東陽)", "desc": "Strong in domestic IPOs. Traditional but stable.", "link": "https://www.toyo-audit.or.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}},
+            {"name": "BDO Sanyu (三優)", "desc": "Friendly culture. Good international network via BDO.", "link": "https://www.bdo.or.jp/sanyu/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}},
+            {"name": "RSM Seiwa (清和)", "desc": "Mid-sized, focus on healthcare and mid-cap clients.", "link": "https://www.seiwa-audit.or.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}}
+        ]
+        for c in mid_tier:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            with st.expander(f"🐯 {c['name']}  |  Score: {sc}/100"):
+                st.write(c['desc'])
+                st.progress(sc)
+                st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+                st.link_button("Recruit Page", c['link'])
+
+    with tab2:
+        st.subheader("FAS (Financial Advisory Services)")
+        st.info("💡 **High Expertise**: M&A, Valuation, Forensics. Often requires CPA + English/Tech.")
+        fas = [
+            {"name": "Deloitte Tohmatsu Financial Advisory (DTFA)", "link": "https://www2.deloitte.com/jp/ja/pages/about-deloitte/articles/dtfa/dtfa-recruit.html", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "KPMG FAS", "link": "https://home.kpmg/jp/ja/home/careers/fas.html", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "PwC Advisory", "link": "https://www.pwc.com/jp/ja/careers/advisory.html", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "EY Strategy and Transactions", "link": "https://www.ey.com/ja_jp/careers/strategy-and-transactions", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}}
+        ]
+        for c in fas:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            with st.expander(f"💼 {c['name']}  |  Score: {sc}/100"):
+                st.progress(sc)
+                st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+                st.link_button("Recruit Page", c['link'])
+
+        st.divider()
+        st.subheader("Consulting Firms")
+        st.markdown("Finance transformation, ERP implementation, Strategy.")
+        consulting = [
+            {"name": "Accenture (Strategy & Consulting)", "desc": "Top tier for DX/IT. High salary, hard work.", "link": "https://www.accenture.com/jp-ja/careers", "locs": ["Tokyo"], "attrs": {"CPA": False, "DS": True, "Global": True}},
+            {"name": "BayCurrent Consulting", "desc": "Rapidly growing Japanese firm. High salary.", "link": "https://www.baycurrent.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": False}},
+            {"name": "Nomura Research Institute (NRI)", "desc": "Stable, high salary, strong domestic presence.", "link": "https://www.nri.com/jp/career", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}},
+            {"name": "ABeam Consulting", "desc": "Strong in SAP/ERP. Good for CPAs liking systems.", "link": "https://www.abeam.com/jp/ja/careers", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}}
+        ]
+        for c in consulting:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            with st.expander(f"🧠 {c['name']}  |  Score: {sc}/100"):
+                st.write(c['desc'])
+                st.progress(sc)
+                st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+                st.link_button("Recruit Page", c['link'])
+
+    with tab3:
+        st.subheader("Tech & Enterprise (CFO Track)")
+        st.info("💡 **Business Side**: FP&A, Accounting Manager, IPO Prep.")
+        fc1, fc2 = st.columns([1, 2])
+        with fc1:
+            te_firm_type = st.selectbox("Firm Type", ["All", "Foreign", "Japanese"], index=0, key="te_firm_type")
+        with fc2:
+            te_standards = st.multiselect("Accounting Standard Experience", ["IFRS", "US GAAP", "JGAAP"], default=[], key="te_standards")
+        use_leftnav = st.checkbox("Left Navigation View (recommended)", value=True, key="te_leftnav")
+        if use_leftnav:
+            col_nav, col_view = st.columns([1, 3])
+            with col_nav:
+                subsec = st.radio(
+                    "Section",
+                    [
+                        "Tech / Global",
+                        "Holdings / Conglomerates",
+                        "Securities",
+                        "Makers",
+                        "Utilities & Energy",
+                        "Megabanks",
+                        "Consulting (MBB)",
+                        "Trading Companies",
+                        "Buy-Side (AM / PE / VC)",
+                        "User Catalog",
+                        "Bulk Add"
+                    ],
+                    index=0,
+                    key="te_nav"
+                )
+                cat_meta = {
+                    "Tech / Global": {"salary": "6–12M JPY", "diff": "High"},
+                    "Holdings / Conglomerates": {"salary": "7–12M JPY", "diff": "High"},
+                    "Securities": {"salary": "6–12M JPY", "diff": "High"},
+                    "Makers": {"salary": "5–9M JPY", "diff": "Medium"},
+                    "Utilities & Energy": {"salary": "5–8M JPY", "diff": "Low–Medium"},
+                    "Megabanks": {"salary": "6–10M JPY", "diff": "Medium"},
+                    "Consulting (MBB)": {"salary": "8–14M JPY", "diff": "Ultra"},
+                    "Trading Companies": {"salary": "8–14M JPY", "diff": "Ultra"},
+                    "Buy-Side (AM / PE / VC)": {"salary": "8–20M JPY", "diff": "Ultra"},
+                    "User Catalog": {"salary": "Varies", "diff": "Varies"},
+                    "Bulk Add": {"salary": "", "diff": ""}
+                }
+                meta = cat_meta.get(subsec, {})
+                if meta:
+                    st.metric("Salary (cat)", meta.get("salary", "—"))
+                    st.metric("Difficulty", meta.get("diff", "—"))
+            with col_view:
+                def _render_items(items, cat_name):
+                    for c in items:
+                        if te_firm_type != "All":
+                            ctype = c.get("type")
+                            if ctype and ctype != te_firm_type:
+                                continue
+                        if te_standards:
+                            cstd = c.get("standards", [])
+                            if cstd and not any(s in cstd for s in te_standards):
+                                continue
+                        sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+                        if sc < min_score:
+                            continue
+                        st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c.get('desc','')} [Link]({c.get('link','')})")
+                        st.progress(sc)
+                        st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+                        cm = cat_meta.get(cat_name, {})
+                        sal = c.get("salary") or cm.get("salary", "—")
+                        dif = c.get("difficulty") or cm.get("diff", "—")
+                        st.caption(f"Salary: {sal} | Difficulty: {dif}")
+                if subsec == "Tech / Global":
+                    items = [
+                        {"name": "Google / Amazon / MS (Japan)", "desc": "FP&A roles. Very high English requirement. Competitive.", "link": "https://careers.google.com/", "locs": ["Tokyo"], "attrs": {"CPA": False, "DS": True, "Global": True}, "type": "Foreign", "standards": ["US GAAP", "IFRS"], "salary": "10–14M+ JPY", "difficulty": "Ultra"},
+                        {"name": "Rakuten Group", "desc": "English official language. Massive FinTech ecosystem.", "link": "https://corp.rakuten.co.jp/careers/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"], "salary": "6–10M JPY"},
+                        {"name": "Line Yahoo", "desc": "Major domestic tech player. Strong benefits.", "link": "https://www.lycorp.co.jp/ja/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Mercari", "desc": "Modern tech culture. Good for ambitious finance pros.", "link": "https://careers.mercari.com/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"]}
+                    ]
+                    _render_items(items, "Tech / Global")
+                elif subsec == "Holdings / Conglomerates":
+                    items = [
+                        {"name": "SoftBank Group", "desc": "Investment conglomerate. Complex consolidations and valuation analytics.", "link": "https://group.softbank/en/corp/recruit", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Recruit Holdings", "desc": "HR Tech conglomerate. Data-driven culture; FP&A and IR strong.", "link": "https://recruit-holdings.com/careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Fast Retailing (UNIQLO)", "desc": "Globally integrated retail. Inventory/FX/IFRS exposure.", "link": "https://www.fastretailing.com/employment/ja/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Takeda Pharmaceutical", "desc": "Global pharma. R&D capitalization, global IFRS, treasury.", "link": "https://www.takeda.com/jp/ja-us/careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}, "type": "Japanese", "standards": ["IFRS"]}
+                    ]
+                    _render_items(items, "Holdings / Conglomerates")
+                elif subsec == "Securities":
+                    items = [
+                        {"name": "Nomura Securities (野村證券)", "desc": "Top-tier securities. IB, Markets, Corporate planning/Finance roles.", "link": "https://www.nomura.com/jpn/careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["US GAAP", "IFRS"]},
+                        {"name": "Daiwa Securities (大和証券)", "desc": "Major securities group. IB/markets, group finance & IR.", "link": "https://www.daiwa-grp.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}, "type": "Japanese", "standards": ["IFRS"]}
+                    ]
+                    _render_items(items, "Securities")
+                elif subsec == "Makers":
+                    items = [
+                        {"name": "Toyota", "desc": "Global auto leader. Robust finance org; strong FP&A/treasury.", "link": "https://global.toyota/en/company/", "locs": ["Tokyo", "Aichi"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Keyence", "desc": "High-margin factory automation. Lean org, high productivity.", "link": "https://www.keyence.co.jp/jobs/", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": "Medium", "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Fujifilm", "desc": "Diversified: healthcare, imaging, materials. Global operations.", "link": "https://recruit.fujifilm.com/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Sony", "desc": "Entertainment + Electronics. Complex consolidation; great for CPAs.", "link": "https://www.sony.com/en/SonyInfo/Careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Panasonic", "desc": "Devices to solutions. Large-scale finance transformation roles.", "link": "https://holdings.panasonic/jp/corporate/jobs/", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Hitachi", "desc": "OT×IT leader. Project accounting, global IFRS exposure.", "link": "https://www.hitachi.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": True, "Global": True}, "type": "Japanese", "standards": ["IFRS"]}
+                    ]
+                    _render_items(items, "Makers")
+                elif subsec == "Utilities & Energy":
+                    items = [
+                        {"name": "Tokyo Gas", "desc": "Stable utility. Long-term planning, project finance, IFRS.", "link": "https://www.tokyo-gas-recruit.com/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": False}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "TEPCO", "desc": "Large-scale regulated utility. Risk management heavy.", "link": "https://www.tepco.co.jp/recruit/index-j.html", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": False}, "type": "Japanese", "standards": ["IFRS"]}
+                    ]
+                    _render_items(items, "Utilities & Energy")
+                elif subsec == "Megabanks":
+                    items = [
+                        {"name": "MUFG", "desc": "Japan’s largest financial group. Treasury, ALM, IFRS9/CECL skills.", "link": "https://www.mufg.jp/csr/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "SMBC", "desc": "Corporate banking powerhouse. Debt/FX exposure for CFO track.", "link": "https://www.smbc.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Mizuho", "desc": "Universal bank. Group finance/controls; transformation programs.", "link": "https://www.mizuho-fg.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]}
+                    ]
+                    _render_items(items, "Megabanks")
+                elif subsec == "Consulting (MBB)":
+                    items = [
+                        {"name": "McKinsey & Company", "desc": "Top strategy firm. CFO transformation, value creation.", "link": "https://www.mckinsey.com/careers", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}, "type": "Foreign"},
+                        {"name": "Boston Consulting Group", "desc": "Deep corporate finance practice.", "link": "https://careers.bcg.com/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}, "type": "Foreign"},
+                        {"name": "Bain & Company", "desc": "Private equity, performance improvement.", "link": "https://www.bain.com/careers/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}, "type": "Foreign"}
+                    ]
+                    _render_items(items, "Consulting (MBB)")
+                elif subsec == "Trading Companies":
+                    st.markdown("Mitsubishi Corp, Mitsui & Co, Itochu, Sumitomo Corp, Marubeni")
+                    st.caption("Salary: 8–14M JPY | Difficulty: Ultra")
+                    st.caption("Extremely competitive. High salary. Global rotations.")
+                elif subsec == "Buy-Side (AM / PE / VC)":
+                    items = [
+                        {"name": "Nomura Asset Management", "desc": "Japan’s leading AM. Equity/Fixed Income/Quant.", "link": "https://www.nomura-am.co.jp/company/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": "Medium", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "Daiwa Asset Management", "desc": "Major AM house. Public equities and funds.", "link": "https://www.daiwa-am.co.jp/company/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": "Low", "Global": True}, "type": "Japanese", "standards": ["IFRS"]},
+                        {"name": "BlackRock Japan", "desc": "Global leader. iShares/Institutional mandates.", "link": "https://careers.blackrock.com/early-careers", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": True, "Global": True}, "type": "Foreign", "standards": ["US GAAP", "IFRS"]},
+                        {"name": "Fidelity Investments Japan", "desc": "Active management, research focus.", "link": "https://www.fidelity.co.jp/corporate/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": "Low", "Global": True}, "type": "Foreign", "standards": ["US GAAP", "IFRS"]},
+                        {"name": "Advantage Partners", "desc": "Japan’s top PE pioneer. Mid-market focus.", "link": "https://www.advantagepartners.com/jp/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}, "type": "Japanese"},
+                        {"name": "Carlyle Japan", "desc": "Global PE. Large-cap to mid-cap.", "link": "https://www.carlyle.com/careers", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}, "type": "Foreign"},
+                        {"name": "Bain Capital Japan", "desc": "Global PE. Strong operating improvement.", "link": "https://www.baincapital.com/careers", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}, "type": "Foreign"},
+                        {"name": "Japan Industrial Partners (JIP)", "desc": "Carve-outs/turnarounds.", "link": "https://www.jipinc.com/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": False}, "type": "Japanese"},
+                        {"name": "JAFCO", "desc": "Japan’s classic VC. Early to growth.", "link": "https://www.jafco.co.jp/english/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}, "type": "Japanese"},
+                        {"name": "Globis Capital Partners", "desc": "Top-tier domestic VC. SaaS/tech focus.", "link": "https://www.globis-capital.co.jp/en/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}, "type": "Japanese"},
+                        {"name": "Incubate Fund", "desc": "Early-stage specialist.", "link": "https://incubatefund.com/en/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}, "type": "Japanese"},
+                        {"name": "DNX Ventures", "desc": "B2B tech-focused VC (JP/US).", "link": "https://www.dnx.vc/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": True, "Global": True}, "type": "Foreign"}
+                    ]
+                    _render_items(items, "Buy-Side (AM / PE / VC)")
+                elif subsec == "User Catalog":
+                    catalog = st.session_state.get("company_catalog", [])
+                    if catalog:
+                        for c in catalog:
+                            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+                            if sc < min_score:
+                                continue
+                            st.markdown(f"**{c.get('name','')}** — Score: {sc}/100  \n{c.get('desc','')} [Link]({c.get('link','')})")
+                            st.progress(sc)
+                            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+                            st.caption("Salary: Varies | Difficulty: Varies")
+                    else:
+                        st.info("No entries. Use 'Bulk Add' to import.")
+                else:
+                    st.markdown("#### Bulk Add Companies (CSV/JSON)")
+                    with st.expander("Import / Manage", expanded=True):
+                        st.caption("Schema: name, desc, link, locs(list or comma-separated), attrs.CPA(bool/str), attrs.DS(bool/str), attrs.Global(bool)")
+                        uploaded = st.file_uploader("Upload CSV or JSON", type=["csv", "json"], accept_multiple_files=False, key="company_catalog_uploader_left")
+                        if uploaded is not None:
+                            try:
+                                import json as _json
+                                import pandas as _pd
+                                if uploaded.name.lower().endswith(".json"):
+                                    entries = _json.loads(uploaded.read().decode("utf-8"))
+                                else:
+                                    dfu = _pd.read_csv(uploaded)
+                                    entries = dfu.to_dict(orient="records")
+                                if not isinstance(entries, list):
+                                    entries = [entries]
+                                catalog = st.session_state.get("company_catalog", [])
+                                for e in entries:
+                                    name = e.get("name") or e.get("Name")
+                                    if not name:
+                                        continue
+                                    desc = e.get("desc") or e.get("Desc") or ""
+                                    link = e.get("link") or e.get("Link") or ""
+                                    locs = e.get("locs") or e.get("Locs") or e.get("locations") or e.get("Locations") or []
+                                    if isinstance(locs, str):
+                                        locs = [s.strip() for s in locs.split(",") if s.strip()]
+                                    attrs = e.get("attrs") or {}
+                                    if not attrs:
+                                        attrs = {
+                                            "CPA": e.get("CPA") if e.get("CPA") is not None else False,
+                                            "DS": e.get("DS") if e.get("DS") is not None else False,
+                                            "Global": e.get("Global") if e.get("Global") is not None else False
+                                        }
+                                    item = {"name": name, "desc": desc, "link": link, "locs": locs, "attrs": attrs}
+                                    exists = False
+                                    for old in catalog:
+                                        if old.get("name") == name:
+                                            old.update(item)
+                                            exists = True
+                                            break
+                                    if not exists:
+                                        catalog.append(item)
+                                st.session_state["company_catalog"] = catalog
+                                try:
+                                    data_blob = load_data()
+                                    data_blob["company_catalog"] = catalog
+                                    save_data(data_blob)
+                                except Exception:
+                                    pass
+                                st.success(f"Imported {len(entries)} entries.")
+                            except Exception as e:
+                                st.error(f"Failed to import: {e}")
+                        col_i1, col_i2 = st.columns([1,1])
+                        with col_i1:
+                            if st.button("Clear Catalog", key="clear_catalog_left"):
+                                st.session_state["company_catalog"] = []
+                                try:
+                                    data_blob = load_data()
+                                    data_blob["company_catalog"] = []
+                                    save_data(data_blob)
+                                except Exception:
+                                    pass
+                                st.info("Catalog cleared.")
+                        with col_i2:
+                            if st.button("Load Catalog from Storage", key="load_catalog_left"):
+                                try:
+                                    data_blob = load_data()
+                                    st.session_state["company_catalog"] = data_blob.get("company_catalog", [])
+                                    st.success("Loaded from storage.")
+                                except Exception as e:
+                                    st.error(f"Failed to load: {e}")
+            st.stop()
+        
+        tech = [
+            {"name": "Google / Amazon / MS (Japan)", "desc": "FP&A roles. Very high English requirement. Competitive.", "link": "https://careers.google.com/", "locs": ["Tokyo"], "attrs": {"CPA": False, "DS": True, "Global": True}},
+            {"name": "Rakuten Group", "desc": "English official language. Massive FinTech ecosystem.", "link": "https://corp.rakuten.co.jp/careers/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}},
+            {"name": "Line Yahoo", "desc": "Major domestic tech player. Strong benefits.", "link": "https://www.lycorp.co.jp/ja/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}},
+            {"name": "Mercari", "desc": "Modern tech culture. Good for ambitious finance pros.", "link": "https://careers.mercari.com/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}}
+        ]
+        st.markdown("#### Tech / Global")
+        for c in tech:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Trading Companies (Sogo Shosha)")
+        shosha = ["Mitsubishi Corp", "Mitsui & Co", "Itochu", "Sumitomo Corp", "Marubeni"]
+        st.write(", ".join(shosha))
+        st.caption("Extremely competitive. High salary. Global rotations.")
+
+        st.divider()
+        st.markdown("#### Top-Tier Holdings / Conglomerates")
+        holdings = [
+            {"name": "SoftBank Group", "desc": "Investment conglomerate. Complex consolidations and valuation analytics.", "link": "https://group.softbank/en/corp/recruit", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": True, "Global": True}},
+            {"name": "Recruit Holdings", "desc": "HR Tech conglomerate. Data-driven culture; FP&A and IR strong.", "link": "https://recruit-holdings.com/careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": True, "Global": True}},
+            {"name": "Fast Retailing (UNIQLO)", "desc": "Globally integrated retail. Inventory/FX/IFRS exposure.", "link": "https://www.fastretailing.com/employment/ja/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Takeda Pharmaceutical", "desc": "Global pharma. R&D capitalization, global IFRS, treasury.", "link": "https://www.takeda.com/jp/ja-us/careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}}
+        ]
+        for c in holdings:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Securities (証券)")
+        securities = [
+            {"name": "Nomura Securities (野村證券)", "desc": "Top-tier securities. IB, Markets, Corporate planning/Finance roles.", "link": "https://www.nomura.com/jpn/careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Daiwa Securities (大和証券)", "desc": "Major securities group. IB/markets, group finance & IR.", "link": "https://www.daiwa-grp.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}}
+        ]
+        for c in securities:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Bulk Add Companies (CSV/JSON)")
+        with st.expander("Import / Manage", expanded=False):
+            st.caption("Schema: name, desc, link, locs(list or comma-separated), attrs.CPA(bool/str), attrs.DS(bool/str), attrs.Global(bool)")
+            uploaded = st.file_uploader("Upload CSV or JSON", type=["csv", "json"], accept_multiple_files=False, key="company_catalog_uploader")
+            if uploaded is not None:
+                try:
+                    import json as _json
+                    import pandas as _pd
+                    if uploaded.name.lower().endswith(".json"):
+                        entries = _json.loads(uploaded.read().decode("utf-8"))
+                    else:
+                        dfu = _pd.read_csv(uploaded)
+                        entries = dfu.to_dict(orient="records")
+                    if not isinstance(entries, list):
+                        entries = [entries]
+                    catalog = st.session_state.get("company_catalog", [])
+                    for e in entries:
+                        name = e.get("name") or e.get("Name")
+                        if not name:
+                            continue
+                        desc = e.get("desc") or e.get("Desc") or ""
+                        link = e.get("link") or e.get("Link") or ""
+                        locs = e.get("locs") or e.get("Locs") or e.get("locations") or e.get("Locations") or []
+                        if isinstance(locs, str):
+                            locs = [s.strip() for s in locs.split(",") if s.strip()]
+                        attrs = e.get("attrs") or {}
+                        if not attrs:
+                            attrs = {
+                                "CPA": e.get("CPA") if e.get("CPA") is not None else False,
+                                "DS": e.get("DS") if e.get("DS") is not None else False,
+                                "Global": e.get("Global") if e.get("Global") is not None else False
+                            }
+                        item = {"name": name, "desc": desc, "link": link, "locs": locs, "attrs": attrs}
+                        exists = False
+                        for old in catalog:
+                            if old.get("name") == name:
+                                old.update(item)
+                                exists = True
+                                break
+                        if not exists:
+                            catalog.append(item)
+                    st.session_state["company_catalog"] = catalog
+                    try:
+                        data_blob = load_data()
+                        data_blob["company_catalog"] = catalog
+                        save_data(data_blob)
+                    except Exception:
+                        pass
+                    st.success(f"Imported {len(entries)} entries.")
+                except Exception as e:
+                    st.error(f"Failed to import: {e}")
+            col_i1, col_i2 = st.columns([1,1])
+            with col_i1:
+                if st.button("Clear Catalog"):
+                    st.session_state["company_catalog"] = []
+                    try:
+                        data_blob = load_data()
+                        data_blob["company_catalog"] = []
+                        save_data(data_blob)
+                    except Exception:
+                        pass
+                    st.info("Catalog cleared.")
+            with col_i2:
+                if st.button("Load Catalog from Storage"):
+                    try:
+                        data_blob = load_data()
+                        st.session_state["company_catalog"] = data_blob.get("company_catalog", [])
+                        st.success("Loaded from storage.")
+                    except Exception as e:
+                        st.error(f"Failed to load: {e}")
+        user_catalog = st.session_state.get("company_catalog", [])
+        if user_catalog:
+            st.markdown("#### User Catalog")
+            for c in user_catalog:
+                sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+                if sc < min_score:
+                    continue
+                st.markdown(f"**{c.get('name','')}** — Score: {sc}/100  \n{c.get('desc','')} [Link]({c.get('link','')})")
+                st.progress(sc)
+                st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Makers (Tier 1)")
+        makers = [
+            {"name": "Toyota", "desc": "Global auto leader. Robust finance org; strong FP&A/treasury.", "link": "https://global.toyota/en/company/", "locs": ["Tokyo", "Aichi"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Keyence", "desc": "High-margin factory automation. Lean org, high productivity.", "link": "https://www.keyence.co.jp/jobs/", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": "Medium", "DS": "Medium", "Global": True}},
+            {"name": "Fujifilm", "desc": "Diversified: healthcare, imaging, materials. Global operations.", "link": "https://recruit.fujifilm.com/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Sony", "desc": "Entertainment + Electronics. Complex consolidation; great for CPAs.", "link": "https://www.sony.com/en/SonyInfo/Careers/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": True, "Global": True}},
+            {"name": "Panasonic", "desc": "Devices to solutions. Large-scale finance transformation roles.", "link": "https://holdings.panasonic/jp/corporate/jobs/", "locs": ["Tokyo", "Osaka"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Hitachi", "desc": "OT×IT leader. Project accounting, global IFRS exposure.", "link": "https://www.hitachi.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": True, "Global": True}}
+        ]
+        for c in makers:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Utilities & Energy")
+        utilities = [
+            {"name": "Tokyo Gas", "desc": "Stable utility. Long-term planning, project finance, IFRS.", "link": "https://www.tokyo-gas-recruit.com/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": False}},
+            {"name": "TEPCO", "desc": "Large-scale regulated utility. Risk management heavy.", "link": "https://www.tepco.co.jp/recruit/index-j.html", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": False}}
+        ]
+        for c in utilities:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Megabanks")
+        megabanks = [
+            {"name": "MUFG", "desc": "Japan’s largest financial group. Treasury, ALM, IFRS9/CECL skills.", "link": "https://www.mufg.jp/csr/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "SMBC", "desc": "Corporate banking powerhouse. Debt/FX exposure for CFO track.", "link": "https://www.smbc.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}},
+            {"name": "Mizuho", "desc": "Universal bank. Group finance/controls; transformation programs.", "link": "https://www.mizuho-fg.co.jp/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Medium", "Global": True}}
+        ]
+        for c in megabanks:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Strategy Consulting (MBB)")
+        mbb = [
+            {"name": "McKinsey & Company", "desc": "Top strategy firm. CFO transformation, value creation.", "link": "https://www.mckinsey.com/careers", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}},
+            {"name": "Boston Consulting Group", "desc": "Deep corporate finance practice.", "link": "https://careers.bcg.com/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}},
+            {"name": "Bain & Company", "desc": "Private equity, performance improvement.", "link": "https://www.bain.com/careers/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}}
+        ]
+        for c in mbb:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
+
+        st.divider()
+        st.markdown("#### Buy-Side (AM / PE / VC)")
+        buyside = [
+            # Asset Management
+            {"name": "Nomura Asset Management", "desc": "Japan’s leading AM. Equity/Fixed Income/Quant.", "link": "https://www.nomura-am.co.jp/company/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": "Medium", "Global": True}},
+            {"name": "Daiwa Asset Management", "desc": "Major AM house. Public equities and funds.", "link": "https://www.daiwa-am.co.jp/company/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": "Low", "Global": True}},
+            {"name": "BlackRock Japan", "desc": "Global leader. iShares/Institutional mandates.", "link": "https://careers.blackrock.com/early-careers", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": True, "Global": True}},
+            {"name": "Fidelity Investments Japan", "desc": "Active management, research focus.", "link": "https://www.fidelity.co.jp/corporate/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Medium", "DS": "Low", "Global": True}},
+            # Private Equity
+            {"name": "Advantage Partners", "desc": "Japan’s top PE pioneer. Mid-market focus.", "link": "https://www.advantagepartners.com/jp/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}},
+            {"name": "Carlyle Japan", "desc": "Global PE. Large-cap to mid-cap.", "link": "https://www.carlyle.com/careers", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}},
+            {"name": "Bain Capital Japan", "desc": "Global PE. Strong operating improvement.", "link": "https://www.baincapital.com/careers", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": True}},
+            {"name": "Japan Industrial Partners (JIP)", "desc": "Carve-outs/turnarounds.", "link": "https://www.jipinc.com/", "locs": ["Tokyo"], "attrs": {"CPA": True, "DS": "Low", "Global": False}},
+            # Venture Capital
+            {"name": "JAFCO", "desc": "Japan’s classic VC. Early to growth.", "link": "https://www.jafco.co.jp/english/recruit/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}},
+            {"name": "Globis Capital Partners", "desc": "Top-tier domestic VC. SaaS/tech focus.", "link": "https://www.globis-capital.co.jp/en/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}},
+            {"name": "Incubate Fund", "desc": "Early-stage specialist.", "link": "https://incubatefund.com/en/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": "Medium", "Global": True}},
+            {"name": "DNX Ventures", "desc": "B2B tech-focused VC (JP/US).", "link": "https://www.dnx.vc/", "locs": ["Tokyo"], "attrs": {"CPA": "Low", "DS": True, "Global": True}}
+        ]
+        for c in buyside:
+            sc = _score_company(c.get("attrs", {}), c.get("locs", []))
+            if sc < min_score:
+                continue
+            st.markdown(f"**{c['name']}** — Score: {sc}/100  \n{c['desc']} [Link]({c['link']})")
+            st.progress(sc)
+            st.caption(f"Locations: {', '.join(c.get('locs', []))}")
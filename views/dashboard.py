@@ -0,0 +1,228 @@
+"""Dashboard: today's metrics, schedule countdown and recent activity."""
+from datetime import date
+
+import streamlit as st
+
+import figure_cache
+import study_rollups
+from common import mastery_model, official_schedule as load_official_schedule, srs_deck
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    official_schedule = load_official_schedule()
+    st.header("Dashboard 🚀")
+    
+    # --- Top Metrics Row ---
+    st.subheader("📊 At a Glance")
+    today = date.today()
+    
+    # Calculate Metrics
+    # 1. Study Time Today (from the rollups, not a scan of every log)
+    rollups = study_rollups.rollups(st.session_state.data)
+    minutes_today = study_rollups.day_minutes(st.session_state.data, today)
+    
+    # 2. Quizzes Today
+    scores_df = pd.DataFrame(st.session_state.data.get("scores", []))
+    quizzes_today = 0
+    avg_score_today = 0
+    if not scores_df.empty:
+        today_str = today.strftime("%Y-%m-%d")
+        today_scores = scores_df[scores_df['date'] == today_str]
+        quizzes_today = len(today_scores)
+        if quizzes_today > 0:
+            avg_score_today = today_scores['val'].mean()
+
+    # 3. Total XP
+    total_xp = st.session_state.data.get('xp', 0)
+
+    # Streak (consecutive study days up to today)
+    streak = study_rollups.streak(st.session_state.data, today)
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Study Time (Today)", f"{minutes_today} min", delta=f"{minutes_today/60:.1f} hrs")
+    m2.metric("Quizzes Completed", f"{quizzes_today}", delta=f"Avg: {avg_score_today:.0f}%" if quizzes_today > 0 else None)
+    m3.metric("Total XP", f"{total_xp}", delta="Level Up Soon?" if total_xp % 100 > 80 else None)
+    
+    # 4. Nearest Deadline
+    target_short = date(2026, 12, 13)
+    days_short = (target_short - today).days
+    m4.metric("Next Exam (Dec Short)", f"{days_short} Days", delta="-1 Day", delta_color="inverse")
+    
+    st.caption(f"🔥 Study Streak: {streak} days")
+
+    # Due reviews per source: a range scan of the review heap, not of every card
+    due = srs_deck().due_counts(today)
+    st.caption(f"🔁 Due today: {due['vocab']} vocabulary · {due['wrong']} wrong answers · {due['formula']} formulas")
+    
+    st.markdown("---")
+
+    # --- Main Content Grid ---
+    c_main_1, c_main_2 = st.columns([2, 1])
+    
+    with c_main_1:
+        st.subheader("🗓️ Exam Countdown")
+        
+        # Enhanced Countdown Cards
+        cd1, cd2, cd3 = st.columns(3)
+        
+        with cd1:
+            target = date(2026, 12, 13)
+            diff = (target - today).days
+            st.info(f"**Dec 2026 Short**\n\n# {max(0, diff)} Days\n\n*Target: 60%*")
+            
+        with cd2:
+            target = date(2027, 5, 23)
+            diff = (target - today).days
+            st.warning(f"**May 2027 Short**\n\n# {max(0, diff)} Days\n\n*Target: PASS*")
+            
+        with cd3:
+            target = date(2027, 8, 20)
+            diff = (target - today).days
+            st.error(f"**Aug 2027 Essay**\n\n# {max(0, diff)} Days\n\n*Target: PASS*")
+
+        se = None
+        try:
+            sched_df = pd.DataFrame(official_schedule)
+            if not sched_df.empty:
+                sched_df['d'] = pd.to_datetime(sched_df['date']).dt.date
+                future = sched_df[sched_df['d'] >= today]
+                if not future.empty:
+                    se = future.sort_values('d').iloc[0]
+        except Exception:
+            pass
+        if se is not None:
+            dd = (se['d'] - today).days
+            st.info(f"**Next Official Event**: {se['event']} ({se['category']})\n\n# {dd} Days\n\n{se.get('notes','')}")
+
+        st.subheader("✅ Compliance Summary")
+        csum1, csum2 = st.columns(2)
+        with csum1:
+            cl_items = st.session_state.data.get("official_checklist", [])
+            total_cl = len(cl_items)
+            done_cl = sum(1 for x in cl_items if x.get("done"))
+            pct_cl = (done_cl / total_cl) if total_cl else 0
+            st.metric("Checklist Done", f"{done_cl}/{total_cl}")
+            st.progress(pct_cl)
+        with csum2:
+            revs = st.session_state.data.get("revisions", [])
+            todo_h = sum(1 for r in revs if r.get("status") == "TODO" and r.get("importance") == "High")
+            read_n = sum(1 for r in revs if r.get("status") == "Read")
+            sum_n = sum(1 for r in revs if r.get("status") == "Summarized")
+            tst_n = sum(1 for r in revs if r.get("status") == "Tested")
+            st.metric("High-Priority TODO", f"{todo_h}")
+            st.caption(f"Read: {read_n} / Summarized: {sum_n} / Tested: {tst_n}")
+            if todo_h > 0:
+                top3 = [r for r in revs if r.get("status") == "TODO" and r.get("importance") == "High"][:3]
+                for r in top3:
+                    st.markdown(f"- {r.get('topic','')} ({r.get('area','')}) — {r.get('effective','')}")
+
+        # Weakness Analysis
+        st.subheader("🧠 Weak Areas Analysis")
+        weak_tags = mastery_model().weakest(3)
+        if weak_tags:
+            # Ranked by the online ability estimate; the band is the 95% range
+            # of expected accuracy on a question of average difficulty
+            for i, w in enumerate(weak_tags):
+                with st.container(border=True):
+                    st.markdown(f"**{'⚠️ ' if i == 0 else ''}{w['tag']}** — est. accuracy {w['accuracy']:.0%} "
+                                f"({w['low']:.0%}–{w['high']:.0%})")
+                    st.progress(w['accuracy'])
+                    st.caption(f"{w['correct']}/{w['answers']} correct · ability {w['ability']:+.2f} ± {1.96 * w['se']:.2f}")
+            st.caption("Filter Drills by these tags to target them.")
+        elif not scores_df.empty:
+            # Group by subject and calculate mean
+            subject_perf = scores_df.groupby('subject')['val'].mean().sort_values()
+            weakest_subject = subject_perf.index[0]
+            weakest_score = subject_perf.iloc[0]
+            
+            st.markdown(f"""
+            <div style="padding: 15px; border-radius: 10px; background-color: #fff3cd; border: 1px solid #ffeeba; color: #856404;">
+                <h4>⚠️ Focus Area: {weakest_subject} ({weakest_score:.1f}%)</h4>
+                <p>Your performance in <b>{weakest_subject}</b> is lower than other subjects. Consider doing a targeted drill.</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button(f"🔥 Start {weakest_subject} Drill Now"):
+                # Redirect logic (simulated by setting session state)
+                # Note: Direct page switching in Streamlit is tricky without rerun, 
+                # but we can set the quiz state to active for this subject
+                # Ideally, user goes to Drills tab, but we can hint them.
+                st.toast(f"Go to 'Drills' tab and select {weakest_subject}!", icon="👉")
+        else:
+            st.info("Complete some drills to identify your weak areas.")
+
+        # Recent Activity Chart (Last 7 Days)
+        st.subheader("📈 Study Consistency (Last 7 Days)")
+        if rollups["count"]:
+            last_7_days = study_rollups.last_days(st.session_state.data, today, 7)
+            chart_data = {
+                "Date": [d.isoformat() for d, _ in last_7_days],
+                "Minutes": [m for _, m in last_7_days]
+            }
+            
+            fig_activity = figure_cache.figure(
+                "dashboard_activity", chart_data,
+                lambda: px.bar(pd.DataFrame(chart_data), x="Date", y="Minutes", title="Daily Study Time"))
+            st.plotly_chart(fig_activity, use_container_width=True)
+        else:
+            st.info("Log your study sessions to see your consistency chart.")
+
+
+    with c_main_2:
+        # Skill Radar
+        st.subheader("Skills")
+        subjects = ['Financial', 'Management', 'Audit', 'Company', 'Tax', 'Elective']
+        radar_scores = [30] * 6 # Default
+        
+        if not scores_df.empty:
+            avg_scores = []
+            for sub in subjects:
+                sub_df = scores_df[scores_df['subject'] == sub]
+                if not sub_df.empty:
+                    avg_scores.append(sub_df['val'].mean())
+                else:
+                    avg_scores.append(30) # Default baseline
+            radar_scores = avg_scores
+            
+        fig = figure_cache.figure("dashboard_skill_radar", radar_scores, lambda: _skill_radar_figure(subjects, radar_scores))
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Daily Tip Card
+        st.subheader("💡 Daily Tip")
+        tips = [
+            "Consistency is key. 30 minutes every day is better than 5 hours once a week.",
+            "Focus on 'why', not just 'how'. Understanding the logic helps in applied questions.",
+            "Don't ignore the theory. It's 40-50% of the exam.",
+            "Review your mistakes. The 'incorrect' options are learning opportunities.",
+            "Sleep is part of studying. Memory consolidation happens during sleep.",
+            "Use the 'Survival Mode' to build speed and accuracy under pressure!",
+            "Audit isn't just memorization; imagine you are the auditor in that situation."
+        ]
+        import random
+        st.info(random.choice(tips))
+        
+        # Progress
+        st.subheader("Phase 0 Progress")
+        st.progress(15)
+        st.caption("Goal: Foundation Mastery")
+
+
+def _skill_radar_figure(subjects, radar_scores):
+    fig = go.Figure(data=go.Scatterpolar(
+        r=radar_scores,
+        theta=subjects,
+        fill='toself',
+        name='Current Skill'
+    ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])), 
+        showlegend=False,
+        margin=dict(l=20, r=20, t=20, b=20),
+        height=300
+    )
+    return fig
@@ -0,0 +1,237 @@
+"""Subject drills and vocabulary quizzes."""
+from datetime import date
+
+import streamlit as st
+
+import adaptive
+import question_bank
+import quiz_engine
+import srs
+from asset_registry import registry as assets
+from common import available_tags, load_generated_subject, mastery_model, save_data, save_mastery, show_asset_errors, srs_deck
+
+
+def render():
+    vocab_data = assets.get("vocab")
+    show_asset_errors("vocab", "questions")
+    drill_questions = question_bank.drill_questions()
+    st.header("Drills ✏️")
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        st.subheader("Select Topic")
+        subject = st.radio("Subject", ["Financial", "Management", "Audit", "Company"])
+        
+        st.subheader("Select Level")
+        level = st.radio("Level", ["Level 1 (Basic)", "Level 2 (Standard)", "Level 3 (Advanced)", "Vocabulary (Important Words)"])
+        level_map = {
+            "Level 1 (Basic)": 1, 
+            "Level 2 (Standard)": 2, 
+            "Level 3 (Advanced)": 3,
+            "Vocabulary (Important Words)": "vocab"
+        }
+        selected_level = level_map[level]
+        
+        if selected_level == "vocab":
+            st.info("💡 Hint: These are key English terms often found in global accounting standards (IFRS/US GAAP).")
+            
+            # Add Tangocyo List View
+            with st.expander("📖 View Vocabulary List (Tangocyo)"):
+                vocab_list_view = vocab_data.get(subject, [])
+                if vocab_list_view:
+                    for v in vocab_list_view:
+                        st.markdown(f"**{v['term']}** ({v['jp']})")
+                        st.markdown(f"- 🇯🇵 {v['desc']}")
+                        st.markdown(f"- 🇺🇸 {v.get('desc_en', '')}")
+                        st.divider()
+                else:
+                    st.warning("No vocabulary data available.")
+        else:
+            # Optional tag filter for generated questions
+            tag_opts = available_tags(subject)
+            if tag_opts:
+                st.session_state['selected_tags'] = st.multiselect("Filter by Tags (optional)", tag_opts, key="tag_filter")
+            else:
+                st.session_state['selected_tags'] = []
+            st.session_state['kw_filter'] = st.text_input("Keyword filter (optional)", value=st.session_state.get('kw_filter', ''), key="kw_filter_input")
+            st.checkbox("Shuffle answer options", value=st.session_state.get('shuffle_opts', True), key="shuffle_opts")
+            st.checkbox("Adaptive (aim for ~75% correct, weak tags first)", value=st.session_state.get('adaptive_drill', False), key="adaptive_drill")
+            st.number_input("Question count", min_value=5, max_value=50, value=int(st.session_state.get('qcount_drill', 20) or 20), step=1, key="qcount_drill")
+
+        if st.button("Start / Restart Quiz"):
+            st.session_state.quiz_state['active'] = True
+            st.session_state.quiz_state['subject'] = subject
+            st.session_state.quiz_state['level'] = selected_level
+            st.session_state.quiz_state['q_index'] = 0
+            st.session_state.quiz_state['score'] = 0
+            st.session_state.quiz_state['show_feedback'] = False
+            st.session_state.quiz_state['selected_option'] = None
+            sel_tags = st.session_state.get('selected_tags', []) or []
+            kw = st.session_state.get('kw_filter', '')
+            qn = int(st.session_state.get('qcount_drill', 10) or 10)
+            shuffle = st.session_state.get('shuffle_opts', True)
+            adaptive_mode = st.session_state.get('adaptive_drill', False)
+            st.session_state.quiz_state['expected_accuracy'] = None
+            
+            # Select questions based on level
+            if selected_level == "vocab":
+                vocab_list = vocab_data.get(subject, [])
+                if vocab_list:
+                    st.session_state.quiz_state['questions'] = quiz_engine.vocab_questions(vocab_list)
+                else:
+                    st.warning(f"No vocabulary data for {subject} yet.")
+                    st.session_state.quiz_state['active'] = False
+            
+            elif selected_level == 2 or selected_level == 3:
+                # Use generated questions for Level 2/3
+                level_gen_qs = quiz_engine.filter_questions(load_generated_subject(subject), level=selected_level, tags=sel_tags, keyword=kw)
+                if level_gen_qs:
+                    if adaptive_mode:
+                        _adaptive_select((subject, selected_level, tuple(sel_tags), kw), level_gen_qs, subject, qn, shuffle)
+                    else:
+                        st.session_state.quiz_state['questions'] = quiz_engine.select_questions(level_gen_qs, qn, shuffle=shuffle)
+                else:
+                    st.warning(f"No generated questions for {subject} Level {selected_level} yet.")
+                    st.session_state.quiz_state['active'] = False
+
+            else:
+                # Level 1 (Static questions + Generated Level 0); the tag
+                # filter only applies to the generated part
+                static_level1 = quiz_engine.filter_questions(drill_questions.get(subject, []), level=1, default_level=1, keyword=kw)
+                level0_gen_qs = quiz_engine.filter_questions(load_generated_subject(subject), level=0, tags=sel_tags, keyword=kw)
+                all_level1_questions = static_level1 + level0_gen_qs
+                
+                if all_level1_questions:
+                    if adaptive_mode:
+                        _adaptive_select((subject, 1, tuple(sel_tags), kw), all_level1_questions, subject, qn, shuffle)
+                    else:
+                        st.session_state.quiz_state['questions'] = quiz_engine.select_questions(all_level1_questions, qn, shuffle=shuffle)
+                else:
+                    st.warning(f"No questions found for {subject} Level 1.")
+                    st.session_state.quiz_state['active'] = False
+                
+    with col2:
+        quiz_panel()
+
+
+def _adaptive_select(pool_key, questions, subject, n, shuffle):
+    # One pool per filter combination; refresh only rebuilds the alias blocks
+    # whose weights moved since the last start
+    cached = st.session_state.get('_adaptive_pool')
+    if cached is None or cached[0] != pool_key or cached[1].fingerprint != adaptive.fingerprint(questions):
+        cached = (pool_key, adaptive.AdaptivePool(questions, subject))
+        st.session_state['_adaptive_pool'] = cached
+    pool = cached[1]
+    pool.refresh(mastery_model())
+    picked, expected = pool.select(n, shuffle=shuffle)
+    st.session_state.quiz_state['questions'] = picked
+    st.session_state.quiz_state['expected_accuracy'] = expected
+
+
+def _submit_answer():
+    qs = st.session_state.quiz_state
+    options = qs['questions'][qs['q_index']]['options']
+    choice = st.session_state.get(f"q_{qs['q_index']}")
+    conf = st.session_state.get(f"conf_{qs['q_index']}", 3)
+    if choice:
+        q = qs['questions'][qs['q_index']]
+        wrong_idx = quiz_engine.submit_answer(qs, st.session_state.data, options.index(choice), confidence=conf)
+        mastery_model().record(q, q.get('subject') or qs.get('subject'), wrong_idx is None)
+        save_mastery()
+        # Misses join the review deck; answers to cards already in it count as reviews
+        deck = srs_deck()
+        key = srs.wrong_key(q)
+        if wrong_idx is not None or key in deck:
+            deck.review(key, srs.AGAIN if wrong_idx is not None else srs.GOOD, date.today())
+            save_data(st.session_state.data)
+        if wrong_idx is not None:
+            st.session_state.last_wrong_idx = wrong_idx
+
+
+def _next_question():
+    quiz_engine.next_question(st.session_state.quiz_state)
+
+
+# Answering only reruns this panel, not the sidebar or the topic picker;
+# state changes happen in the button callbacks before the fragment reruns.
+@st.fragment
+def quiz_panel():
+    qs = st.session_state.quiz_state
+    if qs['active']:
+        current_q = qs['questions'][qs['q_index']]
+        total_q = len(qs['questions'])
+        
+        attemp = qs['q_index'] + (1 if qs.get('show_feedback') else 0)
+        acc = (qs['score'] / attemp * 100) if attemp > 0 else 0.0
+        m1, m2 = st.columns(2)
+        m1.metric("Score", f"{qs['score']} / {total_q}")
+        m2.metric("Accuracy", f"{acc:.1f}%")
+        if qs.get('expected_accuracy') is not None:
+            st.caption(f"🎯 Adaptive set · expected accuracy {qs['expected_accuracy']:.0%}")
+        prog = qs['q_index'] / total_q if total_q else 0.0
+        st.progress(prog)
+        subj = qs.get('subject', 'General') or 'General'
+        lvl = qs.get('level', '?')
+        if isinstance(lvl, int):
+            lvl_txt = f"Lv{lvl}"
+        else:
+            lvl_txt = str(lvl)
+        st.markdown(f"<span class='badge'>{subj}</span><span class='badge badge-level'>{lvl_txt}</span>", unsafe_allow_html=True)
+        st.subheader(f"Question {qs['q_index'] + 1} / {total_q}")
+        st.markdown(f"""<div class='question-card'><strong>{current_q['q']}</strong></div>""", unsafe_allow_html=True)
+        
+        # Options
+        options = current_q['options']
+        
+        # If feedback is shown, disable interaction or show result
+        if qs['show_feedback']:
+            for idx, opt in enumerate(options):
+                if idx == current_q['correct']:
+                    st.markdown(f"<div class='correct-answer'>{opt} (Correct)</div>", unsafe_allow_html=True)
+                elif idx == qs['selected_option']:
+                    st.markdown(f"<div class='incorrect-answer'>{opt} (Your Answer)</div>", unsafe_allow_html=True)
+                else:
+                    st.text(opt)
+            
+            st.markdown("### Explanation")
+            st.info(current_q['explanation'])
+            if qs['selected_option'] is not None and qs['selected_option'] != current_q['correct']:
+                err = st.radio("Tag your error", ["careless", "concept", "guess", "time"], horizontal=True, key=f"err_{qs['q_index']}")
+                if st.button("Save Tag", key=f"save_err_{qs['q_index']}"):
+                    idx = getattr(st.session_state, 'last_wrong_idx', None)
+                    try:
+                        if idx is not None and idx < len(st.session_state.data.get('wrong_answers', [])):
+                            st.session_state.data['wrong_answers'][idx]['error_type'] = err
+                            save_data(st.session_state.data)
+                            st.toast("Tag saved", icon="✅")
+                        else:
+                            st.warning("No recent wrong answer to tag.")
+                    except Exception:
+                        pass
+            
+            if qs['q_index'] < total_q - 1:
+                st.button("Next Question", on_click=_next_question)
+            else:
+                score = qs['score']
+                st.success(f"Quiz Completed! Score: {score} / {total_q}")
+                
+                if st.button("Finish & Claim XP"):
+                    earned_xp, current_level, leveled_up = quiz_engine.finish_quiz(qs, st.session_state.data)
+                    save_data(st.session_state.data)
+                    
+                    if leveled_up:
+                        st.balloons()
+                        st.success(f"LEVEL UP! You are now Level {current_level}!")
+                    else:
+                        st.success(f"Earned {earned_xp} XP!")
+                        
+                    st.rerun()
+                    
+        else:
+            st.radio("Choose Answer:", options, index=None, key=f"q_{qs['q_index']}")
+            st.select_slider("Confidence (1-5)", options=[1,2,3,4,5], value=3, key=f"conf_{qs['q_index']}")
+            if st.button("Submit Answer", on_click=_submit_answer) and not st.session_state.get(f"q_{qs['q_index']}"):
+                st.warning("Please select an option.")
+    else:
+        st.info("Select a subject and level from the sidebar to start.")
@@ -0,0 +1,240 @@
+"""IELTS / TOEFL preparation tracker."""
+import random
+from datetime import date
+
+import streamlit as st
+
+import trend_charts
+from common import ielts_reading_band, save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def render():
+    st.header("English Exam Prep")
+    ep = st.session_state.data.get("english_prep", {})
+    tabs = st.tabs(["IELTS", "TOEFL"])
+    with tabs[0]:
+        i = ep.get("ielts", {})
+        c1, c2 = st.columns(2)
+        with c1:
+            tb = st.number_input("Target Band", min_value=0.0, max_value=9.0, value=float(i.get("target_band", 7.0)), step=0.5, key="ielts_tb")
+        with c2:
+            ed = st.date_input("Exam Date", value=pd.to_datetime(i.get("exam_date") or date.today().strftime("%Y-%m-%d")).date(), key="ielts_ed")
+        if st.button("Save Target (IELTS)"):
+            ep["ielts"]["target_band"] = tb
+            ep["ielts"]["exam_date"] = ed.strftime("%Y-%m-%d")
+            st.session_state.data["english_prep"] = ep
+            save_data(st.session_state.data)
+            st.success("Saved")
+        if i.get("logs"):
+            try:
+                df_prev = pd.DataFrame(i.get("logs", []))
+                df_prev = df_prev.sort_values("date", ascending=False)
+                last = df_prev.iloc[0].to_dict()
+                cols = st.columns(4)
+                lv = float(last.get("listening", 0) or 0)
+                rv = float(last.get("reading", 0) or 0)
+                wv = float(last.get("writing", 0) or 0)
+                sv = float(last.get("speaking", 0) or 0)
+                cols[0].metric("Listening", f"{lv}")
+                cols[1].metric("Reading", f"{rv}")
+                cols[2].metric("Writing", f"{wv}")
+                cols[3].metric("Speaking", f"{sv}")
+            except Exception:
+                pass
+        st.subheader("Checklist")
+        if "checklist" in i:
+            for idx, it in enumerate(i["checklist"]):
+                k = f"ielts_chk_{idx}"
+                val = st.checkbox(it["item"], value=it.get("done", False), key=k)
+                i["checklist"][idx]["done"] = val
+        st.subheader("Practice Logs")
+        with st.form("ielts_log_form"):
+            ld = st.date_input("Date", value=date.today(), key="ielts_log_date")
+            typ = st.selectbox("Type", ["Mock", "Official"], key="ielts_log_type")
+            score = st.number_input("Overall Band", min_value=0.0, max_value=9.0, value=6.5, step=0.5, key="ielts_log_score")
+            c3, c4 = st.columns(2)
+            with c3:
+                lsc = st.number_input("Listening", min_value=0.0, max_value=9.0, value=6.5, step=0.5, key="ielts_l")
+                rsc = st.number_input("Reading", min_value=0.0, max_value=9.0, value=6.5, step=0.5, key="ielts_r")
+            with c4:
+                wsc = st.number_input("Writing", min_value=0.0, max_value=9.0, value=6.5, step=0.5, key="ielts_w")
+                ssc = st.number_input("Speaking", min_value=0.0, max_value=9.0, value=6.5, step=0.5, key="ielts_s")
+            submit = st.form_submit_button("Add Log")
+            if submit:
+                ep["ielts"]["logs"].append({"date": ld.strftime("%Y-%m-%d"), "type": typ, "score": score, "listening": lsc, "reading": rsc, "writing": wsc, "speaking": ssc})
+                st.session_state.data["english_prep"] = ep
+                save_data(st.session_state.data)
+                st.success("Added")
+        df = pd.DataFrame(i.get("logs", []))
+        if not df.empty:
+            st.dataframe(df.sort_values("date", ascending=False), use_container_width=True)
+            b = df["score"].max()
+            a = df["score"].mean()
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Best", f"{b}")
+            m2.metric("Average", f"{a:.2f}")
+            try:
+                tgt = float(tb)
+                gap = max(0.0, tgt - float(b))
+                days_left = 0
+                try:
+                    dleft = pd.to_datetime(i.get("exam_date")).date()
+                    days_left = (dleft - date.today()).days if dleft else 0
+                except Exception:
+                    days_left = 0
+                m3.metric("Gap to Target", f"{gap:.1f}", f"{days_left} days")
+            except Exception:
+                pass
+            try:
+                figx = trend_charts.trend_figure(i.get("logs", []), x="date", y="score", title="IELTS Overall Trend", y_range=[0, 9], mode="lines")
+                st.plotly_chart(figx, use_container_width=True)
+            except Exception:
+                pass
+            st.download_button("Download CSV", data=df.to_csv(index=False).encode("utf-8"), file_name="ielts_logs.csv", mime="text/csv")
+        st.subheader("Tools")
+        mod = st.selectbox("Module", ["Academic", "General Training"], key="ielts_module")
+        with st.expander("Reading: Raw→Band Converter"):
+            raw = st.number_input("Correct out of 40", min_value=0, max_value=40, value=30, step=1, key="ielts_reading_raw")
+            band = ielts_reading_band(mod, raw)
+            st.metric("Estimated Band", f"{band:.1f}")
+        with st.expander("Writing Planner (Task 1/Task 2)"):
+            tsel = st.radio("Task", ["Task 1 (Report)", "Task 2 (Essay)"], horizontal=True, key="ielts_wtask")
+            if tsel.startswith("Task 1"):
+                intro = st.text_area("Intro/Overview", value="The chart illustrates ... Overall, ...")
+                k1 = st.text_area("Key Feature 1", value="Category A increased from ... to ...")
+                k2 = st.text_area("Key Feature 2", value="Category B declined slightly ...")
+                k3 = st.text_area("Key Feature 3 (optional)", value="")
+                if st.button("Generate Outline (Task 1)"):
+                    outline = f"{intro}\n\nParagraph 1: {k1}\nParagraph 2: {k2}\nParagraph 3: {k3}".strip()
+                    st.code(outline, language="markdown")
+            else:
+                qtype = st.selectbox("Question Type", ["Agree/Disagree", "Discuss Both", "Advantages/Disadvantages", "Problem/Solution", "Two-part"])
+                pos = st.text_input("Position", value="I agree that ...")
+                arg_for = st.text_area("Argument A", value="Reason 1 with example ...")
+                arg_against = st.text_area("Argument B", value="Counterpoint with example ...")
+                ex = st.text_area("Real-world Example", value="For instance, ...")
+                if st.button("Generate Outline (Task 2)"):
+                    outline = f"Introduction: {pos}\n\nBody 1: {arg_for}\n\nBody 2: {arg_against}\n\nExample: {ex}\n\nConclusion: Restate position"
+                    st.code(outline, language="markdown")
+        with st.expander("Speaking: Random Topic Generator"):
+            part = st.radio("Part", ["Part 1", "Part 2 (Cue Card)", "Part 3"], horizontal=True, key="ielts_spart")
+            if st.button("Random Topic"):
+                topics1 = ["Hometown", "Work/Study", "Hobbies", "Food", "Travel"]
+                topics2 = [
+                    "Describe a book you recently read",
+                    "Describe a place you would like to visit",
+                    "Describe a person who inspired you",
+                    "Describe an important invention",
+                    "Describe a difficult decision you made"
+                ]
+                topics3 = ["Education and technology", "Environmental policies", "Globalization effects", "Public transport", "Work-life balance"]
+                if part == "Part 1":
+                    st.write(random.choice(topics1))
+                elif part.startswith("Part 2"):
+                    st.write(random.choice(topics2))
+                else:
+                    st.write(random.choice(topics3))
+        st.subheader("Resources")
+        new_r = st.text_input("Add Resource URL", key="ielts_res_url")
+        if st.button("Add Resource (IELTS)"):
+            if new_r:
+                ep["ielts"]["resources"].append(new_r)
+                st.session_state.data["english_prep"] = ep
+                save_data(st.session_state.data)
+                st.success("Added")
+        if i.get("resources"):
+            for u in i["resources"]:
+                st.markdown(f"- [{u}]({u})")
+    with tabs[1]:
+        t = ep.get("toefl", {})
+        c1, c2 = st.columns(2)
+        with c1:
+            ts = st.number_input("Target Score", min_value=0, max_value=120, value=int(t.get("target_score", 100)), step=1, key="toefl_ts")
+        with c2:
+            ed = st.date_input("Exam Date", value=pd.to_datetime(t.get("exam_date") or date.today().strftime("%Y-%m-%d")).date(), key="toefl_ed")
+        if st.button("Save Target (TOEFL)"):
+            ep["toefl"]["target_score"] = ts
+            ep["toefl"]["exam_date"] = ed.strftime("%Y-%m-%d")
+            st.session_state.data["english_prep"] = ep
+            save_data(st.session_state.data)
+            st.success("Saved")
+        if t.get("logs"):
+            try:
+                df_prev = pd.DataFrame(t.get("logs", []))
+                df_prev = df_prev.sort_values("date", ascending=False)
+                last = df_prev.iloc[0].to_dict()
+                cols = st.columns(4)
+                rv = int(last.get("reading_s", 0) or 0)
+                lv = int(last.get("listening_s", 0) or 0)
+                sv = int(last.get("speaking_s", 0) or 0)
+                wv = int(last.get("writing_s", 0) or 0)
+                cols[0].metric("Reading", f"{rv}")
+                cols[1].metric("Listening", f"{lv}")
+                cols[2].metric("Speaking", f"{sv}")
+                cols[3].metric("Writing", f"{wv}")
+            except Exception:
+                pass
+        st.subheader("Checklist")
+        if "checklist" in t:
+            for idx, it in enumerate(t["checklist"]):
+                k = f"toefl_chk_{idx}"
+                val = st.checkbox(it["item"], value=it.get("done", False), key=k)
+                t["checklist"][idx]["done"] = val
+        st.subheader("Practice Logs")
+        with st.form("toefl_log_form"):
+            ld = st.date_input("Date", value=date.today(), key="toefl_log_date")
+            typ = st.selectbox("Type", ["Mock", "Official"], key="toefl_log_type")
+            score = st.number_input("Total Score", min_value=0, max_value=120, value=90, step=1, key="toefl_log_score")
+            c3, c4 = st.columns(2)
+            with c3:
+                rsc = st.number_input("Reading (0-30)", min_value=0, max_value=30, value=22, step=1, key="toefl_r")
+                lsc = st.number_input("Listening (0-30)", min_value=0, max_value=30, value=22, step=1, key="toefl_l")
+            with c4:
+                ssc = st.number_input("Speaking (0-30)", min_value=0, max_value=30, value=22, step=1, key="toefl_s")
+                wsc = st.number_input("Writing (0-30)", min_value=0, max_value=30, value=22, step=1, key="toefl_w")
+            submit = st.form_submit_button("Add Log")
+            if submit:
+                ep["toefl"]["logs"].append({"date": ld.strftime("%Y-%m-%d"), "type": typ, "score": int(score), "reading_s": int(rsc), "listening_s": int(lsc), "speaking_s": int(ssc), "writing_s": int(wsc)})
+                st.session_state.data["english_prep"] = ep
+                save_data(st.session_state.data)
+                st.success("Added")
+        df = pd.DataFrame(t.get("logs", []))
+        if not df.empty:
+            st.dataframe(df.sort_values("date", ascending=False), use_container_width=True)
+            b = df["score"].max()
+            a = df["score"].mean()
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Best", f"{b}")
+            m2.metric("Average", f"{a:.2f}")
+            try:
+                tgt = int(ts)
+                gap = max(0, tgt - int(b))
+                days_left = 0
+                try:
+                    dleft = pd.to_datetime(t.get("exam_date")).date()
+                    days_left = (dleft - date.today()).days if dleft else 0
+                except Exception:
+                    days_left = 0
+                m3.metric("Gap to Target", f"{gap}", f"{days_left} days")
+            except Exception:
+                pass
+            try:
+                figx = trend_charts.trend_figure(t.get("logs", []), x="date", y="score", title="TOEFL Total Trend", y_range=[0, 120], mode="lines")
+                st.plotly_chart(figx, use_container_width=True)
+            except Exception:
+                pass
+            st.download_button("Download CSV", data=df.to_csv(index=False).encode("utf-8"), file_name="toefl_logs.csv", mime="text/csv")
+        st.subheader("Resources")
+        new_r = st.text_input("Add Resource URL", key="toefl_res_url")
+        if st.button("Add Resource (TOEFL)"):
+            if new_r:
+                ep["toefl"]["resources"].append(new_r)
+                st.session_state.data["english_prep"] = ep
+                save_data(st.session_state.data)
+                st.success("Added")
+        if t.get("resources"):
+            for u in t["resources"]:
+                st.markdown(f"- [{u}]({u})")
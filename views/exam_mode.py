@@ -0,0 +1,152 @@
+"""Timed mixed-subject exam."""
+import time
+
+import streamlit as st
+
+import question_bank
+import quiz_engine
+from common import save_data
+
+# Countdown that ticks in the browser. It only talks to the server once, when
+# it reaches zero; the deadline itself is enforced from the stored start_ts.
+_TIMER_HTML = """
+<div class="exam-timer-label">Time Remaining</div>
+<div class="exam-timer">--:--</div>
+"""
+
+_TIMER_CSS = """
+.exam-timer-label { font-size: 14px; color: var(--st-text-color); opacity: 0.7; }
+.exam-timer { font-size: 36px; font-weight: 600; font-variant-numeric: tabular-nums; color: var(--st-text-color); }
+.exam-timer.low { color: #d32f2f; }
+"""
+
+_TIMER_JS = """
+export default function(component) {
+    const { data, parentElement, setTriggerValue } = component;
+    const el = parentElement.querySelector('.exam-timer');
+    // Server sends the remaining time, so client clock skew doesn't matter
+    const end = Date.now() + data.remain_ms;
+    let fired = false;
+    const tick = () => {
+        const left = Math.max(0, Math.ceil((end - Date.now()) / 1000));
+        const mm = String(Math.floor(left / 60)).padStart(2, '0');
+        const ss = String(left % 60).padStart(2, '0');
+        el.textContent = `${mm}:${ss}`;
+        el.classList.toggle('low', left < 60);
+        if (left === 0 && !fired) {
+            fired = true;
+            clearInterval(id);
+            setTriggerValue('expired', data.deadline);
+        }
+    };
+    const id = setInterval(tick, 250);
+    tick();
+    return () => clearInterval(id);
+}
+"""
+
+_exam_timer = st.components.v2.component("exam_timer", html=_TIMER_HTML, css=_TIMER_CSS, js=_TIMER_JS)
+
+
+def render():
+    drill_questions = question_bank.drill_questions()
+    st.header("Exam Mode")
+    if 'exam' not in st.session_state:
+        st.session_state.exam = {'active': False, 'start_ts': None, 'duration_min': 30, 'q_index': 0, 'questions': [], 'answers': [], 'finished': False, 'subject': 'Mixed'}
+    ex = st.session_state.exam
+    if not ex['active'] and not ex['finished']:
+        subject = st.selectbox("Subject", ["Mixed", "Financial", "Management", "Audit", "Company"])
+        qcount = st.number_input("Number of Questions", min_value=10, max_value=60, value=20, step=5)
+        duration = st.number_input("Time Limit (minutes)", min_value=10, max_value=180, value=60, step=5)
+        if st.button("Start Exam", type="primary", use_container_width=True):
+            ex['active'] = True
+            ex['finished'] = False
+            ex['start_ts'] = int(time.time())
+            ex['duration_min'] = int(duration)
+            ex['q_index'] = 0
+            ex['questions'] = quiz_engine.build_exam(drill_questions, subject, qcount)
+            ex['answers'] = [None] * len(ex['questions'])
+            ex['subject'] = subject
+            st.rerun()
+    elif ex['active'] and not ex['finished']:
+        exam_panel()
+    else:
+        first = not ex.get('recorded')
+        corrects, total, percent, earned_xp, curr_level, leveled = quiz_engine.finish_exam(ex, st.session_state.data)
+        st.success(f"Finished. Score: {corrects}/{total} ({percent}%)")
+        if first:
+            save_data(st.session_state.data)
+        if earned_xp > 0:
+            if leveled:
+                st.balloons()
+                st.success(f"+{earned_xp} XP, Level {curr_level}")
+            else:
+                st.info(f"+{earned_xp} XP added")
+        with st.expander("Review"):
+            for i, q in enumerate(st.session_state.exam['questions']):
+                st.markdown(f"**Q{i+1}.** {q['q']}")
+                a = st.session_state.exam['answers'][i]
+                for idx, opt in enumerate(q['options']):
+                    if idx == q.get('correct'):
+                        st.markdown(f"- ✅ {opt}")
+                    elif a is not None and idx == a:
+                        st.markdown(f"- ❌ {opt}")
+                    else:
+                        st.markdown(f"- {opt}")
+                st.caption(q.get('explanation',''))
+                st.divider()
+        if st.button("Reset Exam"):
+            st.session_state.exam = {'active': False, 'start_ts': None, 'duration_min': 30, 'q_index': 0, 'questions': [], 'answers': [], 'finished': False, 'subject': 'Mixed'}
+            st.rerun()
+
+
+def _deadline(ex):
+    return int(ex['start_ts']) + ex['duration_min'] * 60
+
+
+def _enforce_deadline():
+    # Server-authoritative: whatever the browser shows, the stored start_ts decides
+    ex = st.session_state.exam
+    if ex['active'] and time.time() >= _deadline(ex):
+        ex['finished'] = True
+        ex['active'] = False
+    return ex['finished']
+
+
+def _save_answer(i, options):
+    if _enforce_deadline():
+        return
+    sel = st.session_state.get(f"exam_{i}")
+    st.session_state.exam['answers'][i] = options.index(sel) if sel else None
+
+
+def _move(step):
+    ex = st.session_state.exam
+    ex['q_index'] = min(max(ex['q_index'] + step, 0), len(ex['questions']) - 1)
+
+
+# Answer/navigation clicks only rerun the question panel; finishing reruns
+# the whole page to show the results.
+@st.fragment
+def exam_panel():
+    ex = st.session_state.exam
+    if _enforce_deadline():
+        st.rerun()
+    remain = _deadline(ex) - time.time()
+    _exam_timer(key="exam_timer", data={'remain_ms': int(remain * 1000), 'deadline': _deadline(ex)}, height=80, on_expired_change=_enforce_deadline)
+    q = ex['questions'][ex['q_index']]
+    st.markdown(f"**[{q.get('subject','')}] Q{ex['q_index']+1}/{len(ex['questions'])}**")
+    st.write(q['q'])
+    key = f"exam_{ex['q_index']}"
+    st.radio("Select answer", q['options'], index=ex['answers'][ex['q_index']] if ex['answers'][ex['q_index']] is not None else None, key=key)
+    st.button("Save Answer", on_click=_save_answer, args=(ex['q_index'], q['options']))
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.button("Prev", on_click=_move, args=(-1,))
+    with c2:
+        st.button("Next", on_click=_move, args=(1,))
+    with c3:
+        if st.button("Finish Now", type="primary"):
+            ex['finished'] = True
+            ex['active'] = False
+            st.rerun()
@@ -0,0 +1,734 @@
+"""Formula sheet with worked examples and LaTeX."""
+import json
+import os
+from datetime import date
+
+import streamlit as st
+
+import srs
+from asset_registry import registry as assets
+from common import BASE_DIR, save_data, show_asset_errors, srs_deck
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+FORMULAS_FILE = os.path.join(BASE_DIR, "assets", "formulas.json")
+
+# Reference assets are parsed once per process (asset_registry) and shared
+# by all sessions; treat them as read-only.
+def load_formulas_data():
+    return assets.get("formulas")
+
+def save_formulas_data(data):
+    p = FORMULAS_FILE
+    try:
+        with open(p, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return True
+    except Exception:
+        return False
+
+def seed_top10_examples(formulas_data):
+    top10 = {
+        "Future Value (Single Sum)": {
+            "example_ja": "例: PV=1,000、r=5%、n=3年 ⇒ FV = 1,000×(1.05)^3 ≈ 1,157.63",
+            "example_en": "Example: PV=1,000, r=5%, n=3 ⇒ FV = 1,000×(1.05)^3 ≈ 1,157.63",
+            "problem_ja": "問題: PV=200、r=8%、n=4年 の将来価値FVは？",
+            "problem_en": "Problem: Find FV for PV=200, r=8%, n=4.",
+            "solution_ja": "解答: FV = 200×(1.08)^4 ≈ 272.1",
+            "solution_en": "Solution: FV = 200×(1.08)^4 ≈ 272.1"
+        },
+        "Present Value (Single Sum)": {
+            "example_ja": "例: FV=1,000、r=6%、n=2年 ⇒ PV = 1,000 ÷ (1.06)^2 ≈ 890.0",
+            "example_en": "Example: FV=1,000, r=6%, n=2 ⇒ PV = 1,000/(1.06)^2 ≈ 890.0",
+            "problem_ja": "問題: FV=500、r=10%、n=3年 の現在価値PVは？",
+            "problem_en": "Problem: Find PV for FV=500, r=10%, n=3.",
+            "solution_ja": "解答: PV ≈ 500 ÷ 1.331 ≈ 375.7",
+            "solution_en": "Solution: PV ≈ 500/1.331 ≈ 375.7"
+        },
+        "Present Value of Annuity": {
+            "example_ja": "例: P=100、r=5%、n=4 ⇒ PVA = 100×[1 − (1.05)^(−4)] ÷ 0.05 ≈ 354.6",
+            "example_en": "Example: P=100, r=5%, n=4 ⇒ PVA ≈ 354.6",
+            "problem_ja": "問題: P=50、r=6%、n=3 の年金現在価値PVAは？",
+            "problem_en": "Problem: Find PVA for P=50, r=6%, n=3.",
+            "solution_ja": "解答: PVA ≈ 50×[1 − (1.06)^(−3)] ÷ 0.06 ≈ 133.7",
+            "solution_en": "Solution: PVA ≈ 50×[1 − 1.06^(−3)]/0.06 ≈ 133.7"
+        },
+        "Contribution Margin": {
+            "example_ja": "例: 売上1,000、変動費600 ⇒ 限界利益CM = 400",
+            "example_en": "Example: Sales=1,000, Variable=600 ⇒ CM=400",
+            "problem_ja": "問題: 単価20、変動費/単位12、数量200 ⇒ 限界利益は？",
+            "problem_en": "Problem: Price=20, Var/unit=12, Units=200 ⇒ CM?",
+            "solution_ja": "解答: 単位CM=8、合計CM=8×200=1,600",
+            "solution_en": "Solution: Unit CM=8; Total CM=8×200=1,600"
+        },
+        "Break-even Units": {
+            "example_ja": "例: 固定費1,200、単価20、変動費12 ⇒ BEQ=1,200÷(20−12)=150単位",
+            "example_en": "Example: Fixed=1,200, Price=20, Var=12 ⇒ BEQ=150 units",
+            "problem_ja": "問題: 固定費5,000、単価50、変動費30 ⇒ BEQは？",
+            "problem_en": "Problem: Fixed=5,000, Price=50, Var=30 ⇒ BEQ?",
+            "solution_ja": "解答: BEQ=5,000 ÷ (50−30)=250単位",
+            "solution_en": "Solution: BEQ=5,000/(50−30)=250 units"
+        },
+        "Net Present Value": {
+            "example_ja": "例: CF0=-1,000、CF1-3=400、r=8% ⇒ NPV ≈ 30.8（正、採用）",
+            "example_en": "Example: CF0=-1,000, CF1-3=400, r=8% ⇒ NPV ≈ 30.8",
+            "problem_ja": "問題: CF0=-2,000、CF1-4=600、r=10% ⇒ NPVは？",
+            "problem_en": "Problem: CF0=-2,000, CF1-4=600, r=10% ⇒ NPV?",
+            "solution_ja": "解答: 600×[(1−1.1^(−4))/0.1]−2,000 ≈ -98.1",
+            "solution_en": "Solution: 600×[(1−1.1^(−4))/0.1]−2,000 ≈ -98.1"
+        },
+        "WACC": {
+            "example_ja": "例: w_e=0.6, w_d=0.4, k_e=10%, k_d=5%, T=30% ⇒ WACC=7.4%",
+            "example_en": "Example: we=0.6, wd=0.4, ke=10%, kd=5%, T=30% ⇒ WACC=7.4%",
+            "problem_ja": "問題: w_e=0.7, w_d=0.3, k_e=12%, k_d=4%, T=25% ⇒ WACCは？",
+            "problem_en": "Problem: we=0.7, wd=0.3, ke=12%, kd=4%, T=25% ⇒ WACC?",
+            "solution_ja": "解答: 0.7×0.12 + 0.3×0.04×(1−0.25)=9.3%",
+            "solution_en": "Solution: 0.7×0.12 + 0.3×0.04×(1−0.25)=9.3%"
+        },
+        "CAPM Cost of Equity": {
+            "example_ja": "例: Rf=2%、β=1.2、(Rm−Rf)=5% ⇒ k_e=8%",
+            "example_en": "Example: Rf=2%, β=1.2, (Rm−Rf)=5% ⇒ ke=8%",
+            "problem_ja": "問題: Rf=1%、β=0.8、Rm=6% ⇒ k_eは？",
+            "problem_en": "Problem: Rf=1%, β=0.8, Rm=6% ⇒ ke?",
+            "solution_ja": "解答: MRP=5%、k_e=1%+0.8×5%=5%",
+            "solution_en": "Solution: MRP=5%, ke=1%+0.8×5%=5%"
+        },
+        "ROE": {
+            "example_ja": "例: 当期純利益120、平均自己資本1,000 ⇒ ROE=12%",
+            "example_en": "Example: NI=120, Avg Equity=1,000 ⇒ ROE=12%",
+            "problem_ja": "問題: 当期純利益80、平均自己資本400 ⇒ ROEは？",
+            "problem_en": "Problem: NI=80, Avg Equity=400 ⇒ ROE?",
+            "solution_ja": "解答: 80 ÷ 400 = 20%",
+            "solution_en": "Solution: 80/400 = 20%"
+        },
+        "DuPont ROE": {
+            "example_ja": "例: NPM=10%、TAT=1.5、EM=2 ⇒ ROE=30%",
+            "example_en": "Example: NPM=10%, TAT=1.5, EM=2 ⇒ ROE=30%",
+            "problem_ja": "問題: NPM=8%、TAT=1.2、EM=1.8 ⇒ ROEは？",
+            "problem_en": "Problem: NPM=8%, TAT=1.2, EM=1.8 ⇒ ROE?",
+            "solution_ja": "解答: 0.08×1.2×1.8=0.1728 ⇒ 17.28%",
+            "solution_en": "Solution: 0.08×1.2×1.8=0.1728 ⇒ 17.28%"
+        }
+    }
+    # Also seed for Annuity Due PV/FV if present
+    top10.update({
+        "Annuity Due PV": {
+            "example_ja": "例: P=100、r=5%、n=3 ⇒ PVA_due = 100×[(1−1.05^(−3))/0.05]×(1.05) ≈ 286.98",
+            "example_en": "Example: P=100, r=5%, n=3 ⇒ PVA_due ≈ 286.98",
+            "problem_ja": "問題: P=50、r=6%、n=4 の年金現価（期首払い）は？",
+            "problem_en": "Problem: Find annuity-due present value for P=50, r=6%, n=4.",
+            "solution_ja": "解答: PVA_due = 50×[(1−1.06^(−4))/0.06]×1.06 ≈ 183.6",
+            "solution_en": "Solution: PVA_due = 50×[(1−1.06^(−4))/0.06]×1.06 ≈ 183.6"
+        },
+        "Annuity Due FV": {
+            "example_ja": "例: P=100、r=5%、n=3 ⇒ FVA_due = 100×[(1.05^3−1)/0.05]×(1.05) ≈ 331.0",
+            "example_en": "Example: P=100, r=5%, n=3 ⇒ FVA_due ≈ 331.0",
+            "problem_ja": "問題: P=80、r=4%、n=5 の年金将来価値（期首払い）は？",
+            "problem_en": "Problem: Find annuity-due future value for P=80, r=4%, n=5.",
+            "solution_ja": "解答: FVA_due = 80×[(1.04^5−1)/0.04]×1.04 ≈ 433.0",
+            "solution_en": "Solution: FVA_due = 80×[(1.04^5−1)/0.04]×1.04 ≈ 433.0"
+        }
+    })
+    changed = False
+    for i, item in enumerate(formulas_data):
+        name = item.get("name", "")
+        if name in top10:
+            for k, v in top10[name].items():
+                if formulas_data[i].get(k) in (None, "", []):
+                    formulas_data[i][k] = v
+                    changed = True
+    return changed
+
+def _sanitize_text(v):
+    try:
+        if v is None:
+            return ""
+        # Handle numpy/pandas NaN
+        try:
+            import pandas as _pd
+            if _pd.isna(v):
+                return ""
+        except Exception:
+            pass
+        if isinstance(v, str) and v.strip().lower() == "nan":
+            return ""
+        return v
+    except Exception:
+        return ""
+
+def seed_all_formulas(formulas_data):
+    changed = False
+    for i, item in enumerate(formulas_data):
+        name = str(item.get("name", "")).strip()
+        cat = str(item.get("category", "")).strip()
+        ex_ja = _sanitize_text(item.get("example_ja", ""))
+        ex_en = _sanitize_text(item.get("example_en", ""))
+        pb_ja = _sanitize_text(item.get("problem_ja", ""))
+        pb_en = _sanitize_text(item.get("problem_en", ""))
+        so_ja = _sanitize_text(item.get("solution_ja", ""))
+        so_en = _sanitize_text(item.get("solution_en", ""))
+        if not ex_ja and not ex_en and not pb_ja and not pb_en and not so_ja and not so_en:
+            nl = name.lower()
+            if "eoq" in nl or "economic order quantity" in nl:
+                ex_ja = "例: 年需要D=12,000、発注費S=100、在庫費H=2 ⇒ EOQ=√(2×12,000×100/2)≈1,095"
+                ex_en = "Example: D=12,000/yr, S=100/order, H=2/unit/yr ⇒ EOQ≈1,095"
+                pb_ja = "問題: D=36,000、S=80、H=4 のEOQは？"
+                pb_en = "Problem: Find EOQ for D=36,000, S=80, H=4."
+                so_ja = "解答: EOQ=√(2×36,000×80/4)=√1,440,000≈1,200"
+                so_en = "Solution: EOQ=√(2×36,000×80/4)=√1,440,000≈1,200"
+            elif "reorder point" in nl or "rop" in nl:
+                ex_ja = "例: 需要日量d=50、リードタイムL=6、 安全在庫SS=100 ⇒ ROP=50×6+100=400"
+                ex_en = "Example: d=50/day, L=6 days, SS=100 ⇒ ROP=400"
+                pb_ja = "問題: d=80、L=5、SS=60 のROPは？"
+                pb_en = "Problem: Find ROP for d=80, L=5, SS=60."
+                so_ja = "解答: ROP=80×5+60=460"
+                so_en = "Solution: ROP=80×5+60=460"
+            elif "safety stock" in nl:
+                ex_ja = "例: σL=40、Z=1.65 ⇒ SS=1.65×40=66"
+                ex_en = "Example: σL=40, Z=1.65 ⇒ SS=66"
+                pb_ja = "問題: σL=30、Z=1.96 の安全在庫は？"
+                pb_en = "Problem: Find SS for σL=30, Z=1.96."
+                so_ja = "解答: SS=1.96×30=58.8≈59"
+                so_en = "Solution: SS=1.96×30=58.8≈59"
+            elif "material price variance" in nl or "mpv" in nl:
+                ex_ja = "例: AQ=1,000kg、AP=¥6、SP=¥5 ⇒ MPV=1,000×(6−5)=1,000不利"
+                ex_en = "Example: AQ=1,000kg, AP=6, SP=5 ⇒ MPV=1,000 U"
+                pb_ja = "問題: AQ=800、AP=¥4.8、SP=¥5.0 のMPVは？"
+                pb_en = "Problem: Find MPV for AQ=800, AP=4.8, SP=5.0."
+                so_ja = "解答: 800×(4.8−5.0)=−160 有利"
+                so_en = "Solution: 800×(4.8−5.0)=−160 F"
+            elif "material quantity variance" in nl or "mqv" in nl or "usage variance" in nl:
+                ex_ja = "例: SP=¥5、AQ=1,100kg、SQ=1,000kg ⇒ MQV=5×(1,100−1,000)=500不利"
+                ex_en = "Example: SP=5, AQ=1,100, SQ=1,000 ⇒ MQV=500 U"
+                pb_ja = "問題: SP=¥4、AQ=950、SQ=1,000 のMQVは？"
+                pb_en = "Problem: Find MQV for SP=4, AQ=950, SQ=1,000."
+                so_ja = "解答: 4×(950−1,000)=−200 有利"
+                so_en = "Solution: 4×(950−1,000)=−200 F"
+            elif "labor rate variance" in nl or "lrv" in nl:
+                ex_ja = "例: AH=1,200h、AR=¥12、SR=¥10 ⇒ LRV=1,200×(12−10)=2,400不利"
+                ex_en = "Example: AH=1,200h, AR=12, SR=10 ⇒ LRV=2,400 U"
+                pb_ja = "問題: AH=900、AR=¥9.5、SR=¥10 のLRVは？"
+                pb_en = "Problem: Find LRV for AH=900, AR=9.5, SR=10."
+                so_ja = "解答: 900×(9.5−10)=−450 有利"
+                so_en = "Solution: 900×(9.5−10)=−450 F"
+            elif "labor efficiency variance" in nl or "lev" in nl:
+                ex_ja = "例: SR=¥10、AH=1,200h、SH=1,000h ⇒ LEV=10×(1,200−1,000)=2,000不利"
+                ex_en = "Example: SR=10, AH=1,200, SH=1,000 ⇒ LEV=2,000 U"
+                pb_ja = "問題: SR=¥12、AH=800、SH=850 のLEVは？"
+                pb_en = "Problem: Find LEV for SR=12, AH=800, SH=850."
+                so_ja = "解答: 12×(800−850)=−600 有利"
+                so_en = "Solution: 12×(800−850)=−600 F"
+            elif "straight-line" in nl or "定額" in nl:
+                ex_ja = "例: 原価1,000、残存100、耐用年数5 ⇒ 年額=(1,000−100)/5=180"
+                ex_en = "Example: Cost=1,000, Salvage=100, Life=5 ⇒ Annual=180"
+                pb_ja = "問題: 原価800、残存0、耐用年数4 の年額は？"
+                pb_en = "Problem: Find annual SL depreciation for Cost=800, Salvage=0, Life=4."
+                so_ja = "解答: 800/4=200"
+                so_en = "Solution: 800/4=200"
+            elif "declining" in nl or "double-declining" in nl or "定率" in nl:
+                ex_ja = "例: 原価1,000、耐用年数5、率=40% ⇒ 1年目=400、2年目=(1,000−400)×0.4=240"
+                ex_en = "Example: Cost=1,000, Life=5, Rate=40% ⇒ Y1=400, Y2=240"
+                pb_ja = "問題: 原価900、寿命3、率=2/3 の1年目減価は？"
+                pb_en = "Problem: Cost=900, Life=3, Rate=2/3: Year 1 depreciation?"
+                so_ja = "解答: 900×(2/3)=600"
+                so_en = "Solution: 900×(2/3)=600"
+            elif "sum-of-the-years" in nl or "syd" in nl:
+                ex_ja = "例: 原価1,000、残存100、寿命5、合計=15 ⇒ 1年目=(5/15)×900=300"
+                ex_en = "Example: Cost=1,000, Salvage=100, Life=5, Sum=15 ⇒ Y1=300"
+                pb_ja = "問題: 原価600、残存60、寿命4、合計=10 の2年目は？"
+                pb_en = "Problem: Cost=600, Salvage=60, Life=4, Sum=10: Year 2?"
+                so_ja = "解答: (3/10)×540=162"
+                so_en = "Solution: (3/10)×540=162"
+            elif "units of production" in nl or "production-output" in nl:
+                ex_ja = "例: 原価1,000、残存100、総見積50,000u ⇒ 率=(900/50,000)=0.018/u"
+                ex_en = "Example: Cost=1,000, Salvage=100, Total 50,000u ⇒ Rate=0.018/u"
+                pb_ja = "問題: 当期生産4,000u の減価は？"
+                pb_en = "Problem: Find depreciation for 4,000 units."
+                so_ja = "解答: 0.018×4,000=72"
+                so_en = "Solution: 0.018×4,000=72"
+            elif "profitability index" in nl or " pi " in nl or nl.endswith(" pi"):
+                ex_ja = "例: 流入PV=1,200、初期投資=1,000 ⇒ PI=1.2（採用）"
+                ex_en = "Example: PV inflows=1,200, Initial=1,000 ⇒ PI=1.2 (accept)"
+                pb_ja = "問題: PV流入=900、投資=1,000 のPIは？採否は？"
+                pb_en = "Problem: PV inflows=900, investment=1,000 ⇒ PI? Accept?"
+                so_ja = "解答: 0.9、1未満のため不採用"
+                so_en = "Solution: 0.9; below 1, reject"
+            elif "payback" in nl:
+                ex_ja = "例: 初期投資1,000、毎年CF=250 ⇒ 回収期間=4年"
+                ex_en = "Example: Initial 1,000, annual CF=250 ⇒ Payback=4 years"
+                pb_ja = "問題: 初期投資1,200、年CF=300 ⇒ 回収期間は？"
+                pb_en = "Problem: Initial 1,200, annual CF=300 ⇒ Payback?"
+                so_ja = "解答: 1,200/300=4年"
+                so_en = "Solution: 1,200/300=4 years"
+            elif "perpetuity" in nl and "growing" not in nl:
+                ex_ja = "例: C=100、r=5% ⇒ PV=100/0.05=2,000"
+                ex_en = "Example: C=100, r=5% ⇒ PV=100/0.05=2,000"
+                pb_ja = "問題: C=60、r=4% の永久年金PVは？"
+                pb_en = "Problem: C=60, r=4% ⇒ PV?"
+                so_ja = "解答: 60/0.04=1,500"
+                so_en = "Solution: 60/0.04=1,500"
+            elif ("growing perpetuity" in nl) or ("gordon" in nl) or ("ddm" in nl) or ("dividend discount" in nl):
+                ex_ja = "例: D1=2、k=8%、g=3% ⇒ P0=2/(0.08−0.03)=40"
+                ex_en = "Example: D1=2, k=8%, g=3% ⇒ P0=2/(0.08−0.03)=40"
+                pb_ja = "問題: D1=3、k=10%、g=4% のP0は？"
+                pb_en = "Problem: D1=3, k=10%, g=4% ⇒ P0?"
+                so_ja = "解答: 3/(0.10−0.04)=50"
+                so_en = "Solution: 3/(0.10−0.04)=50"
+            elif "current ratio" in nl:
+                ex_ja = "例: 流動資産=500、流動負債=250 ⇒ 2.0倍"
+                ex_en = "Example: CA=500, CL=250 ⇒ 2.0x"
+                pb_ja = "問題: CA=360、CL=300 の流動比率は？"
+                pb_en = "Problem: CA=360, CL=300 ⇒ current ratio?"
+                so_ja = "解答: 360/300=1.2倍"
+                so_en = "Solution: 360/300=1.2x"
+            elif "quick ratio" in nl or "acid-test" in nl:
+                ex_ja = "例: 当座資産=300、流動負債=200 ⇒ 1.5倍"
+                ex_en = "Example: Quick assets=300, CL=200 ⇒ 1.5x"
+                pb_ja = "問題: QA=180、CL=240 の当座比率は？"
+                pb_en = "Problem: QA=180, CL=240 ⇒ quick ratio?"
+                so_ja = "解答: 180/240=0.75倍"
+                so_en = "Solution: 180/240=0.75x"
+            elif "debt-to-equity" in nl or "debt to equity" in nl or "d/e" in nl:
+                ex_ja = "例: 負債=600、自己資本=400 ⇒ D/E=1.5"
+                ex_en = "Example: Debt=600, Equity=400 ⇒ D/E=1.5"
+                pb_ja = "問題: 負債=750、自己資本=500 のD/Eは？"
+                pb_en = "Problem: Debt=750, Equity=500 ⇒ D/E?"
+                so_ja = "解答: 750/500=1.5"
+                so_en = "Solution: 750/500=1.5"
+            elif "times interest earned" in nl or "interest coverage" in nl:
+                ex_ja = "例: EBIT=300、利息=60 ⇒ TIE=5倍"
+                ex_en = "Example: EBIT=300, Interest=60 ⇒ TIE=5x"
+                pb_ja = "問題: EBIT=240、利息=80 のTIEは？"
+                pb_en = "Problem: EBIT=240, Interest=80 ⇒ TIE?"
+                so_ja = "解答: 240/80=3倍"
+                so_en = "Solution: 240/80=3x"
+            elif "inventory turnover" in nl:
+                ex_ja = "例: 売上原価=1,200、平均在庫=300 ⇒ 回転=4.0"
+                ex_en = "Example: COGS=1,200, Avg Inv=300 ⇒ Turnover=4.0"
+                pb_ja = "問題: COGS=900、平均在庫=225 ⇒ 回転は？"
+                pb_en = "Problem: COGS=900, Avg Inv=225 ⇒ turnover?"
+                so_ja = "解答: 900/225=4.0"
+                so_en = "Solution: 900/225=4.0"
+            elif "days sales outstanding" in nl or "dso" in nl or "receivables turnover" in nl:
+                ex_ja = "例: 売掛回転=12 ⇒ DSO≈365/12≈30.4日"
+                ex_en = "Example: AR turnover=12 ⇒ DSO≈365/12≈30.4 days"
+                pb_ja = "問題: AR回転=10 のDSOは？"
+                pb_en = "Problem: AR turnover=10 ⇒ DSO?"
+                so_ja = "解答: 365/10=36.5日"
+                so_en = "Solution: 365/10=36.5 days"
+            elif "days inventory outstanding" in nl or "dio" in nl:
+                ex_ja = "例: 在庫回転=8 ⇒ DIO≈365/8≈45.6日"
+                ex_en = "Example: Inventory turnover=8 ⇒ DIO≈365/8≈45.6 days"
+                pb_ja = "問題: 在庫回転=5 のDIOは？"
+                pb_en = "Problem: Inventory turnover=5 ⇒ DIO?"
+                so_ja = "解答: 365/5=73日"
+                so_en = "Solution: 365/5=73 days"
+            elif "cash conversion cycle" in nl or "ccc" in nl:
+                ex_ja = "例: DIO=50、DSO=35、DPO=40 ⇒ CCC=45日"
+                ex_en = "Example: DIO=50, DSO=35, DPO=40 ⇒ CCC=45 days"
+                pb_ja = "問題: DIO=60、DSO=30、DPO=50 のCCCは？"
+                pb_en = "Problem: DIO=60, DSO=30, DPO=50 ⇒ CCC?"
+                so_ja = "解答: 60+30−50=40日"
+                so_en = "Solution: 60+30−50=40 days"
+            elif "gross margin" in nl or "operating margin" in nl or "net profit margin" in nl:
+                ex_ja = "例: 利益=120、売上=1,000 ⇒ マージン=12%"
+                ex_en = "Example: Profit=120, Sales=1,000 ⇒ margin=12%"
+                pb_ja = "問題: 利益=90、売上=750 のマージンは？"
+                pb_en = "Problem: Profit=90, Sales=750 ⇒ margin?"
+                so_ja = "解答: 90/750=12%"
+                so_en = "Solution: 90/750=12%"
+            elif "present value" in name.lower() or "future value" in name.lower() or "annuity" in name.lower():
+                ex_ja = f"例: 仮に r=5%、期間 n=3、適切な金額を代入して計算してください。"
+                ex_en = f"Example: Assume r=5%, n=3; plug suitable amounts and compute."
+                pb_ja = f"問題: {name} を用いて金額を求めよ。"
+                pb_en = f"Problem: Use {name} to find the requested amount."
+                so_ja = f"解答: 数式に代入し、四捨五入して数値を示す。"
+                so_en = f"Solution: Substitute into the formula and present the rounded value."
+            elif "wacc" in name.lower() or "capm" in name.lower() or "npv" in name.lower() or "irr" in name.lower():
+                ex_ja = "例: Rf, β, MRP または キャッシュフロー列 と 割引率 を仮定して計算。"
+                ex_en = "Example: Assume Rf, β, MRP or CF series and a discount rate to compute."
+                pb_ja = f"問題: {name} を計算し、採否を判断せよ（該当する場合）。"
+                pb_en = f"Problem: Compute {name} and decide accept/reject if applicable."
+                so_ja = "解答: 与えられた数値を代入し、式に従って算出。"
+                so_en = "Solution: Substitute the provided values and evaluate per the formula."
+            elif "roe" in name.lower() or "roa" in name.lower() or "ratio" in name.lower():
+                ex_ja = "例: 分子と分母の数値を仮定し、比率を算出。"
+                ex_en = "Example: Assume numerator and denominator values and compute the ratio."
+                pb_ja = f"問題: {name} を計算し、解釈を述べよ。"
+                pb_en = f"Problem: Calculate {name} and interpret the result."
+                so_ja = "解答: 代入してパーセンテージで表示。"
+                so_en = "Solution: Substitute values and present as a percentage."
+            elif "break-even" in name.lower() or "contribution" in name.lower() or "variance" in name.lower():
+                ex_ja = "例: 単価・変動費・固定費（または実績と標準）を仮定して指標を計算。"
+                ex_en = "Example: Assume price, variable, fixed costs (or actual vs. standard) and compute."
+                pb_ja = f"問題: {name} を算出し、意思決定を示せ。"
+                pb_en = f"Problem: Compute {name} and state the decision implication."
+                so_ja = "解答: 指定式に代入し、単位数または差額を導出。"
+                so_en = "Solution: Substitute into the specified formula and derive units or variance."
+            else:
+                ex_ja = f"例: 「{name}」の簡単な数値例を記入。"
+                ex_en = f"Example: Provide a simple numeric example for \"{name}\"."
+                pb_ja = "問題: 数値を設定し、未知数を求めよ。"
+                pb_en = "Problem: Set numbers and solve for the unknown."
+                so_ja = "解答: 式へ代入し計算結果を提示。"
+                so_en = "Solution: Substitute into the formula and show the result."
+            formulas_data[i]["example_ja"] = ex_ja
+            formulas_data[i]["example_en"] = ex_en
+            formulas_data[i]["problem_ja"] = pb_ja
+            formulas_data[i]["problem_en"] = pb_en
+            formulas_data[i]["solution_ja"] = so_ja
+            formulas_data[i]["solution_en"] = so_en
+            changed = True
+        else:
+            if not ex_ja:
+                formulas_data[i]["example_ja"] = ex_ja
+            if not ex_en:
+                formulas_data[i]["example_en"] = ex_en
+            if not pb_ja:
+                formulas_data[i]["problem_ja"] = pb_ja
+            if not pb_en:
+                formulas_data[i]["problem_en"] = pb_en
+            if not so_ja:
+                formulas_data[i]["solution_ja"] = so_ja
+            if not so_en:
+                formulas_data[i]["solution_en"] = so_en
+    return changed
+
+def _is_missing_text(v):
+    try:
+        if v is None:
+            return True
+        try:
+            import pandas as _pd
+            if _pd.isna(v):
+                return True
+        except Exception:
+            pass
+        if isinstance(v, str) and v.strip().lower() == "nan":
+            return True
+        if isinstance(v, str) and v.strip() == "":
+            return True
+        return False
+    except Exception:
+        return True
+
+def seed_latex_formulas(formulas_data):
+    mapping = {
+        "future value (single sum)": r"FV = PV\\times(1+r)^{n}",
+        "present value (single sum)": r"PV = \\dfrac{FV}{(1+r)^{n}}",
+        "present value of annuity": r"PVA = P\\times\\dfrac{1-(1+r)^{-n}}{r}",
+        "future value of annuity": r"FVA = P\\times\\dfrac{(1+r)^{n}-1}{r}",
+        "fv of annuity": r"FVA = P\\times\\dfrac{(1+r)^{n}-1}{r}",
+        "pv of annuity": r"PVA = P\\times\\dfrac{1-(1+r)^{-n}}{r}",
+        "present value (annuity due)": r"PVA_{\\text{due}} = P\\times\\dfrac{1-(1+r)^{-n}}{r}\\times(1+r)",
+        "future value (annuity due)": r"FVA_{\\text{due}} = P\\times\\dfrac{(1+r)^{n}-1}{r}\\times(1+r)",
+        "annuity due pv": r"PVA_{\\text{due}} = P\\times\\dfrac{1-(1+r)^{-n}}{r}\\times(1+r)",
+        "annuity due fv": r"FVA_{\\text{due}} = P\\times\\dfrac{(1+r)^{n}-1}{r}\\times(1+r)",
+        "pv of growing annuity": r"PV = P\\times\\dfrac{1 - \\left(\\dfrac{1+g}{1+r}\\right)^{n}}{r-g}",
+        "pv of growing perpetuity": r"PV = \\dfrac{C_1}{r-g}",
+        "present value of growing perpetuity": r"PV = \\dfrac{C_1}{r-g}",
+        "growing annuity": r"PV = P\\times\\dfrac{1 - \\left(\\dfrac{1+g}{1+r}\\right)^{n}}{r-g}",
+        "continuous compounding fv": r"FV = PV\\,e^{rt}",
+        "continuous compounding pv": r"PV = FV\\,e^{-rt}",
+        "contribution margin": r"CM = \\text{Sales} - \\text{Variable Costs}",
+        "break-even units": r"Q_{BE} = \\dfrac{\\text{Fixed Costs}}{\\text{Price} - \\text{Variable Cost per Unit}}",
+        "net present value": r"NPV = \\sum_{t=0}^{n} \\dfrac{CF_{t}}{(1+r)^{t}}",
+        "wacc": r"WACC = w_e k_e + w_d k_d (1-T) + w_p k_p",
+        "capm cost of equity": r"k_e = R_f + \\beta\\,(R_m - R_f)",
+        "roe": r"ROE = \\dfrac{\\text{Net Income}}{\\text{Average Equity}}",
+        "dupont roe": r"ROE = \\text{NPM}\\times\\text{TAT}\\times\\text{EM}",
+        "irr": r"0 = \\sum_{t=0}^{n} \\dfrac{CF_{t}}{(1+IRR)^{t}}",
+        "profitability index": r"PI = \\dfrac{\\text{PV of Inflows}}{\\text{Initial Investment}}",
+        "payback period": r"\\text{Payback} = \\dfrac{\\text{Initial Investment}}{\\text{Annual Cash Flow}}",
+        "present value of perpetuity": r"PV = \\dfrac{C}{r}",
+        "gordon growth (ddm)": r"P_0 = \\dfrac{D_1}{k-g}",
+        "pv of growing ddm": r"P_0 = \\dfrac{D_1}{k-g}",
+        "current ratio": r"CR = \\dfrac{CA}{CL}",
+        "quick ratio": r"QR = \\dfrac{\\text{Quick Assets}}{CL}",
+        "debt-to-equity": r"\\dfrac{\\text{Debt}}{\\text{Equity}}",
+        "times interest earned": r"TIE = \\dfrac{EBIT}{\\text{Interest}}",
+        "inventory turnover": r"\\text{Turnover} = \\dfrac{COGS}{\\text{Average Inventory}}",
+        "days sales outstanding": r"DSO = \\dfrac{365}{\\text{Receivables Turnover}}",
+        "days inventory outstanding": r"DIO = \\dfrac{365}{\\text{Inventory Turnover}}",
+        "cash conversion cycle": r"CCC = DIO + DSO - DPO",
+        "gross profit margin": r"GPM = \\dfrac{\\text{Gross Profit}}{\\text{Sales}}",
+        "operating margin": r"OM = \\dfrac{\\text{Operating Income}}{\\text{Sales}}",
+        "net profit margin": r"NPM = \\dfrac{\\text{Net Income}}{\\text{Sales}}",
+        "economic order quantity (eoq)": r"EOQ = \\sqrt{\\dfrac{2DS}{H}}",
+        "reorder point": r"ROP = d\\times L + SS",
+        "safety stock": r"SS = Z\\times\\sigma_{L}",
+        "capm": r"k_e = R_f + \\beta\\,(R_m - R_f)",
+        "effective annual rate": r"EAR = (1 + i/m)^{m} - 1",
+        "future value of annuity (ordinary)": r"FVA = P\\times\\dfrac{(1+r)^{n}-1}{r}",
+        "future value (annuity)": r"FVA = P\\times\\dfrac{(1+r)^{n}-1}{r}",
+        "black–scholes d1": r"d_1 = \\dfrac{\\ln(S/K) + (r + \\tfrac{\\sigma^2}{2})T}{\\sigma\\sqrt{T}}",
+        "black–scholes d2": r"d_2 = d_1 - \\sigma\\sqrt{T}",
+        "black–scholes call price": r"C = S\\,N(d_1) - K e^{-rT} N(d_2)",
+        "black–scholes put price": r"P = K e^{-rT} N(-d_2) - S\\,N(-d_1)",
+        "call delta (bsm)": r"\\Delta_{call} = N(d_1)",
+        "vega (bsm)": r"\\text{Vega} = S\\,\\phi(d_1)\\sqrt{T}",
+        "receivables turnover": r"\\dfrac{\\text{Sales}}{\\overline{AR}}",
+        "payables turnover": r"\\dfrac{COGS}{\\overline{AP}}"
+    }
+    changed = False
+    for i, item in enumerate(formulas_data):
+        nm = str(item.get("name", "")).strip().lower()
+        cur = item.get("latex", "")
+        if _is_missing_text(cur):
+            # exact match
+            if nm in mapping:
+                formulas_data[i]["latex"] = mapping[nm]
+                changed = True
+            else:
+                # substring fallback
+                for key, tex in mapping.items():
+                    if key in nm or nm in key:
+                        formulas_data[i]["latex"] = tex
+                        changed = True
+                        break
+    return changed
+
+def migrate_formulas(data):
+    # Runs once per formulas.json version (on load), not on every rerun
+    changed = seed_top10_examples(data)
+    changed = seed_all_formulas(data) or changed
+    changed = seed_latex_formulas(data) or changed
+    return changed
+
+assets.register("formulas", FORMULAS_FILE, default=[], migrate=migrate_formulas)
+
+
+def render():
+    formulas_data = load_formulas_data()
+    st.header("Formulas 📐")
+    show_asset_errors("formulas")
+    if not formulas_data:
+        st.warning("No formulas found.")
+    else:
+        review_panel(formulas_data)
+        df_all_formulas = pd.DataFrame(formulas_data)
+        st.subheader("Top Picks")
+        show_picks = st.checkbox("Show Top Picks", value=True)
+        if show_picks:
+            cats_all = sorted({str(f.get("category", "General")) for f in formulas_data})
+            size = st.radio("Size", [10, 30], horizontal=True)
+            top10_names = [
+                "Future Value (Single Sum)",
+                "Present Value (Single Sum)",
+                "Present Value of Annuity",
+                "Contribution Margin",
+                "Break-even Units",
+                "Net Present Value",
+                "WACC",
+                "CAPM Cost of Equity",
+                "ROE",
+                "DuPont ROE"
+            ]
+            top30_names = top10_names + [
+                "IRR",
+                "Profitability Index",
+                "Payback Period",
+                "Present Value of Perpetuity",
+                "Gordon Growth (DDM)",
+                "Current Ratio",
+                "Quick Ratio",
+                "Debt-to-Equity",
+                "Times Interest Earned",
+                "Inventory Turnover",
+                "Days Sales Outstanding",
+                "Days Inventory Outstanding",
+                "Cash Conversion Cycle",
+                "Gross Profit Margin",
+                "Operating Margin",
+                "Net Profit Margin",
+                "Economic Order Quantity (EOQ)",
+                "Reorder Point",
+                "Safety Stock",
+                "Annuity Due PV",
+                "Annuity Due FV",
+                "Present Value (Annuity Due)",
+                "Future Value (Annuity Due)"
+            ]
+            pick_names = top10_names if size == 10 else top30_names
+            top_df = df_all_formulas[df_all_formulas["name"].isin(pick_names)].copy()
+            if top_df.empty and not df_all_formulas.empty:
+                top_df = df_all_formulas.head(size).copy()
+                pick_names = list(top_df["name"])
+            if len(top_df) < size and not df_all_formulas.empty:
+                missing = size - len(top_df)
+                fallback = df_all_formulas[~df_all_formulas["name"].isin(pick_names)].head(missing)
+                top_df = pd.concat([top_df, fallback], ignore_index=True)
+                pick_names = list(top_df["name"])
+            order_map = {name: i for i, name in enumerate(pick_names)}
+            top_cat = st.selectbox("Category Focus", ["All"] + cats_all)
+            if top_cat != "All":
+                top_df = top_df[top_df["category"] == top_cat]
+            if not top_df.empty:
+                top_df["rank"] = top_df["name"].map(order_map)
+                top_df = top_df.sort_values("rank")
+                tab1, tab2, tab3 = st.tabs(["Cards", "Table", "Category Chart"])
+                with tab1:
+                    cols = st.columns(2)
+                    for idx, (_, r) in enumerate(top_df.iterrows()):
+                        with cols[idx % 2]:
+                            st.markdown(f"**{r.get('name','')}**")
+                            st.caption(str(r.get('category', '')))
+                            if r.get("latex", ""):
+                                st.latex(r.get("latex", ""))
+                            elif r.get("formula", ""):
+                                st.code(str(r.get("formula", "")))
+                with tab2:
+                    st.table(top_df[["name", "category", "formula"]].rename(columns={"name": "Name", "category": "Category", "formula": "Formula"}))
+                with tab3:
+                    try:
+                        import plotly.express as px
+                        dfc = top_df.groupby("category").size().reset_index(name="count")
+                        if not dfc.empty:
+                            fig = px.bar(dfc, x="category", y="count", title=f"Top {size} by Category", color="category")
+                            fig.update_layout(showlegend=False, xaxis_title="", yaxis_title="Count")
+                            st.plotly_chart(fig, use_container_width=True)
+                        else:
+                            st.info("No data to chart for the selected filter.")
+                    except Exception as e:
+                        st.info("Plotly is unavailable for charting.")
+            else:
+                st.info("No formulas matched the current top selection.")
+        st.divider()
+        cats = sorted({str(f.get("category", "General")) for f in formulas_data})
+        cat_sel = st.multiselect("Category", options=cats, default=[])
+        q = st.text_input("Search")
+        df_f = pd.DataFrame(formulas_data)
+        if not df_f.empty:
+            if cat_sel:
+                df_f = df_f[df_f["category"].isin(cat_sel)]
+            if q:
+                ql = q.lower()
+                def _has(r):
+                    return (ql in str(r.get("name", "")).lower() or
+                            ql in str(r.get("formula", "")).lower() or
+                            ql in str(r.get("explanation", "")).lower() or
+                            ql in str(r.get("variables", "")).lower())
+                df_f = df_f[df_f.apply(_has, axis=1)]
+        st.write(f"Found {len(df_f)} formulas.")
+        for _, row in df_f.iterrows():
+            title = row.get("name", "")
+            cat = row.get("category", "")
+            if cat:
+                title = f"{title} [{cat}]"
+            with st.expander(title):
+                ftxt = row.get("formula", "")
+                ltx = row.get("latex", "")
+                if ltx:
+                    st.latex(ltx)
+                elif ftxt:
+                    st.markdown(f"**Formula:** {ftxt}")
+                vtxt = row.get("variables", "")
+                if vtxt:
+                    st.markdown(f"**Variables:** {vtxt}")
+                etxt = row.get("explanation", "")
+                if etxt:
+                    st.markdown(etxt)
+                ex_ja = _sanitize_text(row.get("example_ja", ""))
+                ex_en = _sanitize_text(row.get("example_en", ""))
+                if ex_ja or ex_en:
+                    st.markdown("**Examples**")
+                    if ex_ja:
+                        st.markdown(f"🇯🇵 {ex_ja}")
+                    if ex_en:
+                        st.markdown(f"🇺🇸 {ex_en}")
+                prob_ja = _sanitize_text(row.get("problem_ja", ""))
+                prob_en = _sanitize_text(row.get("problem_en", ""))
+                sol_ja = _sanitize_text(row.get("solution_ja", ""))
+                sol_en = _sanitize_text(row.get("solution_en", ""))
+                if prob_ja or prob_en:
+                    st.markdown("**Practice Problem**")
+                    if prob_ja:
+                        st.markdown(f"🇯🇵 {prob_ja}")
+                    if prob_en:
+                        st.markdown(f"🇺🇸 {prob_en}")
+                    if sol_ja or sol_en:
+                        with st.expander("Show Solution"):
+                            if sol_ja:
+                                st.markdown(f"🇯🇵 {sol_ja}")
+                            if sol_en:
+                                st.markdown(f"🇺🇸 {sol_en}")
+                with st.expander("Edit Examples / Problem"):
+                    with st.form(f"form_edit_{row.get('name','')}"):
+                        i_ex_ja = st.text_area("Example (JP)", value=_sanitize_text(ex_ja), height=100)
+                        i_ex_en = st.text_area("Example (EN)", value=_sanitize_text(ex_en), height=100)
+                        i_pb_ja = st.text_area("Problem (JP)", value=_sanitize_text(prob_ja), height=120)
+                        i_pb_en = st.text_area("Problem (EN)", value=_sanitize_text(prob_en), height=120)
+                        i_sol_ja = st.text_area("Solution (JP)", value=_sanitize_text(sol_ja), height=120)
+                        i_sol_en = st.text_area("Solution (EN)", value=_sanitize_text(sol_en), height=120)
+                        submitted = st.form_submit_button("Save")
+                        if submitted:
+                            key_name = row.get("name", "")
+                            updated = False
+                            # Copy: formulas_data is shared by all sessions until the file is rewritten
+                            edited = [dict(item) for item in formulas_data]
+                            for idx, item in enumerate(edited):
+                                if item.get("name", "") == key_name:
+                                    edited[idx]["example_ja"] = i_ex_ja
+                                    edited[idx]["example_en"] = i_ex_en
+                                    edited[idx]["problem_ja"] = i_pb_ja
+                                    edited[idx]["problem_en"] = i_pb_en
+                                    edited[idx]["solution_ja"] = i_sol_ja
+                                    edited[idx]["solution_en"] = i_sol_en
+                                    updated = True
+                                    break
+                            if updated and save_formulas_data(edited):
+                                st.toast("Saved examples and problem.", icon="✅")
+                                st.rerun()
+                            else:
+                                st.error("Failed to save. Please try again.")
+
+
+def _start_review(formulas_data):
+    keys = [srs.formula_key(f.get("name", "")) for f in formulas_data if f.get("name")]
+    st.session_state.formula_review = srs.session_queue(srs_deck(), keys, date.today(), "formula:")
+    st.session_state.formula_review_index = 0
+    st.session_state.formula_review_shown = False
+
+
+def _reveal_formula():
+    st.session_state.formula_review_shown = True
+
+
+def _grade_formula(key, grade):
+    srs_deck().review(key, grade, date.today())
+    save_data(st.session_state.data)
+    st.session_state.formula_review_index += 1
+    st.session_state.formula_review_shown = False
+
+
+# Reveal / grade rerun only the review card, not the formula list below
+@st.fragment
+def review_panel(formulas_data):
+    by_key = {srs.formula_key(f.get("name", "")): f for f in formulas_data}
+    due = len(srs_deck().due(date.today(), "formula:"))
+    with st.expander(f"🔁 Review ({due} due today)", expanded="formula_review" in st.session_state):
+        st.button("Start Review", on_click=_start_review, args=(formulas_data,), help="Due formulas first, then a few new ones")
+        queue = st.session_state.get("formula_review")
+        if queue is None:
+            return
+        idx = st.session_state.formula_review_index
+        if idx >= len(queue):
+            st.success(f"Reviewed {len(queue)} formulas. Come back when more are due.")
+            return
+        key = queue[idx]
+        f = by_key.get(key, {})
+        st.caption(f"Card {idx + 1} of {len(queue)} · {f.get('category', '')}")
+        st.markdown(f"**{f.get('name', '')}**")
+        if not st.session_state.formula_review_shown:
+            st.button("Show Formula", on_click=_reveal_formula)
+            return
+        if f.get("latex"):
+            st.latex(f["latex"])
+        elif f.get("formula"):
+            st.code(str(f["formula"]))
+        if f.get("explanation"):
+            st.caption(f["explanation"])
+        grades = [("Again", srs.AGAIN), ("Hard", srs.HARD), ("Good", srs.GOOD), ("Easy", srs.EASY)]
+        for col, (label, grade) in zip(st.columns(len(grades)), grades):
+            col.button(label, key=f"formula_grade_{grade}", use_container_width=True, on_click=_grade_formula, args=(key, grade))
@@ -0,0 +1,343 @@
+"""Career and income projections."""
+import streamlit as st
+
+import figure_cache
+import samplers
+import wealth_sim
+import wealth_sweep
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    st.header("🚀 100-Year Life & Career Plan: The 'Founder' Trajectory")
+    st.markdown("Your roadmap from **Master's Student** to **Tech CEO**. A comprehensive simulation of career, wealth, and life milestones.")
+
+    # Top Status Board
+    st.subheader("📍 Current Status")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Current Age", "24", "Phase: Foundation")
+    c2.metric("Next Big Milestone", "CPA Exam Pass", "2027 (Age 25)")
+    c3.metric("Career Goal", "Audit Tech Founder", "Launch @ Age 35")
+    c4.metric("Financial Freedom", "Target: Age 45", "Asset Goal: 500M JPY")
+    
+    st.divider()
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["⏳ 100-Year Timeline", "🧠 Skill Evolution", "💰 Wealth (Monte Carlo)", "🦄 Entrepreneurship Blueprint", "💍 Life & Family"])
+
+    with tab1:
+        st.subheader("The Century Plan (Age 24 - 100)")
+        
+        timeline_events = [
+            {"Age": 24, "Year": 2026, "Phase": "Foundation", "Event": "Master's (Germany/Japan) + CPA Study Start", "Status": "Current", "Importance": 3},
+            {"Age": 25, "Year": 2027, "Phase": "Foundation", "Event": "Pass CPA Exam (May/Aug) 🏆", "Status": "Goal", "Importance": 5},
+            {"Age": 26, "Year": 2028, "Phase": "Foundation", "Event": "Graduation & Join Big 4 (Digital Audit/FAS)", "Status": "Planned", "Importance": 4},
+            {"Age": 29, "Year": 2031, "Phase": "Growth", "Event": "Promoted to Senior Associate. Lead ML Projects.", "Status": "Planned", "Importance": 3},
+            {"Age": 30, "Year": 2032, "Phase": "Life", "Event": "Marriage 💍 (Target)", "Status": "Life", "Importance": 5},
+            {"Age": 32, "Year": 2034, "Phase": "Growth", "Event": "Manager Promotion. Deep expertise in AI Governance.", "Status": "Planned", "Importance": 3},
+            {"Age": 35, "Year": 2037, "Phase": "Launch", "Event": "🚀 FOUND YOUR COMPANY (AI Audit Firm). Disruption.", "Status": "Dream", "Importance": 5},
+            {"Age": 40, "Year": 2042, "Phase": "Scale", "Event": "Global Expansion. AI-First Assurance.", "Status": "Dream", "Importance": 4},
+            {"Age": 45, "Year": 2047, "Phase": "Exit", "Event": "IPO or Strategic Partnership. Financial Freedom.", "Status": "Dream", "Importance": 5},
+            {"Age": 50, "Year": 2052, "Phase": "Invest", "Event": "Angel Investor for Deep Tech. University Lecturer.", "Status": "Vision", "Importance": 3},
+            {"Age": 60, "Year": 2062, "Phase": "Legacy", "Event": "Establish Scholarship Foundation.", "Status": "Vision", "Importance": 3},
+            {"Age": 80, "Year": 2082, "Phase": "Wisdom", "Event": "Write Memoirs. Mentor next gen.", "Status": "Vision", "Importance": 2},
+            {"Age": 100, "Year": 2102, "Phase": "Complete", "Event": "Die Empty. No regrets.", "Status": "Final", "Importance": 5}
+        ]
+        
+        df_timeline = pd.DataFrame(timeline_events)
+        
+        st.plotly_chart(figure_cache.figure("future_timeline", None, lambda: _timeline_figure(df_timeline)), use_container_width=True)
+        
+        with st.expander("Show Data Table"):
+            st.dataframe(df_timeline, use_container_width=True)
+
+    with tab2:
+        st.subheader("🧠 Skill Evolution: The 'T-Shaped' Professional")
+        st.markdown("Visualizing your growth from a CPA specialist to a Tech CEO.")
+        
+        col_r1, col_r2 = st.columns([2, 1])
+        with col_r1:
+            st.plotly_chart(figure_cache.figure("future_skill_radar", None, _skill_radar_figure), use_container_width=True)
+        with col_r2:
+            st.info("💡 **Key Insight**")
+            st.markdown("""
+            *   **Accounting**: Must be perfect early on (CPA).
+            *   **Coding/AI**: Your differentiator. Grow this during your Associate years.
+            *   **Risk Taking**: The biggest shift required to become a Founder.
+            """)
+
+    with tab3:
+        st.subheader("💰 Financial Simulation: Monte Carlo Analysis")
+        st.markdown("A Quant-style simulation of your future wealth. **Life is probabilistic, not deterministic.**")
+        
+        # --- Interactive Sliders ---
+        col_ctrl1, col_ctrl2 = st.columns(2)
+        with col_ctrl1:
+            st.markdown("**Income & Savings**")
+            initial_salary = st.slider("Starting Salary (Million JPY)", 4.0, 10.0, 6.0, 0.5)
+            savings_rate = st.slider("Savings Rate (%)", 10, 70, 30, 5) / 100.0
+            investment_return_mean = st.slider("Expected Return (%)", 1.0, 15.0, 5.0, 0.5) / 100.0
+            investment_volatility = st.slider("Volatility (Risk) (%)", 5.0, 30.0, 15.0, 1.0) / 100.0
+            
+        with col_ctrl2:
+            st.markdown("**Startup Variables**")
+            launch_age = st.slider("Launch Age", 28, 45, 35)
+            exit_age = st.slider("Exit Age", launch_age + 3, 60, 45)
+            exit_valuation = st.slider("Exit Valuation (Million JPY)", 100, 10000, 500, 100)
+            exit_prob = st.slider("Exit Success Probability (%)", 10, 90, 30, 5) / 100.0
+            
+        st.divider()
+
+        col_run1, col_run2, col_run3, col_run4 = st.columns(4)
+        max_paths = col_run1.select_slider("Max Scenarios", [100_000, 1_000_000, 5_000_000], value=1_000_000)
+        rel_tol = col_run2.select_slider("Stop at Std. Error", [0.005, 0.01, 0.02, 0.05], value=0.01,
+                                         format_func=lambda t: f"{t:.1%}")
+        returns = col_run3.radio("Return Model", wealth_sim.RETURN_MODELS, horizontal=True,
+                                 format_func=lambda m: {"normal": "Normal", "lognormal": "Log-normal (GBM)"}[m])
+        seed = col_run4.number_input("Seed", min_value=0, value=0, step=1)
+
+        sampler = st.radio("Sampling", list(samplers.SAMPLERS), horizontal=True,
+                           format_func=lambda name: samplers.SAMPLERS[name].label,
+                           help="Antithetic and Sobol' (QMC) draws reach the same standard error with fewer scenarios")
+
+        col_btn1, col_btn2 = st.columns([3, 1])
+        run = col_btn1.button("Run Monte Carlo Simulation")
+        # Any click reruns the script, which interrupts a run; the last batch's bands stay below
+        col_btn2.button("⏹ Stop")
+        chart_slot = st.empty()
+        status_slot = st.empty()
+
+        params = {
+            "initial_salary": initial_salary, "savings_rate": savings_rate,
+            "mean": investment_return_mean, "vol": investment_volatility,
+            "launch_age": launch_age, "exit_age": exit_age,
+            "exit_valuation": exit_valuation, "exit_prob": exit_prob,
+        }
+        # A finished run is only shown while the settings it ran with are unchanged
+        inputs = {"params": params, "returns": returns, "sampler": sampler, "seed": int(seed)}
+        if run:
+            st.session_state.pop("wealth_mc", None)
+            for snap in wealth_sim.progressive(params, int(seed), returns, max_paths=max_paths, rel_tol=rel_tol,
+                                               sampler=sampler):
+                snap.pop("sketch")
+                snap["inputs"] = inputs
+                st.session_state.wealth_mc = snap
+                chart_slot.plotly_chart(_wealth_figure(snap["bands"]), use_container_width=True)
+                status_slot.caption(_wealth_status(snap, running=not snap["done"]))
+
+        snap = st.session_state.get("wealth_mc")
+        if snap is not None and snap.get("inputs") != inputs:
+            st.session_state.pop("wealth_mc")
+            snap = None
+            st.info("Settings changed since the last run. Click the button above to run the simulation again.")
+        elif snap is None:
+            st.info("Click the button above to run the Monte Carlo simulation.")
+        if snap is not None:
+            if not run:
+                chart_slot.plotly_chart(_wealth_figure(snap["bands"]), use_container_width=True)
+                status_slot.caption(_wealth_status(snap))
+            outcome = "Converged" if snap["converged"] else "Complete" if snap["done"] else "Stopped"
+            st.success(f"Simulation {outcome}. "
+                       f"Median Asset at Age {wealth_sim.AGES[-1]}: **{snap['bands'][50][-1]:.1f}M JPY**")
+            if run and snap["bands"][90][-1] > 1000:
+                st.balloons()
+
+        st.divider()
+        st.markdown("**🎛️ Sensitivity: final-age wealth across the startup & market parameters**")
+        if st.checkbox("Show sensitivity analysis", help="Each point runs the model on the same scenarios; results are cached"):
+            stat = st.radio("Statistic", ["p50", "p10"], horizontal=True,
+                            format_func=lambda k: {"p50": "Median (P50)", "p10": "Pessimistic (P10)"}[k])
+            sweep_opts = {"returns": returns}
+            col_t, col_h = st.columns(2)
+            with col_t:
+                st.plotly_chart(_tornado_figure(wealth_sweep.tornado(params, stat=stat, **sweep_opts), stat), use_container_width=True)
+            with col_h:
+                names = list(wealth_sweep.RANGES)
+                x_name = st.selectbox("X Axis", names, index=names.index("launch_age"), format_func=wealth_sweep.LABELS.get)
+                y_name = st.selectbox("Y Axis", names, index=names.index("exit_prob"), format_func=wealth_sweep.LABELS.get)
+                if x_name == y_name:
+                    st.info("Pick two different parameters.")
+                else:
+                    x_values, y_values = _sweep_values(x_name), _sweep_values(y_name)
+                    z = wealth_sweep.heatmap(params, x_name, x_values, y_name, y_values, stat=stat, **sweep_opts)
+                    st.plotly_chart(_heatmap_figure(x_name, x_values, y_name, y_values, z, stat), use_container_width=True)
+
+    with tab4:
+        st.subheader("🦄 Entrepreneurship Blueprint: 'Next-Gen AI Audit Firm'")
+        
+        # Business Stats
+        m1, m2, m3 = st.columns(3)
+        m1.metric("TAM (Total Addressable Market)", "¥500 Billion", "Audit Market in Japan")
+        m2.metric("Target Market", "¥50 Billion", "Mid-Cap Listed Companies")
+        m3.metric("Your Edge", "Tech + License", "Unbeatable Combo")
+        
+        st.markdown("---")
+        
+        st.info("💡 **Why AI Audit Firm > SaaS?**")
+        st.markdown("""
+        *   **SaaS Weakness**: High churn, low barrier to entry, "race to the bottom" pricing. Anyone can build a tool.
+        *   **Audit Strength**: **Regulatory Moat**. Only licensed firms can sign off on financial statements. High switching costs.
+        *   **The Opportunity**: Build a **Tech-Enabled Audit Firm** (Service + Tech) that operates at 10x efficiency of Big 4, undercutting their fees while maintaining higher margins.
+        """)
+
+        st.markdown("""
+        **Vision**: Replace the "Army of Associates" with **Autonomous AI Agents**. Focus on high-level judgement and client relationships.
+        
+        **Phase 1: The "Insider" (Age 26-34)**
+        *   **Goal**: Become a domain expert (CPA License is the Key). Understand *exactly* where the inefficiencies are in Big 4.
+        *   **Action**: Lead "Digital Transformation" projects. Learn the *regulatory constraints* inside out.
+        
+        **Phase 2: The "Prototype" (Age 34-35)**
+        *   **Goal**: Build the "AI Auditor" (Internal Tool).
+        *   **Tech**: RAG (Retrieval Augmented Generation) for accounting standards, GNNs for transaction anomaly detection.
+        *   **Team**: You (CTO/CEO) + Experienced Audit Partner (for credibility/signing).
+        
+        **Phase 3: The "Disruption" (Age 35+)**
+        *   **Target**: Mid-cap public companies (tired of high Big 4 fees).
+        *   **Product**: **"AI-First Statutory Audit"**. 
+        *   **Value Prop**: "Faster audit, lower fees, deeper insights." Not just a software tool, but the *full service*.
+        """)
+
+    with tab5:
+        st.subheader("💍 Life, Family & Happiness")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("### 👨‍👩‍👧 Family Goals")
+            st.write("*   **Age 30**: Marriage (Partner who understands the startup grind).")
+            st.write("*   **Age 32**: First Child.")
+            st.write("*   **Age 35**: Second Child (Coincides with Startup Launch - Tough!).")
+            st.write("*   **Policy**: Weekends are for family. No work on Sundays.")
+            
+        with col2:
+            st.markdown("### ✈️ Experiences")
+            st.write("*   **20s**: Backpacking Europe/Asia (Cheap travel).")
+            st.write("*   **30s**: Family trips to Hawaii/Okinawa.")
+            st.write("*   **40s**: World Cruise (Post-Exit).")
+            st.write("*   **Hobbies**: Hiking, Coding, Wine Tasting.")
+
+
+def _wealth_figure(bands):
+    ages = list(wealth_sim.AGES)
+    p10, p50, p90 = bands[10], bands[50], bands[90]
+    fig_mc = go.Figure()
+    fig_mc.add_trace(go.Scatter(x=ages, y=p90, mode='lines', name='90th Percentile (Lucky)', line=dict(width=0), showlegend=False))
+    fig_mc.add_trace(go.Scatter(x=ages, y=p10, mode='lines', name='10th Percentile (Unlucky)', line=dict(width=0), fill='tonexty', fillcolor='rgba(0,100,80,0.2)', showlegend=False))
+    fig_mc.add_trace(go.Scatter(x=ages, y=p50, mode='lines', name='Median Outcome', line=dict(color='rgb(0,100,80)')))
+    fig_mc.update_layout(title="Monte Carlo Wealth Projection (80% Band, P10-P90)", yaxis_title="Net Assets (Million JPY)", hovermode="x")
+    return fig_mc
+
+
+def _sweep_values(name, n=9):
+    lo, hi = wealth_sweep.RANGES[name]
+    if name in wealth_sweep.INTEGER:
+        return sorted({round(lo + (hi - lo) * i / (n - 1)) for i in range(n)})
+    return [lo + (hi - lo) * i / (n - 1) for i in range(n)]
+
+
+def _tornado_figure(result, stat):
+    base = result["base"][stat]
+    # Each bar is labelled with the low / high values actually run
+    labels = [f"{wealth_sweep.LABELS[r['param']]} ({r['low_value']:g}–{r['high_value']:g})" for r in result["rows"]]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=labels, x=[r["low"][stat] - base for r in result["rows"]], base=base, orientation="h",
+                         name="Low end of range", marker_color="rgb(214,39,40)"))
+    fig.add_trace(go.Bar(y=labels, x=[r["high"][stat] - base for r in result["rows"]], base=base, orientation="h",
+                         name="High end of range", marker_color="rgb(0,100,80)"))
+    fig.update_layout(barmode="overlay", title=f"Tornado: {stat.upper()} at Age {wealth_sim.AGES[-1]} (base {base:.0f}M JPY)",
+                      xaxis_title="Net Assets (Million JPY)", xaxis_type="log", legend_orientation="h")
+    return fig
+
+
+def _heatmap_figure(x_name, x_values, y_name, y_values, z, stat):
+    fig = go.Figure(go.Heatmap(x=x_values, y=y_values, z=z, colorscale="Viridis", colorbar_title="M JPY"))
+    fig.update_layout(title=f"{stat.upper()} at Age {wealth_sim.AGES[-1]}",
+                      xaxis_title=wealth_sweep.LABELS[x_name], yaxis_title=wealth_sweep.LABELS[y_name])
+    return fig
+
+
+def _wealth_status(snap, running=False):
+    age = wealth_sim.AGES[-1]
+    parts = []
+    for q in wealth_sim.QUANTILES:
+        se = snap["se"][q]
+        parts.append(f"P{q} {snap['bands'][q][-1]:.1f}" + (f" ± {se:.2f}" if se is not None else ""))
+    if snap["converged"]:
+        state = "✅ converged"
+    elif running:
+        state = "running…"
+    else:
+        state = "max scenarios reached" if snap["done"] else "⏹ stopped"
+    return f"{snap['paths']:,} scenarios · age {age}: " + " · ".join(parts) + f" (M JPY, ± MC std. error) · {state}"
+
+
+def _timeline_figure(df_timeline):
+    # Visual Timeline - Improved
+    fig_timeline = px.scatter(
+        df_timeline, 
+        x="Year", 
+        y="Age", 
+        color="Phase", 
+        size="Importance",
+        hover_name="Event",
+        text="Event", 
+        title="Life Trajectory Map", 
+        size_max=40,
+        template="plotly_white"
+    )
+    fig_timeline.update_traces(textposition='top center', marker=dict(line=dict(width=2, color='DarkSlateGrey')))
+    fig_timeline.update_layout(
+        height=600,
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, title="Age"),
+        showlegend=True
+    )
+    # Add connecting line
+    fig_timeline.add_trace(go.Scatter(
+        x=df_timeline["Year"], 
+        y=df_timeline["Age"], 
+        mode='lines', 
+        line=dict(color='lightgrey', width=1, dash='dot'),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+    return fig_timeline
+
+
+def _skill_radar_figure():
+    categories = ['Accounting/Audit', 'Coding/AI', 'English/Global', 'Leadership', 'Risk Taking']
+
+    fig_radar = go.Figure()
+
+    fig_radar.add_trace(go.Scatterpolar(
+        r=[4, 2, 3, 2, 2],
+        theta=categories,
+        fill='toself',
+        name='Current (Age 24)'
+    ))
+    fig_radar.add_trace(go.Scatterpolar(
+        r=[5, 4, 4, 4, 3],
+        theta=categories,
+        fill='toself',
+        name='Manager (Age 32)'
+    ))
+    fig_radar.add_trace(go.Scatterpolar(
+        r=[5, 5, 5, 5, 5],
+        theta=categories,
+        fill='toself',
+        name='Founder/CEO (Age 40)'
+    ))
+
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+            visible=True,
+            range=[0, 5]
+            )),
+        showlegend=True,
+        title="Skill Radar Chart"
+    )
+    return fig_radar
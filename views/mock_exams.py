@@ -0,0 +1,36 @@
+"""Official and mock exam schedule."""
+import streamlit as st
+
+from common import official_schedule as load_official_schedule
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+mock_exams = [
+    {'date': '2026-11-15', 'type': 'Short', 'name': 'Dec Short Mock (TAC/Ohara)', 'provider': 'TAC/Ohara', 'status': 'Practice'},
+    {'date': '2026-12-13', 'type': 'Short', 'name': 'Official Dec Short Exam', 'provider': 'CPAAOB', 'status': 'Target'},
+    {'date': '2027-04-25', 'type': 'Short', 'name': 'May Short Mock (TAC/Ohara)', 'provider': 'TAC/Ohara', 'status': 'Practice'},
+    {'date': '2027-05-23', 'type': 'Short', 'name': 'Official May Short Exam', 'provider': 'CPAAOB', 'status': 'Target'},
+    {'date': '2027-07-10', 'type': 'Essay', 'name': 'Essay Mock (TAC/Ohara)', 'provider': 'TAC/Ohara', 'status': 'Practice'},
+    {'date': '2027-08-20', 'type': 'Essay', 'name': 'Official Aug Essay Exam', 'provider': 'CPAAOB', 'status': 'Target'}
+]
+
+
+def render():
+    official_schedule = load_official_schedule()
+    st.header("Exam Schedule")
+    t1, t2 = st.tabs(["📅 Official Schedule", "📝 Mock Schedule"])
+    with t1:
+        df_off = pd.DataFrame(official_schedule)
+        if not df_off.empty:
+            df_off = df_off.sort_values('date')
+            st.table(df_off)
+            st.caption("注: 合格発表日は目安。正式な日程・時刻はCPAAOBの公表に従ってください。")
+        else:
+            st.info("No official schedule available.")
+    with t2:
+        df_exams = pd.DataFrame(mock_exams)
+        if not df_exams.empty:
+            st.table(df_exams)
+        else:
+            st.info("No mock exams scheduled.")
@@ -0,0 +1,452 @@
+"""Past exam papers: metadata, vocabulary trends, search and previews."""
+import os
+
+import streamlit as st
+
+import figure_cache
+import pass_sim
+import pdf_pages
+import pdf_store
+import samplers
+from asset_registry import registry as assets
+from common import BASE_DIR, pdf_manifest, render_pdf_pages, show_asset_errors
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+
+
+def render():
+    st.header("Old Exam Papers 📄")
+    
+    # Path to EXAM folder
+    # platform/app.py -> platform/EXAM
+    base_dir = BASE_DIR
+    exam_dir = os.path.join(base_dir, 'EXAM')
+    metadata = assets.get("exam_metadata")
+    show_asset_errors("exam_metadata")
+
+    with st.expander("📝 Exam Info（合格ボーダー R4〜R8）", expanded=True):
+        st.markdown("""
+        ### 短答式（相対評価）
+        - 合格基準: 総点数の70％を基準として、審査会が相当と認めた得点比率
+        - 足切り: 1科目でも満点の40％未満がある場合、不合格の可能性あり
+        
+        参考：近年のボーダー（予備校・メディア集計／一部参考値）
+        
+        | 実施年 | 第I回（12月） | 第II回（5月） | 備考 |
+        |---|---:|---:|---|
+        | 令和8年 (2026) | 72.0% | ― | 最新（第I回、結果1月公表） |
+        | 令和7年 (2025) | 70.4% | 74.0% | 標準化の動き |
+        | 令和6年 (2024) | 68.0% | 78.0% | 易化で高水準 |
+        | 令和5年 (2023) | 71.0% | 70.2% | 70%前後 |
+        | 令和4年 (2022) | 68.0% | 73.0% | 変動大 |
+        
+        - 出典（参考値・解説記事）:
+          - マイナビ会計士「第Ⅱ回短答式試験 結果速報」: https://cpa.mynavi.jp/column_mt/2024/06/967.html
+          - 短答式の合格基準（公式）: https://www.fsa.go.jp/cpaaob/kouninkaikeishi-shiken/kijuntou/05.html
+        
+        ---
+        例: 500点 × 0.72 = 360点
+        
+        ---
+        ### 論文式（偏差値方式）
+        - 合格基準: 総点数の60％を基準として、審査会が相当と認めた得点比率
+        - 足切り: 1科目でも得点比率（偏差値）が40％未満のものがある場合は不合格
+        - 得点比率（偏差値）の一般式: 50 + 10 × (個人の得点 − 平均点) / 標準偏差
+        
+        近年の合格点（公表資料/報道・参考ベース）
+        - 令和6年 (2024): 合格基準 約52.0 前後 / 平均得点率 約45% 前後
+        - 令和7年 (2025): 合格基準 約52.2 / 平均得点率 約45.7%
+        - 令和8年 (2026): 合格基準 見込み 52.0 前後 / 平均得点率 見込み 45〜46%
+        - 令和9年 (2027): 合格基準 52%→54%へ段階的引上げ見込み（注意）
+        
+        - 出典（公式）:
+          - 合格基準について（短答式/論文式の公式基準）: https://www.fsa.go.jp/cpaaob/kouninkaikeishi-shiken/kijuntou/05.html
+          - 令和7年 論文式 合格点の公表例（PDF、偏差値法の説明含む）: https://www.fsa.go.jp/cpaaob/kouninkaikeishi-shiken/r7shiken/ronbungoukaku_r07/02.pdf
+        """)
+        st.warning("参考情報: 令和9年（2027年）以降、論文式の合格基準が現行の約52%から約54%へ段階的に引き上げられる見込みです。初年度は精度高いアウトプットが必要。")
+        st.info("素点の目安: 50%で安全圏（平均45〜46%想定でD≈54–56）、45%が当落線上（D≈50）、40%未満は足切りリスク（D<40）")
+        # R4-R8 short-answer border mini chart
+        try:
+            st.plotly_chart(figure_cache.figure("short_exam_borders", None, _border_figure), use_container_width=True)
+            st.caption("注: 参考値（予備校・メディア集計ベース）。公式の相対基準はリンク参照。")
+        except Exception:
+            pass
+    
+    with st.expander("🆕 令和7・令和8 情報（リンク/予定）", expanded=True):
+        st.markdown("""
+        - 令和7年 (2025)  
+          - 短答式: 公式日程・合格基準は CPAAOB 公表ページを参照  
+          - 論文式: 上記リンク（偏差値方式の説明付き）参照
+        - 令和8年 (2026)  
+          - 短答式/論文式: 順次公表予定（例年どおり）
+        
+        公式ポータル  
+        - 公認会計士・監査審査会（CPAAOB）試験情報: https://www.fsa.go.jp/cpaaob/kouninkaikeishi-shiken/index.html
+        """)
+    
+    with st.expander("🎯 短答 必要得点計算機", expanded=False):
+        # Target presets
+        p1, p2, p3 = st.columns(3)
+        with p1:
+            if st.button("Target 70%"):
+                st.session_state["tanto_target_pct"] = 70
+                st.rerun()
+        with p2:
+            if st.button("Target 72%"):
+                st.session_state["tanto_target_pct"] = 72
+                st.rerun()
+        with p3:
+            if st.button("Target 78%"):
+                st.session_state["tanto_target_pct"] = 78
+                st.rerun()
+
+        # Target slider
+        col_t1, col_t2 = st.columns(2)
+        with col_t1:
+            default_target = st.session_state.get("tanto_target_pct", 72)
+            target_pct = st.slider("目標得点率(%)", min_value=60, max_value=85, value=default_target, step=1, key="tanto_target_slider")
+            target_points = int(500 * target_pct / 100)
+            st.metric("必要合計点(500点満点)", f"{target_points} 点", f"{target_pct}%")
+        with col_t2:
+            st.caption("配点: 企業法100・管理100・監査100・財務200")
+        
+        # Preset buttons for subject shares
+        b1, b2, b3 = st.columns(3)
+        with b1:
+            if st.button("Preset: Balanced 70/70/70/70"):
+                st.session_state["tanto_corp_pct"] = 70
+                st.session_state["tanto_mgmt_pct"] = 70
+                st.session_state["tanto_audit_pct"] = 70
+                st.session_state["tanto_fin_pct"] = 70
+                st.rerun()
+        with b2:
+            if st.button("Preset: Fin-Heavy 65/65/65/78"):
+                st.session_state["tanto_corp_pct"] = 65
+                st.session_state["tanto_mgmt_pct"] = 65
+                st.session_state["tanto_audit_pct"] = 65
+                st.session_state["tanto_fin_pct"] = 78
+                st.rerun()
+        with b3:
+            if st.button("Preset: Safety 75/70/70/75"):
+                st.session_state["tanto_corp_pct"] = 75
+                st.session_state["tanto_mgmt_pct"] = 70
+                st.session_state["tanto_audit_pct"] = 70
+                st.session_state["tanto_fin_pct"] = 75
+                st.rerun()
+
+        st.markdown("##### テンプレ（科目別目標％）")
+        tpl_options = {
+            "Balanced 70/70/70/70": (70, 70, 70, 70),
+            "Fin Priority 65/65/65/78": (65, 65, 65, 78),
+            "Safety 75/70/70/75": (75, 70, 70, 75),
+            "Aggressive Fin 80/68/68/82": (80, 68, 68, 82),
+            "Audit Backstop 70/68/75/78": (70, 68, 75, 78),
+        }
+        sel_tpl = st.selectbox("テンプレを選択", list(tpl_options.keys()), index=0, key="tanto_tpl_sel")
+        if st.button("テンプレ適用"):
+            cp, mp, ap, fp = tpl_options[sel_tpl]
+            st.session_state["tanto_corp_pct"] = cp
+            st.session_state["tanto_mgmt_pct"] = mp
+            st.session_state["tanto_audit_pct"] = ap
+            st.session_state["tanto_fin_pct"] = fp
+            st.rerun()
+
+        # Inputs with keys to allow presets
+        if "tanto_corp_pct" not in st.session_state:
+            st.session_state["tanto_corp_pct"] = 70
+        if "tanto_mgmt_pct" not in st.session_state:
+            st.session_state["tanto_mgmt_pct"] = 70
+        if "tanto_audit_pct" not in st.session_state:
+            st.session_state["tanto_audit_pct"] = 70
+        if "tanto_fin_pct" not in st.session_state:
+            st.session_state["tanto_fin_pct"] = 70
+
+        c1, c2 = st.columns(2)
+        with c1:
+            corp_pct = st.number_input("企業法(%)", min_value=0, max_value=100, value=st.session_state["tanto_corp_pct"], step=1, key="tanto_corp_pct")
+            mgmt_pct = st.number_input("管理会計論(%)", min_value=0, max_value=100, value=st.session_state["tanto_mgmt_pct"], step=1, key="tanto_mgmt_pct")
+        with c2:
+            audit_pct = st.number_input("監査論(%)", min_value=0, max_value=100, value=st.session_state["tanto_audit_pct"], step=1, key="tanto_audit_pct")
+            fin_pct = st.number_input("財務会計論(%)", min_value=0, max_value=100, value=st.session_state["tanto_fin_pct"], step=1, key="tanto_fin_pct")
+        total_points = int(corp_pct/100*100 + mgmt_pct/100*100 + audit_pct/100*100 + fin_pct/100*200)
+        total_pct = round(total_points / 500 * 100, 1)
+        col_r1, col_r2, col_r3 = st.columns(3)
+        with col_r1:
+            st.metric("合計得点率", f"{total_pct}%")
+        with col_r2:
+            st.metric("合計点", f"{total_points} 点")
+        with col_r3:
+            ok = (corp_pct >= 40) and (mgmt_pct >= 40) and (audit_pct >= 40) and (fin_pct >= 40)
+            status = "OK" if (total_pct >= target_pct and ok) else "要改善"
+            st.metric("達成状況", status)
+        if not ok:
+            st.warning("足切り注意: いずれかの科目が40%未満です。")
+        elif total_pct < target_pct:
+            st.info("合計が目標に届いていません。強化科目を見直してください。")
+        else:
+            st.success("目標達成ラインです。")
+    
+    with st.expander("🎲 短答 合格確率シミュレーター（学習記録ベース）", expanded=False):
+        _pass_probability_panel()
+    
+    with st.expander("🧮 論文 偏差値計算機", expanded=False):
+        col_e1, col_e2, col_e3 = st.columns(3)
+        with col_e1:
+            personal = st.number_input("個人の得点", min_value=0.0, value=60.0, step=0.1)
+        with col_e2:
+            mean = st.number_input("平均点", min_value=0.0, value=55.0, step=0.1)
+        with col_e3:
+            std = st.number_input("標準偏差", min_value=0.1, value=7.0, step=0.1)
+        deviation = round(50 + 10 * (personal - mean) / std, 2)
+        st.metric("得点比率（偏差値）", f"{deviation}")
+        if deviation < 40:
+            st.warning("足切りラインに注意（40未満）。")
+        elif deviation < 52:
+            st.info("基準目安 52 に未達。学習強化が必要です。")
+        else:
+            st.success("合格基準目安を超えています。")
+    
+    with st.expander("📐 基本式 / Basic Formulas", expanded=False):
+        st.markdown("""
+        - 短答 合計点: 合計点 = 100×企業法% + 100×管理% + 100×監査% + 200×財務%
+        - 短答 合計得点率: 合計得点率(%) = 合計点 ÷ 500 × 100
+        - 短答 合格条件(目安): 全科目40%以上 かつ 合計得点率 ≥ 目標%
+        - 逆算（必要な財務%）: 財務% = { (目標%×500/100) − [100×(企業法%+管理%+監査%)] } ÷ 200 × 100
+        - 論文 偏差値: D = 50 + 10 × (x − μ)/σ
+        - 論文 必要得点: x = μ + σ × (D − 50)/10
+        """)
+        col_rev1, col_rev2 = st.columns(2)
+        with col_rev1:
+            st.subheader("短答 逆算（必要財務%）")
+            t_pct = st.number_input("目標得点率(%)", min_value=60, max_value=85, value=72, step=1, key="rev_target")
+            rc = st.number_input("企業法(%)", min_value=0, max_value=100, value=70, step=1, key="rev_corp")
+            rm = st.number_input("管理会計論(%)", min_value=0, max_value=100, value=70, step=1, key="rev_mgmt")
+            ra = st.number_input("監査論(%)", min_value=0, max_value=100, value=70, step=1, key="rev_audit")
+            need_fin = ((t_pct/100*500) - (100*(rc+rm+ra))) / 200 * 100
+            need_fin_disp = round(need_fin, 1)
+            feas = 0 <= need_fin <= 100
+            st.metric("必要 財務会計論(%)", f"{need_fin_disp}%")
+            if not feas:
+                st.warning("この条件では達成不可能です（0〜100%の範囲外）。")
+        with col_rev2:
+            st.subheader("論文 必要得点（逆算）")
+            d_target = st.number_input("目標偏差値 D", min_value=35.0, max_value=70.0, value=52.0, step=0.1, key="rev_d")
+            mu = st.number_input("平均点 μ", min_value=0.0, value=55.0, step=0.1, key="rev_mu")
+            sigma = st.number_input("標準偏差 σ", min_value=0.1, value=7.0, step=0.1, key="rev_sigma")
+            need_x = mu + sigma * (d_target - 50) / 10
+            st.metric("必要得点 x", f"{round(need_x, 2)}")
+
+    if not os.path.exists(exam_dir):
+        st.error(f"EXAM directory not found at: {exam_dir}")
+    else:
+        # --- Vocab Analysis Section ---
+        vocab_index_file = os.path.join(base_dir, 'exam_vocab_index.npz')
+        vocab_file = os.path.join(base_dir, 'exam_vocab.json')
+        if os.path.exists(vocab_index_file):
+            with st.expander("📊 Exam Vocabulary Analysis (Tangocho)", expanded=False):
+                st.info("Subject-distinctive terms (TF-IDF over all exam papers, incl. compound nouns). Master these!")
+
+                try:
+                    vx = assets.get("exam_vocab_index")
+                    subjects = [str(s) for s in vx["subjects"]]
+                    if subjects:
+                        selected_subject = st.selectbox("Select Subject for Vocabulary", subjects)
+
+                        if selected_subject:
+                            mask = vx["top_subject"] == subjects.index(selected_subject)
+                            term_ids = vx["top_term"][mask]
+                            df_vocab = pd.DataFrame({
+                                "Word": vx["terms"][term_ids],
+                                "TF-IDF": np.round(vx["top_tfidf"][mask], 2),
+                                "Frequency": vx["top_count"][mask],
+                                "Compound": vx["term_compound"][term_ids],
+                            })
+
+                            col1, col2 = st.columns([1, 2])
+
+                            with col1:
+                                st.dataframe(df_vocab, use_container_width=True, height=400)
+
+                            with col2:
+                                if not df_vocab.empty:
+                                    st.markdown("### Top Keywords")
+                                    fig = px.bar(
+                                        df_vocab.head(20),
+                                        x='TF-IDF',
+                                        y='Word',
+                                        orientation='h',
+                                        title=f"Top 20 Distinctive Words in {selected_subject}",
+                                        color='Frequency',
+                                        color_continuous_scale='Viridis'
+                                    )
+                                    fig.update_layout(yaxis={'categoryorder':'total ascending'})
+                                    st.plotly_chart(fig, use_container_width=True)
+
+                                    # Per-year trend of the top terms
+                                    years = [str(y) for y in vx["years"]]
+                                    if len(years) > 1:
+                                        n_trend = st.slider("Trend: top N words", min_value=3, max_value=15, value=5, key="exam_vocab_trend_n")
+                                        trend = vx["top_trend"][mask][:n_trend]
+                                        df_trend = pd.DataFrame(trend, columns=years)
+                                        df_trend["Word"] = df_vocab["Word"].head(n_trend).values
+                                        df_trend = df_trend.melt(id_vars="Word", var_name="Year", value_name="Count")
+                                        fig_tr = px.line(df_trend, x="Year", y="Count", color="Word", markers=True, title="Frequency by Exam Year")
+                                        st.plotly_chart(fig_tr, use_container_width=True)
+                except Exception as e:
+                    st.error(f"Error loading vocabulary: {e}")
+        elif os.path.exists(vocab_file):
+            with st.expander("📊 Exam Vocabulary Analysis (Tangocho)", expanded=False):
+                st.info("Top frequent words extracted from actual exam papers. Master these!")
+                
+                try:
+                    exam_vocab = assets.get("exam_vocab")
+                    
+                    # Subject selector
+                    subjects = list(exam_vocab.keys())
+                    if subjects:
+                        selected_subject = st.selectbox("Select Subject for Vocabulary", subjects)
+                        
+                        if selected_subject:
+                            words = exam_vocab[selected_subject]
+                            
+                            # Display as a dataframe or cloud
+                            # Create a nice dataframe
+                            df_vocab = pd.DataFrame(words)
+                            df_vocab.columns = ["Word", "Frequency"]
+                            
+                            col1, col2 = st.columns([1, 2])
+                            
+                            with col1:
+                                st.dataframe(df_vocab, use_container_width=True, height=400)
+                                
+                            with col2:
+                                if not df_vocab.empty:
+                                    st.markdown("### Top Keywords")
+                                    # Create a bar chart
+                                    fig = px.bar(
+                                        df_vocab.head(20), 
+                                        x='Frequency', 
+                                        y='Word', 
+                                        orientation='h',
+                                        title=f"Top 20 Words in {selected_subject}",
+                                        color='Frequency',
+                                        color_continuous_scale='Viridis'
+                                    )
+                                    fig.update_layout(yaxis={'categoryorder':'total ascending'})
+                                    st.plotly_chart(fig, use_container_width=True)
+                except Exception as e:
+                    st.error(f"Error loading vocabulary: {e}")
+        
+        st.divider()
+
+        manifest = pdf_manifest()
+        docs = pdf_store.documents(manifest, "EXAM/")
+        
+        with st.expander("🔎 Search Exam Papers", expanded=False):
+            exam_q = st.text_input("Search text in all papers", key="exam_search_q")
+            if exam_q:
+                with st.spinner("Searching..."):
+                    hits = pdf_pages.search([os.path.join(base_dir, d["path"]) for d in docs], exam_q, limit=30)
+                st.caption(f"{len(hits)} hit(s)" + (" (first 30)" if len(hits) >= 30 else ""))
+                for h_i, hit in enumerate(hits):
+                    h_name = os.path.basename(hit["path"])
+                    h_info = metadata.get(h_name, {})
+                    st.markdown(f"📄 **{h_info.get('subject', h_name)}** {h_info.get('year', '')} {h_info.get('type', '')} — p.{hit['page'] + 1}")
+                    st.caption(f"…{hit['snippet']}…")
+                    if st.checkbox("Preview page", key=f"pv_hit_{h_i}"):
+                        render_pdf_pages(hit["path"], key=f"pv_rng_hit_{h_i}", default=str(hit["page"] + 1), height=600)
+        
+        if not docs:
+            st.warning("No PDF exam papers found.")
+        else:
+            n_files = sum(len(d["aliases"]) for d in docs)
+            st.write(f"Found {len(docs)} exam papers ({n_files} files, duplicates merged).")
+            
+            # Sorted by filename to keep subjects grouped (01, 02, ...)
+            for doc in docs:
+                f = doc["name"]
+                info = metadata.get(f, {})
+                display_title = f"**{f}**"
+                sub_info = ""
+                
+                if info:
+                    # Construct nice title
+                    # e.g. R7 Short-Answer (Tanto) I - Corporate Law (企業法)
+                    year = info.get('year', '')
+                    exam_type = info.get('type', '')
+                    subject = info.get('subject', '')
+                    
+                    # Create a clean badge-like string
+                    display_title = f"**{subject}** - {year} {exam_type}"
+                    sub_info = f"Filename: {f}"
+                if len(doc["aliases"]) > 1:
+                    sub_info = (sub_info or f"Filename: {f}") + f" (same as: {', '.join(doc['aliases'][1:])})"
+                
+                with st.container():
+                    col1, col2 = st.columns([5, 1])
+                    with col1:
+                        st.markdown(f"📄 {display_title}")
+                        if sub_info:
+                            st.caption(sub_info)
+                    with col2:
+                        pv_key = f"pv_exam_{f}"
+                        st.checkbox("Preview", key=pv_key)
+                        try:
+                            file_path = pdf_store.blob_path(manifest, doc["path"])
+                            with open(file_path, "rb") as fb:
+                                st.download_button("Download", data=fb.read(), file_name=f, mime="application/pdf", key=f"dl_exam_{f}")
+                        except Exception:
+                            st.warning("File not found for download.")
+                    if st.session_state.get(f"pv_exam_{f}", False):
+                        with st.expander(f"Preview: {display_title}", expanded=False):
+                            render_pdf_pages(pdf_store.blob_path(manifest, doc["path"]), key=f"pv_rng_exam_{f}", height=700)
+                    st.divider()
+            
+            st.info("💡 Tip: Use these papers to practice time management.")
+
+
+def _pass_probability_panel():
+    st.caption("Drills / Exam Mode / Score Tracker の記録から科目別の得点分布と相関を推定し、"
+               "配点（財務200・他100）、40%足切り、R4〜R8 のボーダーを使って本試験を大量にシミュレーションします。")
+    data = st.session_state.data
+    stats = pass_sim.stats(data)
+    rows, corr = pass_sim.fit(stats)
+    if not any(r["n"] for r in rows):
+        st.info("科目別のスコアがまだありません。Drills か Score Tracker で記録すると推定できます。")
+        return
+    sampler = st.radio("Sampling", ["plain", "sobol"], horizontal=True, key="pass_sim_sampler",
+                       format_func=lambda name: samplers.SAMPLERS[name].label)
+    # Stats fold new scores in place, so count plus last fingerprint identify the fit
+    cache_key = (stats["count"], stats["last"], sampler)
+    cached = st.session_state.get("_pass_sim")
+    if cached is None or cached[0] != cache_key:
+        cached = (cache_key, pass_sim.simulate(rows, corr, seed=stats["count"], sampler=sampler))
+        st.session_state["_pass_sim"] = cached
+    res = cached[1]
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("合格確率 P(pass)", f"{res['p_pass']:.0%}", f"95%区間 {res['low']:.0%}〜{res['high']:.0%}", delta_color="off")
+    m2.metric("足切りリスク", f"{res['p_cutoff']:.0%}")
+    m3.metric("合計得点率（中央値）", f"{res['total_median']:.1%}")
+    st.dataframe(pd.DataFrame([{
+        "科目": pass_sim.SUBJECTS[r["subject"]][0],
+        "配点": pass_sim.SUBJECTS[r["subject"]][1],
+        "記録数": r["n"],
+        "推定得点率（中央値）": f"{res['subject_median'][r['subject']]:.0%}",
+    } for r in rows]), hide_index=True, use_container_width=True)
+    st.caption(f"{res['draws']:,} 回の試験シミュレーション · MC 標準誤差 ±{res['mc_se']:.1%} · "
+               "区間は記録数が少ないことによる推定の不確かさを含みます。")
+
+
+def _border_figure():
+    df_borders = pd.DataFrame(pass_sim.BORDERS, columns=["Year", "Session", "Border"])
+    fig_border = px.bar(
+        df_borders, x="Year", y="Border", color="Session", barmode="group",
+        title="短答式 合格ボーダー（参考値）R4〜R8", range_y=[60, 80],
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+    fig_border.update_layout(legend_title_text="Session", yaxis_title="Border (%)")
+    return fig_border
@@ -0,0 +1,102 @@
+"""Tracker for revised standards and law changes."""
+from datetime import date
+
+import streamlit as st
+
+from common import save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def render():
+    st.header("改正トラッカー 🧭")
+    st.info("会計基準・監査基準・会社法・税制改正などの重要トピックを管理します。")
+    if "revisions" not in st.session_state.data:
+        st.session_state.data["revisions"] = []
+    with st.expander("Seed Common Topics"):
+        if st.button("Seed Accounting Core"):
+            seeds = [
+                {"area":"Accounting","topic":"収益認識 基本論点 (IFRS15/J-IFRS)","effective":date.today().strftime("%Y-%m-%d"),"importance":"High","status":"TODO","notes":""},
+                {"area":"Accounting","topic":"リース 会計 (IFRS16/J-IFRS)","effective":date.today().strftime("%Y-%m-%d"),"importance":"High","status":"TODO","notes":""},
+                {"area":"Accounting","topic":"金融商品 区分・測定 (IFRS9)","effective":date.today().strftime("%Y-%m-%d"),"importance":"High","status":"TODO","notes":""}
+            ]
+            exist = set((r.get("area"), r.get("topic")) for r in st.session_state.data["revisions"])
+            for s in seeds:
+                key = (s["area"], s["topic"])
+                if key not in exist:
+                    st.session_state.data["revisions"].append(s)
+            save_data(st.session_state.data)
+            st.rerun()
+        if st.button("Seed Audit/Company/Tax"):
+            seeds = [
+                {"area":"Audit","topic":"監査基準の更新 リスクアプローチ","effective":date.today().strftime("%Y-%m-%d"),"importance":"High","status":"TODO","notes":""},
+                {"area":"Company Law","topic":"会社法 改正点 (機関設計・開示)","effective":date.today().strftime("%Y-%m-%d"),"importance":"Medium","status":"TODO","notes":""},
+                {"area":"Tax","topic":"税制改正 法人税 主要改正項目","effective":date.today().strftime("%Y-%m-%d"),"importance":"High","status":"TODO","notes":""}
+            ]
+            exist = set((r.get("area"), r.get("topic")) for r in st.session_state.data["revisions"])
+            for s in seeds:
+                key = (s["area"], s["topic"])
+                if key not in exist:
+                    st.session_state.data["revisions"].append(s)
+            save_data(st.session_state.data)
+            st.rerun()
+    with st.expander("Add Revision / 改正を追加", expanded=True):
+        with st.form("rev_add"):
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                area = st.selectbox("Area", ["Accounting", "Audit", "Company Law", "Tax"], index=0, key="rev_area")
+            with c2:
+                topic = st.text_input("Topic", key="rev_topic")
+            with c3:
+                eff = st.date_input("Effective Date", value=date.today(), key="rev_eff")
+            c4, c5, c6 = st.columns(3)
+            with c4:
+                importance = st.selectbox("Importance", ["High", "Medium", "Low"], index=0, key="rev_imp")
+            with c5:
+                status = st.selectbox("Status", ["TODO", "Read", "Summarized", "Tested"], index=0, key="rev_stat")
+            with c6:
+                notes = st.text_input("Notes", key="rev_notes")
+            add_btn = st.form_submit_button("Add")
+            if add_btn and topic.strip():
+                st.session_state.data["revisions"].append({
+                    "area": area,
+                    "topic": topic.strip(),
+                    "effective": eff.strftime("%Y-%m-%d"),
+                    "importance": importance,
+                    "status": status,
+                    "notes": notes
+                })
+                save_data(st.session_state.data)
+                st.success("Added.")
+                st.rerun()
+    data = st.session_state.data.get("revisions", [])
+    if data:
+        df = pd.DataFrame(data)
+        f1, f2 = st.columns([1, 1])
+        with f1:
+            f_area = st.multiselect("Filter Area", ["Accounting", "Audit", "Company Law", "Tax"], default=[])
+        with f2:
+            f_stat = st.multiselect("Filter Status", ["TODO", "Read", "Summarized", "Tested"], default=[])
+        df_view = df.copy()
+        if f_area:
+            df_view = df_view[df_view["area"].isin(f_area)]
+        if f_stat:
+            df_view = df_view[df_view["status"].isin(f_stat)]
+        st.dataframe(df_view.sort_values(["importance", "effective"], ascending=[True, False]), use_container_width=True)
+        with st.expander("Update Status / ステータス更新"):
+            for i, row in df.iterrows():
+                c1, c2, c3 = st.columns([3, 2, 2])
+                with c1:
+                    st.markdown(f"- {row['topic']} ({row['area']}) — {row['effective']}")
+                with c2:
+                    new_stat = st.selectbox("Status", ["TODO", "Read", "Summarized", "Tested"], index=["TODO","Read","Summarized","Tested"].index(row["status"]), key=f"rev_status_{i}")
+                with c3:
+                    if st.button("Save", key=f"rev_save_{i}"):
+                        st.session_state.data["revisions"][i]["status"] = new_stat
+                        save_data(st.session_state.data)
+                        st.toast("Updated", icon="✅")
+                        st.rerun()
+        st.download_button("Download CSV", data=df.to_csv(index=False).encode("utf-8"), file_name="revisions.csv", mime="text/csv")
+    else:
+        st.info("No revisions yet. Add important topics above.")
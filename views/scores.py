@@ -0,0 +1,77 @@
+"""Score entry and history."""
+import functools
+from datetime import date
+
+import streamlit as st
+
+import figure_cache
+import fingerprints
+import trend_charts
+from common import save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+HISTORY_ROWS = 50
+
+
+def render():
+    st.header("Score Tracker")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        with st.form("score_form"):
+            name = st.text_input("Exam/Drill Name")
+            date_val = st.date_input("Date", value=date.today())
+            subject = st.selectbox("Subject", ["Financial", "Management", "Audit", "Company", "Tax", "Elective", "Total"])
+            val = st.number_input("Score (%)", min_value=0, max_value=100, value=70)
+            submitted = st.form_submit_button("Save Score")
+            
+            if submitted:
+                new_score = {
+                    'name': name,
+                    'date': date_val.strftime("%Y-%m-%d"),
+                    'subject': subject,
+                    'val': val
+                }
+                st.session_state.data["scores"].append(new_score)
+                save_data(st.session_state.data)
+                st.success("Score saved!")
+                
+    with col2:
+        if st.session_state.data["scores"]:
+            scores = st.session_state.data["scores"]
+            st.subheader("History")
+            _history_table(scores)
+            # The CSV is only built when the button is clicked
+            st.download_button("Download Scores CSV", data=functools.partial(_scores_csv, scores), file_name="scores.csv", mime="text/csv")
+            
+            # Line Chart
+            st.subheader("Trend")
+            # Running digest of the history, caught up as scores are appended
+            # (rebuilt if the last one folded in changed); see fingerprints.py
+            fig = figure_cache.figure("score_trend", fingerprints.digest(st.session_state.data, "scores"), lambda: trend_charts.trend_figure(
+                scores, x="date", y="val", group="subject", y_range=[0, 100]))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No scores recorded yet.")
+
+
+
+def _history_table(scores):
+    # One page of the most recently entered scores, so the table (and what
+    # is sent to the browser) stays the same size however long the history
+    pages = max(1, -(-len(scores) // HISTORY_ROWS))
+    page = 1
+    if pages > 1:
+        page = int(st.number_input(f"Page (of {pages}, newest first)", min_value=1, max_value=pages, value=1, step=1, key="scores_page"))
+    end = len(scores) - (page - 1) * HISTORY_ROWS
+    rows = scores[max(0, end - HISTORY_ROWS):end]
+    st.dataframe(pd.DataFrame(rows).sort_values('date', ascending=False))
+    if pages > 1:
+        st.caption(f"{len(rows)} of {len(scores)} scores")
+
+
+def _scores_csv(scores):
+    return pd.DataFrame(scores).to_csv(index=False).encode('utf-8')
@@ -0,0 +1,50 @@
+"""Study session logger."""
+from datetime import date
+
+import streamlit as st
+
+import study_rollups
+from common import save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def render():
+    st.header("Study Timer")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Log Study Session")
+        with st.form("timer_form"):
+            subject = st.selectbox("Subject", ["Financial", "Management", "Audit", "Company", "Tax", "Elective"])
+            duration = st.number_input("Duration (minutes)", min_value=1, value=60)
+            date_val = st.date_input("Date", value=date.today())
+            submitted = st.form_submit_button("Log Session")
+            
+            if submitted:
+                new_log = {
+                    'date': date_val.strftime("%Y-%m-%d"),
+                    'subject': subject,
+                    'duration': duration
+                }
+                study_rollups.add_log(st.session_state.data, new_log)
+                save_data(st.session_state.data)
+                st.success("Session logged!")
+                
+    with col2:
+        st.subheader("Recent Logs")
+        if st.session_state.data["logs"]:
+            df_logs = pd.DataFrame(st.session_state.data["logs"])
+            st.dataframe(df_logs.sort_values('date', ascending=False))
+            
+            rollups = study_rollups.rollups(st.session_state.data)
+            total_mins = int(rollups["total"])
+            hours = total_mins // 60
+            mins = total_mins % 60
+            st.metric("Total Study Time", f"{hours}h {mins}m")
+            by_subject = sorted(rollups["subjects"].items(), key=lambda kv: -kv[1])
+            st.caption(" · ".join(f"{sub} {int(m) // 60}h {int(m) % 60}m" for sub, m in by_subject))
+        else:
+            st.info("No logs yet.")
@@ -0,0 +1,157 @@
+"""Survival mode: answer until three strikes."""
+from datetime import date
+
+import streamlit as st
+
+import question_bank
+import quiz_engine
+from common import save_data
+
+
+def render():
+    drill_questions = question_bank.drill_questions()
+    st.header("⚡ Survival Mode")
+    st.markdown("### Challenge your limits! 3 Strikes and you're out.")
+    
+    # Initialize State
+    if 'survival' not in st.session_state:
+        st.session_state.survival = {
+            'active': False,
+            'lives': 3,
+            'streak': 0,
+            'score': 0,
+            'q': None,
+            'feedback': False,
+            'user_ans': None,
+            'target_streak': "Unlimited"
+        }
+    
+    ss = st.session_state.survival
+    
+    # Load Questions Logic
+    if 'all_questions' not in st.session_state:
+        all_qs = []
+        # Static
+        for sub, qs in drill_questions.items():
+            for q in qs:
+                # Create a copy to avoid modifying original
+                q_copy = q.copy()
+                q_copy['subject'] = sub
+                all_qs.append(q_copy)
+        # Generated
+        for sub, qs in question_bank.generated_questions().items():
+            for q in qs:
+                q_copy = q.copy()
+                q_copy['subject'] = sub
+                all_qs.append(q_copy)
+        st.session_state.all_questions = all_qs
+    
+    if not ss['active']:
+        st.subheader("Select Challenge Mode")
+        streak_target = st.radio("Target Streak", ["Unlimited", 1, 5, 10], horizontal=True, format_func=lambda x: "∞ Unlimited" if x == "Unlimited" else f"Target: {x} 🔥")
+
+        if st.button("🚀 Start Challenge", use_container_width=True):
+            ss['active'] = True
+            ss['lives'] = 3
+            ss['streak'] = 0
+            ss['score'] = 0
+            ss['q'] = None
+            ss['feedback'] = False
+            ss['target_streak'] = streak_target
+            st.rerun()
+            
+    else:
+        survival_panel()
+
+
+def _submit_answer(ans_key):
+    ss = st.session_state.survival
+    ans = st.session_state.get(ans_key)
+    points = quiz_engine.survival_answer(ss, st.session_state.data, ss['q']['options'].index(ans))
+    if points:
+        st.toast(f"Correct! +{points} XP", icon="✅")
+    else:
+        st.toast("Wrong Answer!", icon="❌")
+
+
+def _next_question():
+    ss = st.session_state.survival
+    ss['q'] = None
+    ss['feedback'] = False
+
+
+# Each answer reruns only the game panel; "Try Again" goes back to the
+# full page (mode picker).
+@st.fragment
+def survival_panel():
+    ss = st.session_state.survival
+    # Metrics
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Lives", "❤️" * ss['lives'])
+    target_display = "∞" if ss.get('target_streak', "Unlimited") == "Unlimited" else ss['target_streak']
+    c2.metric("Streak", f"🔥 {ss['streak']} / {target_display}")
+    c3.metric("Score", ss['score'])
+    
+    target = ss.get('target_streak', "Unlimited")
+    is_win = target != "Unlimited" and ss['streak'] >= target
+
+    if ss['lives'] <= 0 or is_win:
+        if is_win:
+            st.balloons()
+            st.success(f"🎉 MISSION ACCOMPLISHED! You reached a {ss['streak']} streak!")
+        else:
+            st.error("💀 GAME OVER")
+        
+        st.markdown(f"### Final Score: {ss['score']}")
+        
+        # Save High Score
+        if ss['score'] > 0:
+            st.session_state.data["scores"].append({
+                'name': f"Survival Mode ⚡ (Target {target})",
+                'date': date.today().strftime("%Y-%m-%d"),
+                'subject': 'Survival',
+                'val': ss['score'] # Just storing score
+            })
+            save_data(st.session_state.data)
+        
+        if st.button("Try Again", use_container_width=True):
+            ss['active'] = False
+            st.rerun()
+    else:
+        # Get Question
+        if ss['q'] is None:
+            import random
+            if st.session_state.all_questions:
+                q_data = quiz_engine.shuffle_options(random.choice(st.session_state.all_questions))
+                
+                ss['q'] = {
+                    'q': q_data['q'],
+                    'options': q_data['options'],
+                    'correct_idx': q_data['correct'],
+                    'explanation': q_data['explanation'],
+                    'subject': q_data.get('subject', 'General')
+                }
+            else:
+                st.error("No questions found!")
+                st.stop()
+        
+        q = ss['q']
+        
+        st.markdown(f"**[{q['subject']}]** {q['q']}")
+        
+        if not ss['feedback']:
+            # Use a form to prevent reload on radio selection
+            form_key = f"surv_form_{ss['score']}_{ss['lives']}"
+            with st.form(key=form_key):
+                st.radio("Select Answer:", q['options'], key=f"{form_key}_ans")
+                st.form_submit_button("Submit Answer", on_click=_submit_answer, args=(f"{form_key}_ans",))
+        else:
+            # Show Feedback
+            if ss['user_ans'] == q['correct_idx']:
+                st.success("✅ Correct!")
+            else:
+                st.error(f"❌ Wrong! Correct: {q['options'][q['correct_idx']]}")
+            
+            st.info(f"**Explanation:**\n\n{q['explanation']}")
+            
+            st.button("Next Question ➡", use_container_width=True, on_click=_next_question)
@@ -0,0 +1,246 @@
+"""My Syllabus: course lecture lists, lecture page ranges and study PDFs."""
+import os
+
+import streamlit as st
+
+import pdf_pages
+import pdf_store
+import tracing
+from common import BASE_DIR, load_lecture_index, pdf_manifest, render_pdf_bytes, render_pdf_pages, save_data
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+MATERIALS_DIR = os.path.join(BASE_DIR, 'studying')
+
+
+# Load Study Materials (Syllabus)
+@st.cache_data(show_spinner=False)
+def load_study_materials(mtimes: tuple):
+    # Excel parsing is the slow part; cached until a file under studying/ changes
+    materials_dir = MATERIALS_DIR
+    syllabus = {}
+    extra_pdfs = []
+    
+    if not os.path.exists(materials_dir):
+        return {}, []
+        
+    for filename in os.listdir(materials_dir):
+        if filename.endswith('.xlsx') and not filename.startswith('~$'): # Ignore temp files
+            try:
+                # Extract subject from filename (e.g., "1-財務会計論コース.xlsx" -> "財務会計論")
+                parts = filename.split('-')
+                if len(parts) > 1:
+                    subject_name = parts[1].replace('コース.xlsx', '')
+                else:
+                    subject_name = filename.replace('.xlsx', '')
+                
+                # Read Excel
+                file_path = os.path.join(materials_dir, filename)
+                df = pd.read_excel(file_path, header=1)
+                
+                # Fill merged cells (NaN) with previous value
+                if 'カテゴリ' in df.columns:
+                    df['カテゴリ'] = df['カテゴリ'].ffill()
+                if 'サブカテゴリ' in df.columns:
+                    df['サブカテゴリ'] = df['サブカテゴリ'].ffill()
+                
+                # Filter relevant columns
+                if '講座名' in df.columns:
+                    items = []
+                    for _, row in df.iterrows():
+                        if pd.notna(row['講座名']):
+                            items.append({
+                                'category': row.get('カテゴリ', ''),
+                                'subcategory': row.get('サブカテゴリ', ''),
+                                'title': row['講座名'],
+                                'duration': row.get('再生時間/標準時間', '')
+                            })
+                    
+                    # Find corresponding PDF
+                    pdf_path = os.path.join(materials_dir, filename.replace('.xlsx', '.pdf'))
+                    has_pdf = os.path.exists(pdf_path)
+                    
+                    syllabus[subject_name] = {
+                        'items': items,
+                        'pdf_path': pdf_path if has_pdf else None,
+                        'excel_path': file_path
+                    }
+            except Exception as e:
+                print(f"Error loading {filename}: {e}")
+    
+    # Load extra PDFs from 'PDF' subdirectory
+    pdf_dir = os.path.join(materials_dir, 'PDF')
+    if os.path.exists(pdf_dir):
+        for f in os.listdir(pdf_dir):
+            if f.lower().endswith('.pdf'):
+                extra_pdfs.append({
+                    'name': f,
+                    'path': os.path.join(pdf_dir, f)
+                })
+                
+    # Also load standalone PDFs in the root of 'studying' that are not paired with an Excel file
+    # Get list of PDF paths already associated with courses
+    paired_pdfs = set()
+    for subject_data in syllabus.values():
+        if subject_data['pdf_path']:
+            paired_pdfs.add(os.path.normpath(subject_data['pdf_path']))
+            
+    for filename in os.listdir(materials_dir):
+        if filename.lower().endswith('.pdf'):
+            full_path = os.path.join(materials_dir, filename)
+            if os.path.normpath(full_path) not in paired_pdfs:
+                extra_pdfs.append({
+                    'name': filename,
+                    'path': full_path
+                })
+                
+    return syllabus, extra_pdfs
+
+def study_materials_mtimes():
+    # Excel files are edited in place, so key on the files, not just the directory
+    sig = []
+    for d in (MATERIALS_DIR, os.path.join(MATERIALS_DIR, 'PDF')):
+        if os.path.isdir(d):
+            for entry in os.scandir(d):
+                sig.append((entry.path, entry.stat().st_mtime))
+    return tuple(sorted(sig))
+
+
+def render():
+    with tracing.section("syllabus"):
+        study_materials, extra_pdfs = load_study_materials(study_materials_mtimes())
+    st.header("My Study Syllabus 📚")
+    st.info("Based on your uploaded materials in 'studying' folder.")
+    
+    if not study_materials and not extra_pdfs:
+        st.warning("No study materials found in 'studying' folder.")
+    else:
+        # Progress Tracking
+        if 'syllabus_progress' not in st.session_state.data:
+            st.session_state.data['syllabus_progress'] = []
+            
+        completed_items = set(st.session_state.data['syllabus_progress'])
+        manifest = pdf_manifest()
+        
+        # Callback for checkbox
+        def toggle_syllabus(key):
+            if key in st.session_state.data['syllabus_progress']:
+                st.session_state.data['syllabus_progress'].remove(key)
+            else:
+                st.session_state.data['syllabus_progress'].append(key)
+                # Add XP for completing a lecture!
+                st.session_state.data['xp'] = st.session_state.data.get('xp', 0) + 50
+                st.toast("Lecture Completed! +50 XP", icon="🎓")
+            save_data(st.session_state.data)
+
+        # Tabs for subjects
+        if study_materials:
+            subjects = list(study_materials.keys())
+            tabs = st.tabs(subjects)
+            
+            for i, subject in enumerate(subjects):
+                with tabs[i]:
+                    data = study_materials[subject]
+                    items = data['items']
+                    pdf_path = data['pdf_path']
+                    excel_path = data['excel_path']
+                    
+                    # Header Actions
+                    c1, c2 = st.columns([3, 1])
+                    with c1:
+                        st.subheader(f"{subject} ({len(items)} Lectures)")
+                    with c2:
+                        if pdf_path:
+                            pv_key = f"pv_pdf_{subject}"
+                            st.checkbox("Preview PDF here", key=pv_key)
+                            try:
+                                with open(pdf_store.blob_path(manifest, pdf_path), "rb") as f:
+                                    st.download_button("Download PDF", data=f.read(), file_name=os.path.basename(pdf_path), mime="application/pdf", key=f"dl_pdf_{subject}")
+                            except Exception:
+                                st.warning("PDF not found for download.")
+                        if excel_path:
+                            try:
+                                with open(excel_path, "rb") as f:
+                                    st.download_button("Download Excel", data=f.read(), file_name=os.path.basename(excel_path), mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", key=f"dl_xlsx_{subject}")
+                            except Exception:
+                                st.warning("Excel not found for download.")
+                    if pdf_path and st.session_state.get(f"pv_pdf_{subject}", False):
+                        with st.expander("📄 PDF Preview", expanded=False):
+                            render_pdf_pages(pdf_store.blob_path(manifest, pdf_path), key=f"pv_rng_{subject}", height=700)
+
+                    
+                    # Progress Bar for Subject
+                    subject_completed = [item['title'] for item in items if f"{subject}|{item['title']}" in completed_items]
+                    prog = len(subject_completed) / len(items) if items else 0
+                    st.progress(prog)
+                    st.caption(f"Progress: {len(subject_completed)} / {len(items)} ({prog:.1%})")
+                    
+                    # Lecture -> page ranges in the course PDF
+                    lecture_pages = [None] * len(items)
+                    if pdf_path and excel_path:
+                        try:
+                            lec_index = load_lecture_index(pdf_path, excel_path, (os.path.getmtime(pdf_path), os.path.getmtime(excel_path)), items)
+                            lecture_pages = [it['pages'] for it in lec_index['items']]
+                        except Exception as e:
+                            st.caption(f"Lecture page index unavailable: {e}")
+                    aligned = [k for k, pg in enumerate(lecture_pages) if pg]
+                    if aligned:
+                        with st.expander("📑 Open Lecture (pages only)", expanded=False):
+                            lec_labels = {k: f"{items[k]['title']}  (p.{lecture_pages[k][0] + 1}–{lecture_pages[k][1] + 1})" for k in aligned}
+                            sel_lec = st.selectbox("Lecture", aligned, key=f"lec_sel_{subject}", format_func=lec_labels.get)
+                            p_start, p_end = lecture_pages[sel_lec]
+                            lec_bytes = pdf_pages.page_range_bytes(pdf_path, (p_start, p_end))
+                            st.caption(f"Pages {p_start + 1}–{p_end + 1} of {lec_index['n_pages']} · {len(lec_bytes) / 1024:.0f} KB")
+                            lec_name = f"{os.path.splitext(os.path.basename(pdf_path))[0]}_p{p_start + 1}-{p_end + 1}.pdf"
+                            st.download_button("Download pages", data=lec_bytes, file_name=lec_name, mime="application/pdf", key=f"dl_lec_{subject}")
+                            if st.checkbox("Preview pages here", key=f"pv_lec_{subject}"):
+                                render_pdf_bytes(lec_bytes, lec_name, height=700)
+                    
+                    # Group by Category/Subcategory
+                    df = pd.DataFrame(items)
+                    if not df.empty and 'category' in df.columns:
+                        for cat, group in df.groupby('category'):
+                            with st.expander(f"📂 {cat}", expanded=True):
+                                for idx, row in group.iterrows():
+                                    title = row['title']
+                                    unique_key = f"{subject}|{title}"
+                                    is_done = unique_key in completed_items
+                                    
+                                    c_chk, c_txt, c_time = st.columns([0.5, 4, 1.5])
+                                    with c_chk:
+                                        # Use subject and index to ensure widget key uniqueness
+                                        st.checkbox("", value=is_done, key=f"chk_{subject}_{idx}", on_change=toggle_syllabus, kwargs={'key': unique_key})
+                                    
+                                    with c_txt:
+                                        if is_done:
+                                            st.markdown(f"~~{title}~~")
+                                        else:
+                                            st.markdown(f"**{title}**")
+                                            if row['subcategory']:
+                                                st.caption(f"└ {row['subcategory']}")
+                                                
+                                    with c_time:
+                                        st.caption(f"⏱️ {row['duration']}")
+                                        if lecture_pages[idx]:
+                                            st.caption(f"📄 p.{lecture_pages[idx][0] + 1}–{lecture_pages[idx][1] + 1}")
+
+        # Supplemental Resources (Extra PDFs)
+        if extra_pdfs:
+            st.markdown("---")
+            st.subheader("📚 Supplemental Resources")
+            for i, pdf in enumerate(extra_pdfs):
+                c1, c2 = st.columns([4, 2])
+                with c1:
+                    st.markdown(f"📄 **{pdf['name']}**")
+                with c2:
+                    pvk = f"pv_extra_{i}"
+                    st.checkbox("Preview here", key=pvk)
+                    try:
+                        with open(pdf_store.blob_path(manifest, pdf['path']), "rb") as f:
+                            st.download_button("Download", data=f.read(), file_name=os.path.basename(pdf['path']), mime="application/pdf", key=f"dl_extra_{i}")
+                    except Exception:
+                        st.warning("File not found for download.")
+                if st.session_state.get(f"pv_extra_{i}", False):
+                    with st.expander(f"Preview: {pdf['name']}", expanded=False):
+                        render_pdf_pages(pdf_store.blob_path(manifest, pdf['path']), key=f"pv_rng_extra_{i}", height=600)
@@ -0,0 +1,188 @@
+"""Vocabulary lists and flashcards."""
+from datetime import date
+
+import streamlit as st
+
+import srs
+from asset_registry import registry as assets
+from common import save_data, show_asset_errors, srs_deck
+
+
+def render():
+    vocab_data = assets.get("vocab")
+    show_asset_errors("vocab")
+    st.header("Vocabulary Mastery 📖")
+    st.info("Master the essential accounting terminology in Japanese and English.")
+
+    # Create Tabs
+    tab1, tab2 = st.tabs(["📚 Word List", "⚡ Tap & Study (Flashcards)"])
+
+    # --- TAB 1: Word List ---
+    with tab1:
+        st.subheader("Bilingual Terminology List")
+        
+        # Subject Selection
+        subjects = list(vocab_data.keys())
+        selected_subject = st.selectbox("Select Subject", subjects, key="vocab_list_subject")
+        
+        if selected_subject:
+            terms = vocab_data[selected_subject]
+            st.write(f"Found {len(terms)} terms for **{selected_subject}**.")
+            
+            for term in terms:
+                with st.expander(f"**{term['term']}** ({term['jp']})"):
+                    st.markdown(f"**🇯🇵 Definition:** {term['desc']}")
+                    st.markdown(f"**🇺🇸 Definition:** {term.get('desc_en', 'No English definition available.')}")
+
+    # --- TAB 2: Flashcards ---
+    with tab2:
+        st.subheader("⚡ Flashcard Mode")
+        st.markdown("Tap to flip the card, swipe (click next) to move to the next word.")
+        
+        # Initialize Session State for Flashcards
+        if 'flashcard_active' not in st.session_state:
+            st.session_state.flashcard_active = False
+            st.session_state.flashcard_subject = subjects[0]
+            st.session_state.flashcard_index = 0
+            st.session_state.flashcard_flipped = False
+            st.session_state.flashcard_queue = None
+
+        # Subject Selection for Flashcards
+        fc_subject = st.selectbox("Select Subject for Study", subjects, key="fc_subject_selector")
+        use_srs = st.checkbox("Spaced repetition (due cards first, then new words)", key="fc_srs")
+        
+        # Start/Reset Button
+        if st.button("Start / Restart Session", type="primary"):
+            st.session_state.flashcard_active = True
+            st.session_state.flashcard_subject = fc_subject
+            st.session_state.flashcard_index = 0
+            st.session_state.flashcard_flipped = False
+            st.session_state.flashcard_queue = _review_queue(vocab_data, fc_subject) if use_srs else None
+            st.rerun()
+
+        flashcard_panel(vocab_data)
+
+
+def _flip_card():
+    st.session_state.flashcard_flipped = True
+
+
+def _show_card(idx):
+    st.session_state.flashcard_index = idx
+    st.session_state.flashcard_flipped = False
+
+
+def _review_queue(vocab_data, subject):
+    """Indices into ``vocab_data[subject]``: due cards, then up to NEW_PER_SESSION unseen terms."""
+    index = {srs.vocab_key(subject, t['term']): i for i, t in enumerate(vocab_data.get(subject, []))}
+    keys = srs.session_queue(srs_deck(), list(index), date.today(), f"vocab:{subject}:")
+    return [index[k] for k in keys if k in index]
+
+
+def _restart_review(vocab_data):
+    # Cards graded this session are no longer due; rebuild instead of replaying them
+    st.session_state.flashcard_queue = _review_queue(vocab_data, st.session_state.flashcard_subject)
+    _show_card(0)
+
+
+def _grade_card(key, grade, idx):
+    srs_deck().review(key, grade, date.today())
+    save_data(st.session_state.data)
+    _show_card(idx)
+
+
+# Flip / next only rerun the card, not the word list tab (one expander per term)
+@st.fragment
+def flashcard_panel(vocab_data):
+    if st.session_state.flashcard_active:
+        current_terms = vocab_data.get(st.session_state.flashcard_subject, [])
+        queue = st.session_state.get('flashcard_queue')
+        if queue is not None:
+            current_terms = [current_terms[i] for i in queue]
+        total_cards = len(current_terms)
+        
+        if total_cards == 0 and queue is not None:
+            st.success("✅ All caught up: no cards are due and no new words are left for today.")
+        elif total_cards == 0:
+            st.warning("No words available for this subject.")
+        else:
+            current_idx = st.session_state.flashcard_index
+            
+            # Check if session is finished
+            if current_idx >= total_cards:
+                st.balloons()
+                st.success(f"🎉 You've completed all {total_cards} words for {st.session_state.flashcard_subject}!")
+                if queue is not None:
+                    st.button("Start Over", on_click=_restart_review, args=(vocab_data,))
+                else:
+                    st.button("Start Over", on_click=_show_card, args=(0,))
+            else:
+                word_data = current_terms[current_idx]
+                
+                # Progress Bar
+                progress = (current_idx + 1) / total_cards
+                st.progress(progress)
+                st.caption(f"Card {current_idx + 1} of {total_cards}")
+
+                # Card Container
+                card_container = st.container()
+                
+                # Card Logic
+                with card_container:
+                    # Styling
+                    st.markdown("""
+                    <style>
+                    .flashcard {
+                        border: 2px solid #e0e0e0;
+                        border-radius: 15px;
+                        padding: 40px;
+                        text-align: center;
+                        background-color: white;
+                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+                        min-height: 200px;
+                        display: flex;
+                        flex-direction: column;
+                        justify-content: center;
+                        align-items: center;
+                        margin-bottom: 20px;
+                    }
+                    .flashcard-term { font-size: 28px; font-weight: bold; color: #1e88e5; }
+                    .flashcard-jp { font-size: 24px; font-weight: bold; color: #d32f2f; margin-top: 10px;}
+                    .flashcard-desc { font-size: 16px; color: #424242; margin-top: 15px; }
+                    </style>
+                    """, unsafe_allow_html=True)
+
+                    if not st.session_state.flashcard_flipped:
+                        # FRONT SIDE
+                        st.markdown(f"""
+                        <div class="flashcard">
+                            <div class="flashcard-term">{word_data['term']}</div>
+                            <div style="color: #9e9e9e; margin-top: 20px;">(Tap 'Flip' to see meaning)</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        st.button("🔄 Flip Card", use_container_width=True, on_click=_flip_card)
+                            
+                    else:
+                        # BACK SIDE
+                        st.markdown(f"""
+                        <div class="flashcard">
+                            <div class="flashcard-term">{word_data['term']}</div>
+                            <div class="flashcard-jp">{word_data['jp']}</div>
+                            <div class="flashcard-desc">🇯🇵 {word_data['desc']}</div>
+                            <div class="flashcard-desc">🇺🇸 {word_data.get('desc_en', '')}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        if queue is not None:
+                            key = srs.vocab_key(st.session_state.flashcard_subject, word_data['term'])
+                            grades = [("😵 Again", srs.AGAIN), ("😐 Hard", srs.HARD), ("🙂 Good", srs.GOOD), ("😎 Easy", srs.EASY)]
+                            for col, (label, grade) in zip(st.columns(len(grades)), grades):
+                                col.button(label, use_container_width=True, on_click=_grade_card, args=(key, grade, current_idx + 1))
+                        else:
+                            col_prev, col_next = st.columns(2)
+                            with col_prev:
+                                st.button("⬅️ Previous", use_container_width=True, disabled=current_idx == 0, on_click=_show_card, args=(current_idx - 1,))
+                        
+                            with col_next:
+                                st.button("Next ➡️", use_container_width=True, on_click=_show_card, args=(current_idx + 1,))
@@ -0,0 +1,82 @@
+"""Wrong-answer notebook and retries."""
+import random
+from datetime import date
+
+import streamlit as st
+
+import quiz_engine
+import srs
+from common import save_data, srs_deck
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def render():
+    st.header("Wrong Answers")
+    wa = st.session_state.data.get('wrong_answers', [])
+    if not wa:
+        st.info("No wrong answers recorded yet.")
+    else:
+        df = pd.DataFrame(wa)
+        subjects = sorted([s for s in df['subject'].dropna().unique()])
+        c1, c2, c3 = st.columns([2, 1, 1])
+        with c1:
+            sub = st.selectbox("Subject", ["All"] + subjects)
+        with c2:
+            n = st.number_input("Retry count", min_value=5, max_value=50, value=20)
+        with c3:
+            csv = df.to_csv(index=False).encode('utf-8')
+            st.download_button("Download CSV", data=csv, file_name="wrong_answers.csv", mime="text/csv")
+        cc1, cc2 = st.columns([1,1])
+        with cc1:
+            if st.button("Clear All", type="secondary"):
+                st.session_state.data['wrong_answers'] = []
+                srs_deck().remove_source("wrong")
+                save_data(st.session_state.data)
+                st.rerun()
+        if sub != "All":
+            df = df[df['subject'] == sub]
+        st.dataframe(df[['date','subject','level','q']].sort_values('date', ascending=False), use_container_width=True)
+        if not df.empty:
+            records = df.to_dict(orient='records')
+            due = _due_records(records)
+            st.caption(f"🔁 {len(due)} due for review today")
+            if st.button("Retry 20"):
+                sample = _retry_sample(records, due, n)
+                qs = []
+                for r in sample:
+                    opts = r.get('options', [])
+                    correct_idx = r.get('correct_idx', None)
+                    if opts and correct_idx is not None:
+                        qs.append({
+                            'q': r.get('q',''),
+                            'options': opts,
+                            'correct': correct_idx,
+                            'explanation': r.get('explanation',''),
+                            'subject': r.get('subject'),
+                            # Rows without tags come back from the DataFrame as NaN
+                            'tags': r['tags'] if isinstance(r.get('tags'), list) else [],
+                        })
+                if qs:
+                    st.session_state.quiz_state = quiz_engine.new_quiz(qs, sub if sub != "All" else "Mixed", "Retry")
+                    st.toast("Retry started", icon="✅")
+                    st.rerun()
+
+
+def _due_records(records):
+    """Records whose review card is due, most overdue first (one per question)."""
+    by_key = {}
+    for r in records:
+        by_key.setdefault(srs.wrong_key(r), r)
+    return [by_key[k] for k in srs_deck().due(date.today(), "wrong:") if k in by_key]
+
+
+def _retry_sample(records, due, n):
+    # Due cards first, topped up at random from the rest of the notebook
+    sample = due[:n]
+    if len(sample) < n:
+        taken = {srs.wrong_key(r) for r in sample}
+        rest = [r for r in records if srs.wrong_key(r) not in taken]
+        sample += random.sample(rest, min(len(rest), n - len(sample)))
+    return sample
@@ -0,0 +1,210 @@
+"""Pre-build the derived caches before the server takes traffic.
+
+    python warmup.py && streamlit run app.py
+    python warmup.py --check          # verify only, build nothing
+
+Builds (skipping whatever is already current):
+
+  pdf_store    .pdf_store/manifest.json (hashes of EXAM/ and studying/)
+  page_text    extracted page text of every EXAM/ paper (Old Exams search)
+  lectures     lecture -> page range index per studying/*.xlsx course
+  assets       every asset registry entry parses (runs the formulas migration;
+               --check only reports it as pending)
+  questions_js questions.js rebuilt from questions.json for index.html
+
+then checks the indexes it cannot rebuild cheaply (exam_vocab_index.npz and
+exam_metadata.json must cover every EXAM/ paper), and finally renders the
+first page in a fresh interpreter to show the first request is served
+within ``--budget-ms``.
+
+Exits 1 if anything is stale after warming or the first request is over
+budget.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import lecture_index
+import pdf_pages
+import pdf_store
+import quiz_engine
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+QUESTIONS_FILE = os.path.join(BASE_DIR, "questions.json")
+QUESTIONS_JS = os.path.join(BASE_DIR, "questions.js")
+EXAM_PREFIX = "EXAM/"
+
+FIRST_REQUEST = r"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+t0 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+print(json.dumps({"ms": (time.perf_counter() - t0) * 1000, "exception": at.exception[0].value[:200] if at.exception else None}))
+"""
+
+
+def warm_pdf_store(check):
+    manifest = pdf_store.load_manifest()
+    fresh = pdf_store.scan(previous=manifest)
+    if fresh == manifest:
+        return manifest, []
+    if check:
+        old = manifest.get("files", {})
+        changed = sorted(rel for rel in set(fresh["files"]) | set(old) if fresh["files"].get(rel) != old.get(rel))
+        return fresh, [f"manifest out of date: {', '.join(changed[:5])}{' ...' if len(changed) > 5 else ''}"]
+    pdf_store.save_manifest(fresh)
+    return fresh, []
+
+
+def warm_page_text(manifest, check):
+    # Old Exams full-text search; the course PDFs' text is only read while
+    # building their lecture index
+    stale = []
+    for doc in pdf_store.documents(manifest, EXAM_PREFIX):
+        if os.path.exists(pdf_pages.text_cache_path(doc["sha256"])):
+            continue
+        if check:
+            stale.append(doc["path"])
+            continue
+        try:
+            pdf_pages.page_texts(os.path.join(BASE_DIR, doc["path"]))
+        except Exception as e:
+            stale.append(f"{doc['path']} ({e})")
+    return [f"no page text: {name}" for name in stale]
+
+
+def warm_lectures(check):
+    stale = []
+    for excel_path, pdf_path in lecture_index.syllabus_pairs():
+        if lecture_index.cached_index(pdf_path, excel_path) is not None:
+            continue
+        name = os.path.basename(excel_path)
+        if check:
+            stale.append(f"no lecture index: {name}")
+            continue
+        try:
+            lecture_index.load_or_build(pdf_path, excel_path, lecture_index.read_syllabus_items(excel_path))
+        except Exception as e:
+            stale.append(f"lecture index failed: {name} ({e})")
+    return stale
+
+
+def warm_assets(check):
+    # Registers "questions" and the formulas migration on the shared registry
+    import question_bank  # noqa: F401
+    import views.formulas  # noqa: F401
+    from asset_registry import registry
+
+    problems = []
+    for name in registry.names():
+        if check:
+            # Loads and migrates a private copy; nothing is cached or saved
+            problem = registry.check(name)
+            if problem:
+                problems.append(f"asset {name}: {problem}")
+            continue
+        registry.get(name)
+        if name in registry.errors:
+            problems.append(f"asset {name}: {registry.errors[name]}")
+    return problems
+
+
+def warm_questions_js(check):
+    if not os.path.exists(QUESTIONS_FILE):
+        return []
+    with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
+        questions = json.load(f)
+    prefix = "const generatedQuestions = "
+    try:
+        with open(QUESTIONS_JS, "r", encoding="utf-8") as f:
+            js = f.read()
+        current = json.loads(js[len(prefix):].rstrip().rstrip(";")) if js.startswith(prefix) else None
+    except (FileNotFoundError, ValueError):
+        current = None
+    if current == questions:
+        return []
+    if check:
+        return ["questions.js does not match questions.json"]
+    quiz_engine.write_questions_js(questions, QUESTIONS_JS)
+    return []
+
+
+def check_exam_indexes(manifest):
+    """Offline-built indexes must cover every EXAM/ paper (rebuilt by generate_exam_*.py)."""
+    from asset_registry import registry
+
+    papers = {d["name"] for d in pdf_store.documents(manifest, EXAM_PREFIX)}
+    problems = []
+    vx = registry.get("exam_vocab_index")
+    if papers and vx is not None:
+        missing = papers - {str(f) for f in vx["files"]}
+        if missing:
+            problems.append(f"exam_vocab_index.npz lacks {len(missing)} paper(s), run generate_exam_vocab.py: {', '.join(sorted(missing)[:5])}")
+    missing = papers - set(registry.get("exam_metadata") or {})
+    if missing:
+        problems.append(f"exam_metadata.json lacks {len(missing)} paper(s), run generate_exam_metadata.py: {', '.join(sorted(missing)[:5])}")
+    return problems
+
+
+def first_request(app):
+    proc = subprocess.run([sys.executable, "-c", FIRST_REQUEST, app], cwd=BASE_DIR, capture_output=True, text=True,
+                          env=dict(os.environ, PYTHONPATH=BASE_DIR + os.pathsep + os.environ.get("PYTHONPATH", "")))
+    lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+    if proc.returncode != 0 or not lines:
+        return None, f"first request failed: {proc.stderr.strip()[-500:]}"
+    result = json.loads(lines[-1])
+    return result["ms"], result["exception"] and f"first request raised: {result['exception']}"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Pre-build and verify the app's derived caches")
+    ap.add_argument("--check", action="store_true", help="only verify; exit 1 if anything would need rebuilding")
+    ap.add_argument("--budget-ms", type=float, default=2500, help="first-request latency budget (fresh interpreter, warm disk caches)")
+    ap.add_argument("--skip-first-request", action="store_true")
+    ap.add_argument("--app", default=os.path.join(BASE_DIR, "app.py"))
+    args = ap.parse_args()
+
+    timings, problems = [], []
+
+    def step(name, fn, *a):
+        t0 = time.perf_counter()
+        result = fn(*a)
+        timings.append((name, (time.perf_counter() - t0) * 1000))
+        return result
+
+    manifest, found = step("pdf_store", warm_pdf_store, args.check)
+    problems += found
+    problems += step("page_text", warm_page_text, manifest, args.check)
+    problems += step("lectures", warm_lectures, args.check)
+    problems += step("assets", warm_assets, args.check)
+    problems += step("questions_js", warm_questions_js, args.check)
+    problems += step("exam_indexes", check_exam_indexes, manifest)
+
+    if not args.skip_first_request:
+        # Keep the render from creating the user data file
+        data_file = os.path.join(BASE_DIR, "cpa_data.json")
+        had_data = os.path.exists(data_file)
+        try:
+            ms, error = step("first_request", first_request, args.app)
+        finally:
+            if not had_data and os.path.exists(data_file):
+                os.remove(data_file)
+        if error:
+            problems.append(error)
+        elif ms > args.budget_ms:
+            problems.append(f"first request took {ms:.0f} ms, budget {args.budget_ms:.0f} ms")
+
+    for name, ms in timings:
+        print(f"{name:<14} {ms:9.0f} ms")
+    if problems:
+        print(f"\n{'STALE' if args.check else 'FAIL'}:\n  " + "\n  ".join(problems))
+        sys.exit(1)
+    print("\nall caches fresh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""Vectorized Monte Carlo of the Future tab's wealth model.
+
+Each path follows the same life plan, ages 24-57:
+
+    corporate   salary ladder (0 until 26, then x1, x1.5, x2, x2.5 of the
+                starting salary) times the savings rate, until launch age
+    launch      a 5M JPY launch cost, assets floored at zero
+    founder     4M JPY lean salary, 10% saved, until exit age
+    exit        + exit valuation with probability ``exit_prob``
+    every year  assets *= 1 + r
+
+Paths are simulated together: the yearly returns for all paths are one
+(paths x years) matrix from a seeded ``np.random.Generator``, exit outcomes
+one Bernoulli vector, and the per-age rules are applied column by column
+(34 vectorized steps whatever the number of paths). ``returns`` selects
+
+    normal      r ~ N(mean, vol), the original model
+    lognormal   1 + r log-normal (GBM with yearly steps), moment-matched so
+                E[r] = mean and sd[r] = vol; assets can never go negative
+
+``progressive`` runs the same model in batches without keeping the paths:
+each batch is folded into a ``QuantileSketch`` (per-age log-bucketed
+histograms, DDSketch-style, relative accuracy ``ALPHA``) and then dropped,
+so memory is O(ages x buckets) however many paths run. The standard error
+of the final-age P10/P50/P90 comes from batch means (the spread of the
+per-batch estimates), and the run stops once every one is within
+``REL_TOL`` of its estimate or ``max_paths`` is reached.
+
+Random inputs come from a ``samplers`` strategy (plain, antithetic or
+scrambled Sobol'). ``estimate`` can also use the unfloored wealth as a
+control variate: without the launch-cost floor the model is linear in the
+independent yearly growth factors, so its mean is known exactly
+(``expected_linear``) and tracks the real wealth on almost every path.
+
+    python wealth_sim.py --paths 100000 --returns lognormal
+    python wealth_sim.py --progressive --paths 5000000 --sampler sobol
+    python scripts/bench_samplers.py     # error per strategy at a fixed time budget
+"""
+import argparse
+import math
+import time
+
+import samplers
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+AGES = tuple(range(24, 58))
+START_ASSETS = 1.0
+LAUNCH_COST = 5.0
+FOUNDER_SALARY = 4.0
+FOUNDER_SAVINGS = 0.1
+RETURN_MODELS = ("normal", "lognormal")
+QUANTILES = (10, 50, 90)
+
+# Progressive runs
+BATCH = 1 << 16  # a power of two keeps each Sobol' batch a full net
+MAX_PATHS = 1_000_000
+REL_TOL = 0.01
+MIN_BATCHES = 4
+ALPHA = 0.005
+SKETCH_MIN = 1e-3
+SKETCH_MAX = 1e7
+
+DEFAULTS = {
+    "initial_salary": 6.0,
+    "savings_rate": 0.30,
+    "mean": 0.05,
+    "vol": 0.15,
+    "launch_age": 35,
+    "exit_age": 45,
+    "exit_valuation": 500.0,
+    "exit_prob": 0.30,
+}
+
+
+def corporate_salary(age, initial_salary):
+    if age < 26:
+        return 0.0
+    if age < 30:
+        return initial_salary
+    if age < 35:
+        return initial_salary * 1.5
+    if age < 40:
+        return initial_salary * 2.0
+    return initial_salary * 2.5
+
+
+def lognormal_params(mean, vol):
+    """(mu, sigma) of log(1 + r) such that r has the given mean and standard deviation."""
+    sigma2 = math.log(1.0 + (vol / (1.0 + mean)) ** 2)
+    return math.log(1.0 + mean) - sigma2 / 2.0, math.sqrt(sigma2)
+
+
+def growth_factors(z, mean, vol, returns="normal"):
+    """Yearly growth factors 1 + r from standard normals ``z`` (any shape)."""
+    if returns == "normal":
+        return 1.0 + mean + vol * z
+    if returns == "lognormal":
+        mu, sigma = lognormal_params(mean, vol)
+        return np.exp(mu + sigma * z)
+    raise ValueError(f"unknown return model {returns!r}; expected one of {RETURN_MODELS}")
+
+
+def _draw(n_paths, p, rng, returns, sampler):
+    # Drawn year-major so each yearly step reads and writes contiguous memory
+    z, u = samplers.get(sampler).draw(rng, n_paths, len(AGES), 1)
+    growth = growth_factors(z, p["mean"], p["vol"], returns)
+    exit_gain = np.where(u[0] < p["exit_prob"], float(p["exit_valuation"]), 0.0)
+    return growth.T, exit_gain
+
+
+def simulate(n_paths, params=None, seed=None, returns="normal", sampler="plain"):
+    """Asset paths, shape (n_paths, len(AGES)), in million JPY at the end of each age.
+
+    ``seed`` may also be a Generator, which batches then share.
+    """
+    p = {**DEFAULTS, **(params or {})}
+    return run_paths(*_draw(n_paths, p, np.random.default_rng(seed), returns, sampler), p)
+
+
+def run_paths(growth, exit_gain, p, floor=True, history=True):
+    """Apply the life plan to a (paths x years) growth matrix and per-path exit gains.
+
+    Returns the (paths x years) history, or only the final assets when ``history`` is false.
+    """
+    assets = np.full(growth.shape[0], START_ASSETS)
+    # Year-major storage; the (paths x years) result is a transposed view
+    out = np.empty(growth.shape[::-1]).T if history else None
+    for j, age in enumerate(AGES):
+        if age < p["launch_age"]:
+            assets += corporate_salary(age, p["initial_salary"]) * p["savings_rate"]
+        elif age == p["launch_age"]:
+            assets -= LAUNCH_COST
+            if floor:
+                np.maximum(assets, 0.0, out=assets)
+        elif age < p["exit_age"]:
+            assets += FOUNDER_SALARY * FOUNDER_SAVINGS
+        elif age == p["exit_age"]:
+            assets += exit_gain
+        assets *= growth[:, j]
+        if history:
+            out[:, j] = assets
+    return out if history else assets
+
+
+def expected_linear(params=None):
+    """Per-age mean of the unfloored wealth (``run_paths(floor=False)``); E[1 + r] = 1 + mean in both return models."""
+    p = {**DEFAULTS, **(params or {})}
+    assets, out = START_ASSETS, []
+    for age in AGES:
+        if age < p["launch_age"]:
+            assets += corporate_salary(age, p["initial_salary"]) * p["savings_rate"]
+        elif age == p["launch_age"]:
+            assets -= LAUNCH_COST
+        elif age < p["exit_age"]:
+            assets += FOUNDER_SALARY * FOUNDER_SAVINGS
+        elif age == p["exit_age"]:
+            assets += p["exit_prob"] * float(p["exit_valuation"])
+        assets *= 1.0 + p["mean"]
+        out.append(assets)
+    return out
+
+
+def estimate(n_paths, params=None, seed=None, returns="normal", sampler="plain", control=False, qs=QUANTILES):
+    """{"mean": ..., q: ...} of the final-age wealth from ``n_paths`` paths.
+
+    With ``control`` the paths are reweighted so the unfloored wealth hits
+    its known mean (``samplers.control_variate_weights``); the mean and the
+    quantiles then come from the weighted sample.
+    """
+    p = {**DEFAULTS, **(params or {})}
+    growth, exit_gain = _draw(n_paths, p, np.random.default_rng(seed), returns, sampler)
+    final = run_paths(growth, exit_gain, p, history=False)
+    if not control:
+        out = {"mean": float(final.mean())}
+        out.update(zip(qs, np.percentile(final, qs).tolist()))
+        return out
+    linear = run_paths(growth, exit_gain, p, floor=False, history=False)
+    w = samplers.control_variate_weights(linear, expected_linear(p)[-1])
+    out = {"mean": float(w @ final)}
+    out.update((q, samplers.weighted_quantile(final, w, q)) for q in qs)
+    return out
+
+
+def percentiles(paths, qs=QUANTILES):
+    """{q: per-age percentile array} over the paths."""
+    values = np.percentile(paths.T, qs, axis=1)
+    return {q: values[i] for i, q in enumerate(qs)}
+
+
+class QuantileSketch:
+    """Streaming per-column quantiles from log-spaced buckets, within ``alpha`` relative error.
+
+    Values with |x| < ``min_value`` count as zero and |x| beyond ``max_value``
+    share the last bucket. Buckets run from the most negative value, through
+    zero, to the most positive, so a quantile is one cumulative-count search.
+    """
+
+    def __init__(self, n_cols, alpha=ALPHA, min_value=SKETCH_MIN, max_value=SKETCH_MAX):
+        self.gamma = (1.0 + alpha) / (1.0 - alpha)
+        self.log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.offset = math.floor(math.log(min_value) / self.log_gamma)
+        self.n_keys = math.ceil(math.log(max_value) / self.log_gamma) - self.offset + 1
+        self.width = 2 * self.n_keys + 1
+        self.counts = np.zeros((n_cols, self.width), dtype=np.int64)
+        self.n = 0
+
+    def _buckets(self, values):
+        mag = np.abs(values)
+        key = np.ceil(np.log(np.maximum(mag, self.min_value)) / self.log_gamma) - self.offset
+        key = np.clip(key, 0, self.n_keys - 1).astype(np.int64)
+        zero = self.n_keys
+        return np.where(mag < self.min_value, zero, np.where(values > 0, zero + 1 + key, zero - 1 - key))
+
+    def update(self, values):
+        """Fold in a (rows x columns) batch."""
+        n_cols = self.counts.shape[0]
+        flat = (self._buckets(values) + np.arange(n_cols) * self.width).ravel()
+        self.counts += np.bincount(flat, minlength=n_cols * self.width).reshape(n_cols, self.width)
+        self.n += values.shape[0]
+
+    def _value(self, bucket):
+        zero = self.n_keys
+        key = np.abs(bucket - zero) - 1 + self.offset
+        mid = 2.0 * self.gamma ** key / (self.gamma + 1.0)
+        return np.where(bucket == zero, 0.0, np.sign(bucket - zero) * mid)
+
+    def quantiles(self, qs=QUANTILES):
+        """{q: per-column estimate of the q-th percentile}."""
+        cum = self.counts.cumsum(axis=1)
+        out = {}
+        for q in qs:
+            rank = q / 100.0 * (self.n - 1)
+            out[q] = self._value((cum <= rank).sum(axis=1))
+        return out
+
+    @property
+    def nbytes(self):
+        return self.counts.nbytes
+
+
+def batch_se(estimates):
+    """Standard error of the mean of per-batch estimates (rows), or None below MIN_BATCHES."""
+    if len(estimates) < MIN_BATCHES:
+        return None
+    arr = np.asarray(estimates)
+    return arr.std(axis=0, ddof=1) / math.sqrt(len(arr))
+
+
+def progressive(params=None, seed=None, returns="normal", batch=BATCH, max_paths=MAX_PATHS, rel_tol=REL_TOL,
+                qs=QUANTILES, sampler="plain"):
+    """Yield a snapshot after every batch until the final-age quantiles converge or ``max_paths`` run.
+
+    Snapshot: ``paths`` so far, ``bands`` {q: per-age estimate}, ``se`` {q: final-age
+    standard error or None}, ``converged``, ``done`` (converged or out of paths) and the
+    ``sketch`` itself.
+    """
+    # Small runs use smaller (still power-of-two) batches, so at least
+    # MIN_BATCHES run and a standard error can be reported
+    batch = min(batch, 1 << max(0, (max_paths // MIN_BATCHES).bit_length() - 1))
+    rng = np.random.default_rng(seed)
+    sketch = QuantileSketch(len(AGES))
+    per_batch = []
+    while sketch.n < max_paths:
+        paths = simulate(min(batch, max_paths - sketch.n), params, rng, returns, sampler)
+        sketch.update(paths)
+        per_batch.append(np.percentile(paths[:, -1], qs))
+        del paths
+        bands = sketch.quantiles(qs)
+        se = batch_se(per_batch)
+        converged = se is not None and all(
+            s <= rel_tol * max(abs(bands[q][-1]), SKETCH_MIN) for q, s in zip(qs, se))
+        yield {
+            "paths": sketch.n,
+            "bands": bands,
+            "se": dict(zip(qs, se)) if se is not None else dict.fromkeys(qs),
+            "converged": converged,
+            "done": converged or sketch.n >= max_paths,
+            "sketch": sketch,
+        }
+        if converged:
+            return
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Time the vectorized wealth simulation")
+    ap.add_argument("--paths", type=int, default=100_000)
+    ap.add_argument("--returns", choices=RETURN_MODELS, default="normal")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--sampler", choices=tuple(samplers.SAMPLERS), default="plain")
+    ap.add_argument("--progressive", action="store_true", help="batched run with a quantile sketch, up to --paths")
+    args = ap.parse_args()
+
+    if args.progressive:
+        t = time.perf_counter()
+        for snap in progressive(seed=args.seed, returns=args.returns, max_paths=args.paths,
+                                sampler=args.sampler):
+            se = snap["se"][50]
+            print(f"  {snap['paths']:>9} paths  {time.perf_counter() - t:6.2f} s  P50 {snap['bands'][50][-1]:.1f}"
+                  + (f" ± {se:.2f}" if se is not None else ""))
+        print(f"{'converged' if snap['converged'] else 'stopped at max paths'}; sketch {snap['sketch'].nbytes / 1e3:.0f} KB")
+        return
+
+    t = time.perf_counter()
+    paths = simulate(args.paths, seed=args.seed, returns=args.returns, sampler=args.sampler)
+    sim = time.perf_counter() - t
+    t = time.perf_counter()
+    bands = percentiles(paths)
+    pct = time.perf_counter() - t
+    print(f"{args.paths} paths x {len(AGES)} ages ({args.returns}, {args.sampler}): simulate {sim * 1e3:.0f} ms, "
+          f"percentiles {pct * 1e3:.0f} ms, {paths.nbytes / 1e6:.0f} MB")
+    print("  age {}: P10 {:.1f}  P50 {:.1f}  P90 {:.1f}  (million JPY)".format(
+        AGES[-1], bands[10][-1], bands[50][-1], bands[90][-1]))
+
+
+if __name__ == "__main__":
+    main()
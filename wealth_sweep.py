@@ -0,0 +1,255 @@
+"""Parameter sweeps and sensitivity of final-age wealth (wealth_sim's model).
+
+    points = wealth_sweep.latin_hypercube(1000, seed=0)
+    rows = wealth_sweep.run(points)              # [{"p50": ..., "p10": ..., "mean": ...}, ...]
+    bars = wealth_sweep.tornado(base, stat="p10")  # one-at-a-time low/high swings
+    grid = wealth_sweep.heatmap(base, "launch_age", ages, "exit_prob", probs)
+
+Every point is evaluated on the same ``n_paths`` random inputs (common
+random numbers, scrambled Sobol' by default), so differences between
+points are the parameters' effect rather than sampling noise. Points are
+evaluated ``CHUNK`` at a time as one (years x points x paths) array
+computation: the per-age rules become masks over the points' launch and
+exit ages. Chunks go to a process pool when there are several CPUs and
+enough work. Results are cached per process by parameter tuple (plus paths,
+seed, return model and sampler), so moving one heatmap axis only computes
+the new cells.
+
+    python wealth_sweep.py --points 1000
+"""
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import samplers
+import wealth_sim
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+# Swept parameters and their ranges (the Future tab's sliders)
+RANGES = {
+    "launch_age": (28, 45),
+    "exit_age": (31, 60),
+    "exit_valuation": (100.0, 10000.0),
+    "exit_prob": (0.10, 0.90),
+    "savings_rate": (0.10, 0.70),
+    "mean": (0.01, 0.15),
+    "vol": (0.05, 0.30),
+}
+INTEGER = ("launch_age", "exit_age")
+MIN_FOUNDER_YEARS = 3
+LABELS = {
+    "launch_age": "Launch Age",
+    "exit_age": "Exit Age",
+    "exit_valuation": "Exit Valuation",
+    "exit_prob": "Exit Probability",
+    "savings_rate": "Savings Rate",
+    "mean": "Expected Return",
+    "vol": "Volatility",
+}
+KEYS = ("initial_salary",) + tuple(RANGES)
+
+N_PATHS = 2048
+CHUNK = 32
+MIN_PARALLEL_CHUNKS = 4
+MAX_CACHE = 20_000
+
+
+def normalize(params):
+    """Full parameter dict with integer ages and exit at least MIN_FOUNDER_YEARS after launch."""
+    p = {**wealth_sim.DEFAULTS, **params}
+    for name in INTEGER:
+        p[name] = int(round(p[name]))
+    p["exit_age"] = max(p["exit_age"], p["launch_age"] + MIN_FOUNDER_YEARS)
+    return p
+
+
+def key(p):
+    return tuple(float(p[k]) for k in KEYS)
+
+
+def grid(base, axes):
+    """Cartesian product of ``axes`` ({name: values}) over ``base``."""
+    points = [dict(base)]
+    for name, values in axes.items():
+        points = [{**p, name: v} for p in points for v in values]
+    return [normalize(p) for p in points]
+
+
+def latin_hypercube(n, base=None, names=tuple(RANGES), seed=None):
+    """``n`` points with each of ``names`` stratified into ``n`` equal slices of its range."""
+    rng = np.random.default_rng(seed)
+    cols = {}
+    for name in names:
+        lo, hi = RANGES[name]
+        u = (rng.permutation(n) + rng.random(n)) / n
+        cols[name] = lo + u * (hi - lo)
+    return [normalize({**(base or {}), **{name: float(cols[name][i]) for name in names}}) for i in range(n)]
+
+
+def _inputs(n_paths, seed, sampler):
+    z, u = samplers.get(sampler).draw(np.random.default_rng(seed), n_paths, len(wealth_sim.AGES), 1)
+    return z, u[0]
+
+
+def evaluate_chunk(points, n_paths=N_PATHS, seed=0, returns="normal", sampler="sobol"):
+    """[(p50, p10, mean)] of final-age wealth for ``points``, all on the same random inputs."""
+    z, u = _inputs(n_paths, seed, sampler)
+
+    def col(name):
+        return np.array([p[name] for p in points], dtype=float)[:, None]
+
+    launch, exit_, savings, salary = col("launch_age"), col("exit_age"), col("savings_rate"), col("initial_salary")
+    mean, vol = col("mean"), col("vol")
+    if returns == "lognormal":
+        mu, sigma = np.vectorize(wealth_sim.lognormal_params)(mean, vol)
+    exit_gain = np.where(u[None, :] < col("exit_prob"), col("exit_valuation"), 0.0)
+    assets = np.full((len(points), n_paths), wealth_sim.START_ASSETS)
+    for j, age in enumerate(wealth_sim.AGES):
+        step = np.where(age < launch, wealth_sim.corporate_salary(age, 1.0) * salary * savings,
+                        np.where(age < exit_, wealth_sim.FOUNDER_SALARY * wealth_sim.FOUNDER_SAVINGS, 0.0))
+        assets += step
+        launching = (age == launch)[:, 0]
+        if launching.any():
+            assets[launching] = np.maximum(assets[launching] - wealth_sim.LAUNCH_COST - step[launching], 0.0)
+        exiting = (age == exit_)[:, 0]
+        if exiting.any():
+            assets[exiting] += exit_gain[exiting]
+        if returns == "lognormal":
+            assets *= np.exp(mu + sigma * z[j])
+        else:
+            assets *= 1.0 + mean + vol * z[j]
+    p50, p10 = np.percentile(assets, [50, 10], axis=1)
+    return list(zip(p50.tolist(), p10.tolist(), assets.mean(axis=1).tolist()))
+
+
+class SweepCache:
+    def __init__(self, max_entries=MAX_CACHE):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, k):
+        with self._lock:
+            if k in self._entries:
+                self._entries.move_to_end(k)
+                self.hits += 1
+                return self._entries[k]
+            self.misses += 1
+            return None
+
+    def put(self, k, value):
+        with self._lock:
+            self._entries[k] = value
+            self._entries.move_to_end(k)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+cache = SweepCache()
+
+
+def run(points, n_paths=N_PATHS, seed=0, returns="normal", sampler="sobol", workers=None):
+    """[{"p50", "p10", "mean"}] per point (final-age wealth, million JPY), cached by parameter tuple."""
+    points = [normalize(p) for p in points]
+    opts = (n_paths, seed, returns, sampler)
+    keys = [key(p) + opts for p in points]
+    results = [cache.get(k) for k in keys]
+    todo = {}
+    for k, p, r in zip(keys, points, results):
+        if r is None:
+            todo.setdefault(k, p)
+    items = list(todo.items())
+    chunks = [items[i:i + CHUNK] for i in range(0, len(items), CHUNK)]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(chunks) >= MIN_PARALLEL_CHUNKS:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            outs = list(pool.map(evaluate_chunk, [[p for _, p in c] for c in chunks],
+                                 *zip(*[opts] * len(chunks))))
+    else:
+        outs = [evaluate_chunk([p for _, p in c], *opts) for c in chunks]
+    fresh = {}
+    for chunk, out in zip(chunks, outs):
+        for (k, _), (p50, p10, mean) in zip(chunk, out):
+            fresh[k] = {"p50": p50, "p10": p10, "mean": mean}
+            cache.put(k, fresh[k])
+    return [fresh[k] if r is None else r for k, r in zip(keys, results)]
+
+
+def bounds(name, base):
+    """``RANGES[name]`` narrowed to what ``normalize`` keeps with the other parameters at ``base``.
+
+    Exit must stay MIN_FOUNDER_YEARS after launch, so the ages' ends depend on
+    each other; clamping here keeps a one-at-a-time swing from moving the other age.
+    """
+    lo, hi = RANGES[name]
+    if name == "exit_age":
+        lo = min(max(lo, base["launch_age"] + MIN_FOUNDER_YEARS), hi)
+    elif name == "launch_age":
+        hi = max(min(hi, base["exit_age"] - MIN_FOUNDER_YEARS), lo)
+    return lo, hi
+
+
+def tornado(base, names=tuple(RANGES), stat="p50", **opts):
+    """Per parameter, weakest ``stat`` swing first: final wealth with it at the low / high end of its range.
+
+    Rows carry the values actually used (``low_value``, ``high_value``, see ``bounds``).
+    """
+    base = normalize(base)
+    points = [base]
+    ends = []
+    for name in names:
+        lo, hi = bounds(name, base)
+        ends.append((lo, hi))
+        points += [{**base, name: lo}, {**base, name: hi}]
+    out = run(points, **opts)
+    rows = []
+    for i, (name, (lo, hi)) in enumerate(zip(names, ends)):
+        low, high = out[1 + 2 * i], out[2 + 2 * i]
+        rows.append({"param": name, "low": low, "high": high, "low_value": lo, "high_value": hi,
+                     "swing": abs(high[stat] - low[stat])})
+    rows.sort(key=lambda r: r["swing"])
+    return {"base": out[0], "rows": rows}
+
+
+def heatmap(base, x_name, x_values, y_name, y_values, stat="p50", **opts):
+    """len(y_values) x len(x_values) array of ``stat`` over a two-parameter grid."""
+    points = [{**base, x_name: x, y_name: y} for y in y_values for x in x_values]
+    out = run(points, **opts)
+    return np.array([r[stat] for r in out]).reshape(len(y_values), len(x_values))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Time a Latin-hypercube sweep of the wealth model")
+    ap.add_argument("--points", type=int, default=1000)
+    ap.add_argument("--paths", type=int, default=N_PATHS)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--returns", choices=wealth_sim.RETURN_MODELS, default="normal")
+    args = ap.parse_args()
+
+    points = latin_hypercube(args.points, seed=0)
+    t = time.perf_counter()
+    rows = run(points, n_paths=args.paths, returns=args.returns, workers=args.workers)
+    cold = time.perf_counter() - t
+    t = time.perf_counter()
+    run(points, n_paths=args.paths, returns=args.returns, workers=args.workers)
+    warm = time.perf_counter() - t
+    print(f"{args.points} points x {args.paths} paths: {cold:.2f} s ({cold / args.points * 1e3:.1f} ms/point), "
+          f"cached rerun {warm * 1e3:.0f} ms, workers {args.workers or os.cpu_count()}")
+    p50 = np.array([r["p50"] for r in rows])
+    print(f"  final P50 across the hypercube: min {p50.min():.1f}, median {np.median(p50):.1f}, max {p50.max():.1f}")
+
+
+if __name__ == "__main__":
+    main()